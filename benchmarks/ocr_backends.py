@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+OCR 백엔드 지연 시간과 정확도 비교 벤치마크
+
+알려진 버튼 레이블을 그린 합성 이미지를 각 백엔드로 인식하여
+이미지당 처리 시간과 레이블 일치율을 출력한다. (OCR 캐시 미사용)
+
+사용 예:
+    python benchmarks/ocr_backends.py --backends tesseract fake --count 32
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.ocr_backends import OCR_BACKENDS, FakeBackend, create_backend
+
+# 합성 이미지에 그릴 버튼 레이블
+BUTTON_LABELS = [
+    'Login', 'Sign up', 'Search', 'Submit', 'Cancel', 'Next', 'Back', 'Save',
+    'Delete', 'Continue', 'Apply', 'Buy now', 'Add to cart', 'Register', 'Logout', 'Send',
+]
+
+
+def parse_args():
+    """명령줄 인수 파싱"""
+    parser = argparse.ArgumentParser(description='OCR 백엔드 지연 시간/정확도 벤치마크')
+    parser.add_argument('--backends', nargs='+', choices=sorted(OCR_BACKENDS), default=sorted(OCR_BACKENDS),
+                        help='비교할 백엔드 (기본값: 모든 백엔드)')
+    parser.add_argument('--count', type=int, default=len(BUTTON_LABELS), help='합성 이미지 수 (기본값: 16)')
+    parser.add_argument('--repeat', type=int, default=3, help='백엔드별 반복 횟수 (기본값: 3, 가장 빠른 결과 사용)')
+    parser.add_argument('--json', dest='json_path', help='결과를 저장할 JSON 파일 경로')
+    return parser.parse_args()
+
+
+def render_button(label: str, index: int) -> bytes:
+    """
+    버튼 레이블을 그린 PNG 이미지 생성
+
+    Args:
+        label: 버튼 레이블
+        index: 이미지 번호 (색상 변화에 사용)
+
+    Returns:
+        PNG 이미지 바이트 데이터
+    """
+    try:
+        font = ImageFont.load_default(size=32)
+    except TypeError:  # Pillow 10.1 미만은 크기 지정 불가
+        font = ImageFont.load_default()
+
+    left, top, right, bottom = font.getbbox(label)
+    width, height = right - left + 40, bottom - top + 24
+    background = (255, 255 - (index * 7) % 60, 255 - (index * 13) % 60)
+
+    image = Image.new('RGB', (width, height), background)
+    ImageDraw.Draw(image).text((20 - left, 12 - top), label, fill=(0, 0, 0), font=font)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def make_samples(count: int) -> List[Tuple[str, bytes]]:
+    """(레이블, 이미지) 합성 샘플 리스트 생성"""
+    return [(BUTTON_LABELS[i % len(BUTTON_LABELS)], render_button(BUTTON_LABELS[i % len(BUTTON_LABELS)], i))
+            for i in range(count)]
+
+
+def normalize(text: str) -> str:
+    """비교용 텍스트 정규화 (대소문자, 공백 무시)"""
+    return ''.join(text.lower().split())
+
+
+def run_backend(name: str, samples: List[Tuple[str, bytes]], repeat: int) -> Dict[str, Any]:
+    """
+    백엔드 하나로 샘플을 인식하고 결과 측정
+
+    Args:
+        name: 백엔드 이름
+        samples: (레이블, 이미지) 샘플 리스트
+        repeat: 반복 횟수
+
+    Returns:
+        백엔드 이름, 사용 가능 여부, 처리 시간, 정확도를 담은 딕셔너리
+    """
+    images = [image for _, image in samples]
+    if name == FakeBackend.name:
+        # 테스트용 백엔드는 정답을 돌려주므로 측정 도구 자체의 부하 기준선이 됨
+        backend = FakeBackend({image: label for label, image in samples})
+    else:
+        backend = create_backend(name)
+
+    result = {'backend': name, 'available': backend.available, 'images': len(images)}
+    if not backend.available:
+        return result
+
+    timings = []
+    responses = []
+    for _ in range(max(1, repeat)):
+        start_time = time.perf_counter()
+        responses = backend.detect_text_batch(images)
+        timings.append(time.perf_counter() - start_time)
+    backend.close()
+
+    correct = sum(1 for (label, _), texts in zip(samples, responses)
+                  if texts and normalize(' '.join(text['text'] for text in texts)) == normalize(label))
+    errors = sum(1 for texts in responses if texts is None)
+
+    result.update({
+        'best_seconds': min(timings),
+        'per_image_ms': min(timings) / max(1, len(images)) * 1000,
+        'accuracy': correct / max(1, len(images)),
+        'errors': errors,
+    })
+    return result
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    samples = make_samples(args.count)
+
+    results = [run_backend(name, samples, args.repeat) for name in args.backends]
+
+    print(f"\nOCR 백엔드 벤치마크 (이미지 {len(samples)}개, {args.repeat}회 반복 중 최고 기록):")
+    print(f"{'백엔드':<12}{'전체(초)':>10}{'이미지당(ms)':>14}{'정확도':>10}{'오류':>6}")
+    for result in results:
+        if not result['available']:
+            print(f"{result['backend']:<12}{'(사용 불가)':>10}")
+            continue
+        print(f"{result['backend']:<12}{result['best_seconds']:>10.3f}{result['per_image_ms']:>14.1f}"
+              f"{result['accuracy']:>10.0%}{result['errors']:>6}")
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
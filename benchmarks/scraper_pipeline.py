@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+스크래핑 파이프라인 단계별 성능 벤치마크
+
+상호작용 요소 수가 다른 합성 HTML 페이지(폼, 아이콘 버튼, iframe, 반복 카드)를
+로컬 HTTP 서버로 제공하고, 페이지마다 파이프라인 단계
+(이동, 후보 수집, 정보 추출, 로케이터 검사, OCR, 코드 생성, 파일 쓰기)의 시간을 측정한다.
+결과는 JSON으로 저장할 수 있고, 저장한 기준 결과와 비교하여 느려진 단계를 보고한다.
+(OCR은 네트워크 없이 결과가 정해지는 fake 백엔드를 기본으로 사용)
+
+--trace-webdriver를 지정하면 단계별 WebDriver 명령 수도 함께 기록한다. (selenium 엔진)
+
+사용 예:
+    python benchmarks/scraper_pipeline.py --engine static --sizes 50 500 --json bench.json
+    python benchmarks/scraper_pipeline.py --baseline bench.json --max-regression 0.2
+    python benchmarks/scraper_pipeline.py --sizes 500 --repeat 1 --trace-webdriver
+"""
+import argparse
+import base64
+import functools
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.ocr_backends import BUTTON_LABELS, render_button
+from src.main import apply_ocr, create_scraper
+from src.utils.command_tracer import CommandTracer
+from src.utils.locators import validate_locators
+from src.utils.ocr import OCRProcessor
+from src.utils.ocr_backends import OCR_BACKENDS, FakeBackend, create_backend
+from src.utils.po_generator import PageObjectGenerator
+
+# 결과 JSON 형식 버전 (2: 페이지 크기가 실제 수집되는 요소 수와 같도록 픽스처 변경)
+RESULT_VERSION = 2
+
+# 측정 단계 (출력 순서)
+PHASES = ['navigate', 'collect', 'extract', 'locators', 'ocr', 'generate', 'write']
+
+# 기본 페이지 크기 (수집되는 상호작용 요소 수)
+DEFAULT_SIZES = [50, 500, 2000, 10000]
+
+# 기준 결과보다 이 시간(초) 이상 느려진 단계만 회귀로 판단 (짧은 단계의 측정 잡음 제외)
+MIN_REGRESSION_SECONDS = 0.005
+
+
+def parse_args():
+    """명령줄 인수 파싱"""
+    parser = argparse.ArgumentParser(description='스크래핑 파이프라인 단계별 성능 벤치마크')
+    parser.add_argument('--engine', choices=['selenium', 'static'], default='selenium',
+                        help='스크래핑 엔진 (기본값: selenium, static은 OCR 단계 제외)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='페이지별 상호작용 요소 수 (기본값: 50 500 2000 10000)')
+    parser.add_argument('--repeat', type=int, default=3, help='페이지별 반복 횟수 (기본값: 3, 단계별 가장 빠른 결과 사용)')
+    parser.add_argument('--ocr-backend', choices=sorted(OCR_BACKENDS), default='fake',
+                        help='OCR 단계에 사용할 백엔드 (기본값: fake)')
+    parser.add_argument('--chromedriver', type=str, help='ChromeDriver 실행 파일 경로')
+    parser.add_argument('--json', dest='json_path', help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 파일 경로')
+    parser.add_argument('--max-regression', type=float, default=0.1,
+                        help='기준 결과 대비 허용하는 단계별 시간 증가율 (기본값: 0.1, 넘으면 종료 코드 1)')
+    parser.add_argument('--trace-webdriver', action='store_true',
+                        help='단계별 WebDriver 명령 수 기록 (selenium 엔진, 명령 크기 계산 때문에 시간이 약간 늘어남)')
+    return parser.parse_args()
+
+
+# 페이지 구성 요소별 수집되는 상호작용 요소 수 (헤더 링크, 폼, 카드)
+HEADER_ELEMENTS = 2
+FORM_ELEMENTS = 5
+CARD_ELEMENTS = 2
+
+
+@functools.lru_cache(maxsize=None)
+def icon_image(index: int) -> str:
+    """아이콘 버튼에 넣을 레이블 이미지 (data URI, 레이블 수만큼만 생성)"""
+    label = BUTTON_LABELS[index % len(BUTTON_LABELS)]
+    return 'data:image/png;base64,' + base64.b64encode(render_button(label, index)).decode('ascii')
+
+
+def make_page(size: int) -> str:
+    """
+    스크래퍼가 수집하는 상호작용 요소가 size개인 합성 HTML 페이지 생성 (같은 크기는 항상 같은 HTML)
+
+    요소 구성 (괄호 안은 수집되는 요소 수):
+    - 헤더 링크 (2)
+    - 폼: 요소 50개마다 하나 (텍스트/비밀번호 입력, 체크박스, 드롭다운, 제출 버튼: 5)
+    - 아이콘 버튼: 요소 10개마다 하나 (텍스트 없이 이미지만 있는 버튼, OCR 대상: 1)
+    - iframe: 요소 1000개마다 하나 (별도 문서 로드, 프레임 안의 요소는 수집하지 않음: 0)
+    - 나머지: 반복 카드 (상품 링크와 장바구니 버튼: 2), 홀수로 남으면 '더 보기' 버튼 (1)
+
+    Args:
+        size: 상호작용 요소 수 (고정 구성보다 작으면 고정 구성만 생성)
+
+    Returns:
+        HTML 문자열
+    """
+    forms = max(1, size // 50)
+    icons = size // 10
+    frames = max(1, size // 1000)
+    remaining = max(0, size - HEADER_ELEMENTS - forms * FORM_ELEMENTS - icons)
+    cards, more = divmod(remaining, CARD_ELEMENTS)
+
+    parts = ['<!DOCTYPE html><html><head><meta charset="utf-8"><title>Benchmark</title></head><body>',
+             '<header><a href="/">Home</a> <a href="/cart">Cart</a></header>']
+
+    for number in range(1, forms + 1):
+        parts.append(
+            f'<form id="form-{number}" action="/submit">'
+            f'<input type="text" name="user-{number}" placeholder="User {number}">'
+            f'<input type="password" name="password-{number}" placeholder="Password {number}">'
+            f'<label><input type="checkbox" name="remember-{number}"> Remember {number}</label>'
+            f'<select name="country-{number}"><option>Korea</option><option>Japan</option></select>'
+            f'<button type="submit">Submit {number}</button></form>')
+
+    parts.append('<div class="toolbar">')
+    for number in range(icons):
+        parts.append(f'<button class="icon-btn"><img src="{icon_image(number % len(BUTTON_LABELS))}" alt=""></button>')
+    parts.append('</div>')
+
+    for number in range(frames):
+        parts.append(f'<iframe src="frame.html?n={number}" width="300" height="80"></iframe>')
+
+    parts.append('<main class="cards">')
+    for number in range(1, cards + 1):
+        parts.append(
+            f'<div class="card" data-sku="{number}">'
+            f'<a class="card-title btn-link" href="/item/{number}">Item {number}</a>'
+            f'<p>Description {number}</p><button class="btn add">Add to cart</button></div>')
+    if more:
+        parts.append('<button class="btn more">Load more</button>')
+    parts.append('</main></body></html>')
+    return '\n'.join(parts)
+
+
+FRAME_PAGE = ('<!DOCTYPE html><html><body><form><input type="search" name="q" placeholder="Search">'
+              '<button>Go</button></form></body></html>')
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """요청 로그를 출력하지 않는 정적 파일 핸들러"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """합성 페이지를 임시 디렉토리에 쓰고 로컬 HTTP 서버로 제공"""
+
+    def __init__(self, sizes: List[int]):
+        """
+        픽스처 생성 및 서버 시작
+
+        Args:
+            sizes: 페이지별 상호작용 요소 수
+        """
+        self.directory = tempfile.TemporaryDirectory(prefix='po_bench_')
+        root = Path(self.directory.name)
+        (root / 'frame.html').write_text(FRAME_PAGE, encoding='utf-8')
+        for size in sizes:
+            (root / f'page_{size}.html').write_text(make_page(size), encoding='utf-8')
+
+        handler = functools.partial(QuietHandler, directory=str(root))
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def url(self, size: int) -> str:
+        """크기별 페이지 URL"""
+        return f"http://127.0.0.1:{self.server.server_port}/page_{size}.html"
+
+    def close(self):
+        """서버 종료 및 픽스처 삭제"""
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+
+def run_once(scraper, url: str, ocr_processor: Optional[OCRProcessor], output_dir: Path,
+             tracer: Optional[CommandTracer] = None) -> Dict[str, Any]:
+    """
+    페이지 하나에 대해 파이프라인 단계를 한 번 실행하고 단계별 시간 측정
+
+    Args:
+        scraper: WebScraper 또는 StaticScraper 인스턴스
+        url: 페이지 URL
+        ocr_processor: OCR 프로세서 (없으면 OCR 단계 생략)
+        output_dir: 생성 코드를 쓸 디렉토리
+        tracer: 스크래퍼 드라이버에 연결한 WebDriver 명령 추적기 (없으면 명령 수 미기록)
+
+    Returns:
+        {'elements': 추출한 요소 수, 'ocr_images': OCR 대상 버튼 수, 'phases': {단계: 초},
+         'commands': {단계: WebDriver 명령 수}} 딕셔너리
+    """
+    phases = {}
+    commands = {}
+
+    def timed(phase, function, *args):
+        calls = tracer.totals()['calls'] if tracer is not None else 0
+        start_time = time.perf_counter()
+        result = function(*args)
+        phases[phase] = time.perf_counter() - start_time
+        if tracer is not None:
+            commands[phase] = tracer.totals()['calls'] - calls
+        return result
+
+    if not timed('navigate', scraper.navigate_to, url):
+        raise RuntimeError(f"페이지를 열 수 없습니다: {url}")
+    candidates = timed('collect', scraper.collect_candidates)
+    references = [element for element, _ in candidates]
+    elements = timed('extract', scraper.get_elements_info, references)
+    for info, (_, categories) in zip(elements, candidates):
+        info['element_category'] = categories[0]
+    timed('locators', validate_locators, scraper, elements, references)
+
+    records = [(element, info['element_category'], info) for element, info in zip(references, elements)]
+    ocr_targets = sum(1 for _, category, info in records
+                      if category == 'button' and info.get('is_displayed') and not info.get('text'))
+    if ocr_processor is not None:
+        timed('ocr', apply_ocr, scraper, ocr_processor, records)
+
+    code = timed('generate', PageObjectGenerator().generate_page_object_class, url, elements)
+    timed('write', (output_dir / 'page.py').write_text, code, 'utf-8')
+
+    return {'elements': len(elements), 'ocr_images': ocr_targets, 'phases': phases, 'commands': commands}
+
+
+def run_size(scraper, url: str, size: int, repeat: int, ocr_processor: Optional[OCRProcessor],
+             output_dir: Path, tracer: Optional[CommandTracer] = None) -> Dict[str, Any]:
+    """
+    페이지 하나를 반복 측정하여 단계별 가장 빠른 시간 선택
+
+    Args:
+        scraper: 스크래퍼 인스턴스
+        url: 페이지 URL
+        size: 페이지 크기 (요청한 상호작용 요소 수)
+        repeat: 반복 횟수
+        ocr_processor: OCR 프로세서 (없으면 OCR 단계 생략)
+        output_dir: 생성 코드를 쓸 디렉토리
+        tracer: WebDriver 명령 추적기 (없으면 명령 수 미기록)
+
+    Returns:
+        크기, 요소 수, 단계별 시간, 합계(추적 시 단계별 명령 수)를 담은 딕셔너리
+    """
+    runs = [run_once(scraper, url, ocr_processor, output_dir, tracer) for _ in range(max(1, repeat))]
+    phases = {phase: min(run['phases'][phase] for run in runs) for phase in PHASES if phase in runs[0]['phases']}
+    entry = {
+        'size': size,
+        'elements': runs[0]['elements'],
+        'ocr_images': runs[0]['ocr_images'],
+        'phases': phases,
+        'total': sum(phases.values()),
+    }
+    if tracer is not None:
+        # 명령 수는 반복마다 같으므로 첫 실행 값 사용
+        entry['commands'] = runs[0]['commands']
+    return entry
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[Dict[str, Any]]:
+    """
+    기준 결과와 단계별 시간 비교
+
+    Args:
+        results: 이번 실행 결과
+        baseline: 기준 결과 (같은 형식)
+        max_regression: 허용하는 시간 증가율
+
+    Returns:
+        크기와 단계별 {'size', 'phase', 'baseline', 'current', 'ratio', 'regression'} 리스트
+        (기준 결과에 없는 크기와 단계, 추출한 요소 수가 달라 픽스처가 다른 크기는 제외)
+    """
+    baseline_sizes = {entry['size']: entry for entry in baseline.get('results', [])}
+    rows = []
+    for entry in results['results']:
+        previous = baseline_sizes.get(entry['size'])
+        if previous is None or previous.get('elements') != entry['elements']:
+            continue
+        for phase in PHASES + ['total']:
+            current = entry['total'] if phase == 'total' else entry['phases'].get(phase)
+            before = previous['total'] if phase == 'total' else previous['phases'].get(phase)
+            if current is None or before is None:
+                continue
+            ratio = current / before if before > 0 else 1.0
+            rows.append({
+                'size': entry['size'],
+                'phase': phase,
+                'baseline': before,
+                'current': current,
+                'ratio': ratio,
+                'regression': ratio > 1 + max_regression and current - before > MIN_REGRESSION_SECONDS,
+            })
+    return rows
+
+
+def print_results(results: Dict[str, Any]):
+    """단계별 시간 표 출력"""
+    phases = [phase for phase in PHASES if any(phase in entry['phases'] for entry in results['results'])]
+    print(f"\n파이프라인 벤치마크 (엔진: {results['engine']}, {results['repeat']}회 반복 중 단계별 최고 기록, 단위: ms):")
+    print(f"{'크기':>6}{'요소':>7}" + ''.join(f"{phase:>10}" for phase in phases) + f"{'합계':>10}")
+    for entry in results['results']:
+        row = ''.join(f"{entry['phases'][phase] * 1000:>10.1f}" if phase in entry['phases'] else f"{'-':>10}"
+                      for phase in phases)
+        print(f"{entry['size']:>6}{entry['elements']:>7}{row}{entry['total'] * 1000:>10.1f}")
+
+    if any('commands' in entry for entry in results['results']):
+        print("\n단계별 WebDriver 명령 수:")
+        print(f"{'크기':>6}{'':>7}" + ''.join(f"{phase:>10}" for phase in phases) + f"{'합계':>10}")
+        for entry in results['results']:
+            commands = entry.get('commands', {})
+            row = ''.join(f"{commands[phase]:>10}" if phase in commands else f"{'-':>10}" for phase in phases)
+            print(f"{entry['size']:>6}{'':>7}{row}{sum(commands.values()):>10}")
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+
+    ocr_processor = None
+    if args.engine == 'selenium':
+        backend = FakeBackend() if args.ocr_backend == FakeBackend.name else create_backend(args.ocr_backend)
+        ocr_processor = OCRProcessor(backend=backend)
+
+    tracer = CommandTracer() if args.trace_webdriver and args.engine == 'selenium' else None
+    server = FixtureServer(args.sizes)
+    scraper = create_scraper(argparse.Namespace(engine=args.engine, chromedriver=args.chromedriver, tabs=1,
+                                                 no_driver_download=False), tracer=tracer)
+    try:
+        with tempfile.TemporaryDirectory(prefix='po_bench_out_') as output_dir:
+            entries = [run_size(scraper, server.url(size), size, args.repeat, ocr_processor, Path(output_dir), tracer)
+                       for size in args.sizes]
+    finally:
+        scraper.close()
+        server.close()
+
+    results = {
+        'version': RESULT_VERSION,
+        'engine': args.engine,
+        'ocr_backend': args.ocr_backend if ocr_processor is not None else None,
+        'repeat': args.repeat,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': entries,
+    }
+    print_results(results)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json_path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('engine') != results['engine']:
+            print(f"\n경고: 기준 결과의 엔진({baseline.get('engine')})이 이번 실행과 다릅니다.")
+        if baseline.get('version') != RESULT_VERSION:
+            print(f"\n경고: 기준 결과의 형식 버전({baseline.get('version')})이 이번 실행({RESULT_VERSION})과 다릅니다. "
+                  "요소 수가 다른 크기는 비교하지 않습니다.")
+
+        rows = compare(results, baseline, args.max_regression)
+        regressions = [row for row in rows if row['regression']]
+        print(f"\n기준 결과 비교 ({args.baseline}, 허용 증가율 {args.max_regression:.0%}):")
+        print(f"{'크기':>6}  {'단계':<10}{'기준(ms)':>10}{'현재(ms)':>10}{'비율':>8}")
+        for row in rows:
+            mark = '  <- 느려짐' if row['regression'] else ''
+            print(f"{row['size']:>6}  {row['phase']:<10}{row['baseline'] * 1000:>10.1f}"
+                  f"{row['current'] * 1000:>10.1f}{row['ratio']:>8.2f}{mark}")
+        if regressions:
+            print(f"\n느려진 단계 {len(regressions)}개")
+            sys.exit(1)
+        print("\n느려진 단계 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ setup(
         "requests>=2.28.0",
         "beautifulsoup4>=4.11.0",
         "lxml>=4.9.0",
+        "soupsieve>=2.3",
     ],
     entry_points={
         "console_scripts": [
@@ -5,323 +5,934 @@
 import os
 import sys
 import argparse
-from typing import List, Dict, Any
-import time
+import re
+from typing import List, Dict, Any, Optional, Set, Tuple
 from pathlib import Path
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 
 # 현재 디렉토리를 모듈 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.utils.web_scraper import WebScraper
+from src.templates import page_object_template
+from src.utils.batch import ScraperPool
+from src.utils.command_tracer import CommandTracer, format_commands
+from src.utils.crawler import SiteCrawler, dom_fingerprint, read_sitemap
+from src.utils.static_scraper import StaticScraper
+from src.utils.image_filter import ImageFilter, SKIP_REASONS
+from src.utils.incremental import Manifest, write_if_changed
+from src.utils.locator_scoring import AttributeIndex
+from src.utils.locators import choose_locators, describe_locator, validate_locators
 from src.utils.ocr import OCRProcessor
+from src.utils.ocr_backends import OCR_BACKENDS, create_backend
+from src.utils.ocr_cache import OCRCache
+from src.utils.ocr_executor import RateLimitedBackend
+from src.utils.ocr_pipeline import OCRPipeline
 from src.utils.po_generator import PageObjectGenerator
+from src.utils.profiler import Profiler, format_phases
+from src.utils.snapshot import SnapshotWriter, read_snapshot
 
 # 환경 변수 로드
 load_dotenv()
 
+# 출력 디렉토리에 복사하는 PageTemplate 모듈 파일 이름
+PAGE_TEMPLATE_MODULE = 'page_template.py'
+
 def parse_args():
     """명령줄 인수 파싱"""
     parser = argparse.ArgumentParser(description='URL로부터 페이지 오브젝트 패턴 함수 생성')
-    parser.add_argument('--url', type=str, required=True, help='페이지 오브젝트를 생성할 웹페이지 URL')
+    source_group = parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument('--url', type=str, help='페이지 오브젝트를 생성할 웹페이지 URL')
+    source_group.add_argument('--urls-file', type=str, help='여러 URL을 일괄 처리할 URL 목록 파일 (한 줄에 하나)')
+    source_group.add_argument('--from-snapshot', type=str,
+                              help='--save-snapshot으로 저장한 스냅샷 파일에서 브라우저 없이 코드만 다시 생성')
+    source_group.add_argument('--crawl', type=str,
+                              help='같은 출처의 링크를 따라가며 사이트 전체를 처리할 시작 URL 또는 sitemap.xml URL')
+    parser.add_argument('--save-snapshot', type=str,
+                        help='페이지별 요소 정보를 저장할 스냅샷 파일 경로 (JSON Lines, .gz로 끝나면 gzip 압축)')
     parser.add_argument('--output', type=str, default='output', help='생성된 페이지 오브젝트 코드를 저장할 디렉토리')
+    parser.add_argument('--incremental', action='store_true',
+                        help='이전 실행 이후 내용이 바뀌지 않은 페이지는 건너뛰고 바뀐 요소의 메서드만 다시 생성')
     parser.add_argument('--no-ocr', action='store_true', help='OCR 기능을 비활성화합니다 (Google Cloud Vision API가 없는 경우 사용)')
+    parser.add_argument('--ocr-backend', choices=sorted(OCR_BACKENDS), default=None,
+                        help='OCR 백엔드 (기본값: OCR_BACKEND 환경 변수 또는 vision, tesseract는 로컬 실행 파일 사용)')
+    parser.add_argument('--ocr-workers', type=int, default=2,
+                        help='스크린샷 캡처와 동시에 OCR을 수행할 작업자 수 (기본값: 2, 0이면 캡처가 끝난 뒤 OCR 수행)')
+    parser.add_argument('--ocr-concurrency', type=int, default=None,
+                        help='동시에 보낼 최대 OCR 요청 수 (기본값: OCR_CONCURRENCY 환경 변수 또는 4)')
+    parser.add_argument('--ocr-rate', type=float, default=None,
+                        help='초당 최대 OCR 요청 수 (기본값: OCR_RATE_LIMIT 환경 변수 또는 10, 0이면 제한 없음)')
+    parser.add_argument('--ocr-budget', type=float, default=None,
+                        help='실행 전체의 OCR 시간 예산 (초, 기본값: OCR_TIME_BUDGET 환경 변수, 없으면 제한 없음)')
+    parser.add_argument('--no-ocr-cache', action='store_true', help='OCR 결과 디스크 캐시를 사용하지 않습니다 (기본값: 이미지 내용 해시로 결과 캐시)')
+    parser.add_argument('--no-locator-check', action='store_true',
+                        help='로케이터 고유성 검사를 하지 않습니다 (기본값: 후보 로케이터를 한 번에 검사하여 고유한 로케이터 선택, '
+                             '검사하지 않으면 견고성 점수가 가장 높은 후보 사용)')
     parser.add_argument('--max-elements', type=int, help='처리할 최대 요소 수 (기본값: 제한 없음)')
     parser.add_argument('--timeout', type=int, default=60, help='스크래핑 타임아웃 (초, 기본값: 60)')
     parser.add_argument('--debug', action='store_true', help='디버그 모드 활성화 (더 많은 정보 출력)')
     parser.add_argument('--text-only', action='store_true', help='텍스트가 있는 요소만 포함 (기본값: 모든 요소 포함)')
     parser.add_argument('--buttons-only', action='store_true', help='버튼 요소만 추출 (기본값: 모든 상호작용 요소 추출)')
     parser.add_argument('--inputs-only', action='store_true', help='입력 요소만 추출 (기본값: 모든 상호작용 요소 추출)')
+    parser.add_argument('--workers', type=int, default=4, help='--urls-file/--crawl 일괄 처리 시 동시에 사용할 스크래퍼(브라우저) 수 (기본값: 4)')
+    parser.add_argument('--tabs', type=int, default=1, help='--urls-file/--crawl 일괄 처리 시 브라우저당 번갈아 사용할 탭 수 (기본값: 1)')
+    parser.add_argument('--max-depth', type=int, default=2, help='--crawl 시 시작 URL에서 따라갈 최대 링크 단계 수 (기본값: 2)')
+    parser.add_argument('--max-pages', type=int, default=100, help='--crawl 시 방문할 최대 페이지 수 (기본값: 100)')
+    parser.add_argument('--chromedriver', type=str, help='ChromeDriver 실행 파일 경로 (기본값: CHROMEDRIVER_PATH, PATH, 로컬 캐시 순으로 탐색)')
+    parser.add_argument('--no-driver-download', action='store_true',
+                        help='맞는 ChromeDriver가 없을 때 내려받지 않고 바로 실패 (네트워크가 없는 환경용)')
+    parser.add_argument('--engine', choices=['selenium', 'static'], default='selenium',
+                        help='스크래핑 엔진 (selenium: Chrome 사용, static: 브라우저 없이 정적 HTML 또는 로컬 파일 분석, 기본값: selenium)')
+    parser.add_argument('--profile', type=str,
+                        help='단계별 경과/CPU 시간, 요소별 추출 지연 시간 분포, 스크린샷/OCR 바이트 수를 기록한 실행 보고서(JSON) 경로')
+    parser.add_argument('--cprofile', type=str, help='cProfile 결과를 저장할 파일 경로 (메인 스레드만, pstats로 분석)')
+    parser.add_argument('--trace-webdriver', action='store_true',
+                        help='WebDriver 명령(요소 탐색, 속성 조회, 스크립트 실행, 스크린샷 등)의 횟수, 왕복 시간, '
+                             '요청/응답 크기를 단계별로 기록하여 요약과 실행 보고서에 표시 (selenium 엔진)')
     
     return parser.parse_args()
 
-def main():
-    """메인 함수"""
-    # 명령줄 인수 파싱
-    args = parse_args()
+def page_module_name(url: str, include_path: bool = False) -> str:
+    """
+    URL로부터 출력 모듈 파일 이름 생성
     
-    print(f"URL '{args.url}'에서 상호작용 요소 추출 중...")
+    Args:
+        url: 웹페이지 URL 또는 로컬 파일 경로
+        include_path: True면 경로도 파일 이름에 포함 (같은 도메인의 여러 페이지 구분용)
+        
+    Returns:
+        '[도메인명]_page.py' 또는 '[도메인명]_[경로]_page.py' 형식의 파일 이름
+    """
+    parsed = urlparse(url.replace('\n', '').replace('\r', ''))
+    parts = [parsed.netloc]
+    if not parsed.netloc:
+        # 로컬 파일은 도메인이 없으므로 파일 이름을 사용
+        parts.append(Path(parsed.path).stem)
+    elif include_path:
+        parts.extend([parsed.path, parsed.query])
     
-    # 출력 디렉토리 생성
-    output_dir = Path(args.output)
-    output_dir.mkdir(exist_ok=True)
+    name = re.sub(r'[\W_]+', '_', ' '.join(part for part in parts if part)).strip('_')
+    return f"{name or 'index'}_page.py"
+
+def assign_output_names(urls: List[str], used_names: Set[str]) -> Dict[str, str]:
+    """
+    URL별 출력 파일 이름 지정 (이름이 겹치면 URL 순서대로 번호를 붙여 구분)
     
-    # 웹 스크래퍼 인스턴스 생성
-    scraper = WebScraper()
+    Args:
+        urls: 이름을 지정할 URL 리스트
+        used_names: 이미 사용한 파일 이름 집합 (지정한 이름이 추가됨)
+        
+    Returns:
+        URL별 파일 이름 딕셔너리
+    """
+    output_names = {}
+    for url in urls:
+        name = page_module_name(url, include_path=True)
+        stem, counter = name[:-len('_page.py')], 1
+        while name in used_names:
+            name = f"{stem}_{counter}_page.py"
+            counter += 1
+        used_names.add(name)
+        output_names[url] = name
+    return output_names
+
+def create_scraper(args, profiler: Optional[Profiler] = None, tracer: Optional[CommandTracer] = None):
+    """
+    선택한 엔진에 맞는 스크래퍼 인스턴스 생성
     
-    # OCR 프로세서 인스턴스 생성
-    ocr_processor = OCRProcessor()
+    Args:
+        args: 명령줄 인수
+        profiler: 스크래퍼 단계 시간을 기록할 프로파일러 (기본값: 기록하지 않음)
+        tracer: WebDriver 명령을 기록할 추적기 (기본값: 추적하지 않음, 정적 엔진은 사용하지 않음)
+        
+    Returns:
+        WebScraper 또는 StaticScraper 인스턴스
+    """
+    if args.engine == 'static':
+        return StaticScraper(profiler=profiler)
     
-    # 페이지 오브젝트 생성기 인스턴스 생성
-    po_generator = PageObjectGenerator()
+    # Chrome 실행이 필요한 경우에만 Selenium 모듈 로드
+    from src.utils.web_scraper import WebScraper
+    # 여러 탭을 번갈아 쓰려면 드라이버 호출이 로드 중인 탭을 기다리지 않아야 함
+    page_load_strategy = 'none' if args.tabs > 1 else None
+    return WebScraper(driver_path=args.chromedriver, profiler=profiler, tracer=tracer,
+                      page_load_strategy=page_load_strategy, allow_driver_download=not args.no_driver_download)
+
+def read_urls_file(path: str) -> List[str]:
+    """
+    URL 목록 파일 읽기 (한 줄에 하나, 빈 줄과 '#' 주석은 무시)
     
-    try:
-        # URL로 이동
-        if not scraper.navigate_to(args.url):
-            print(f"URL '{args.url}'로 이동할 수 없습니다.")
-            return
+    Args:
+        path: URL 목록 파일 경로
         
-        # 타임아웃 설정
-        start_time = time.time()
-        print(f"상호작용 요소 검색을 시작합니다. 최대 {args.timeout}초 대기 중...")
+    Returns:
+        URL 리스트 (중복 제거, 순서 유지)
+    """
+    urls = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#') and line not in urls:
+                urls.append(line)
+    return urls
+
+def apply_ocr(scraper, ocr_processor: OCRProcessor, records: List[Tuple[Any, str, Dict[str, Any]]],
+              debug: bool = False, workers: int = 0, image_filter: Optional[ImageFilter] = None) -> int:
+    """
+    텍스트가 없는 버튼의 스크린샷을 한꺼번에 캡처하여 OCR로 텍스트 인식
+    
+    workers가 1 이상이면 캡처가 끝난 스크린샷부터 OCR 작업자에게 넘겨
+    나머지 스크린샷을 캡처하는 동안 OCR을 함께 진행한다.
+    텍스트가 있을 수 없는 이미지와 중복 이미지는 OCR로 보내지 않는다.
+    
+    Args:
+        scraper: WebScraper 인스턴스
+        ocr_processor: OCR 프로세서 인스턴스
+        records: (웹 요소, 요소 유형, 요소 정보) 튜플 리스트 (요소 정보가 갱신됨)
+        debug: True면 텍스트가 있는 버튼도 OCR 수행하고 결과 출력
+        workers: OCR 파이프라인 작업자 수 (0이면 모든 캡처가 끝난 뒤 OCR 수행)
+        image_filter: 이번 호출에 사용할 새 이미지 사전 필터 (통계 확인용, 기본값: 새 필터)
         
-        # 어떤 요소를 추출할지 결정
-        all_elements = []
+    Returns:
+        OCR 결과로 텍스트가 갱신된 요소 수
+    """
+    targets = [(i, element, info) for i, (element, category, info) in enumerate(records)
+               if category == 'button' and info.get('is_displayed') and (not info.get('text') or debug)]
+    if not targets:
+        return 0
+    
+    # 버튼 스크린샷 일괄 캡처 (필요한 최소한의 화면 캡처에서 모두 잘라냄)
+    print(f"OCR 대상 버튼 {len(targets)}개의 스크린샷 캡처 중...")
+    elements = [element for _, element, _ in targets]
+    image_filter = image_filter or ImageFilter()
+    
+    if workers > 0 and hasattr(scraper, 'iter_element_screenshots'):
+        # 캡처된 스크린샷을 바로 OCR 작업 큐에 넣고 결과는 캡처가 모두 끝난 뒤 모음
+        with OCRPipeline(ocr_processor, workers=workers) as pipeline:
+            for index, image_bytes in scraper.iter_element_screenshots(elements):
+                prepared = image_filter.prepare(index, image_bytes)
+                if prepared is not None:
+                    pipeline.submit(index, prepared)
+            results_by_index = pipeline.results()
+        if debug:
+            print(f"OCR 파이프라인: 작업 {pipeline.jobs}개, 캡처 종료 후 대기 {pipeline.wait_time:.2f}초")
+    else:
+        screenshots = scraper.capture_elements_screenshots(elements)
+        prepared = [(index, image_filter.prepare(index, image_bytes)) for index, image_bytes in enumerate(screenshots)]
+        prepared = [(index, image_bytes) for index, image_bytes in prepared if image_bytes is not None]
         
-        if args.buttons_only:
-            # 버튼만 추출
-            buttons = scraper.get_buttons()
-            print(f"{len(buttons)}개의 버튼 요소를 찾았습니다.")
-            all_elements = [(button, 'button') for button in buttons]
-            
-        elif args.inputs_only:
-            # 입력 필드만 추출
-            inputs = scraper.get_inputs()
-            print(f"{len(inputs)}개의 입력 요소를 찾았습니다.")
-            all_elements = [(input_field, 'input') for input_field in inputs]
-            
-        else:
-            # 모든 상호작용 요소 추출
-            interaction_elements = scraper.get_interaction_elements()
-            
-            # 요소 유형별로 처리
-            for category, elements in interaction_elements.items():
-                for element in elements:
-                    all_elements.append((element, category))
+        # OCR 일괄 요청으로 텍스트 인식
+        ocr_results = ocr_processor.detect_text_batch([image_bytes for _, image_bytes in prepared])
+        results_by_index = {index: texts for (index, _), texts in zip(prepared, ocr_results)}
+    
+    # 중복 이미지는 처음 본 이미지의 결과를 사용
+    for index, original_index in image_filter.duplicates.items():
+        results_by_index[index] = results_by_index.get(original_index, [])
+    ocr_results_list = [results_by_index.get(index, []) for index in range(len(targets))]
+    
+    updated = 0
+    for (i, _, element_info), ocr_results in zip(targets, ocr_results_list):
+        try:
+            # 버튼 텍스트인지 확인
+            button_texts = [result for result in ocr_results 
+                           if ocr_processor.is_button_text(result)]
             
-            print(f"총 {len(all_elements)}개의 상호작용 요소를 찾았습니다:")
-            print(f"- 버튼: {len(interaction_elements['button'])}개")
-            print(f"- 입력 필드: {len(interaction_elements['input'])}개")
-            print(f"- 체크박스/라디오 버튼: {len(interaction_elements['checkbox_radio'])}개")
-            print(f"- 선택 요소: {len(interaction_elements['select'])}개")
-        
-        elapsed_time = time.time() - start_time
-        print(f"요소 탐색 완료 (소요 시간: {elapsed_time:.2f}초)")
-        
-        if not all_elements:
-            print("상호작용 요소를 찾을 수 없습니다.")
-            return
+            # OCR 결과가 있으면 기존 텍스트 업데이트
+            if button_texts:
+                # 가장 큰 텍스트 사용 (버튼 레이블일 가능성이 높음)
+                best_text = max(button_texts, 
+                               key=lambda x: (x['bottom_right'][0] - x['top_left'][0]) * 
+                                           (x['bottom_right'][1] - x['top_left'][1]))
+                
+                if debug:
+                    old_text = element_info.get('text', '(없음)')
+                    new_text = best_text['text']
+                    if old_text != new_text:
+                        print(f"요소 {i+1} OCR 결과: '{old_text}' -> '{new_text}'")
+                
+                element_info['text'] = best_text['text']
+                element_info['ocr_data'] = button_texts
+                updated += 1
+        except Exception as e:
+            if debug:
+                print(f"요소 {i+1} OCR 처리 중 오류: {e}")
+    
+    return updated
+
+def write_page_template(output_dir: Path) -> Path:
+    """
+    생성된 페이지 오브젝트가 상속하는 PageTemplate 모듈을 출력 디렉토리에 복사 (내용이 같으면 쓰지 않음)
+    
+    Args:
+        output_dir: 출력 디렉토리
         
-        # 처리할 요소 수 제한 (지정된 경우)
-        if args.max_elements and len(all_elements) > args.max_elements:
-            print(f"요소가 너무 많습니다. 처음 {args.max_elements}개만 처리합니다.")
-            all_elements = all_elements[:args.max_elements]
+    Returns:
+        템플릿 모듈 파일 경로
+    """
+    output_file = output_dir / PAGE_TEMPLATE_MODULE
+    write_if_changed(output_file, Path(page_object_template.__file__).read_text(encoding='utf-8'))
+    return output_file
+
+def write_page_object(po_generator: PageObjectGenerator, url: str, elements: List[Dict[str, Any]],
+                      output_dir: Path, output_name: Optional[str] = None, manifest: Optional[Manifest] = None,
+                      fingerprint: Optional[str] = None) -> Tuple[Path, str]:
+    """
+    요소 정보로 페이지 오브젝트 코드를 생성하여 파일로 저장 (내용이 같으면 파일을 다시 쓰지 않음)
+    
+    Args:
+        po_generator: 페이지 오브젝트 생성기 인스턴스
+        url: 페이지 URL
+        elements: 요소 정보 딕셔너리 리스트
+        output_dir: 출력 디렉토리
+        output_name: 출력 파일 이름 (기본값: URL의 도메인명 기반)
+        manifest: 증분 재생성 매니페스트 (주어지면 바뀌지 않은 요소의 메서드 코드를 재사용하고 결과를 기록)
+        fingerprint: 매니페스트에 기록할 페이지 내용 지문
         
-        # 요소 정보 수집
-        element_info_list = []
-        skipped_elements = 0
-        non_text_elements = 0
+    Returns:
+        (생성된 파일 경로, 페이지 오브젝트 코드) 튜플
+    """
+    # URL에서 개행 문자 제거
+    clean_url = url.replace('\n', '').replace('\r', '')
+    output_name = output_name or page_module_name(clean_url)
+    
+    # 페이지 오브젝트 코드 생성 (증분 모드에서는 지문이 같은 요소의 메서드 코드 재사용)
+    method_cache = manifest.method_cache(output_name) if manifest is not None else None
+    po_code = po_generator.generate_page_object_class(clean_url, elements, method_cache)
+    
+    # 필요한 import 문 추가 (PageTemplate은 출력 디렉토리의 page_template.py, 패키지로 사용하면 상대 import)
+    imports = [
+        "from selenium.webdriver.common.by import By",
+        "",
+        "try:",
+        f"    from .{PAGE_TEMPLATE_MODULE[:-3]} import PageTemplate",
+        "except ImportError:",
+        f"    from {PAGE_TEMPLATE_MODULE[:-3]} import PageTemplate",
+        ""
+    ]
+    content = "\n".join(imports) + "\n" + po_code
+    
+    # 출력 파일 경로
+    output_file = output_dir / output_name
+    
+    # 파일에 저장 (기존 파일과 내용 해시가 같으면 쓰지 않음)
+    with po_generator.profiler.phase('write'):
+        written = write_if_changed(output_file, content)
+    if written:
+        print(f"페이지 오브젝트 클래스가 {output_file}에 생성되었습니다.")
+    else:
+        print(f"페이지 오브젝트 클래스 {output_file}의 내용이 같아 파일을 다시 쓰지 않았습니다.")
+    
+    if manifest is not None:
+        manifest.update(output_name, clean_url, fingerprint, elements, method_cache, content)
+    
+    return output_file, po_code
+
+def process_page(scraper, url: str, args, ocr_processor: Optional[OCRProcessor], po_generator: PageObjectGenerator,
+                 output_dir: Path, output_name: Optional[str] = None, navigate: bool = True,
+                 snapshot: Optional[SnapshotWriter] = None, manifest: Optional[Manifest] = None,
+                 profiler: Optional[Profiler] = None) -> Optional[Path]:
+    """
+    한 페이지에서 상호작용 요소를 추출하여 페이지 오브젝트 모듈 생성
+    
+    Args:
+        scraper: WebScraper 또는 StaticScraper 인스턴스
+        url: 페이지 오브젝트를 생성할 웹페이지 URL
+        args: 명령줄 인수
+        ocr_processor: OCR 프로세서 인스턴스 (--no-ocr이면 None)
+        po_generator: 페이지 오브젝트 생성기 인스턴스
+        output_dir: 출력 디렉토리
+        output_name: 출력 파일 이름 (기본값: URL의 도메인명 기반)
+        navigate: False면 이미 로드된 현재 페이지를 사용 (탭 스케줄링용)
+        snapshot: 요소 정보를 저장할 스냅샷 파일 (없으면 저장하지 않음)
+        manifest: 증분 재생성 매니페스트 (없으면 항상 전체 처리)
+        profiler: 페이지 처리 단계 시간을 기록할 프로파일러 (기본값: 기록하지 않음)
         
-        print(f"요소 정보 추출 중... (최대 {len(all_elements)}개)")
-        for i, (element, category) in enumerate(all_elements):
-            try:
-                # 중간 진행 상황 표시
-                if (i+1) % 10 == 0:
-                    print(f"진행 중: {i+1}/{len(all_elements)}개 처리됨")
-                
-                # 요소 정보 추출
-                element_info = scraper.get_element_info(element)
-                
-                # 카테고리 설정
-                element_info['element_category'] = category
-                
-                # 요소가 화면에 표시되지 않으면 건너뜀
-                if not element_info.get('is_displayed', False):
-                    if args.debug:
-                        print(f"요소 {i+1}: 화면에 표시되지 않음 (건너뜀)")
-                    skipped_elements += 1
-                    continue
-                
-                # OCR이 비활성화되지 않고 버튼이면 OCR 수행
-                if not args.no_ocr and category == 'button' and (not element_info.get('text') or args.debug):
-                    try:
-                        # 버튼 스크린샷 캡처
-                        element_screenshot = scraper.capture_element_screenshot(element)
-                        
-                        # OCR로 텍스트 인식
-                        ocr_results = ocr_processor.detect_text(element_screenshot)
-                        
-                        # 버튼 텍스트인지 확인
-                        button_texts = [result for result in ocr_results 
-                                       if ocr_processor.is_button_text(result)]
-                        
-                        # OCR 결과가 있으면 기존 텍스트 업데이트
-                        if button_texts:
-                            # 가장 큰 텍스트 사용 (버튼 레이블일 가능성이 높음)
-                            best_text = max(button_texts, 
-                                           key=lambda x: (x['bottom_right'][0] - x['top_left'][0]) * 
-                                                       (x['bottom_right'][1] - x['top_left'][1]))
-                            
-                            if args.debug:
-                                old_text = element_info.get('text', '(없음)')
-                                new_text = best_text['text']
-                                if old_text != new_text:
-                                    print(f"요소 {i+1} OCR 결과: '{old_text}' -> '{new_text}'")
-                            
-                            element_info['text'] = best_text['text']
-                            element_info['ocr_data'] = button_texts
-                    except Exception as e:
-                        if args.debug:
-                            print(f"요소 {i+1} OCR 처리 중 오류: {e}")
-                
-                # 인덱스 추가 (CSS 선택자용)
-                element_info['index'] = i + 1
-                
-                # 텍스트가 있거나 --text-only 옵션이 비활성화된 경우 추가
-                has_text = bool(element_info.get('text', '').strip())
-                
-                if has_text or not args.text_only:
-                    # 자동 생성 요소 이름 설정 (텍스트가 없는 경우)
-                    if not has_text and category != 'input':  # 입력 필드는 placeholder 등이 있으므로 제외
-                        # 태그와 ID 또는 클래스 기반으로 자동 이름 생성
-                        tag = element_info.get('tag_name', 'element')
-                        element_id = element_info.get('id', '')
-                        element_class = element_info.get('class', '').split()[0] if element_info.get('class') else ''
-                        element_type = element_info.get('type', '')
-                        element_name = element_info.get('name', '')
-                        element_placeholder = element_info.get('placeholder', '')
-                        href = element_info.get('href', '')
-                        
-                        # 가장 구체적인 정보 사용
-                        if element_placeholder:
-                            auto_name = element_placeholder
-                        elif element_id:
-                            auto_name = f"{tag}_{element_id}"
-                        elif element_name:
-                            auto_name = f"{tag}_{element_name}"
-                        elif element_class:
-                            auto_name = f"{tag}_{element_class}"
-                        elif element_type:
-                            auto_name = f"{tag}_{element_type}"
-                        elif href:
-                            # URL에서 의미 있는 부분 추출하고 개행 문자 제거
-                            href = href.replace('\n', '').replace('\r', '')
-                            url_part = href.split('/')[-1].split('?')[0]
-                            if url_part:
-                                auto_name = f"{tag}_{url_part}"
-                            else:
-                                auto_name = f"{tag}_{i+1}"
+    Returns:
+        생성된 파일 경로 (생성할 요소가 없으면 None)
+    """
+    profiler = profiler if profiler is not None else Profiler(enabled=False)
+    with profiler.phase('page'):
+        return _process_page(scraper, url, args, ocr_processor, po_generator, output_dir, output_name, navigate,
+                             snapshot, manifest, profiler)
+
+def _process_page(scraper, url: str, args, ocr_processor: Optional[OCRProcessor], po_generator: PageObjectGenerator,
+                  output_dir: Path, output_name: Optional[str], navigate: bool, snapshot: Optional[SnapshotWriter],
+                  manifest: Optional[Manifest], profiler: Profiler) -> Optional[Path]:
+    """process_page의 처리 본체"""
+    # 이 페이지를 처리하는 동안 실행한 WebDriver 명령 수 (같은 스레드의 누적 값 차이)
+    tracer = getattr(scraper, 'tracer', None)
+    commands_before = tracer.thread_totals() if tracer is not None else None
+    
+    # URL로 이동
+    if navigate and not scraper.navigate_to(url):
+        raise RuntimeError(f"URL '{url}'로 이동할 수 없습니다.")
+    
+    # 증분 모드: 이전 실행과 내용 지문이 같은 페이지는 요소 탐색과 OCR 전에 건너뜀
+    # (스냅샷을 저장할 때는 모든 페이지의 요소 정보가 필요하므로 건너뛰지 않음)
+    fingerprint = None
+    if manifest is not None:
+        output_name = output_name or page_module_name(url.replace('\n', '').replace('\r', ''))
+        fingerprint = dom_fingerprint(scraper.get_page_signature(include_content=True))
+        if snapshot is None and manifest.is_unchanged(output_name, fingerprint, output_dir):
+            print(f"'{url}' 페이지의 내용이 이전 실행과 같아 건너뜁니다.")
+            return output_dir / output_name
+    
+    # 타임아웃 설정
+    print(f"상호작용 요소 검색을 시작합니다. 최대 {args.timeout}초 대기 중...")
+    
+    # 어떤 요소를 추출할지 결정
+    if args.buttons_only:
+        categories = ['button']
+    elif args.inputs_only:
+        categories = ['input']
+    else:
+        categories = None  # 모든 상호작용 요소
+    
+    # 한 번의 브라우저 내 탐색으로 후보 요소 수집 (요소별로 일치한 유형 목록 포함)
+    with profiler.phase('search') as search_timer:
+        candidates = scraper.collect_candidates(categories)
+    category_counts = {}
+    for _, element_categories in candidates:
+        for category in element_categories:
+            category_counts[category] = category_counts.get(category, 0) + 1
+    
+    if args.buttons_only:
+        print(f"{category_counts.get('button', 0)}개의 버튼 요소를 찾았습니다.")
+    elif args.inputs_only:
+        print(f"{category_counts.get('input', 0)}개의 입력 요소를 찾았습니다.")
+    else:
+        print(f"총 {sum(category_counts.values())}개의 상호작용 요소를 찾았습니다 (고유 요소 {len(candidates)}개):")
+        print(f"- 버튼: {category_counts.get('button', 0)}개")
+        print(f"- 입력 필드: {category_counts.get('input', 0)}개")
+        print(f"- 체크박스/라디오 버튼: {category_counts.get('checkbox_radio', 0)}개")
+        print(f"- 선택 요소: {category_counts.get('select', 0)}개")
+    
+    print(f"요소 탐색 완료 (소요 시간: {search_timer.wall:.2f}초)")
+    
+    if not candidates:
+        print("상호작용 요소를 찾을 수 없습니다.")
+        return None
+    
+    # 처리할 요소 수 제한 (지정된 경우)
+    if args.max_elements and len(candidates) > args.max_elements:
+        print(f"요소가 너무 많습니다. 처음 {args.max_elements}개만 처리합니다.")
+        candidates = candidates[:args.max_elements]
+    
+    # 요소 생존 및 표시 여부 일괄 확인 (요소마다 대기하지 않음)
+    total_elements = len(candidates)
+    element_states = scraper.check_elements([element for element, _ in candidates])
+    stale_elements = sum(1 for state in element_states if not state['alive'])
+    skipped_elements = sum(1 for state in element_states if state['alive'] and not state['displayed'])
+    candidates = [candidate for candidate, state in zip(candidates, element_states) if state['displayed']]
+    
+    if args.debug and (stale_elements or skipped_elements):
+        print(f"더 이상 존재하지 않는 요소 {stale_elements}개, 화면에 표시되지 않는 요소 {skipped_elements}개를 제외합니다.")
+    
+    # 요소 정보 수집
+    element_info_list = []
+    element_references = []
+    non_text_elements = 0
+    
+    print(f"요소 정보 추출 중... (최대 {len(candidates)}개)")
+    
+    # 요소 정보 일괄 추출 (한 번의 스크립트 실행으로 모든 요소 처리)
+    bulk_element_info = scraper.get_elements_info([element for element, _ in candidates])
+    
+    # 요소가 일치한 유형마다 하나씩 처리 (정보는 한 번만 추출)
+    all_elements = []
+    for (element, element_categories), info in zip(candidates, bulk_element_info):
+        for category in element_categories:
+            all_elements.append((element, category, dict(info)))
+    
+    # OCR이 비활성화되지 않았으면 텍스트가 없는 버튼에 OCR 일괄 수행
+    image_filter = ImageFilter()
+    if not args.no_ocr:
+        with profiler.phase('ocr'):
+            apply_ocr(scraper, ocr_processor, all_elements, args.debug, args.ocr_workers, image_filter)
+    
+    for i, (element, category, element_info) in enumerate(all_elements):
+        try:
+            # 중간 진행 상황 표시
+            if (i+1) % 10 == 0:
+                print(f"진행 중: {i+1}/{len(all_elements)}개 처리됨")
+            
+            # 카테고리 설정
+            element_info['element_category'] = category
+            
+            # 요소가 화면에 표시되지 않으면 건너뜀
+            if not element_info.get('is_displayed', False):
+                if args.debug:
+                    print(f"요소 {i+1}: 화면에 표시되지 않음 (건너뜀)")
+                skipped_elements += 1
+                continue
+            
+            # 인덱스 추가 (CSS 선택자용)
+            element_info['index'] = i + 1
+            
+            # 텍스트가 있거나 --text-only 옵션이 비활성화된 경우 추가
+            has_text = bool(element_info.get('text', '').strip())
+            
+            if has_text or not args.text_only:
+                # 자동 생성 요소 이름 설정 (텍스트가 없는 경우)
+                if not has_text and category != 'input':  # 입력 필드는 placeholder 등이 있으므로 제외
+                    # 태그와 ID 또는 클래스 기반으로 자동 이름 생성
+                    tag = element_info.get('tag_name', 'element')
+                    element_id = element_info.get('id', '')
+                    element_class = element_info.get('class', '').split()[0] if element_info.get('class') else ''
+                    element_type = element_info.get('type', '')
+                    element_name = element_info.get('name', '')
+                    element_placeholder = element_info.get('placeholder', '')
+                    href = element_info.get('href', '')
+                    
+                    # 가장 구체적인 정보 사용
+                    if element_placeholder:
+                        auto_name = element_placeholder
+                    elif element_id:
+                        auto_name = f"{tag}_{element_id}"
+                    elif element_name:
+                        auto_name = f"{tag}_{element_name}"
+                    elif element_class:
+                        auto_name = f"{tag}_{element_class}"
+                    elif element_type:
+                        auto_name = f"{tag}_{element_type}"
+                    elif href:
+                        # URL에서 의미 있는 부분 추출하고 개행 문자 제거
+                        href = href.replace('\n', '').replace('\r', '')
+                        url_part = href.split('/')[-1].split('?')[0]
+                        if url_part:
+                            auto_name = f"{tag}_{url_part}"
                         else:
                             auto_name = f"{tag}_{i+1}"
-                        
-                        # 특수문자 제거
-                        import re
-                        auto_name = re.sub(r'[^\w\s]', '_', auto_name)
-                        auto_name = re.sub(r'_+', '_', auto_name)  # 연속된 언더스코어 하나로
-                        auto_name = auto_name[:100]  # 이름이 너무 길어지지 않도록 제한
-                        
-                        element_info['text'] = auto_name
-                    
-                    # 디버그 모드에서 요소 정보 추가 출력
-                    if args.debug:
-                        tag = element_info.get('tag_name', '?')
-                        cls = element_info.get('class', '').split()[0] if element_info.get('class') else ''
-                        id_attr = element_info.get('id', '')
-                        name_attr = element_info.get('name', '')
-                        type_attr = element_info.get('type', '')
-                        placeholder = element_info.get('placeholder', '')
-                        
-                        id_info = f" id='{id_attr}'" if id_attr else ''
-                        class_info = f" class='{cls}...'" if cls else ''
-                        name_info = f" name='{name_attr}'" if name_attr else ''
-                        type_info = f" type='{type_attr}'" if type_attr else ''
-                        placeholder_info = f" placeholder='{placeholder}'" if placeholder else ''
-                        
-                        element_desc = f"<{tag}{id_info}{class_info}{name_info}{type_info}{placeholder_info}>"
-                        text = element_info.get('text', '(텍스트 없음)')
-                        category_text = f"[{category}]"
-                        
-                        print(f"요소 {i+1}: {category_text} {element_desc} {text}")
                     else:
-                        category_text = f"[{category}]"
-                        text = element_info.get('text', '(텍스트 없음)')
-                        print(f"요소 {i+1}: {category_text} {text}")
+                        auto_name = f"{tag}_{i+1}"
                     
-                    element_info_list.append(element_info)
+                    # 특수문자 제거
+                    import re
+                    auto_name = re.sub(r'[^\w\s]', '_', auto_name)
+                    auto_name = re.sub(r'_+', '_', auto_name)  # 연속된 언더스코어 하나로
+                    auto_name = auto_name[:100]  # 이름이 너무 길어지지 않도록 제한
+                    
+                    element_info['text'] = auto_name
+                
+                # 디버그 모드에서 요소 정보 추가 출력
+                if args.debug:
+                    tag = element_info.get('tag_name', '?')
+                    cls = element_info.get('class', '').split()[0] if element_info.get('class') else ''
+                    id_attr = element_info.get('id', '')
+                    name_attr = element_info.get('name', '')
+                    type_attr = element_info.get('type', '')
+                    placeholder = element_info.get('placeholder', '')
+                    
+                    id_info = f" id='{id_attr}'" if id_attr else ''
+                    class_info = f" class='{cls}...'" if cls else ''
+                    name_info = f" name='{name_attr}'" if name_attr else ''
+                    type_info = f" type='{type_attr}'" if type_attr else ''
+                    placeholder_info = f" placeholder='{placeholder}'" if placeholder else ''
+                    
+                    element_desc = f"<{tag}{id_info}{class_info}{name_info}{type_info}{placeholder_info}>"
+                    text = element_info.get('text', '(텍스트 없음)')
+                    category_text = f"[{category}]"
+                    
+                    print(f"요소 {i+1}: {category_text} {element_desc} {text}")
                 else:
-                    if args.debug:
-                        print(f"요소 {i+1}: 텍스트 없음 (건너뜀)")
-                    non_text_elements += 1
+                    category_text = f"[{category}]"
+                    text = element_info.get('text', '(텍스트 없음)')
+                    print(f"요소 {i+1}: {category_text} {text}")
                 
-            except Exception as e:
-                print(f"요소 {i+1} 처리 중 오류: {e}")
+                element_info_list.append(element_info)
+                element_references.append(element)
+            else:
+                if args.debug:
+                    print(f"요소 {i+1}: 텍스트 없음 (건너뜀)")
+                non_text_elements += 1
+            
+        except Exception as e:
+            print(f"요소 {i+1} 처리 중 오류: {e}")
+    
+    # 페이지의 속성 값 빈도 색인으로 로케이터 후보의 견고성 점수를 매기고,
+    # 후보를 한 번의 스크립트 실행으로 검사하여 요소 하나에만 일치하는 점수가 가장 높은 로케이터 선택
+    ambiguous_elements = []
+    if element_info_list:
+        with profiler.phase('locators'):
+            attribute_index = AttributeIndex()
+            attribute_index.add_page(element_info_list)
+            if args.no_locator_check:
+                choose_locators(element_info_list, attribute_index)
+            else:
+                ambiguous_elements = validate_locators(scraper, element_info_list, element_references,
+                                                       attribute_index)
+    
+    profiler.add('elements.candidates', total_elements)
+    profiler.add('elements.valid', len(element_info_list))
+    
+    # 요약 정보 출력
+    print(f"\n처리 결과 요약:")
+    print(f"- 총 요소 수: {total_elements}")
+    print(f"- 더 이상 존재하지 않아(stale) 건너뛴 요소: {stale_elements}")
+    print(f"- 화면에 표시되지 않아 건너뛴 요소: {skipped_elements}")
+    print(f"- 텍스트가 없어 건너뛴 요소: {non_text_elements}")
+    print(f"- 유효한 요소: {len(element_info_list)}")
+    if not args.no_locator_check:
+        print(f"- 고유하지 않은 로케이터: {len(ambiguous_elements)}")
+        for element_info in ambiguous_elements:
+            text = element_info.get('text') or element_info.get('name') or element_info.get('tag_name') or ''
+            text = ' '.join(text.split())[:40]
+            print(f"  * [{element_info.get('element_category')}] {text}: {describe_locator(element_info)}")
+    
+    if not args.no_ocr:
+        print(f"- OCR 백엔드: {ocr_processor.backend.name}")
+        filter_stats = image_filter.stats()
+        skipped_detail = ', '.join(f"{label} {filter_stats[reason]}" for reason, label in SKIP_REASONS)
+        print(f"- OCR 이미지: 전송 {filter_stats['sent']}개, 건너뜀 {filter_stats['skipped']}개 ({skipped_detail})")
+        if isinstance(ocr_processor.backend, RateLimitedBackend):
+            request_stats = ocr_processor.backend.stats()
+            errors = ', '.join(f"{kind} {count}" for kind, count in sorted(request_stats['errors'].items())) or '없음'
+            print(f"- OCR 요청: {request_stats['requests']}회 (재시도 {request_stats['retries']}회, "
+                  f"실패한 이미지 {request_stats['failed_images']}개, 오류: {errors})")
+        print(f"- OCR 전송 크기: {filter_stats['bytes_out'] / 1024:.1f}KB (원본 {filter_stats['bytes_in'] / 1024:.1f}KB)")
+    if ocr_processor is not None and ocr_processor.cache is not None:
+        cache_stats = ocr_processor.cache.stats()
+        print(f"- OCR 캐시: 적중 {cache_stats['hits']}회, 미스 {cache_stats['misses']}회, "
+              f"삭제 {cache_stats['evictions']}회 (저장된 결과 {cache_stats['entries']}개)")
+    
+    if tracer is not None:
+        commands = {key: value - commands_before[key] for key, value in tracer.thread_totals().items()}
+        print(f"- WebDriver 명령: {commands['calls']}회 (왕복 {commands['time']:.2f}초, "
+              f"요청 {commands['request_bytes'] / 1024:.1f}KB, 응답 {commands['response_bytes'] / 1024:.1f}KB, "
+              f"실패 {commands['errors']}회)")
+    
+    startup_info = getattr(scraper, 'startup_info', None)
+    if startup_info:
+        print(f"- 드라이버 확인: {startup_info['resolve_time']:.2f}초 ({startup_info['driver_source']}: {startup_info['driver_path']})")
+        print(f"- 브라우저 시작: {startup_info['launch_time']:.2f}초")
+    
+    # 페이지 오브젝트 클래스 생성
+    if element_info_list:
+        print(f"{len(element_info_list)}개의 유효한 요소로 페이지 오브젝트 생성 중...")
         
-        # 요약 정보 출력
-        if args.debug:
-            print(f"\n처리 결과 요약:")
-            print(f"- 총 요소 수: {len(all_elements)}")
-            print(f"- 화면에 표시되지 않아 건너뛴 요소: {skipped_elements}")
-            print(f"- 텍스트가 없어 건너뛴 요소: {non_text_elements}")
-            print(f"- 유효한 요소: {len(element_info_list)}")
+        # 브라우저 없이 다시 생성할 수 있도록 생성기 입력을 스냅샷에 저장
+        if snapshot is not None:
+            with profiler.phase('snapshot'):
+                snapshot.write_page(url.replace('\n', '').replace('\r', ''), element_info_list, output_name)
         
-        # 페이지 오브젝트 클래스 생성
-        if element_info_list:
-            print(f"{len(element_info_list)}개의 유효한 요소로 페이지 오브젝트 생성 중...")
-            
-            # 페이지 이름 생성 (URL에서 도메인명 추출)
-            from urllib.parse import urlparse
-            # URL에서 개행 문자 제거
-            clean_url = args.url.replace('\n', '').replace('\r', '')
-            domain = urlparse(clean_url).netloc.replace(".", "_").replace("-", "_")
+        output_file, po_code = write_page_object(po_generator, url, element_info_list, output_dir, output_name,
+                                                 manifest, fingerprint)
+        
+        # 생성된 메서드 이름 목록 출력
+        if args.debug:
+            import re
+            methods = re.findall(r'def\s+(\w+)\(self', po_code)
+            methods = [m for m in methods if m != 'navigate' and m != '__init__']  # 기본 메서드 제외
             
-            # 페이지 오브젝트 코드 생성
-            po_code = po_generator.generate_page_object_class(clean_url, element_info_list)
+            # 메서드 유형 분류
+            click_methods = [m for m in methods if m.startswith('click_')]
+            enter_methods = [m for m in methods if m.startswith('enter_')]
+            select_methods = [m for m in methods if m.startswith('select_')]
             
-            # 출력 파일 경로
-            output_file = output_dir / f"{domain}_page.py"
+            print("\n생성된 메서드 목록:")
+            if click_methods:
+                print(f"\n버튼 메서드 ({len(click_methods)}개):")
+                for i, method in enumerate(click_methods):
+                    print(f"{i+1}. {method}")
             
-            # 파일에 저장
-            with open(output_file, 'w', encoding='utf-8') as f:
-                # 필요한 import 문 추가
-                imports = [
-                    "from selenium.webdriver.common.by import By",
-                    "from selenium.webdriver.support.ui import WebDriverWait",
-                    "from selenium.webdriver.support import expected_conditions as EC",
-                    ""
-                ]
-                f.write("\n".join(imports) + "\n" + po_code)
+            if enter_methods:
+                print(f"\n입력 필드 메서드 ({len(enter_methods)}개):")
+                for i, method in enumerate(enter_methods):
+                    print(f"{i+1}. {method}")
             
-            print(f"페이지 오브젝트 클래스가 {output_file}에 생성되었습니다.")
+            if select_methods:
+                print(f"\n선택 요소 메서드 ({len(select_methods)}개):")
+                for i, method in enumerate(select_methods):
+                    print(f"{i+1}. {method}")
             
-            # 생성된 메서드 이름 목록 출력
-            if args.debug:
-                import re
-                methods = re.findall(r'def\s+(\w+)\(self', po_code)
-                methods = [m for m in methods if m != 'navigate' and m != '__init__']  # 기본 메서드 제외
-                
-                # 메서드 유형 분류
-                click_methods = [m for m in methods if m.startswith('click_')]
-                enter_methods = [m for m in methods if m.startswith('enter_')]
-                select_methods = [m for m in methods if m.startswith('select_')]
-                
-                print("\n생성된 메서드 목록:")
-                if click_methods:
-                    print(f"\n버튼 메서드 ({len(click_methods)}개):")
-                    for i, method in enumerate(click_methods):
-                        print(f"{i+1}. {method}")
-                
-                if enter_methods:
-                    print(f"\n입력 필드 메서드 ({len(enter_methods)}개):")
-                    for i, method in enumerate(enter_methods):
-                        print(f"{i+1}. {method}")
-                
-                if select_methods:
-                    print(f"\n선택 요소 메서드 ({len(select_methods)}개):")
-                    for i, method in enumerate(select_methods):
-                        print(f"{i+1}. {method}")
-                
+        
+        return output_file
+    
+    else:
+        print("유효한 상호작용 요소를 찾을 수 없습니다.")
+        return None
+
+
+def run_batch(urls: List[str], args, ocr_processor: Optional[OCRProcessor], po_generator: PageObjectGenerator,
+              output_dir: Path, snapshot: Optional[SnapshotWriter] = None,
+              manifest: Optional[Manifest] = None, profiler: Optional[Profiler] = None,
+              tracer: Optional[CommandTracer] = None) -> List[Dict[str, Any]]:
+    """
+    여러 URL을 재사용되는 스크래퍼 풀로 동시에 처리
+    
+    Args:
+        urls: 처리할 URL 리스트
+        args: 명령줄 인수
+        ocr_processor: OCR 프로세서 인스턴스 (--no-ocr이면 None)
+        po_generator: 페이지 오브젝트 생성기 인스턴스
+        output_dir: 출력 디렉토리
+        snapshot: 요소 정보를 저장할 스냅샷 파일 (없으면 저장하지 않음)
+        manifest: 증분 재생성 매니페스트 (없으면 모든 페이지를 처리)
+        profiler: 스크래퍼와 페이지 처리 단계 시간을 기록할 프로파일러 (기본값: 기록하지 않음)
+        tracer: 모든 스크래퍼의 WebDriver 명령을 기록할 추적기 (기본값: 추적하지 않음)
+        
+    Returns:
+        URL별 처리 결과 리스트 (입력 순서)
+    """
+    # URL별 출력 파일 이름 (이름이 겹치면 번호를 붙여 구분)
+    output_names = assign_output_names(urls, set())
+    
+    def process_url(scraper, url):
+        return process_page(scraper, url, args, ocr_processor, po_generator, output_dir, output_names[url],
+                            snapshot=snapshot, manifest=manifest, profiler=profiler)
+    
+    def process_loaded_tab(scraper, url):
+        # 탭 스케줄러가 현재 탭에 페이지를 이미 로드한 상태
+        return process_page(scraper, url, args, ocr_processor, po_generator, output_dir, output_names[url],
+                            navigate=False, snapshot=snapshot, manifest=manifest, profiler=profiler)
+    
+    with ScraperPool(lambda: create_scraper(args, profiler, tracer), args.workers) as pool:
+        if args.tabs > 1 and args.engine == 'selenium':
+            results = pool.map_tabs(process_loaded_tab, urls, args.tabs)
         else:
-            print("유효한 상호작용 요소를 찾을 수 없습니다.")
+            results = pool.map(process_url, urls)
     
-    except Exception as e:
-        print(f"오류 발생: {e}")
-        if args.debug:
-            import traceback
-            traceback.print_exc()
+    print(f"\n일괄 처리 결과 요약 (작업자 {args.workers}개, 작업자당 탭 {args.tabs}개):")
+    print(f"- 총 URL 수: {len(results)}")
+    print(f"- 생성 성공: {sum(1 for result in results if result['status'] == 'success')}")
+    print(f"- 생성할 요소 없음: {sum(1 for result in results if result['status'] == 'empty')}")
+    print(f"- 실패: {sum(1 for result in results if result['status'] == 'error')}")
+    for result in results:
+        if result['status'] == 'error':
+            print(f"  * {result['url']}: {result['error']}")
+    
+    return results
+
+def run_crawl(start_url: str, args, ocr_processor: Optional[OCRProcessor], po_generator: PageObjectGenerator,
+              output_dir: Path, snapshot: Optional[SnapshotWriter] = None,
+              manifest: Optional[Manifest] = None, profiler: Optional[Profiler] = None,
+              tracer: Optional[CommandTracer] = None) -> List[Dict[str, Any]]:
+    """
+    시작 URL(또는 sitemap.xml)에서 같은 출처의 링크를 따라가며 구조가 다른 페이지마다 페이지 오브젝트 생성
+    
+    Args:
+        start_url: 시작 URL 또는 sitemap.xml URL
+        args: 명령줄 인수
+        ocr_processor: OCR 프로세서 인스턴스 (--no-ocr이면 None)
+        po_generator: 페이지 오브젝트 생성기 인스턴스
+        output_dir: 출력 디렉토리
+        snapshot: 요소 정보를 저장할 스냅샷 파일 (없으면 저장하지 않음)
+        manifest: 증분 재생성 매니페스트 (없으면 모든 페이지를 처리)
+        profiler: 스크래퍼와 페이지 처리 단계 시간을 기록할 프로파일러 (기본값: 기록하지 않음)
+        tracer: 모든 스크래퍼의 WebDriver 명령을 기록할 추적기 (기본값: 추적하지 않음)
+        
+    Returns:
+        방문한 URL별 처리 결과 리스트 (방문 순서)
+    """
+    if urlparse(start_url).path.lower().endswith('.xml'):
+        seeds = read_sitemap(start_url)
+        print(f"sitemap에서 URL {len(seeds)}개를 읽었습니다.")
+    else:
+        seeds = [start_url]
+    
+    # 출력 파일 이름은 깊이마다 작업자에게 나누어 주기 전에 발견 순서대로 정함
+    # (작업자 완료 순서에 따라 번호가 바뀌면 증분 재생성 매니페스트와 맞지 않음)
+    output_names = {}
+    used_names = set()
+    
+    def name_level(urls):
+        output_names.update(assign_output_names(urls, used_names))
+    
+    def process_loaded_page(scraper, url):
+        # 크롤러가 현재 페이지를 이미 로드한 상태
+        return process_page(scraper, url, args, ocr_processor, po_generator, output_dir, output_names[url],
+                            navigate=False, snapshot=snapshot, manifest=manifest, profiler=profiler)
+    
+    tabs = args.tabs if args.engine == 'selenium' else 1
+    with ScraperPool(lambda: create_scraper(args, profiler, tracer), args.workers) as pool:
+        crawler = SiteCrawler(pool, seeds, max_depth=args.max_depth, max_pages=args.max_pages, tabs=tabs)
+        results = crawler.crawl(process_loaded_page, before_level=name_level)
+    
+    print(f"\n크롤링 결과 요약 (최대 깊이 {args.max_depth}, 최대 페이지 {args.max_pages}, 작업자 {args.workers}개):")
+    print(f"- 방문한 페이지 수: {len(results)} (최대 깊이 {max((result['depth'] for result in results), default=0)})")
+    print(f"- 생성 성공: {sum(1 for result in results if result['status'] == 'success')}")
+    print(f"- 구조가 같은 페이지 (건너뜀): {sum(1 for result in results if result['status'] == 'duplicate')}")
+    print(f"- 생성할 요소 없음: {sum(1 for result in results if result['status'] == 'empty')}")
+    print(f"- 실패: {sum(1 for result in results if result['status'] == 'error')}")
+    for result in results:
+        if result['status'] == 'error':
+            print(f"  * {result['url']}: {result['error']}")
     
+    return results
+
+def run_from_snapshot(path: str, po_generator: PageObjectGenerator, output_dir: Path) -> List[Path]:
+    """
+    스냅샷 파일의 페이지별 요소 정보로 페이지 오브젝트 코드를 다시 생성 (브라우저 미사용)
+    
+    Args:
+        path: 스냅샷 파일 경로
+        po_generator: 페이지 오브젝트 생성기 인스턴스 (생성기의 프로파일러에 단계 시간 기록)
+        output_dir: 출력 디렉토리
+        
+    Returns:
+        생성된 파일 경로 리스트
+    """
+    output_files = []
+    with po_generator.profiler.phase('from_snapshot') as timer:
+        pages = [page for page in read_snapshot(path) if page['elements']]
+        
+        # 로케이터를 검사하지 않은 요소는 스냅샷 전체 페이지의 속성 값 빈도 색인으로 로케이터 선택
+        # (숫자만 다른 값이 여러 페이지에 나타나면 페이지마다 바뀌는 값으로 보고 점수를 낮춤)
+        attribute_index = AttributeIndex()
+        for page in pages:
+            attribute_index.add_page(page['elements'], current=False)
+        
+        for page in pages:
+            attribute_index.use_page(page['elements'])
+            choose_locators(page['elements'], attribute_index)
+            output_file, _ = write_page_object(po_generator, page['url'], page['elements'], output_dir,
+                                               page.get('output_name'))
+            output_files.append(output_file)
+    
+    print(f"\n스냅샷에서 페이지 오브젝트 {len(output_files)}개를 {timer.wall:.2f}초 만에 생성했습니다.")
+    return output_files
+
+def run(args, profiler: Profiler, tracer: Optional[CommandTracer] = None):
+    """
+    명령줄 인수에 따라 페이지 오브젝트 생성 실행
+    
+    Args:
+        args: 명령줄 인수
+        profiler: 단계 시간을 기록할 프로파일러
+        tracer: WebDriver 명령을 기록할 추적기 (없으면 추적하지 않음)
+    """
+    # 출력 디렉토리 생성
+    output_dir = Path(args.output)
+    output_dir.mkdir(exist_ok=True)
+    write_page_template(output_dir)
+    
+    # 페이지 오브젝트 생성기 인스턴스 생성
+    po_generator = PageObjectGenerator(profiler=profiler)
+    
+    # 스냅샷에서 코드만 다시 생성 (브라우저와 OCR 미사용)
+    if args.from_snapshot:
+        run_from_snapshot(args.from_snapshot, po_generator, output_dir)
+        return
+    
+    # 정적 엔진은 화면을 렌더링하지 않으므로 OCR을 사용할 수 없음
+    if args.engine == 'static':
+        args.no_ocr = True
+    
+    # OCR 프로세서 인스턴스 생성 (같은 이미지의 OCR 결과는 디스크 캐시에서 재사용)
+    # OCR을 사용하지 않으면 백엔드를 만들지 않음 (인증 정보가 잘못되어도 실행에 영향 없음)
+    ocr_processor = None
+    if not args.no_ocr:
+        ocr_cache = None if args.no_ocr_cache else OCRCache()
+        ocr_backend = create_backend(args.ocr_backend)
+        if ocr_backend.remote:
+            # 원격 OCR 요청은 속도 제한과 재시도를 적용하여 동시에 실행
+            ocr_backend = RateLimitedBackend(ocr_backend, concurrency=args.ocr_concurrency, rate=args.ocr_rate,
+                                             time_budget=args.ocr_budget)
+        ocr_processor = OCRProcessor(cache=ocr_cache, backend=ocr_backend, profiler=profiler)
+    
+    # 생성기 입력을 저장할 스냅샷 파일
+    snapshot = SnapshotWriter(args.save_snapshot) if args.save_snapshot else None
+    
+    # 증분 재생성 매니페스트 (생성되는 코드에 영향을 주는 옵션이 바뀌면 전체 재생성)
+    manifest = None
+    if args.incremental:
+        manifest = Manifest(output_dir, options={
+            'engine': args.engine,
+            'no_ocr': args.no_ocr,
+            'ocr_backend': ocr_processor.backend.name if ocr_processor is not None else None,
+            'max_elements': args.max_elements,
+            'text_only': args.text_only,
+            'buttons_only': args.buttons_only,
+            'inputs_only': args.inputs_only,
+            'no_locator_check': args.no_locator_check,
+            'debug': args.debug,  # 디버그 모드에서는 텍스트가 있는 버튼도 OCR 결과로 바뀜
+        })
+    
+    try:
+        # 사이트 크롤링
+        if args.crawl:
+            run_crawl(args.crawl, args, ocr_processor, po_generator, output_dir, snapshot, manifest, profiler,
+                      tracer)
+            return
+        
+        # 여러 URL 일괄 처리
+        if args.urls_file:
+            urls = read_urls_file(args.urls_file)
+            print(f"'{args.urls_file}'의 URL {len(urls)}개를 작업자 {args.workers}개로 처리합니다.")
+            run_batch(urls, args, ocr_processor, po_generator, output_dir, snapshot, manifest, profiler, tracer)
+            return
+        
+        print(f"URL '{args.url}'에서 상호작용 요소 추출 중...")
+        
+        # 웹 스크래퍼 인스턴스 생성
+        with profiler.phase('startup'):
+            scraper = create_scraper(args, profiler, tracer)
+        
+        try:
+            process_page(scraper, args.url, args, ocr_processor, po_generator, output_dir, snapshot=snapshot,
+                         manifest=manifest, profiler=profiler)
+        
+        except Exception as e:
+            print(f"오류 발생: {e}")
+            if args.debug:
+                import traceback
+                traceback.print_exc()
+        
+        finally:
+            scraper.close()
+    
+    finally:
+        # OCR 캐시에 모아 둔 사용 시각 기록
+        if ocr_processor is not None and ocr_processor.cache is not None:
+            ocr_processor.cache.close()
+        if snapshot is not None:
+            snapshot.close()
+            print(f"요소 스냅샷 {snapshot.pages}페이지를 {snapshot.path}에 저장했습니다.")
+        if manifest is not None:
+            manifest.save()
+            print(f"증분 재생성: 변경 없는 페이지 {manifest.unchanged_pages}개 건너뜀, "
+                  f"메서드 재사용 {manifest.reused_methods}개, 새로 생성 {manifest.generated_methods}개")
+
+def main():
+    """메인 함수"""
+    # 명령줄 인수 파싱
+    args = parse_args()
+    
+    # --profile이 없으면 단계 시간을 모으지 않음 (진행 메시지의 소요 시간만 측정)
+    profiler = Profiler(enabled=bool(args.profile))
+    tracer = CommandTracer(profiler) if args.trace_webdriver else None
+    cprofile = None
+    if args.cprofile:
+        import cProfile
+        cprofile = cProfile.Profile()
+        cprofile.enable()
+    
+    try:
+        run(args, profiler, tracer)
     finally:
-        # 리소스 정리는 객체 소멸자에서 처리됨
-        pass
+        if tracer is not None:
+            commands = tracer.report()
+            totals = commands['totals']
+            print(f"\nWebDriver 명령 합계: {totals['calls']}회 (왕복 {totals['time']:.2f}초, "
+                  f"요청 {totals['request_bytes'] / 1024:.1f}KB, 응답 {totals['response_bytes'] / 1024:.1f}KB, "
+                  f"실패 {totals['errors']}회)")
+            if totals['calls']:
+                for line in format_commands(commands):
+                    print(line)
+        if cprofile is not None:
+            cprofile.disable()
+            Path(args.cprofile).parent.mkdir(parents=True, exist_ok=True)
+            cprofile.dump_stats(args.cprofile)
+            print(f"cProfile 결과를 {args.cprofile}에 저장했습니다.")
+        if args.profile:
+            extra = {'options': vars(args)}
+            if tracer is not None:
+                extra['webdriver'] = tracer.report()
+            report = profiler.write_report(args.profile, extra)
+            print(f"\n단계별 실행 시간 (전체 {report['wall_time']:.2f}초, CPU {report['cpu_time']:.2f}초):")
+            for line in format_phases(report):
+                print(line)
+            print(f"실행 보고서를 {args.profile}에 저장했습니다.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,104 +1,306 @@
 """
 페이지 오브젝트 클래스 템플릿
 """
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+)
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# 캐시한 요소로 동작하다 발생하면 요소를 다시 찾아 한 번 더 시도하는 예외
+# (페이지가 다시 렌더링되어 요소가 사라졌거나 아직 상호작용할 수 없는 상태)
+RETRY_EXCEPTIONS = (
+    StaleElementReferenceException,
+    ElementNotInteractableException,
+    ElementClickInterceptedException,
+)
+
+# 폼 필드 일괄 입력 스크립트 (브라우저 왕복 한 번)
+# arguments[0]: [필드 이름, 웹 요소 또는 [By 값, 로케이터 값], 값] 리스트, arguments[1]: input/change 이벤트 발생 여부
+# 체크박스/라디오는 checked, 드롭다운은 보이는 텍스트가 같은 옵션, 나머지는 value(편집 가능 요소는 텍스트)를 설정한다.
+# 값은 프로토타입의 setter로 설정하여 React 등이 감시하는 value 속성 재정의를 우회한다.
+# 요소를 찾지 못한 필드 이름 리스트를 반환한다.
+FILL_FORM_SCRIPT = """
+var fields = arguments[0], dispatch = arguments[1], missing = [];
+function resolve(target) {
+    if (!Array.isArray(target)) return target;
+    var by = target[0], value = target[1];
+    if (by === 'id') return document.getElementById(value);
+    if (by === 'name') return document.getElementsByName(value)[0] || null;
+    if (by === 'class name') return document.getElementsByClassName(value)[0] || null;
+    if (by === 'css selector') return document.querySelector(value);
+    if (by === 'xpath') {
+        return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return null;
+}
+function setProperty(el, name, value) {
+    var descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), name);
+    if (descriptor && descriptor.set) descriptor.set.call(el, value); else el[name] = value;
+}
+for (var i = 0; i < fields.length; i++) {
+    var el = resolve(fields[i][1]), value = fields[i][2];
+    if (!el) { missing.push(fields[i][0]); continue; }
+    if (el.type === 'checkbox' || el.type === 'radio') {
+        setProperty(el, 'checked', !!value);
+    } else if (el.tagName === 'SELECT') {
+        var found = false;
+        for (var j = 0; j < el.options.length; j++) {
+            if (el.options[j].text.trim() !== String(value).trim()) continue;
+            setProperty(el, 'value', el.options[j].value);
+            found = true;
+            break;
+        }
+        if (!found) throw new Error(fields[i][0] + ': option not found: ' + value);
+    } else if (el.isContentEditable) {
+        el.textContent = value;
+    } else {
+        setProperty(el, 'value', value);
+    }
+    if (dispatch) {
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+}
+return missing;
+"""
+
 
 class PageTemplate:
     """
     페이지 오브젝트 패턴의 기본 템플릿 클래스
+
+    생성된 페이지 오브젝트는 이 클래스를 상속하고 로케이터를 클래스 상수로 선언한다.
+    대기 객체는 인스턴스마다 하나만 만들어 재사용하고, 찾은 요소는 로케이터별로 캐시하여
+    다음 호출에서는 대기와 탐색 없이 바로 사용한다 (요소가 stale이면 다시 찾음).
     """
 
-    def __init__(self, driver):
+    # 페이지 URL (생성된 클래스에서 지정)
+    url = None
+
+    # 요소 대기 시간 (초)과 대기 중 확인 간격 (초, Selenium 기본값은 0.5)
+    timeout = 10
+    poll_frequency = 0.1
+
+    def __init__(self, driver, timeout=None, poll_frequency=None):
         """
         생성자
-        
+
         Args:
             driver: Selenium WebDriver 인스턴스
+            timeout: 요소 대기 시간 (초, 기본값: 클래스의 timeout)
+            poll_frequency: 대기 중 확인 간격 (초, 기본값: 클래스의 poll_frequency)
         """
         self.driver = driver
-        self.url = None
-    
+        if timeout is not None:
+            self.timeout = timeout
+        if poll_frequency is not None:
+            self.poll_frequency = poll_frequency
+        self.wait = WebDriverWait(driver, self.timeout, poll_frequency=self.poll_frequency)
+        self._elements = {}
+
     def navigate(self):
         """페이지로 이동"""
         if self.url:
             self.driver.get(self.url)
+            self.clear_cache()
+        return self
+
+    def clear_cache(self):
+        """캐시한 요소 모두 삭제 (페이지를 이동하거나 새로 고친 뒤 사용)"""
+        self._elements.clear()
         return self
-    
-    def wait_for_element(self, locator, timeout=10):
+
+    def _wait(self, timeout=None):
+        """공유 대기 객체 (다른 대기 시간을 지정하면 그 시간의 대기 객체)"""
+        if timeout is None or timeout == self.timeout:
+            return self.wait
+        return WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency)
+
+    def wait_for_element(self, locator, timeout=None):
         """
         요소가 나타날 때까지 대기
-        
+
         Args:
             locator: (By, value) 형식의 로케이터 튜플
-            timeout: 타임아웃 (초 단위)
-            
+            timeout: 타임아웃 (초 단위, 기본값: 인스턴스의 timeout)
+
         Returns:
             찾은 웹 요소
         """
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(locator)
-        )
-    
-    def wait_for_clickable(self, locator, timeout=10):
+        return self._wait(timeout).until(EC.presence_of_element_located(locator))
+
+    def wait_for_clickable(self, locator, timeout=None):
         """
         요소가 클릭 가능할 때까지 대기
-        
+
         Args:
             locator: (By, value) 형식의 로케이터 튜플
-            timeout: 타임아웃 (초 단위)
-            
+            timeout: 타임아웃 (초 단위, 기본값: 인스턴스의 timeout)
+
         Returns:
             찾은 웹 요소
         """
-        return WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable(locator)
-        )
-    
-    def click_element(self, locator, timeout=10):
+        return self._wait(timeout).until(EC.element_to_be_clickable(locator))
+
+    def find(self, locator, clickable=False):
+        """
+        캐시한 요소를 반환하고 없으면 대기하여 찾은 뒤 캐시
+
+        Args:
+            locator: (By, value) 형식의 로케이터 튜플
+            clickable: True면 클릭 가능할 때까지, False면 나타날 때까지 대기
+
+        Returns:
+            웹 요소
+        """
+        element = self._elements.get(locator)
+        if element is None:
+            element = self.wait_for_clickable(locator) if clickable else self.wait_for_element(locator)
+            self._elements[locator] = element
+        return element
+
+    def _perform(self, locator, action, clickable=False):
+        """
+        요소에 동작 수행 (캐시한 요소가 stale이거나 상호작용할 수 없으면 다시 찾아 한 번 더 시도)
+
+        Args:
+            locator: (By, value) 형식의 로케이터 튜플
+            action: 웹 요소를 받아 동작을 수행하는 함수
+            clickable: True면 클릭 가능할 때까지, False면 나타날 때까지 대기
+
+        Returns:
+            action의 반환값
+        """
+        element = self._elements.get(locator)
+        if element is not None:
+            try:
+                return action(element)
+            except RETRY_EXCEPTIONS:
+                del self._elements[locator]
+        return action(self.find(locator, clickable))
+
+    def click_element(self, locator):
         """
         요소 클릭
-        
+
         Args:
             locator: (By, value) 형식의 로케이터 튜플
-            timeout: 타임아웃 (초 단위)
-            
+
         Returns:
             self (메서드 체이닝을 위함)
         """
-        element = self.wait_for_clickable(locator, timeout)
-        element.click()
+        self._perform(locator, lambda element: element.click(), clickable=True)
         return self
-    
-    def input_text(self, locator, text, timeout=10):
+
+    def input_text(self, locator, text):
         """
-        텍스트 입력
-        
+        텍스트 입력 (기존 텍스트를 지운 뒤 입력)
+
         Args:
             locator: (By, value) 형식의 로케이터 튜플
             text: 입력할 텍스트
-            timeout: 타임아웃 (초 단위)
-            
+
         Returns:
             self (메서드 체이닝을 위함)
         """
-        element = self.wait_for_element(locator, timeout)
-        element.clear()
-        element.send_keys(text)
+        def enter(element):
+            element.clear()
+            element.send_keys(text)
+
+        self._perform(locator, enter)
+        return self
+
+    def set_checked(self, locator, check=True):
+        """
+        체크박스/라디오 버튼 상태 설정
+
+        Args:
+            locator: (By, value) 형식의 로케이터 튜플
+            check: True면 체크, False면 체크 해제
+
+        Returns:
+            self (메서드 체이닝을 위함)
+        """
+        def toggle(element):
+            # 원하는 상태와 다르면 클릭
+            if element.is_selected() != check:
+                element.click()
+
+        self._perform(locator, toggle)
+        return self
+
+    def select_option(self, locator, option_text):
+        """
+        드롭다운에서 옵션 선택
+
+        Args:
+            locator: (By, value) 형식의 로케이터 튜플
+            option_text: 선택할 옵션의 텍스트
+
+        Returns:
+            self (메서드 체이닝을 위함)
+        """
+        self._perform(locator, lambda element: Select(element).select_by_visible_text(option_text))
         return self
-    
-    def get_text(self, locator, timeout=10):
+
+    def fill_form(self, fields, values, dispatch_events=False, type_keys=()):
+        """
+        폼 필드 여러 개를 한 번의 스크립트 실행으로 입력
+
+        캐시한 요소는 그대로, 나머지는 로케이터를 스크립트에 넘겨 브라우저에서 찾는다.
+        아직 나타나지 않은 필드는 대기하여 찾은 뒤 한 번 더 실행한다.
+
+        Args:
+            fields: {필드 이름: 로케이터 튜플} 딕셔너리 (생성된 클래스의 *_FIELDS 상수)
+            values: {필드 이름: 값} 딕셔너리 (체크박스/라디오는 True/False, 드롭다운은 옵션 텍스트)
+            dispatch_events: True면 값을 설정한 뒤 input, change 이벤트 발생 (기본값: False)
+            type_keys: 실제 키 입력(send_keys)이 필요한 텍스트 필드 이름 목록 (자동 완성, 입력 마스크 등)
+
+        Returns:
+            self (메서드 체이닝을 위함)
+        """
+        unknown = [name for name in values if name not in fields]
+        if unknown:
+            raise TypeError(f"폼에 없는 필드입니다: {', '.join(unknown)}")
+
+        scripted = {name: value for name, value in values.items() if name not in type_keys}
+        if scripted:
+            try:
+                missing = self._fill_fields(fields, scripted, dispatch_events)
+            except StaleElementReferenceException:
+                # 캐시한 요소가 사라졌으면 로케이터로 다시 실행
+                self.clear_cache()
+                missing = self._fill_fields(fields, scripted, dispatch_events)
+            if missing:
+                for name in missing:
+                    self.find(fields[name])
+                self._fill_fields(fields, {name: scripted[name] for name in missing}, dispatch_events)
+
+        for name in type_keys:
+            if name in values:
+                self.input_text(fields[name], values[name])
+        return self
+
+    def _fill_fields(self, fields, values, dispatch_events):
+        """FILL_FORM_SCRIPT 실행 (요소를 찾지 못한 필드 이름 리스트 반환)"""
+        targets = []
+        for name, value in values.items():
+            locator = fields[name]
+            targets.append([name, self._elements.get(locator) or list(locator), value])
+        return self.driver.execute_script(FILL_FORM_SCRIPT, targets, dispatch_events)
+
+    def get_text(self, locator):
         """
         요소의 텍스트 가져오기
-        
+
         Args:
             locator: (By, value) 형식의 로케이터 튜플
-            timeout: 타임아웃 (초 단위)
-            
+
         Returns:
             요소의 텍스트
         """
-        element = self.wait_for_element(locator, timeout)
-        return element.text
\ No newline at end of file
+        return self._perform(locator, lambda element: element.text)
@@ -0,0 +1,221 @@
+"""
+여러 URL을 재사용되는 스크래퍼 풀로 동시에 처리하는 모듈
+"""
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+
+def run_isolated(func: Callable[[], Any], url: str) -> Dict[str, Any]:
+    """
+    URL 하나의 처리를 실행하고 예외를 결과로 기록 (다른 URL로 실패가 전파되지 않음)
+
+    Args:
+        func: 출력 파일 경로를 반환하는 처리 함수 (요소가 없으면 None)
+        url: 처리 중인 URL
+
+    Returns:
+        {'url', 'status', 'output', 'error', 'elapsed'} 형식의 처리 결과 딕셔너리
+    """
+    start_time = time.time()
+    result = {'url': url, 'status': 'error', 'output': None, 'error': None, 'elapsed': 0.0}
+
+    try:
+        output = func()
+        result['status'] = 'success' if output else 'empty'
+        result['output'] = str(output) if output else None
+    except Exception as e:
+        result['error'] = str(e)
+
+    result['elapsed'] = time.time() - start_time
+    return result
+
+
+class ScraperPool:
+    """장시간 재사용되는 스크래퍼(브라우저) 인스턴스 풀"""
+
+    def __init__(self, factory: Callable[[], Any], size: int = 4):
+        """
+        스크래퍼 풀 초기화 (스크래퍼는 필요할 때 생성)
+
+        Args:
+            factory: 새 스크래퍼 인스턴스를 만드는 함수
+            size: 동시에 사용할 최대 스크래퍼 수
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self._idle = queue.LifoQueue()
+        self._scrapers = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def acquire(self):
+        """
+        유휴 스크래퍼를 가져오거나 새로 생성
+
+        Returns:
+            스크래퍼 인스턴스
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            scraper = self.factory()
+            with self._lock:
+                self._scrapers.append(scraper)
+            return scraper
+
+    def release(self, scraper, healthy: bool = True):
+        """
+        스크래퍼를 풀에 반환 (비정상 스크래퍼는 종료하고 폐기)
+
+        Args:
+            scraper: 반환할 스크래퍼 인스턴스
+            healthy: 재사용 가능 여부
+        """
+        if healthy:
+            self._idle.put(scraper)
+            return
+
+        with self._lock:
+            if scraper in self._scrapers:
+                self._scrapers.remove(scraper)
+        self._close_scraper(scraper)
+
+    def map(self, func: Callable[[Any, str], Any], urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        URL별로 func(scraper, url)를 동시에 실행 (URL 단위로 실패 격리)
+
+        Args:
+            func: 스크래퍼와 URL을 받아 출력 파일 경로를 반환하는 함수
+            urls: 처리할 URL 리스트
+
+        Returns:
+            URL별 처리 결과 딕셔너리 리스트 (입력 순서)
+        """
+        with ThreadPoolExecutor(max_workers=min(self.size, max(1, len(urls)))) as executor:
+            return list(executor.map(lambda url: self._run(func, url), urls))
+
+    def map_tabs(self, func: Callable[[Any, str], Any], urls: List[str], tabs: int) -> List[Dict[str, Any]]:
+        """
+        작업자마다 브라우저 하나의 여러 탭을 번갈아 사용하여 URL 처리
+
+        한 탭에서 페이지가 로드되는 동안 다른 탭에서 요소를 추출하므로
+        브라우저 프로세스를 늘리지 않고도 처리량을 높일 수 있다.
+        탭 처리를 지원하지 않는 스크래퍼는 작업자마다 URL을 차례로 처리한다.
+
+        Args:
+            func: 스크래퍼와 URL을 받아 출력 파일 경로를 반환하는 함수 (현재 탭에 페이지가 로드된 상태로 호출)
+            urls: 처리할 URL 리스트
+            tabs: 작업자(브라우저)당 탭 수
+
+        Returns:
+            URL별 처리 결과 딕셔너리 리스트 (입력 순서)
+        """
+        if tabs <= 1:
+            return self.map(func, urls)
+
+        pending = queue.Queue()
+        for url in urls:
+            pending.put(url)
+
+        def next_url():
+            try:
+                return pending.get_nowait()
+            except queue.Empty:
+                return None
+
+        workers = min(self.size, max(1, -(-len(urls) // max(1, tabs))))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._run_tabs, func, next_url, tabs) for _ in range(workers)]
+            results = {}
+            for future in futures:
+                for result in future.result():
+                    results[result['url']] = result
+
+        # 작업자 오류로 결과가 기록되지 않은 URL은 실패로 처리
+        return [results.get(url) or {'url': url, 'status': 'error', 'output': None,
+                                     'error': "탭 처리 중 드라이버 오류로 중단됨", 'elapsed': 0.0}
+                for url in urls]
+
+    def close(self):
+        """풀의 모든 스크래퍼 종료"""
+        with self._lock:
+            scrapers, self._scrapers = self._scrapers, []
+        for scraper in scrapers:
+            self._close_scraper(scraper)
+
+    def _run(self, func: Callable[[Any, str], Any], url: str) -> Dict[str, Any]:
+        """스크래퍼 하나로 URL 하나를 처리하고 결과 기록"""
+        start_time = time.time()
+        try:
+            scraper = self.acquire()
+        except Exception as e:
+            return {'url': url, 'status': 'error', 'output': None,
+                    'error': f"스크래퍼 생성 실패: {e}", 'elapsed': time.time() - start_time}
+
+        result = run_isolated(lambda: func(scraper, url), url)
+        self.release(scraper, result['status'] != 'error' or self._is_healthy(scraper))
+        return result
+
+    def _run_tabs(self, func: Callable[[Any, str], Any], next_url: Callable[[], Any], tabs: int) -> List[Dict[str, Any]]:
+        """스크래퍼 하나의 여러 탭으로 공유 URL 목록이 빌 때까지 처리"""
+        results = []
+        urls = iter(next_url, None)
+
+        while True:
+            url = next(urls, None)
+            if url is None:
+                return results
+
+            try:
+                scraper = self.acquire()
+            except Exception as e:
+                results.append({'url': url, 'status': 'error', 'output': None,
+                                'error': f"스크래퍼 생성 실패: {e}", 'elapsed': 0.0})
+                continue
+
+            # 꺼낸 URL을 다시 앞에 붙여 탭 스케줄러에 전달
+            pending = itertools.chain([url], urls)
+            if not hasattr(scraper, 'process_urls_in_tabs'):
+                # 탭을 지원하지 않는 스크래퍼: 페이지를 직접 로드한 뒤 처리
+                for url in pending:
+                    results.append(run_isolated(lambda: self._navigate_and_run(func, scraper, url), url))
+                self.release(scraper)
+                continue
+
+            healthy = True
+            try:
+                for result in scraper.process_urls_in_tabs(pending, lambda url: func(scraper, url), tabs):
+                    results.append(result)
+            except Exception as e:
+                # 드라이버 세션 오류: 처리 중이던 URL은 결과 없이 남고 나머지는 새 스크래퍼로 계속 처리
+                print(f"탭 처리 중 오류 (스크래퍼 교체): {e}")
+                healthy = self._is_healthy(scraper)
+            finally:
+                self.release(scraper, healthy)
+
+    def _navigate_and_run(self, func: Callable[[Any, str], Any], scraper, url: str) -> Any:
+        """페이지를 로드한 뒤 func 실행"""
+        if not scraper.navigate_to(url):
+            raise RuntimeError(f"URL '{url}'로 이동할 수 없습니다.")
+        return func(scraper, url)
+
+    def _is_healthy(self, scraper) -> bool:
+        """스크래퍼의 드라이버 세션이 살아 있는지 확인"""
+        is_alive = getattr(scraper, 'is_alive', None)
+        return is_alive() if callable(is_alive) else True
+
+    def _close_scraper(self, scraper):
+        """스크래퍼 종료 (종료 중 오류는 무시)"""
+        try:
+            scraper.close()
+        except Exception:
+            pass
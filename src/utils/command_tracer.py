@@ -0,0 +1,173 @@
+"""
+WebDriver 명령 왕복을 기록하는 추적 모듈
+
+WebDriver의 모든 명령(요소 탐색, 속성 조회, 스크립트 실행, 스크린샷 등)은 드라이버의
+command_executor.execute를 거쳐 HTTP 요청 하나로 전송된다. 이 함수를 감싸서 명령마다
+지연 시간과 요청/응답 크기를 기록하고, 명령을 실행한 스레드에서 진행 중이던
+프로파일러 단계별로 모은다. (여러 드라이버와 작업자 스레드가 같은 추적기를 공유 가능)
+"""
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from src.utils.profiler import Profiler
+
+# 진행 중인 단계가 없을 때 사용하는 단계 이름
+UNPHASED = '(none)'
+
+
+def payload_size(value: Any) -> int:
+    """
+    명령 요청/응답 값의 JSON 크기 (바이트, 전송 크기의 근사값)
+
+    Args:
+        value: 요청 인수 또는 응답 딕셔너리
+
+    Returns:
+        UTF-8로 인코딩한 JSON 문자열 길이 (값이 없으면 0)
+    """
+    if value is None:
+        return 0
+    if isinstance(value, str):  # 스크린샷 등 문자열 응답
+        return len(value)
+    return len(json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8'))
+
+
+def _empty_totals() -> Dict[str, Any]:
+    """명령 합계 초기값"""
+    return {'calls': 0, 'time': 0.0, 'request_bytes': 0, 'response_bytes': 0, 'errors': 0}
+
+
+def _accumulate(totals: Dict[str, Any], elapsed: float, request_bytes: int, response_bytes: int, error: bool):
+    """명령 하나를 합계에 더함"""
+    totals['calls'] += 1
+    totals['time'] += elapsed
+    totals['request_bytes'] += request_bytes
+    totals['response_bytes'] += response_bytes
+    totals['errors'] += int(error)
+
+
+class CommandTracer:
+    """WebDriver 명령의 횟수, 지연 시간, 요청/응답 크기를 단계와 명령 이름별로 모으는 추적기"""
+
+    def __init__(self, profiler: Optional[Profiler] = None):
+        """
+        추적기 초기화
+
+        Args:
+            profiler: 명령을 실행할 때 진행 중인 단계 이름을 알려 줄 프로파일러
+                      (없으면 모든 명령을 UNPHASED 단계로 기록)
+        """
+        self.profiler = profiler
+        self.commands = {}  # (단계, 명령) -> 합계
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def attach(self, driver) -> None:
+        """
+        드라이버의 명령 실행 함수를 감싸 이후 모든 명령을 기록 (WebElement 메서드 포함)
+
+        Args:
+            driver: Selenium WebDriver 인스턴스
+        """
+        executor = driver.command_executor
+        execute = executor.execute
+
+        def traced_execute(command, params):
+            # execute가 URL 경로에 넣는 인수를 params에서 지우므로 실행 전에 크기 계산
+            request_bytes = payload_size(params)
+            start_time = time.perf_counter()
+            try:
+                response = execute(command, params)
+            except Exception:
+                self.record(command, time.perf_counter() - start_time, request_bytes, 0, error=True)
+                raise
+            # 실패한 명령은 응답 상태 코드나 W3C 오류 값으로 표시됨 (예외는 드라이버가 나중에 발생)
+            value = response.get('value') if isinstance(response, dict) else None
+            status = response.get('status') if isinstance(response, dict) else None
+            error = (isinstance(status, int) and status >= 400) or (isinstance(value, dict) and 'error' in value)
+            self.record(command, time.perf_counter() - start_time, request_bytes, payload_size(value), error)
+            return response
+
+        executor.execute = traced_execute
+
+    def record(self, command: str, elapsed: float, request_bytes: int = 0, response_bytes: int = 0,
+               error: bool = False) -> None:
+        """
+        명령 하나 기록 (현재 스레드의 진행 중인 프로파일러 단계로 분류)
+
+        Args:
+            command: WebDriver 명령 이름 (예: 'findElements', 'w3cExecuteScript', 'screenshot')
+            elapsed: 왕복 시간 (초)
+            request_bytes: 요청 인수 크기 (바이트)
+            response_bytes: 응답 값 크기 (바이트)
+            error: 명령이 실패했으면 True
+        """
+        phase = (self.profiler.current_phase() if self.profiler is not None else None) or UNPHASED
+        with self._lock:
+            totals = self.commands.setdefault((phase, command), _empty_totals())
+            _accumulate(totals, elapsed, request_bytes, response_bytes, error)
+
+        thread_totals = getattr(self._local, 'totals', None)
+        if thread_totals is None:
+            thread_totals = self._local.totals = _empty_totals()
+        _accumulate(thread_totals, elapsed, request_bytes, response_bytes, error)
+
+    def thread_totals(self) -> Dict[str, Any]:
+        """
+        현재 스레드에서 실행한 명령의 누적 합계 (페이지별 요약용, 다른 작업자 스레드의 명령 제외)
+
+        Returns:
+            {'calls', 'time', 'request_bytes', 'response_bytes', 'errors'} 딕셔너리 복사본
+        """
+        return dict(getattr(self._local, 'totals', None) or _empty_totals())
+
+    def totals(self) -> Dict[str, Any]:
+        """모든 스레드의 명령 합계"""
+        totals = _empty_totals()
+        with self._lock:
+            for entry in self.commands.values():
+                for key in totals:
+                    totals[key] += entry[key]
+        return totals
+
+    def by_phase(self) -> Dict[str, Dict[str, Any]]:
+        """
+        단계별 명령 합계
+
+        Returns:
+            {단계: {'calls', 'time', 'request_bytes', 'response_bytes', 'errors', 'commands': {명령: 합계}}}
+            딕셔너리 (명령은 왕복 시간이 긴 순서)
+        """
+        phases = {}
+        with self._lock:
+            items = sorted(self.commands.items(), key=lambda item: -item[1]['time'])
+            for (phase, command), entry in items:
+                summary = phases.setdefault(phase, dict(_empty_totals(), commands={}))
+                for key in entry:
+                    summary[key] += entry[key]
+                summary['commands'][command] = dict(entry)
+        return phases
+
+    def report(self) -> Dict[str, Any]:
+        """실행 보고서에 넣을 {'totals', 'phases'} 딕셔너리"""
+        return {'totals': self.totals(), 'phases': self.by_phase()}
+
+
+def format_commands(report: Dict[str, Any]) -> List[str]:
+    """
+    단계별 명령 합계를 사람이 읽는 표 형식 줄로 변환 (왕복 시간이 긴 단계부터)
+
+    Args:
+        report: CommandTracer.report()가 반환한 딕셔너리
+
+    Returns:
+        출력할 줄 리스트 (단계마다 가장 오래 걸린 명령 포함)
+    """
+    lines = [f"  {'단계':<22}{'명령':>7}{'시간(s)':>10}{'요청(KB)':>10}{'응답(KB)':>10}  주요 명령"]
+    for phase, entry in sorted(report['phases'].items(), key=lambda item: -item[1]['time']):
+        top = ', '.join(f"{command} {totals['calls']}" for command, totals in list(entry['commands'].items())[:3])
+        lines.append(f"  {phase:<22}{entry['calls']:>7}{entry['time']:>10.3f}{entry['request_bytes'] / 1024:>10.1f}"
+                     f"{entry['response_bytes'] / 1024:>10.1f}  {top}")
+    return lines
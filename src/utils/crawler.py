@@ -0,0 +1,278 @@
+"""
+시작 URL 또는 sitemap.xml에서 같은 출처의 페이지를 찾아 처리하는 사이트 크롤러 모듈
+
+페이지를 처리하면서 찾은 링크를 정규화하여 따라가고, 정규화한 URL과
+상호작용 요소 구조(DOM 지문)로 같은 페이지를 한 번만 처리한다.
+깊이(링크 단계)와 페이지 수 제한 안에서 깊이별로 스크래퍼 풀을 사용해 동시에 처리한다.
+"""
+import hashlib
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+from urllib.request import url2pathname
+
+import requests
+
+from src.utils.batch import ScraperPool
+
+# 기본 포트 (URL 정규화 시 생략)
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# 페이지 내용과 무관한 추적용 쿼리 매개변수
+TRACKING_PARAMS = {'gclid', 'fbclid', 'msclkid', 'ref', 'ref_src'}
+
+# 페이지가 아닌 리소스 확장자
+SKIP_EXTENSIONS = {
+    '.pdf', '.zip', '.gz', '.tar', '.rar', '.7z', '.exe', '.dmg', '.apk',
+    '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico', '.bmp',
+    '.mp3', '.mp4', '.avi', '.mov', '.webm', '.css', '.js', '.json', '.xml', '.txt', '.csv',
+    '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+}
+
+# 방문하면 세션이 끊어지는 경로 (로그아웃 링크)
+SKIP_PATH_PATTERN = re.compile(r'log-?out|sign-?out', re.IGNORECASE)
+
+# sitemap 파일에서 읽을 최대 sitemap 수 (sitemap index 중첩 포함)
+MAX_SITEMAPS = 50
+
+
+def normalize_url(url: str, base: Optional[str] = None) -> Optional[str]:
+    """
+    같은 페이지를 가리키는 URL이 같은 문자열이 되도록 정규화
+
+    스킴과 호스트는 소문자로, 기본 포트와 사용자 정보, 프래그먼트(#)는 제거하고,
+    연속된 슬래시를 합치며, 추적용 매개변수(utm_* 등)를 제외한 쿼리는 정렬한다.
+
+    Args:
+        url: 정규화할 URL (상대 URL이면 base 기준)
+        base: 기준 URL
+
+    Returns:
+        정규화된 URL (http, https, file 이외의 스킴이면 None)
+    """
+    url = (url or '').strip()
+    if base:
+        url = urljoin(base, url)
+
+    try:
+        parsed = urlsplit(url)
+        port = parsed.port
+    except ValueError:
+        return None
+
+    scheme = parsed.scheme.lower()
+    if scheme not in ('http', 'https', 'file'):
+        return None
+
+    host = (parsed.hostname or '').lower()
+    netloc = host if port is None or DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+    path = re.sub(r'/{2,}', '/', parsed.path) or '/'
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ))
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+def url_origin(url: str) -> str:
+    """
+    URL의 출처 (스킴과 호스트)
+
+    Args:
+        url: 정규화된 URL
+
+    Returns:
+        'scheme://host[:port]' 형식의 문자열
+    """
+    parsed = urlsplit(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def is_page_url(url: str) -> bool:
+    """
+    페이지로 방문할 URL인지 확인 (리소스 파일과 로그아웃 링크 제외)
+
+    Args:
+        url: 정규화된 URL
+
+    Returns:
+        방문할 URL이면 True
+    """
+    path = urlsplit(url).path
+    return os.path.splitext(path)[1].lower() not in SKIP_EXTENSIONS and not SKIP_PATH_PATTERN.search(path)
+
+
+def dom_fingerprint(signature: List[str]) -> str:
+    """
+    페이지 구조 서명의 해시 (같은 템플릿으로 만든 페이지는 같은 값)
+
+    Args:
+        signature: 스크래퍼의 get_page_signature() 결과
+
+    Returns:
+        SHA-1 16진수 문자열
+    """
+    return hashlib.sha1('\n'.join(signature).encode('utf-8')).hexdigest()
+
+
+def read_sitemap(url: str, timeout: int = 30) -> List[str]:
+    """
+    sitemap.xml(sitemap index 포함)에서 페이지 URL 목록 읽기
+
+    Args:
+        url: sitemap URL 또는 로컬 파일 경로
+        timeout: 요청 타임아웃 (초)
+
+    Returns:
+        페이지 URL 리스트 (문서 순서, 중복 제외)
+    """
+    urls, sitemaps, visited = [], [url], set()
+
+    while sitemaps and len(visited) < MAX_SITEMAPS:
+        sitemap_url = sitemaps.pop(0)
+        if sitemap_url in visited:
+            continue
+        visited.add(sitemap_url)
+
+        try:
+            root = ET.fromstring(_read_resource(sitemap_url, timeout))
+        except Exception as e:
+            print(f"sitemap 읽기 오류 ({sitemap_url}): {e}")
+            continue
+
+        # 네임스페이스와 관계없이 태그 이름으로 판별
+        is_index = root.tag.rsplit('}', 1)[-1] == 'sitemapindex'
+        for node in root.iter():
+            if node.tag.rsplit('}', 1)[-1] != 'loc' or not (node.text or '').strip():
+                continue
+            location = urljoin(sitemap_url, node.text.strip())
+            if is_index:
+                sitemaps.append(location)
+            elif location not in urls:
+                urls.append(location)
+
+    return urls
+
+
+def _read_resource(url: str, timeout: int) -> bytes:
+    """HTTP(S) URL은 내려받고 그 외에는 로컬 파일로 읽음"""
+    parsed = urlsplit(url)
+    if parsed.scheme in ('http', 'https'):
+        response = requests.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.content
+
+    path = url2pathname(parsed.path) if parsed.scheme == 'file' else url
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class SiteCrawler:
+    """같은 출처의 링크를 깊이별로 따라가며 페이지를 처리하는 크롤러"""
+
+    def __init__(self, pool: ScraperPool, seeds: List[str], max_depth: int = 2, max_pages: int = 100,
+                 tabs: int = 1):
+        """
+        크롤러 초기화
+
+        Args:
+            pool: 페이지를 처리할 스크래퍼 풀
+            seeds: 시작 URL 또는 로컬 파일 경로 리스트 (깊이 0, 첫 URL의 출처만 따라감)
+            max_depth: 시작 URL에서 따라갈 최대 링크 단계 수
+            max_pages: 방문할 최대 페이지 수
+            tabs: 작업자(브라우저)당 탭 수 (2 이상이면 ScraperPool.map_tabs 사용)
+        """
+        self.pool = pool
+        # 로컬 파일 경로는 file:// URL로 변환하여 상대 링크를 따라갈 수 있게 함
+        seeds = [seed if urlsplit(seed).scheme else Path(seed).resolve().as_uri() for seed in seeds]
+        self.seeds = [url for url in (normalize_url(seed) for seed in seeds) if url]
+        self.origin = url_origin(self.seeds[0]) if self.seeds else ''
+        self.max_depth = max(0, max_depth)
+        self.max_pages = max(1, max_pages)
+        self.tabs = tabs
+
+        self.links = {}
+        # 지문별 처음 처리한 URL, 지문이 같아 건너뛴 URL별 원본 URL
+        self.fingerprints = {}
+        self.duplicates = {}
+        self._lock = threading.Lock()
+
+    def crawl(self, process: Callable[[Any, str], Any],
+              before_level: Optional[Callable[[List[str]], Any]] = None) -> List[Dict[str, Any]]:
+        """
+        크롤링하며 구조가 다른 페이지마다 process(scraper, url) 실행
+
+        Args:
+            process: 현재 페이지가 로드된 스크래퍼와 URL을 받아 출력 파일 경로를 반환하는 함수
+            before_level: 깊이마다 작업자에게 나누어 주기 전에 그 깊이의 URL 리스트(발견 순서)로 호출할 함수
+                          (작업자 완료 순서와 관계없이 정해지는 출력 파일 이름 지정 등)
+
+        Returns:
+            방문한 URL별 처리 결과 딕셔너리 리스트 (방문 순서, 구조가 같아 건너뛴 페이지는 status가 'duplicate')
+        """
+        def visit_loaded(scraper, url):
+            return self._visit(process, scraper, url)
+
+        def visit(scraper, url):
+            if not scraper.navigate_to(url):
+                raise RuntimeError(f"URL '{url}'로 이동할 수 없습니다.")
+            return self._visit(process, scraper, url)
+
+        results = []
+        frontier = list(dict.fromkeys(self.seeds))
+        seen = set(frontier)
+        depth = 0
+
+        while frontier and len(results) < self.max_pages:
+            frontier = frontier[:self.max_pages - len(results)]
+            print(f"깊이 {depth}: 페이지 {len(frontier)}개 처리 중... (누적 {len(results)}/{self.max_pages})")
+            if before_level is not None:
+                before_level(frontier)
+
+            if self.tabs > 1:
+                # 탭 스케줄러가 페이지를 로드한 뒤 호출 (탭을 지원하지 않는 스크래퍼는 풀이 직접 로드)
+                level_results = self.pool.map_tabs(visit_loaded, frontier, self.tabs)
+            else:
+                level_results = self.pool.map(visit, frontier)
+
+            for result in level_results:
+                if result['url'] in self.duplicates:
+                    result['status'] = 'duplicate'
+                    result['duplicate_of'] = self.duplicates[result['url']]
+                result['depth'] = depth
+                results.append(result)
+
+            if depth >= self.max_depth:
+                break
+
+            # 다음 깊이에서 방문할 같은 출처의 새 URL
+            next_frontier = []
+            for url in frontier:
+                for link in self.links.get(url, []):
+                    normalized = normalize_url(link)
+                    if (normalized and normalized not in seen and url_origin(normalized) == self.origin
+                            and is_page_url(normalized)):
+                        seen.add(normalized)
+                        next_frontier.append(normalized)
+            frontier = next_frontier
+            depth += 1
+
+        return results
+
+    def _visit(self, process: Callable[[Any, str], Any], scraper, url: str) -> Any:
+        """링크와 구조 지문을 기록하고 처음 보는 구조의 페이지만 처리"""
+        links = scraper.get_links()
+        fingerprint = dom_fingerprint(scraper.get_page_signature())
+
+        with self._lock:
+            self.links[url] = links
+            original = self.fingerprints.setdefault(fingerprint, url)
+            if original != url:
+                self.duplicates[url] = original
+                return None
+
+        return process(scraper, url)
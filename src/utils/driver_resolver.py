@@ -0,0 +1,161 @@
+"""
+ChromeDriver 실행 파일 경로를 네트워크 없이 빠르게 찾는 모듈
+
+다음 순서로 드라이버를 찾고, 일치하는 드라이버가 있으면 네트워크에 접근하지 않는다.
+1. 명시적으로 지정한 경로 또는 CHROMEDRIVER_PATH 환경 변수
+2. 시스템 PATH의 chromedriver (Chrome과 주 버전이 다르면 사용하지 않음)
+3. Chrome 주 버전별 로컬 디스크 캐시
+4. (위에서 찾지 못한 경우에만) webdriver-manager로 내려받아 캐시에 저장
+"""
+import os
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv()
+
+DRIVER_NAME = 'chromedriver.exe' if sys.platform == 'win32' else 'chromedriver'
+
+# 버전 확인에 사용할 Chrome 실행 파일 후보
+CHROME_BINARIES = [
+    'google-chrome',
+    'google-chrome-stable',
+    'chromium',
+    'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+]
+
+
+class DriverNotFoundError(RuntimeError):
+    """ChromeDriver를 찾을 수 없을 때 발생하는 예외"""
+
+
+def default_cache_dir() -> Path:
+    """
+    드라이버 캐시 디렉토리 경로
+
+    Returns:
+        PO_GENERATOR_CACHE_DIR 환경 변수 또는 ~/.cache/po_generator 아래의 chromedriver 디렉토리
+    """
+    base = os.getenv('PO_GENERATOR_CACHE_DIR') or os.path.join('~', '.cache', 'po_generator')
+    return Path(os.path.expanduser(base)) / 'chromedriver'
+
+
+def detect_chrome_version() -> Optional[str]:
+    """
+    설치된 Chrome 버전 확인 (네트워크 미사용)
+
+    Returns:
+        '120.0.6099.109' 형식의 버전 문자열 (찾지 못하면 None)
+    """
+    binaries = [os.getenv('CHROME_BINARY')] + CHROME_BINARIES
+    for binary in binaries:
+        if not binary:
+            continue
+        version = _run_version_command([binary, '--version'])
+        if version:
+            return version
+
+    if sys.platform == 'win32':
+        for root in ('HKEY_CURRENT_USER', 'HKEY_LOCAL_MACHINE'):
+            version = _run_version_command(['reg', 'query', rf'{root}\Software\Google\Chrome\BLBeacon', '/v', 'version'])
+            if version:
+                return version
+    return None
+
+
+def detect_driver_version(driver_path: str) -> Optional[str]:
+    """
+    ChromeDriver 실행 파일의 버전 확인
+
+    Args:
+        driver_path: 드라이버 실행 파일 경로
+
+    Returns:
+        '120.0.6099.109' 형식의 버전 문자열 (확인하지 못하면 None)
+    """
+    return _run_version_command([driver_path, '--version'])
+
+
+def resolve_chromedriver(explicit_path: Optional[str] = None, cache_dir: Optional[Path] = None,
+                         allow_download: bool = True) -> Tuple[str, str]:
+    """
+    ChromeDriver 실행 파일 경로 결정
+
+    Args:
+        explicit_path: 명시적으로 지정한 드라이버 경로 (기본값: CHROMEDRIVER_PATH 환경 변수)
+        cache_dir: 드라이버 캐시 디렉토리 (기본값: default_cache_dir())
+        allow_download: 캐시에 없을 때 webdriver-manager로 내려받을지 여부 (False면 네트워크 미사용)
+
+    Returns:
+        (드라이버 경로, 찾은 위치) 튜플. 찾은 위치는 'explicit', 'path', 'cache', 'download' 중 하나
+
+    Raises:
+        DriverNotFoundError: 드라이버를 찾을 수 없는 경우
+    """
+    explicit_path = explicit_path or os.getenv('CHROMEDRIVER_PATH')
+    if explicit_path:
+        if not _is_executable(explicit_path):
+            raise DriverNotFoundError(f"지정한 ChromeDriver를 실행할 수 없습니다: {explicit_path}")
+        return explicit_path, 'explicit'
+
+    chrome_version = detect_chrome_version()
+    major_version = chrome_version.split('.')[0] if chrome_version else None
+
+    # PATH의 드라이버도 캐시와 같이 Chrome 주 버전이 같을 때만 사용 (버전을 확인할 수 없으면 그대로 사용)
+    system_driver = shutil.which(DRIVER_NAME)
+    system_mismatch = None
+    if system_driver:
+        driver_version = detect_driver_version(system_driver) if major_version else None
+        if not driver_version or driver_version.split('.')[0] == major_version:
+            return system_driver, 'path'
+        system_mismatch = f"{system_driver} (버전 {driver_version})"
+        print(f"PATH의 ChromeDriver {driver_version}이(가) Chrome {chrome_version}과 맞지 않아 사용하지 않습니다.")
+
+    cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+    cached_driver = cache_dir / major_version / DRIVER_NAME if major_version else None
+
+    if cached_driver is not None and _is_executable(str(cached_driver)):
+        return str(cached_driver), 'cache'
+
+    if not allow_download:
+        mismatch_note = f", PATH의 드라이버는 버전이 다름: {system_mismatch}" if system_mismatch else ''
+        raise DriverNotFoundError(
+            f"Chrome {chrome_version or '(버전 확인 불가)'}에 맞는 ChromeDriver가 캐시에 없습니다: {cache_dir}"
+            f"{mismatch_note}"
+        )
+
+    # 네트워크를 사용하는 마지막 수단
+    from webdriver_manager.chrome import ChromeDriverManager
+    downloaded = ChromeDriverManager().install()
+
+    if cached_driver is None:
+        return downloaded, 'download'
+
+    try:
+        cached_driver.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(downloaded, cached_driver)
+        return str(cached_driver), 'download'
+    except OSError:
+        return downloaded, 'download'
+
+
+def _is_executable(path: str) -> bool:
+    """실행 가능한 파일인지 확인"""
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _run_version_command(command) -> Optional[str]:
+    """버전 출력 명령을 실행하여 버전 문자열 추출"""
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=5).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r'(\d+\.\d+\.\d+\.\d+)', output or '')
+    return match.group(1) if match else None
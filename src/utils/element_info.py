@@ -0,0 +1,233 @@
+"""
+요소 정보 딕셔너리 생성 모듈
+
+WebDriver 호출 결과(요소별 개별 조회 또는 일괄 조회)로부터
+PageObjectGenerator가 사용하는 동일한 형식의 요소 정보 딕셔너리를 만든다.
+"""
+import re
+from typing import Dict, Any, Optional
+
+# 요소에서 추출하는 속성 목록 (요소 정보 딕셔너리 키, HTML 속성 이름)
+ELEMENT_ATTRIBUTES = [
+    ('id', 'id'),
+    ('class', 'class'),
+    ('name', 'name'),
+    ('type', 'type'),
+    ('value', 'value'),
+    ('href', 'href'),
+    ('aria_label', 'aria-label'),
+    ('title', 'title'),
+    ('placeholder', 'placeholder'),
+]
+
+# 상호작용 요소 유형별 CSS 선택자 (유형 이름, 선택자 리스트)
+CATEGORY_SELECTORS = {
+    'button': [
+        # 표준 button 태그
+        "button",
+        # input 태그 중 button, submit 타입
+        "input[type='button'], input[type='submit']",
+        # role이 button인 요소들
+        "[role='button']",
+        # 버튼 클래스, 주요 링크, 헤더/푸터 링크
+        "a[class*='btn'], div[class*='btn'], span[class*='btn']",
+        "a[href*='login'], a[href*='signin'], a[href*='signup'], a[href*='register']",
+        "a[href*='mypage'], a[href*='cart'], a[href*='search'], a[href*='customer']",
+        "header a, .header a, #header a, footer a, .footer a, #footer a",
+    ],
+    'input': [
+        # 기본 입력 필드 (text, password, email, number 등)
+        "input[type='text'], input[type='password'], input[type='email'], input[type='number']",
+        "input[type='tel'], input[type='search'], input[type='url'], input:not([type])",
+        # textarea, contenteditable 요소
+        "textarea",
+        "[contenteditable='true']",
+        # 특정 클래스나 역할을 가진 입력 요소
+        "[role='textbox'], [class*='input'], [class*='field'], [class*='text-box']",
+        # 로그인/회원가입 폼 내의 입력 요소
+        "form input, div[class*='login'] input, div[class*='signin'] input, div[id*='login'] input",
+    ],
+    'checkbox_radio': [
+        "input[type='checkbox'], input[type='radio']",
+    ],
+    'select': [
+        "select",
+    ],
+}
+
+
+# 페이지 구조 서명에 사용하는 속성 (텍스트와 링크 주소는 페이지마다 달라지므로 제외)
+PAGE_SIGNATURE_ATTRIBUTES = ['type', 'id', 'name', 'role']
+
+# 페이지 내용 서명에 사용하는 속성 (생성되는 코드에 영향을 주는 속성 전체, 증분 재생성용)
+PAGE_CONTENT_ATTRIBUTES = PAGE_SIGNATURE_ATTRIBUTES + [
+    attribute for _, attribute in ELEMENT_ATTRIBUTES if attribute not in PAGE_SIGNATURE_ATTRIBUTES
+]
+
+# 고유 선택자 생성에 사용하는 안정적인 속성 (우선순위 순서, 위치 기반 경로보다 먼저 시도)
+SELECTOR_ATTRIBUTES = ['id', 'name', 'data-testid', 'data-test', 'data-qa', 'data-cy', 'aria-label',
+                       'placeholder', 'title', 'for', 'href', 'alt']
+
+# 따옴표 없이 '#아이디'로 쓸 수 있는 아이디
+_SIMPLE_ID_PATTERN = re.compile(r'^[A-Za-z_][\w-]*$')
+
+
+def attribute_selector(tag_name: str, attribute: str, value: str) -> str:
+    """
+    속성 값으로 요소를 찾는 CSS 선택자 (브라우저의 uniqueSelector 스크립트와 같은 규칙)
+
+    Args:
+        tag_name: 태그 이름
+        attribute: 속성 이름
+        value: 속성 값
+
+    Returns:
+        '#아이디' 또는 '태그[속성="값"]' 형식의 CSS 선택자
+    """
+    if attribute == 'id' and _SIMPLE_ID_PATTERN.match(value):
+        return f"#{value}"
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+    return f'{tag_name}[{attribute}="{escaped}"]'
+
+
+def page_signature_selector() -> str:
+    """
+    모든 유형의 선택자를 결합한 CSS 선택자 (페이지 구조 서명용)
+
+    Returns:
+        결합된 CSS 선택자
+    """
+    return ", ".join(category_selector(category) for category in CATEGORY_SELECTORS)
+
+
+def category_selector(category: str) -> str:
+    """
+    유형별 선택자 리스트를 하나의 CSS 선택자로 결합
+
+    Args:
+        category: 요소 유형 이름
+
+    Returns:
+        결합된 CSS 선택자
+    """
+    return ", ".join(CATEGORY_SELECTORS[category])
+
+
+def classify_element(tag_name: str, element_type: str) -> str:
+    """
+    태그와 type 속성으로 요소 유형 판별
+
+    Args:
+        tag_name: 태그 이름 (소문자)
+        element_type: type 속성 값
+
+    Returns:
+        요소 유형 (button, input, checkbox_radio, select, other)
+    """
+    if tag_name == 'input':
+        if element_type in ['text', 'password', 'email', 'tel', 'number', 'url', 'search']:
+            return 'input'
+        elif element_type in ['checkbox', 'radio']:
+            return 'checkbox_radio'
+        elif element_type in ['button', 'submit', 'reset']:
+            return 'button'
+        return 'other'
+    elif tag_name == 'button':
+        return 'button'
+    elif tag_name == 'textarea':
+        return 'input'
+    elif tag_name == 'select':
+        return 'select'
+    elif tag_name == 'a':
+        return 'button'  # a 태그를 버튼으로 간주
+    return 'other'
+
+
+def build_element_info(raw: Dict[str, Any], element: Optional[Any] = None) -> Dict[str, Any]:
+    """
+    원시 요소 데이터로부터 요소 정보 딕셔너리 생성
+
+    Args:
+        raw: tag_name, text, 속성 값, location, size, is_displayed, is_enabled,
+             unique_selector(페이지에서 요소 하나에만 일치하는 CSS 선택자, 선택),
+             form(요소가 속한 폼의 id, name 또는 'form순번', 선택)을 담은 딕셔너리
+        element: 원본 웹 요소 (없으면 None)
+
+    Returns:
+        요소 정보를 담은 딕셔너리
+    """
+    tag_name = raw.get('tag_name', '')
+    text = (raw.get('text') or '').strip()
+    attributes = {key: raw.get(key) or "" for key, _ in ELEMENT_ATTRIBUTES}
+
+    element_id = attributes['id']
+    element_class = attributes['class']
+    element_name = attributes['name']
+    element_href = attributes['href']
+    element_category = classify_element(tag_name, attributes['type'])
+
+    # 텍스트가 없으면 다른 속성에서 텍스트 추출 시도
+    if not text:
+        if attributes['value'] and element_category != 'input':  # 입력 필드의 값은 텍스트로 사용하지 않음
+            text = attributes['value']
+        elif attributes['placeholder']:
+            text = attributes['placeholder']
+        elif attributes['aria_label']:
+            text = attributes['aria_label']
+        elif attributes['title']:
+            text = attributes['title']
+        elif element_href:
+            # URL에서 마지막 부분만 추출 (개행 문자 제거)
+            element_href = element_href.replace('\n', '').replace('\r', '')
+            attributes['href'] = element_href
+            text = element_href.split('/')[-1].split('?')[0].replace('-', ' ').replace('_', ' ')
+
+    # XPath 생성 (더 효율적인 방법으로)
+    xpath_options = []
+
+    # ID 기반 XPath (가장 안정적)
+    if element_id:
+        # ID도 개행 문자가 있을 수 있으므로 제거
+        clean_id = element_id.replace('\n', ' ').replace('\r', ' ')
+        clean_id = ' '.join(clean_id.split())  # 연속된 공백을 하나로
+        xpath_options.append(f"//*[@id='{clean_id}']")
+
+    # 이름 기반 XPath
+    if element_name:
+        # 이름에도 개행 문자가 있을 수 있으므로 제거
+        clean_name = element_name.replace('\n', ' ').replace('\r', ' ')
+        clean_name = ' '.join(clean_name.split())  # 연속된 공백을 하나로
+        xpath_options.append(f"//*[@name='{clean_name}']")
+
+    # 텍스트 기반 XPath (안정적이지만 텍스트가 변경될 수 있음)
+    if text and len(text) < 50:  # 텍스트가 너무 길면 XPath로 쓰기 어려움
+        # 개행문자를 공백으로 변환하고 정규화
+        clean_text = text.replace('\n', ' ').replace('\r', ' ')
+        clean_text = ' '.join(clean_text.split())  # 연속된 공백을 하나로
+        xpath_options.append(f"//*[normalize-space(.)='{clean_text}']")
+
+    # CSS 선택자 생성
+    css_selector = None
+    if element_id:
+        css_selector = f"#{element_id}"
+    elif element_class:
+        css_selector = f".{element_class.split()[0]}"  # 첫 번째 클래스만 사용
+
+    info = {
+        'element': element,
+        'tag_name': tag_name,
+        'element_category': element_category,
+        'text': text,
+    }
+    info.update(attributes)
+    info.update({
+        'location': raw.get('location') or {'x': 0, 'y': 0},
+        'size': raw.get('size') or {'width': 0, 'height': 0},
+        'xpath_options': xpath_options,
+        'css_selector': css_selector,
+        'unique_selector': raw.get('unique_selector') or None,
+        'form': raw.get('form') or None,
+        'is_displayed': bool(raw.get('is_displayed')),
+        'is_enabled': bool(raw.get('is_enabled')),
+    })
+    return info
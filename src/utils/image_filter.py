@@ -0,0 +1,115 @@
+"""
+OCR 전송 전 이미지 사전 필터 모듈
+
+텍스트가 있을 수 없는 이미지(너무 작은 이미지, 단색 이미지, 캡처 실패로 만든 빈 이미지)와
+이미 본 이미지는 OCR로 보내지 않고, 보내는 이미지는 흑백으로 바꾸고 크기를 줄인다.
+"""
+import hashlib
+from io import BytesIO
+from typing import Dict, Optional
+
+from PIL import Image, ImageStat
+
+# 건너뛴 이유 (통계 키, 요약 출력용 이름)
+SKIP_REASONS = [
+    ('too_small', '작음'),
+    ('uniform', '단색'),
+    ('empty', '빈 이미지'),
+    ('duplicate', '중복'),
+]
+
+
+class ImageFilter:
+    """OCR 대상 이미지를 거르고 압축하는 클래스 (페이지 하나 또는 실행 하나 단위로 사용)"""
+
+    def __init__(self, min_width: int = 8, min_height: int = 8, min_stddev: float = 2.0, max_side: int = 640):
+        """
+        필터 기준 설정
+
+        Args:
+            min_width: OCR로 보낼 최소 너비 (픽셀)
+            min_height: OCR로 보낼 최소 높이 (픽셀)
+            min_stddev: 흑백 픽셀 값의 최소 표준편차 (이보다 작으면 단색으로 판단)
+            max_side: 보낼 이미지의 최대 가로/세로 길이 (넘으면 비율을 유지하여 축소)
+        """
+        self.min_width = min_width
+        self.min_height = min_height
+        self.min_stddev = min_stddev
+        self.max_side = max_side
+
+        self.sent = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.skipped = {reason: 0 for reason, _ in SKIP_REASONS}
+
+        # 흑백 픽셀 해시별로 처음 본 이미지 번호
+        self._seen = {}
+        # 중복 이미지 번호별 처음 본 이미지 번호
+        self.duplicates = {}
+
+    def prepare(self, index: int, image_content: bytes) -> Optional[bytes]:
+        """
+        OCR로 보낼 이미지 준비
+
+        Args:
+            index: 이미지 번호 (중복 이미지의 원본을 찾을 때 사용)
+            image_content: 이미지 바이트 데이터
+
+        Returns:
+            흑백 PNG로 압축한 이미지 바이트 데이터 (건너뛸 이미지는 None, 중복이면 duplicates에 기록)
+        """
+        self.bytes_in += len(image_content or b'')
+
+        try:
+            image = Image.open(BytesIO(image_content))
+            image = image.convert('L')
+        except Exception:
+            self.skipped['empty'] += 1
+            return None
+
+        if image.width < self.min_width or image.height < self.min_height:
+            self.skipped['too_small'] += 1
+            return None
+
+        # 캡처 실패로 만든 빈 이미지와 아이콘 없는 단색 영역
+        minimum, maximum = image.getextrema()
+        if minimum == maximum:
+            self.skipped['empty'] += 1
+            return None
+        if ImageStat.Stat(image).stddev[0] < self.min_stddev:
+            self.skipped['uniform'] += 1
+            return None
+
+        key = hashlib.sha256(image.tobytes() + f"{image.width}x{image.height}".encode()).hexdigest()
+        if key in self._seen:
+            self.duplicates[index] = self._seen[key]
+            self.skipped['duplicate'] += 1
+            return None
+        self._seen[key] = index
+
+        if max(image.width, image.height) > self.max_side:
+            image.thumbnail((self.max_side, self.max_side))
+
+        buffer = BytesIO()
+        image.save(buffer, format='PNG', optimize=True)
+        prepared = buffer.getvalue()
+
+        self.sent += 1
+        self.bytes_out += len(prepared)
+        return prepared
+
+    def stats(self) -> Dict[str, int]:
+        """
+        필터 통계
+
+        Returns:
+            보낸 이미지 수, 건너뛴 이미지 수(이유별 포함), 입력/전송 바이트 수를 담은 딕셔너리
+        """
+        stats = {
+            'sent': self.sent,
+            'skipped': sum(self.skipped.values()),
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+        }
+        stats.update(self.skipped)
+        return stats
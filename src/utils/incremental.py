@@ -0,0 +1,204 @@
+"""
+증분 재생성 모듈
+
+출력 디렉토리의 매니페스트 파일에 페이지별 내용 지문, 요소별 지문과 생성된 메서드 코드,
+출력 파일의 내용 해시를 기록하여 다음 실행에서 다음을 건너뛴다.
+- 내용 지문(코드 생성에 쓰이는 속성과 텍스트)이 같은 페이지는 요소 탐색, OCR, 코드 생성 전체
+- 지문(속성과 구조적 위치)이 같은 요소는 메서드 코드 생성
+- 내용 해시가 같은 출력 파일은 파일 쓰기
+
+생성기 코드나 출력에 영향을 주는 옵션이 바뀌면 매니페스트 전체를 무효화한다.
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.utils.element_info import ELEMENT_ATTRIBUTES
+
+MANIFEST_NAME = '.po_manifest.json'
+MANIFEST_VERSION = 1
+
+# 요소 지문에 포함하는 요소 정보 키 (생성되는 메서드 코드를 결정하는 값과 구조적 위치)
+# 위치, 크기, 표시 여부는 코드에 영향을 주지 않으므로 제외
+FINGERPRINT_KEYS = (['element_category', 'tag_name', 'text'] + [key for key, _ in ELEMENT_ATTRIBUTES]
+                    + ['xpath_options', 'css_selector', 'unique_selector', 'form', 'index', 'locator', 'locator_matches'])
+
+# 생성되는 코드에 영향을 주는 모듈 (생성기 버전 해시 대상)
+GENERATOR_MODULES = ['po_generator.py', 'locators.py', 'locator_scoring.py']
+
+
+def content_hash(content: str) -> str:
+    """
+    파일 내용의 해시
+
+    Args:
+        content: 파일 내용
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def element_fingerprint(element_info: Dict[str, Any]) -> str:
+    """
+    요소 하나의 지문 (같은 지문의 요소는 같은 메서드 코드를 생성)
+
+    Args:
+        element_info: 요소 정보 딕셔너리
+
+    Returns:
+        SHA-1 16진수 문자열
+    """
+    values = [element_info.get(key) for key in FINGERPRINT_KEYS]
+    return hashlib.sha1(json.dumps(values, ensure_ascii=False, default=str).encode('utf-8')).hexdigest()
+
+
+def generator_version() -> str:
+    """
+    페이지 오브젝트 생성기와 로케이터 선택 코드의 해시 (코드가 바뀌면 저장된 메서드 코드를 재사용하지 않기 위함)
+
+    Returns:
+        SHA-1 16진수 문자열
+    """
+    digest = hashlib.sha1()
+    for name in GENERATOR_MODULES:
+        digest.update(Path(__file__).with_name(name).read_bytes())
+    return digest.hexdigest()
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """
+    기존 파일과 내용 해시가 다를 때만 파일 쓰기
+
+    Args:
+        path: 출력 파일 경로
+        content: 파일 내용
+
+    Returns:
+        파일을 썼으면 True, 내용이 같아 건너뛰었으면 False
+    """
+    path = Path(path)
+    try:
+        if content_hash(path.read_text(encoding='utf-8')) == content_hash(content):
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+
+class Manifest:
+    """출력 디렉토리의 증분 재생성 매니페스트 (여러 작업자 스레드에서 사용 가능)"""
+
+    def __init__(self, output_dir: Path, options: Optional[Dict[str, Any]] = None):
+        """
+        매니페스트 파일 읽기 (없거나 설정이 다르면 빈 매니페스트로 시작)
+
+        Args:
+            output_dir: 출력 디렉토리 (매니페스트는 이 디렉토리의 .po_manifest.json)
+            options: 생성되는 코드에 영향을 주는 실행 옵션 (이전 실행과 다르면 전체 재생성)
+        """
+        self.path = Path(output_dir) / MANIFEST_NAME
+        self.settings = {'generator': generator_version(), 'options': options or {}}
+        self.pages = {}
+        self._lock = threading.Lock()
+
+        # 실행 통계
+        self.unchanged_pages = 0
+        self.reused_methods = 0
+        self.generated_methods = 0
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') == MANIFEST_VERSION and data.get('settings') == self.settings:
+            self.pages = data.get('pages') or {}
+
+    def is_unchanged(self, output_name: str, fingerprint: str, output_dir: Path) -> bool:
+        """
+        페이지를 다시 처리하지 않아도 되는지 확인
+
+        Args:
+            output_name: 출력 파일 이름
+            fingerprint: 현재 페이지의 내용 지문
+            output_dir: 출력 디렉토리
+
+        Returns:
+            지문이 이전 실행과 같고 출력 파일이 그대로 남아 있으면 True
+        """
+        with self._lock:
+            page = self.pages.get(output_name)
+        if not page or page.get('fingerprint') != fingerprint:
+            return False
+
+        try:
+            content = (Path(output_dir) / output_name).read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return False
+        if content_hash(content) != page.get('content_hash'):
+            return False
+
+        with self._lock:
+            self.unchanged_pages += 1
+        return True
+
+    def method_cache(self, output_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        이전 실행에서 생성한 요소 지문별 메서드 코드
+
+        Args:
+            output_name: 출력 파일 이름
+
+        Returns:
+            {요소 지문: {'name', 'lines'}} 딕셔너리 (복사본)
+        """
+        with self._lock:
+            page = self.pages.get(output_name) or {}
+            return dict(page.get('methods') or {})
+
+    def update(self, output_name: str, url: str, fingerprint: Optional[str], elements: List[Dict[str, Any]],
+               method_cache: Dict[str, Dict[str, Any]], content: str):
+        """
+        페이지 처리 결과 기록
+
+        Args:
+            output_name: 출력 파일 이름
+            url: 페이지 URL
+            fingerprint: 페이지의 내용 지문 (없으면 다음 실행에서 건너뛰지 않음)
+            elements: 코드 생성에 사용한 요소 정보 리스트
+            method_cache: 코드 생성 후의 요소 지문별 메서드 코드
+            content: 출력 파일 내용
+        """
+        fingerprints = [element_fingerprint(element) for element in elements]
+
+        with self._lock:
+            previous = (self.pages.get(output_name) or {}).get('methods') or {}
+            reused = sum(1 for value in fingerprints if value in previous)
+            self.reused_methods += reused
+            self.generated_methods += len(fingerprints) - reused
+
+            # 현재 요소의 메서드 코드만 남김
+            self.pages[output_name] = {
+                'url': url,
+                'fingerprint': fingerprint,
+                'content_hash': content_hash(content),
+                'methods': {value: method_cache[value] for value in fingerprints if value in method_cache},
+            }
+
+    def save(self):
+        """매니페스트 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            data = {'version': MANIFEST_VERSION, 'settings': self.settings, 'pages': self.pages}
+            temp_path = self.path.with_name(self.path.name + '.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, self.path)
@@ -0,0 +1,254 @@
+"""
+로케이터 견고성 점수 모듈
+
+페이지(선택적으로 크롤링한 여러 페이지)의 요소 속성 값 빈도 색인을 한 번 만들고,
+로케이터 후보마다 안정성 점수와 속도 점수를 색인 조회만으로 계산한다.
+- 안정성: 값의 출처(아이디, data-testid, 텍스트, 클래스, 위치 경로 등)별 기본 점수에
+  페이지 안의 중복 수, 자동 생성 값(프레임워크 접두사, 해시, 긴 숫자, 높은 엔트로피, 사람이 읽는 문구는 제외),
+  다른 페이지에 나타난 숫자만 다른 값의 변형 수를 반영
+- 속도: 브라우저에서 요소를 찾는 방법(By)별 점수
+"""
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional
+
+from src.utils.element_info import ELEMENT_ATTRIBUTES
+
+# 값 출처별 기본 안정성 점수 (출처 이름은 HTML 속성 이름, 텍스트는 'text', 위치 경로는 'path')
+SOURCE_STABILITY = {
+    'data-testid': 1.0,
+    'data-test': 1.0,
+    'data-qa': 1.0,
+    'data-cy': 1.0,
+    'id': 0.95,
+    'name': 0.9,
+    'for': 0.85,
+    'aria-label': 0.8,
+    'placeholder': 0.75,
+    'title': 0.7,
+    'alt': 0.7,
+    'text': 0.6,
+    'href': 0.6,
+    'class': 0.5,
+    'path': 0.2,
+}
+
+# 로케이터 방식별 속도 점수 (아이디 조회가 가장 빠르고 XPath 평가가 가장 느림)
+BY_SPEED = {
+    'id': 1.0,
+    'name': 0.9,
+    'css selector': 0.8,
+    'class name': 0.8,
+    'xpath': 0.5,
+}
+
+# 종합 점수의 안정성 가중치 (나머지는 속도)
+STABILITY_WEIGHT = 0.8
+
+# 자동 생성 값의 안정성 배수, 숫자만 다른 변형이 있는 값의 안정성 배수
+GENERATED_PENALTY = 0.1
+VARIANT_PENALTY = 0.5
+
+# 자동 생성 값 패턴 (프레임워크가 붙이는 아이디와 빌드 도구의 해시 클래스 이름)
+GENERATED_PATTERNS = [
+    re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE),  # UUID
+    re.compile(r'^:r[0-9a-z]+:$'),  # React useId
+    re.compile(r'^(ember|ext-gen|ext-comp|yui_|gwt-uid-|ui-id-|jqxWidget|mui-|rc-|react-select-|headlessui-|radix-)'
+               r'[\w:-]*\d', re.IGNORECASE),
+    re.compile(r'^(css|jsx|sc|emotion|jss|svelte|styled)-[\w-]+$'),  # CSS-in-JS 클래스
+    re.compile(r'__[A-Za-z0-9_-]{5}$'),  # CSS Modules 해시 접미사
+    re.compile(r'(^|[-_:])(?=[0-9a-f]*\d)(?=[0-9a-f]*[a-f])[0-9a-f]{6,}$', re.IGNORECASE),  # 16진수 해시 접미사
+    re.compile(r'\d{5,}'),  # 긴 숫자 (연도 같은 4자리 숫자 제외)
+]
+
+# 자동 생성 값 판별을 하지 않는 출처 (사람이 읽는 문구, 예: 'Copyright 2024')
+READABLE_SOURCES = {'text', 'aria-label', 'placeholder', 'title', 'alt'}
+
+# 엔트로피 판별 대상 최소 길이와 기준 (문자당 비트)
+ENTROPY_MIN_LENGTH = 8
+ENTROPY_THRESHOLD = 3.0
+
+_DIGITS_PATTERN = re.compile(r'\d+')
+# camelCase 토큰의 단어와 숫자 부분 (예: 'submitOrder1' -> 'submit', 'Order', '1')
+_TOKEN_PART_PATTERN = re.compile(r'[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+')
+
+
+def value_entropy(value: str) -> float:
+    """
+    문자열의 문자당 섀넌 엔트로피
+
+    Args:
+        value: 문자열
+
+    Returns:
+        문자당 비트 수
+    """
+    if not value:
+        return 0.0
+    counts = Counter(value)
+    return -sum(count / len(value) * math.log2(count / len(value)) for count in counts.values())
+
+
+def looks_generated(value: str) -> bool:
+    """
+    빌드나 렌더링마다 바뀌는 자동 생성 값인지 판별 (패턴과 엔트로피)
+
+    Args:
+        value: 아이디, 클래스 이름 등 속성 값
+
+    Returns:
+        자동 생성 값으로 보이면 True
+    """
+    value = (value or '').strip()
+    if not value:
+        return False
+    if any(pattern.search(value) for pattern in GENERATED_PATTERNS):
+        return True
+
+    # 구분자 없이 대소문자와 숫자가 섞인 긴 토큰 (예: 'a8Kx2pQz', camelCase 식별자는 제외)
+    for token in re.split(r'[-_:.\s]+', value):
+        if (len(token) >= ENTROPY_MIN_LENGTH and re.search(r'\d', token) and re.search(r'[A-Za-z]', token)
+                and not _is_identifier(token) and value_entropy(token) >= ENTROPY_THRESHOLD):
+            return True
+    return False
+
+
+def _is_identifier(token: str) -> bool:
+    """두 글자 이상의 단어를 camelCase로 잇고 숫자 부분이 하나 이하인 토큰인지 (예: 'firstName1', 'submitOrder2')"""
+    parts = _TOKEN_PART_PATTERN.findall(token)
+    if ''.join(parts) != token:
+        return False
+    digits = [part for part in parts if part.isdigit()]
+    return len(digits) <= 1 and all(len(part) >= 2 for part in parts if not part.isdigit())
+
+
+def value_shape(value: str) -> str:
+    """숫자 부분을 '0'으로 바꾼 값 (목록 순번 등 숫자만 다른 값 묶음용)"""
+    return _DIGITS_PATTERN.sub('0', value)
+
+
+def element_values(element_info: Dict[str, Any]) -> List[tuple]:
+    """
+    색인에 넣을 요소의 (출처, 값) 목록
+
+    Args:
+        element_info: 요소 정보 딕셔너리
+
+    Returns:
+        (출처 이름, 값) 튜플 리스트 (클래스는 토큰별)
+    """
+    values = []
+    for key, attribute in ELEMENT_ATTRIBUTES:
+        value = element_info.get(key) or ''
+        if attribute == 'class':
+            values.extend(('class', token) for token in value.split())
+        elif value:
+            values.append((attribute, value))
+    text = ' '.join((element_info.get('text') or '').split())
+    if text:
+        values.append(('text', text))
+    return values
+
+
+class AttributeIndex:
+    """요소 속성 값의 빈도 색인 (현재 페이지의 값별 요소 수, 다른 페이지에 나타난 숫자만 다른 변형)"""
+
+    def __init__(self):
+        """빈 색인 생성"""
+        self.counts = Counter()
+        # (출처, 값 모양) -> 값별로 그 값이 나타난 페이지 수
+        self.variants = defaultdict(Counter)
+        self.pages = 0
+
+    def add_page(self, elements: List[Dict[str, Any]], current: bool = True):
+        """
+        페이지 하나의 요소 속성 값을 색인에 추가
+
+        Args:
+            elements: 요소 정보 딕셔너리 리스트 (유형이 여러 개라 중복된 요소는 한 번만 셈)
+            current: True면 이 페이지를 값별 요소 수(count) 조회 대상으로 설정
+        """
+        counts = Counter()
+        for element in _unique_elements(elements):
+            counts.update(element_values(element))
+
+        for source, value in counts:
+            self.variants[(source, value_shape(value))][value] += 1
+        self.pages += 1
+        if current:
+            self.counts = counts
+
+    def use_page(self, elements: List[Dict[str, Any]]):
+        """
+        이미 추가한 페이지를 값별 요소 수 조회 대상으로 설정 (크롤링 전체 색인에서 페이지별 점수 계산용)
+
+        Args:
+            elements: 요소 정보 딕셔너리 리스트
+        """
+        self.counts = Counter()
+        for element in _unique_elements(elements):
+            self.counts.update(element_values(element))
+
+    def count(self, source: str, value: str) -> int:
+        """현재 페이지에서 값이 같은 요소 수"""
+        return self.counts.get((source, value), 0)
+
+    def variant_count(self, source: str, value: str) -> int:
+        """
+        숫자만 다른 서로 다른 값의 수 (조회한 값과 현재 페이지 밖의 다른 페이지에 나타난 값)
+
+        같은 페이지의 목록 순번(예: name='address1', 'address2')은 페이지마다 바뀌는 값이 아니므로 세지 않는다.
+        """
+        values = {value}
+        for variant, pages in self.variants.get((source, value_shape(value)), {}).items():
+            # 현재 페이지에 있는 값은 현재 페이지를 뺀 나머지 페이지에도 나타났을 때만 셈
+            if pages > (1 if (source, variant) in self.counts else 0):
+                values.add(variant)
+        return len(values)
+
+
+def score_locator(by: str, source: str, value: str, index: Optional[AttributeIndex] = None) -> Dict[str, float]:
+    """
+    로케이터 후보 하나의 안정성, 속도, 종합 점수
+
+    Args:
+        by: Selenium By 값
+        source: 값의 출처 (SOURCE_STABILITY의 키)
+        value: 출처 속성의 원래 값 (로케이터 문자열이 아님)
+        index: 속성 값 빈도 색인 (없으면 중복과 변형을 반영하지 않음)
+
+    Returns:
+        {'stability', 'speed', 'score'} 딕셔너리 (0~1)
+    """
+    stability = SOURCE_STABILITY.get(source, 0.5)
+    if source != 'path':
+        if source not in READABLE_SOURCES and looks_generated(value):
+            stability *= GENERATED_PENALTY
+        if index is not None:
+            if index.variant_count(source, value) > 1:
+                stability *= VARIANT_PENALTY
+            # 같은 값의 요소가 여러 개면 고유하지 않음
+            stability /= max(1, index.count(source, value))
+
+    speed = BY_SPEED.get(by, 0.5)
+    return {
+        'stability': round(stability, 4),
+        'speed': speed,
+        'score': round(STABILITY_WEIGHT * stability + (1 - STABILITY_WEIGHT) * speed, 4),
+    }
+
+
+def _unique_elements(elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """유형이 여러 개라 여러 번 들어 있는 같은 요소를 하나로 (요소 참조 또는 속성과 위치로 판별)"""
+    seen, unique = set(), []
+    for element in elements:
+        if element.get('element') is not None:
+            key = id(element['element'])
+        else:
+            key = (element.get('tag_name'), element.get('unique_selector'), str(element.get('location')),
+                   tuple(element_values(element)))
+        if key not in seen:
+            seen.add(key)
+            unique.append(element)
+    return unique
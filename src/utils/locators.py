@@ -0,0 +1,212 @@
+"""
+로케이터 후보 생성 및 고유성 검증 모듈
+
+요소마다 로케이터 후보를 만들어 속성 값 빈도 색인(locator_scoring)으로 견고성 점수를 매기고,
+페이지의 모든 후보를 스크래퍼의 check_locators()로 한 번에 검사하여 대상 요소 하나에만
+일치하는 점수가 가장 높은 로케이터를 요소 정보에 기록한다. PageObjectGenerator는 기록된
+로케이터가 있으면 이를 사용한다.
+"""
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.locator_scoring import AttributeIndex, score_locator
+
+# Selenium By 값 (selenium.webdriver.common.by.By와 같은 문자열)
+BY_ID = 'id'
+BY_NAME = 'name'
+BY_CSS_SELECTOR = 'css selector'
+BY_CLASS_NAME = 'class name'
+BY_XPATH = 'xpath'
+
+# 고유 선택자의 속성 선택자 ('태그[속성="값"]')와 XPath 후보의 속성 조건 ("//*[@속성='값']")
+_ATTRIBUTE_SELECTOR_PATTERN = re.compile(r'^[\w-]*\[([\w-]+)="((?:[^"\\]|\\.)*)"\]$')
+_XPATH_ATTRIBUTE_PATTERN = re.compile(r"^//\*\[@([\w-]+)='(.*)'\]$")
+
+# 생성 코드에서 사용하는 By 상수 이름
+BY_CONSTANTS = {
+    BY_ID: 'By.ID',
+    BY_NAME: 'By.NAME',
+    BY_CSS_SELECTOR: 'By.CSS_SELECTOR',
+    BY_CLASS_NAME: 'By.CLASS_NAME',
+    BY_XPATH: 'By.XPATH',
+}
+
+
+def scored_candidates(element_info: Dict[str, Any],
+                      index: Optional[AttributeIndex] = None) -> List[Tuple[str, str, Dict[str, float]]]:
+    """
+    요소의 로케이터 후보와 점수 (종합 점수가 높은 순서, 같으면 브라우저에서 찾는 비용이 낮은 순서)
+
+    Args:
+        element_info: 요소 정보 딕셔너리
+        index: 속성 값 빈도 색인 (없으면 값의 출처와 자동 생성 여부만 반영)
+
+    Returns:
+        (By 값, 로케이터 값, {'stability', 'speed', 'score'}) 튜플 리스트 (중복 제외)
+    """
+    # (By 값, 로케이터 값, 값의 출처, 출처 속성의 원래 값)
+    sourced = []
+    element_id = element_info.get('id')
+    if element_id:
+        sourced.append((BY_ID, element_id, 'id', element_id))
+    if element_info.get('name'):
+        sourced.append((BY_NAME, element_info['name'], 'name', element_info['name']))
+    css_selector = element_info.get('css_selector')
+    # '#아이디'는 By.ID와 같은 요소를 찾으므로 제외
+    if css_selector and css_selector != f"#{element_id}":
+        sourced.append((BY_CSS_SELECTOR, css_selector, 'class', css_selector[1:]))
+    if element_info.get('aria_label'):
+        aria_label = ' '.join(element_info['aria_label'].split())
+        escaped = aria_label.replace("'", "\\'")
+        sourced.append((BY_CSS_SELECTOR, f"[aria-label='{escaped}']", 'aria-label', aria_label))
+    # 고유 선택자 중 속성 선택자는 해당 속성을 출처로, 위치 경로는 페이지 구조가 바뀌면 깨지므로 가장 낮은 점수로 사용
+    unique_selector = element_info.get('unique_selector')
+    if unique_selector and unique_selector != f"#{element_id}":
+        source, value = _selector_source(unique_selector)
+        sourced.append((BY_CSS_SELECTOR, unique_selector, source, value))
+    if element_info.get('class'):
+        tag = element_info.get('tag_name') or '*'
+        class_name = element_info['class'].split()[0]
+        sourced.append((BY_CSS_SELECTOR, f"{tag}.{class_name}" if tag != '*' else f".{class_name}", 'class',
+                        class_name))
+    for xpath in element_info.get('xpath_options') or []:
+        source, value = _xpath_source(xpath, element_info)
+        sourced.append((BY_XPATH, xpath, source, value))
+        # 태그로 범위를 좁힌 XPath (//*[...]는 같은 텍스트의 부모 요소와도 일치)
+        tag = element_info.get('tag_name')
+        if tag and xpath.startswith('//*['):
+            sourced.append((BY_XPATH, f"//{tag}{xpath[3:]}", source, value))
+
+    candidates = {}
+    for by, locator, source, value in sourced:
+        if (by, locator) not in candidates:
+            candidates[(by, locator)] = score_locator(by, source, value, index)
+    # sorted()는 안정 정렬이므로 점수가 같으면 위의 (비용이 낮은) 순서 유지
+    ranked = sorted(candidates.items(), key=lambda item: -item[1]['score'])
+    return [(by, locator, score) for (by, locator), score in ranked]
+
+
+def candidate_locators(element_info: Dict[str, Any],
+                       index: Optional[AttributeIndex] = None) -> List[Tuple[str, str]]:
+    """
+    요소의 로케이터 후보 (견고성 점수가 높은 순서)
+
+    Args:
+        element_info: 요소 정보 딕셔너리
+        index: 속성 값 빈도 색인 (없으면 값의 출처와 자동 생성 여부만 반영)
+
+    Returns:
+        (By 값, 로케이터 값) 튜플 리스트 (중복 제외)
+    """
+    return [(by, locator) for by, locator, _ in scored_candidates(element_info, index)]
+
+
+def choose_locators(elements: List[Dict[str, Any]], index: Optional[AttributeIndex] = None) -> int:
+    """
+    브라우저 검사 없이 점수가 가장 높은 로케이터 후보를 요소 정보에 기록
+    (--no-locator-check로 검사하지 않았거나 검사 결과가 없는 스냅샷 요소용)
+
+    이미 검증한 로케이터(locator_matches가 있는 요소)는 바꾸지 않는다.
+
+    Args:
+        elements: 요소 정보 딕셔너리 리스트 (locator, locator_score가 기록됨)
+        index: 속성 값 빈도 색인
+
+    Returns:
+        로케이터를 기록한 요소 수
+    """
+    chosen = 0
+    for element in elements:
+        if 'locator_matches' in element:
+            continue
+        candidates = scored_candidates(element, index)
+        if candidates:
+            by, locator, score = candidates[0]
+            element['locator'] = [by, locator]
+            element['locator_score'] = score['score']
+            chosen += 1
+    return chosen
+
+
+def validate_locators(scraper, elements: List[Dict[str, Any]], references: Optional[List[Any]] = None,
+                      index: Optional[AttributeIndex] = None) -> List[Dict[str, Any]]:
+    """
+    페이지의 모든 요소 로케이터 후보를 한 번에 검사하여 고유한 로케이터 선택
+
+    요소 참조가 있는 요소마다 다음 키를 기록한다.
+    - locator: 선택한 [By 값, 로케이터 값] (대상 요소와 일치하는 후보가 없으면 기록하지 않음)
+    - locator_matches: 선택한 로케이터와 일치하는 요소 수 (1이면 고유)
+    - locator_score: 선택한 로케이터의 견고성 종합 점수
+
+    Args:
+        scraper: check_locators()를 지원하는 WebScraper 또는 StaticScraper 인스턴스
+        elements: 요소 정보 딕셔너리 리스트 (기록한 값으로 갱신됨)
+        references: elements와 같은 순서의 웹 요소 또는 요소 노드 리스트 (기본값: 요소 정보의 'element')
+        index: 속성 값 빈도 색인 (없으면 값의 출처와 자동 생성 여부만 반영)
+
+    Returns:
+        고유한 로케이터를 찾지 못한 요소 정보 리스트
+    """
+    if references is None:
+        references = [element.get('element') for element in elements]
+    targets = [(element, reference) for element, reference in zip(elements, references) if reference is not None]
+    if not targets:
+        return []
+
+    scored = [scored_candidates(element, index) for element, _ in targets]
+    candidates = [[(by, locator) for by, locator, _ in locators] for locators in scored]
+    results = scraper.check_locators([reference for _, reference in targets], candidates)
+
+    ambiguous = []
+    for (element, _), locators, checks in zip(targets, scored, results):
+        # 대상 요소와 일치하는 후보 중 일치 수가 가장 적고 (같으면 점수가 더 높은) 로케이터
+        matching = [(count, order) for order, (count, found) in enumerate(checks) if found and count > 0]
+        if matching:
+            count, order = min(matching)
+            by, locator, score = locators[order]
+            element['locator'] = [by, locator]
+            element['locator_matches'] = count
+            element['locator_score'] = score['score']
+        else:
+            element.pop('locator', None)
+            element.pop('locator_score', None)
+            element['locator_matches'] = 0
+
+        if element['locator_matches'] != 1:
+            ambiguous.append(element)
+
+    return ambiguous
+
+
+def _selector_source(selector: str) -> Tuple[str, str]:
+    """고유 선택자 값의 출처 (속성 이름 또는 위치 경로 'path')와 원래 값"""
+    if selector.startswith('#') and ' ' not in selector:
+        return 'id', selector[1:]
+    match = _ATTRIBUTE_SELECTOR_PATTERN.match(selector)
+    if match:
+        return match.group(1), re.sub(r'\\(.)', r'\1', match.group(2))
+    return 'path', selector
+
+
+def _xpath_source(xpath: str, element_info: Dict[str, Any]) -> Tuple[str, str]:
+    """XPath 후보 값의 출처 (속성 이름 또는 텍스트 'text')와 원래 값"""
+    match = _XPATH_ATTRIBUTE_PATTERN.match(xpath)
+    if match:
+        return match.group(1), match.group(2)
+    return 'text', ' '.join((element_info.get('text') or '').split())
+
+
+def describe_locator(element_info: Dict[str, Any]) -> str:
+    """
+    요약 출력용 로케이터 설명
+
+    Args:
+        element_info: 요소 정보 딕셔너리
+
+    Returns:
+        'By.NAME "q" (3개 일치)' 형식의 문자열
+    """
+    if not element_info.get('locator'):
+        return "일치하는 로케이터 후보 없음"
+    by, value = element_info['locator']
+    return f"{BY_CONSTANTS.get(by, by)} \"{value}\" ({element_info.get('locator_matches', 0)}개 일치)"
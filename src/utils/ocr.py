@@ -1,45 +1,39 @@
 """
-Google Cloud Vision API를 사용한 OCR 기능 모듈
+OCR 기능 모듈
+
+실제 텍스트 인식은 ocr_backends 모듈의 백엔드(Google Cloud Vision, Tesseract 등)가 수행한다.
 """
-import os
-import io
-import json
-from typing import List, Dict, Any
-import warnings
+from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 
+from src.utils.ocr_backends import OCRBackend, create_backend
+from src.utils.ocr_cache import OCRCache, image_key
+from src.utils.profiler import Profiler
+
 # 환경 변수 로드
 load_dotenv()
 
 class OCRProcessor:
-    """Google Cloud Vision API를 사용하여 이미지에서 텍스트를 추출하는 클래스"""
+    """OCR 백엔드(기본값: Google Cloud Vision API)를 사용하여 이미지에서 텍스트를 추출하는 클래스"""
     
-    def __init__(self):
-        """Google Cloud Vision 클라이언트 초기화"""
-        # API 키 확인
-        self.api_available = False
-        credentials_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
+    def __init__(self, cache: Optional[OCRCache] = None, backend: Optional[OCRBackend] = None,
+                 profiler: Optional[Profiler] = None):
+        """
+        OCR 백엔드 초기화
         
-        if not credentials_path or not os.path.isfile(credentials_path):
-            warnings.warn(f"Google Cloud Vision API 인증 정보 파일이 존재하지 않습니다: {credentials_path}")
-            self.client = None
-        else:
-            try:
-                # 인증 파일 확인
-                print(f"인증 파일 확인 중: {credentials_path}")
-                with open(credentials_path, 'r') as f:
-                    json.load(f)  # JSON 형식 검증
-                
-                # 환경 변수가 제대로 설정되었는지 확인
-                os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
-                
-                from google.cloud import vision
-                self.client = vision.ImageAnnotatorClient()
-                self.api_available = True
-                print("Google Cloud Vision API 초기화 성공")
-            except Exception as e:
-                warnings.warn(f"Google Cloud Vision API 초기화 오류: {e}")
-                self.client = None
+        Args:
+            cache: OCR 결과 디스크 캐시 (없으면 캐시 미사용)
+            backend: OCR 백엔드 (기본값: OCR_BACKEND 환경 변수로 선택한 백엔드)
+            profiler: 백엔드 요청 시간과 전송한 이미지 크기를 기록할 프로파일러 (기본값: 기록하지 않음)
+        """
+        self.cache = cache
+        self.backend = backend if backend is not None else create_backend()
+        self.profiler = profiler if profiler is not None else Profiler(enabled=False)
+    
+    @property
+    def api_available(self) -> bool:
+        """OCR 백엔드 사용 가능 여부"""
+        return self.backend.available
     
     def detect_text(self, image_content: bytes) -> List[Dict[str, Any]]:
         """
@@ -51,48 +45,63 @@ class OCRProcessor:
         Returns:
             감지된 텍스트와 경계 상자 좌표를 포함하는 딕셔너리 리스트
         """
-        # API가 사용 불가능한 경우 빈 리스트 반환
-        if not self.api_available or self.client is None:
-            print("Google Cloud Vision API가 구성되지 않았습니다. 빈 결과를 반환합니다.")
-            return []
+        return self.detect_text_batch([image_content])[0]
+    
+    def detect_text_batch(self, images: List[bytes]) -> List[List[Dict[str, Any]]]:
+        """
+        여러 이미지의 텍스트를 한 번에 감지
         
-        try:
-            from google.cloud import vision
-            image = vision.Image(content=image_content)
-            response = self.client.text_detection(image=image)
-            
-            if response.error.message:
-                raise Exception(f"Google Vision API 오류: {response.error.message}")
+        캐시에 없는 이미지만 백엔드로 보내며 내용이 같은 이미지는 한 번만 보낸다.
+        (Vision 백엔드는 16개씩 묶은 batch_annotate_images 요청으로 보냄)
+        
+        Args:
+            images: 이미지 바이트 데이터 리스트
             
-            # 첫 번째 항목은 전체 텍스트
-            if not response.text_annotations:
-                return []
-                
-            texts = []
-            for text in response.text_annotations[1:]:  # 첫 번째 항목은 전체 텍스트이므로 건너뜀
-                vertices = [(vertex.x, vertex.y) for vertex in text.bounding_poly.vertices]
-                
-                # 바운딩 박스의 좌상단과 우하단 좌표 계산
-                x_values = [vertex[0] for vertex in vertices]
-                y_values = [vertex[1] for vertex in vertices]
-                top_left = (min(x_values), min(y_values))
-                bottom_right = (max(x_values), max(y_values))
-                
-                texts.append({
-                    'text': text.description,
-                    'vertices': vertices,
-                    'top_left': top_left,
-                    'bottom_right': bottom_right,
-                    'center': (
-                        (top_left[0] + bottom_right[0]) / 2, 
-                        (top_left[1] + bottom_right[1]) / 2
-                    )
-                })
-                
-            return texts
+        Returns:
+            입력 순서와 같은 순서의 감지 결과 리스트 (오류가 난 이미지는 빈 리스트)
+        """
+        results = [[] for _ in images]
+        namespace = self.backend.name
+        
+        # 캐시 조회 후 남은 이미지를 내용 해시별로 묶음
+        pending = {}
+        for index, image_content in enumerate(images):
+            if self.cache is not None:
+                cached = self.cache.get(image_content, namespace)
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            pending.setdefault(image_key(image_content), []).append(index)
+        
+        if not pending:
+            return results
+        
+        # 백엔드가 사용 불가능한 경우 빈 결과 반환
+        if not self.backend.available:
+            print(self.backend.unavailable_message)
+            return results
+        
+        indices_list = list(pending.values())
+        requested = [images[indices[0]] for indices in indices_list]
+        self.profiler.add('ocr.images', len(requested))
+        self.profiler.add('ocr.bytes', sum(len(image_content) for image_content in requested))
+        try:
+            with self.profiler.phase('ocr.request'):
+                responses = self.backend.detect_text_batch(requested)
         except Exception as e:
             print(f"텍스트 감지 중 오류 발생: {e}")
-            return []
+            return results
+        
+        for indices, texts in zip(indices_list, responses):
+            if texts is None:
+                continue
+            # 오류 없이 받은 결과만 캐시에 저장
+            if self.cache is not None:
+                self.cache.put(images[indices[0]], texts, namespace)
+            for index in indices:
+                results[index] = texts
+        
+        return results
     
     def is_button_text(self, text_info: Dict[str, Any]) -> bool:
         """
@@ -0,0 +1,497 @@
+"""
+OCR 엔진 백엔드 모듈
+
+OCRProcessor는 이미지 목록을 받아 텍스트 감지 결과를 돌려주는 백엔드를 통해 OCR을 수행한다.
+- vision: Google Cloud Vision API (네트워크 필요)
+- vision_rest: Google Cloud Vision REST API (API 키 사용, 엔드포인트 변경 가능)
+- tesseract: 로컬에 설치된 Tesseract 실행 파일 (subprocess, 네트워크 미사용)
+- fake: 이미지 내용으로 결정되는 결과를 돌려주는 테스트용 백엔드
+
+백엔드는 OCR_BACKEND 환경 변수나 --ocr-backend 옵션으로 선택한다.
+"""
+import abc
+import base64
+import csv
+import io
+import json
+import os
+import shutil
+import subprocess
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from src.utils.ocr_cache import image_key
+
+# 환경 변수 로드
+load_dotenv()
+
+# 기본 백엔드 (OCR_BACKEND 환경 변수로 변경 가능)
+DEFAULT_BACKEND = 'vision'
+
+# batch_annotate_images 요청 하나에 담을 수 있는 최대 이미지 수 (Vision API 제한)
+MAX_IMAGES_PER_REQUEST = 16
+
+# Vision REST API 엔드포인트 (VISION_API_ENDPOINT 환경 변수로 변경 가능)
+DEFAULT_VISION_ENDPOINT = 'https://vision.googleapis.com/v1/images:annotate'
+
+
+def make_text_result(text: str, vertices: List[tuple]) -> Dict[str, Any]:
+    """
+    텍스트와 경계 상자 꼭짓점으로 감지 결과 딕셔너리 생성
+
+    Args:
+        text: 감지된 텍스트
+        vertices: 경계 상자 꼭짓점 (x, y) 튜플 리스트
+
+    Returns:
+        text, vertices, top_left, bottom_right, center를 담은 딕셔너리
+    """
+    # 바운딩 박스의 좌상단과 우하단 좌표 계산
+    x_values = [vertex[0] for vertex in vertices]
+    y_values = [vertex[1] for vertex in vertices]
+    top_left = (min(x_values), min(y_values))
+    bottom_right = (max(x_values), max(y_values))
+
+    return {
+        'text': text,
+        'vertices': vertices,
+        'top_left': top_left,
+        'bottom_right': bottom_right,
+        'center': (
+            (top_left[0] + bottom_right[0]) / 2,
+            (top_left[1] + bottom_right[1]) / 2
+        )
+    }
+
+
+class OCRRequestError(Exception):
+    """OCR 요청 하나가 실패했을 때 발생하는 예외"""
+
+    def __init__(self, message: str, kind: str = 'error', retryable: bool = False, status: Optional[int] = None):
+        """
+        Args:
+            message: 오류 메시지
+            kind: 오류 종류 (rate_limited, server_error, timeout, connection, client_error, error 등)
+            retryable: 다시 요청하면 성공할 수 있는 오류인지 여부
+            status: HTTP 상태 코드 (알 수 없으면 None)
+        """
+        super().__init__(message)
+        self.kind = kind
+        self.retryable = retryable
+        self.status = status
+
+
+def error_from_status(status: Optional[int], message: str) -> OCRRequestError:
+    """
+    HTTP 상태 코드로 OCR 요청 오류 생성
+
+    Args:
+        status: HTTP 상태 코드
+        message: 오류 메시지
+
+    Returns:
+        오류 종류와 재시도 가능 여부가 채워진 OCRRequestError
+    """
+    if status == 429:
+        return OCRRequestError(message, 'rate_limited', True, status)
+    if status == 504 or status == 408:
+        return OCRRequestError(message, 'timeout', True, status)
+    if status is not None and status >= 500:
+        return OCRRequestError(message, 'server_error', True, status)
+    if status is not None and status >= 400:
+        return OCRRequestError(message, 'client_error', False, status)
+    return OCRRequestError(message, 'error', False, status)
+
+
+class OCRBackend(abc.ABC):
+    """OCR 백엔드 기본 클래스 (하위 클래스는 request_batch를 구현)"""
+
+    name = ''
+
+    # 백엔드를 사용할 수 있는지 여부 (인증 정보나 실행 파일이 없으면 False)
+    available = False
+
+    # 네트워크 서비스를 호출하는지 여부 (호출 속도 제한 대상)
+    remote = False
+
+    # 요청 하나에 담을 최대 이미지 수
+    max_batch_size = MAX_IMAGES_PER_REQUEST
+
+    # 사용할 수 없을 때 출력할 안내 메시지
+    unavailable_message = "OCR 백엔드를 사용할 수 없습니다. 빈 결과를 반환합니다."
+
+    def detect_text_batch(self, images: List[bytes]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        여러 이미지에서 텍스트 감지 (max_batch_size개씩 나누어 요청)
+
+        Args:
+            images: 이미지 바이트 데이터 리스트
+
+        Returns:
+            입력 순서와 같은 순서의 감지 결과 리스트 (오류가 난 이미지는 None)
+        """
+        results = []
+        for start in range(0, len(images), self.max_batch_size):
+            chunk = images[start:start + self.max_batch_size]
+            try:
+                results.extend(self.request_batch(chunk))
+            except OCRRequestError as e:
+                print(f"텍스트 일괄 감지 중 오류 발생: {e}")
+                results.extend([None] * len(chunk))
+        return results
+
+    @abc.abstractmethod
+    def request_batch(self, images: List[bytes]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        이미지 최대 max_batch_size개를 요청 하나로 처리
+
+        Args:
+            images: 이미지 바이트 데이터 리스트
+
+        Returns:
+            입력 순서와 같은 순서의 감지 결과 리스트 (해당 이미지만 실패하면 None)
+
+        Raises:
+            OCRRequestError: 요청 전체가 실패한 경우
+        """
+
+    def close(self):
+        """백엔드 자원 정리"""
+
+
+class VisionBackend(OCRBackend):
+    """Google Cloud Vision API 백엔드 (gRPC 클라이언트 라이브러리)"""
+
+    name = 'vision'
+    remote = True
+    unavailable_message = "Google Cloud Vision API가 구성되지 않았습니다. 빈 결과를 반환합니다."
+
+    def __init__(self, batch_size: int = MAX_IMAGES_PER_REQUEST):
+        """
+        Google Cloud Vision 클라이언트 초기화
+
+        Args:
+            batch_size: 요청 하나에 담을 최대 이미지 수 (API 제한: 16)
+        """
+        self.max_batch_size = max(1, min(batch_size, MAX_IMAGES_PER_REQUEST))
+        self.client = None
+
+        # API 키 확인
+        credentials_path = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
+
+        if not credentials_path or not os.path.isfile(credentials_path):
+            warnings.warn(f"Google Cloud Vision API 인증 정보 파일이 존재하지 않습니다: {credentials_path}")
+            return
+
+        try:
+            # 인증 파일 확인
+            print(f"인증 파일 확인 중: {credentials_path}")
+            with open(credentials_path, 'r') as f:
+                json.load(f)  # JSON 형식 검증
+
+            # 환경 변수가 제대로 설정되었는지 확인
+            os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
+
+            from google.cloud import vision
+            self.client = vision.ImageAnnotatorClient()
+            self.available = True
+            print("Google Cloud Vision API 초기화 성공")
+        except Exception as e:
+            warnings.warn(f"Google Cloud Vision API 초기화 오류: {e}")
+            self.client = None
+
+    def request_batch(self, images: List[bytes]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        batch_annotate_images 요청 하나로 텍스트 감지
+
+        Args:
+            images: 이미지 바이트 데이터 리스트 (최대 max_batch_size개)
+
+        Returns:
+            입력 순서와 같은 순서의 감지 결과 리스트 (오류가 난 이미지는 None)
+
+        Raises:
+            OCRRequestError: 요청 전체가 실패한 경우
+        """
+        from google.cloud import vision
+        feature = vision.Feature(type_=vision.Feature.Type.TEXT_DETECTION)
+        requests = [vision.AnnotateImageRequest(image=vision.Image(content=image_content), features=[feature])
+                    for image_content in images]
+        try:
+            response = self.client.batch_annotate_images(requests=requests)
+        except Exception as e:
+            # google.api_core 예외는 HTTP 상태 코드를 code 속성으로 제공
+            status = getattr(e, 'code', None)
+            raise error_from_status(status if isinstance(status, int) else None, f"Google Vision API 오류: {e}")
+
+        results = []
+        for image_response in response.responses:
+            if image_response.error.message:
+                print(f"텍스트 감지 중 오류 발생: Google Vision API 오류: {image_response.error.message}")
+                results.append(None)
+                continue
+            results.append(self._parse_text_annotations(image_response.text_annotations))
+
+        if len(results) != len(images):
+            raise OCRRequestError(f"Google Vision API 응답 수가 요청 수와 다릅니다: {len(results)}/{len(images)}")
+        return results
+
+    def _parse_text_annotations(self, text_annotations) -> List[Dict[str, Any]]:
+        """
+        Vision API 텍스트 주석을 텍스트와 경계 상자 좌표 딕셔너리 리스트로 변환
+
+        Args:
+            text_annotations: 응답의 text_annotations 필드
+
+        Returns:
+            감지된 텍스트와 경계 상자 좌표를 포함하는 딕셔너리 리스트
+        """
+        # 첫 번째 항목은 전체 텍스트
+        if not text_annotations:
+            return []
+
+        return [make_text_result(text.description, [(vertex.x, vertex.y) for vertex in text.bounding_poly.vertices])
+                for text in text_annotations[1:]]  # 첫 번째 항목은 전체 텍스트이므로 건너뜀
+
+
+class VisionRestBackend(OCRBackend):
+    """Google Cloud Vision REST API 백엔드 (API 키 사용, 엔드포인트 변경 가능)"""
+
+    name = 'vision_rest'
+    remote = True
+    unavailable_message = "Google Cloud Vision API 키가 설정되지 않았습니다. 빈 결과를 반환합니다."
+
+    def __init__(self, api_key: Optional[str] = None, endpoint: Optional[str] = None, timeout: float = 30):
+        """
+        HTTP 세션 초기화
+
+        Args:
+            api_key: API 키 (기본값: GOOGLE_VISION_API_KEY 환경 변수)
+            endpoint: images:annotate 엔드포인트 URL (기본값: VISION_API_ENDPOINT 환경 변수 또는 Google 엔드포인트)
+            timeout: 요청 하나의 최대 대기 시간 (초)
+        """
+        import requests
+
+        self.api_key = api_key or os.getenv('GOOGLE_VISION_API_KEY')
+        self.endpoint = endpoint or os.getenv('VISION_API_ENDPOINT') or DEFAULT_VISION_ENDPOINT
+        self.timeout = timeout
+        self.session = requests.Session()
+        # 엔드포인트를 바꾼 경우(프록시, 로컬 대역 서버)에는 API 키 없이도 사용 가능
+        self.available = bool(self.api_key) or self.endpoint != DEFAULT_VISION_ENDPOINT
+
+        if not self.available:
+            warnings.warn("GOOGLE_VISION_API_KEY 환경 변수가 설정되지 않았습니다.")
+
+    def request_batch(self, images: List[bytes]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        images:annotate 요청 하나로 텍스트 감지
+
+        Args:
+            images: 이미지 바이트 데이터 리스트 (최대 max_batch_size개)
+
+        Returns:
+            입력 순서와 같은 순서의 감지 결과 리스트 (오류가 난 이미지는 None)
+
+        Raises:
+            OCRRequestError: 요청 전체가 실패한 경우
+        """
+        import requests
+
+        payload = {'requests': [{
+            'image': {'content': base64.b64encode(image_content).decode('ascii')},
+            'features': [{'type': 'TEXT_DETECTION'}],
+        } for image_content in images]}
+        params = {'key': self.api_key} if self.api_key else None
+
+        try:
+            response = self.session.post(self.endpoint, params=params, json=payload, timeout=self.timeout)
+        except requests.Timeout as e:
+            raise OCRRequestError(f"Google Vision API 응답 시간 초과: {e}", 'timeout', True)
+        except requests.RequestException as e:
+            raise OCRRequestError(f"Google Vision API 연결 오류: {e}", 'connection', True)
+
+        if response.status_code != 200:
+            raise error_from_status(response.status_code,
+                                    f"Google Vision API 오류: HTTP {response.status_code} {response.text[:200]}")
+
+        results = []
+        for image_response in response.json().get('responses', []):
+            if image_response.get('error', {}).get('message'):
+                print(f"텍스트 감지 중 오류 발생: Google Vision API 오류: {image_response['error']['message']}")
+                results.append(None)
+                continue
+            # 첫 번째 항목은 전체 텍스트이므로 건너뜀 (값이 0인 좌표는 응답에서 생략됨)
+            results.append([
+                make_text_result(text.get('description', ''),
+                                 [(vertex.get('x', 0), vertex.get('y', 0))
+                                  for vertex in text.get('boundingPoly', {}).get('vertices', [])] or [(0, 0)])
+                for text in image_response.get('textAnnotations', [])[1:]
+            ])
+
+        if len(results) != len(images):
+            raise OCRRequestError(f"Google Vision API 응답 수가 요청 수와 다릅니다: {len(results)}/{len(images)}")
+        return results
+
+    def close(self):
+        """HTTP 세션 종료"""
+        self.session.close()
+
+
+class TesseractBackend(OCRBackend):
+    """로컬 Tesseract 실행 파일 백엔드 (이미지마다 subprocess 실행, 여러 이미지를 동시에 처리)"""
+
+    name = 'tesseract'
+    max_batch_size = 1
+    unavailable_message = "Tesseract 실행 파일을 찾을 수 없습니다. 빈 결과를 반환합니다."
+
+    def __init__(self, command: Optional[str] = None, lang: Optional[str] = None,
+                 workers: Optional[int] = None, timeout: float = 30):
+        """
+        Tesseract 실행 파일 확인
+
+        Args:
+            command: 실행 파일 경로 (기본값: TESSERACT_CMD 환경 변수 또는 PATH의 tesseract)
+            lang: 인식 언어 (기본값: TESSERACT_LANG 환경 변수 또는 kor+eng)
+            workers: 동시에 실행할 프로세스 수 (기본값: CPU 수)
+            timeout: 이미지 하나의 최대 처리 시간 (초)
+        """
+        self.command = shutil.which(command or os.getenv('TESSERACT_CMD') or 'tesseract')
+        self.lang = lang or os.getenv('TESSERACT_LANG', 'kor+eng')
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.timeout = timeout
+        self.available = self.command is not None
+
+        if not self.available:
+            warnings.warn("Tesseract 실행 파일을 찾을 수 없습니다. TESSERACT_CMD 환경 변수로 경로를 지정하세요.")
+
+    def detect_text_batch(self, images: List[bytes]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        이미지마다 Tesseract를 실행하여 단어 단위로 텍스트 감지
+
+        Args:
+            images: 이미지 바이트 데이터 리스트
+
+        Returns:
+            입력 순서와 같은 순서의 감지 결과 리스트 (오류가 난 이미지는 None)
+        """
+        if len(images) <= 1:
+            return [self._detect_text(image_content) for image_content in images]
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(images))) as executor:
+            return list(executor.map(self._detect_text, images))
+
+    def request_batch(self, images: List[bytes]) -> List[Optional[List[Dict[str, Any]]]]:
+        """이미지마다 Tesseract를 차례로 실행 (오류가 난 이미지는 None)"""
+        return [self._detect_text(image_content) for image_content in images]
+
+    def _detect_text(self, image_content: bytes) -> Optional[List[Dict[str, Any]]]:
+        """표준 입력으로 이미지를 넘기고 TSV 출력에서 단어와 경계 상자 추출"""
+        try:
+            completed = subprocess.run(
+                [self.command, 'stdin', 'stdout', '-l', self.lang, 'tsv'],
+                input=image_content, capture_output=True, timeout=self.timeout,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"텍스트 감지 중 오류 발생: Tesseract 실행 오류: {e}")
+            return None
+
+        if completed.returncode != 0:
+            message = completed.stderr.decode('utf-8', errors='replace').strip()
+            print(f"텍스트 감지 중 오류 발생: Tesseract 오류: {message}")
+            return None
+
+        return parse_tesseract_tsv(completed.stdout.decode('utf-8', errors='replace'))
+
+
+def parse_tesseract_tsv(output: str) -> List[Dict[str, Any]]:
+    """
+    Tesseract TSV 출력을 텍스트와 경계 상자 좌표 딕셔너리 리스트로 변환
+
+    Args:
+        output: tesseract ... tsv 명령의 출력
+
+    Returns:
+        단어 단위 감지 결과 딕셔너리 리스트
+    """
+    texts = []
+    for row in csv.DictReader(io.StringIO(output), delimiter='\t', quoting=csv.QUOTE_NONE):
+        text = (row.get('text') or '').strip()
+        # 단어 수준(level 5) 행 중 인식된 단어만 사용
+        if row.get('level') != '5' or not text or float(row.get('conf') or -1) < 0:
+            continue
+
+        left, top = int(row['left']), int(row['top'])
+        right, bottom = left + int(row['width']), top + int(row['height'])
+        texts.append(make_text_result(text, [(left, top), (right, top), (right, bottom), (left, bottom)]))
+    return texts
+
+
+class FakeBackend(OCRBackend):
+    """이미지 내용으로 결정되는 결과를 돌려주는 테스트용 백엔드 (네트워크, 외부 프로그램 미사용)"""
+
+    name = 'fake'
+    available = True
+
+    def __init__(self, texts: Optional[Dict[bytes, str]] = None):
+        """
+        테스트용 백엔드 초기화
+
+        Args:
+            texts: 이미지 바이트별로 돌려줄 텍스트 (없는 이미지는 내용 해시로 만든 텍스트)
+        """
+        self.texts = dict(texts or {})
+        self.calls = 0
+        self.images = 0
+
+    def request_batch(self, images: List[bytes]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        이미지마다 단어 하나짜리 결과 생성 (요청 수는 calls, 이미지 수는 images에 누적)
+
+        Args:
+            images: 이미지 바이트 데이터 리스트
+
+        Returns:
+            입력 순서와 같은 순서의 감지 결과 리스트 (빈 텍스트를 지정한 이미지는 빈 리스트)
+        """
+        self.calls += 1
+        self.images += len(images)
+
+        results = []
+        for image_content in images:
+            text = self.texts.get(image_content)
+            if text is None:
+                text = f"text-{image_key(image_content)[:8]}"
+            results.append([make_text_result(text, [(0, 0), (10 * len(text), 0), (10 * len(text), 20), (0, 20)])]
+                           if text else [])
+        return results
+
+
+# 백엔드 이름별 클래스
+OCR_BACKENDS = {
+    VisionBackend.name: VisionBackend,
+    VisionRestBackend.name: VisionRestBackend,
+    TesseractBackend.name: TesseractBackend,
+    FakeBackend.name: FakeBackend,
+}
+
+
+def create_backend(name: Optional[str] = None) -> OCRBackend:
+    """
+    이름으로 OCR 백엔드 생성
+
+    Args:
+        name: 백엔드 이름 (기본값: OCR_BACKEND 환경 변수 또는 vision)
+
+    Returns:
+        OCR 백엔드 인스턴스
+
+    Raises:
+        ValueError: 알 수 없는 백엔드 이름인 경우
+    """
+    name = (name or os.getenv('OCR_BACKEND') or DEFAULT_BACKEND).lower()
+    if name not in OCR_BACKENDS:
+        raise ValueError(f"알 수 없는 OCR 백엔드입니다: {name} (사용 가능: {', '.join(OCR_BACKENDS)})")
+    return OCR_BACKENDS[name]()
@@ -0,0 +1,217 @@
+"""
+OCR 결과를 이미지 내용 해시로 저장하는 디스크 캐시 모듈
+
+같은 아이콘 버튼(장바구니, 검색, 메뉴 등)은 사이트의 모든 페이지에 반복해서 나타나므로
+잘라낸 이미지 바이트의 해시를 키로 OCR 결과를 저장해 두고 다시 요청하지 않는다.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+# 환경 변수 로드
+load_dotenv()
+
+# 기본 설정 (환경 변수로 변경 가능)
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60  # 30일
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024     # 100MB
+
+
+def default_cache_path() -> str:
+    """
+    OCR 캐시 파일 경로
+
+    Returns:
+        OCR_CACHE_PATH 환경 변수 또는 PO_GENERATOR_CACHE_DIR(기본값: ~/.cache/po_generator) 아래의 ocr_cache.sqlite3
+    """
+    if os.getenv('OCR_CACHE_PATH'):
+        return os.path.expanduser(os.getenv('OCR_CACHE_PATH'))
+    base = os.getenv('PO_GENERATOR_CACHE_DIR') or os.path.join('~', '.cache', 'po_generator')
+    return os.path.join(os.path.expanduser(base), 'ocr_cache.sqlite3')
+
+
+def image_key(image_content: bytes, namespace: str = '') -> str:
+    """
+    이미지 바이트의 내용 해시 (캐시 키)
+
+    Args:
+        image_content: 이미지 바이트 데이터
+        namespace: 결과를 구분할 이름 (OCR 백엔드 이름 등, 기본값: 구분 없음)
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    digest = hashlib.sha256(image_content)
+    if namespace:
+        digest.update(b'\0' + namespace.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class OCRCache:
+    """크기 제한과 만료 시간이 있는 LRU 방식의 OCR 결과 디스크 캐시"""
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = None, max_bytes: Optional[int] = None):
+        """
+        캐시 파일 열기 (없으면 생성)
+
+        Args:
+            path: 캐시 파일 경로 (기본값: default_cache_path())
+            ttl: 항목 만료 시간 (초, 기본값: OCR_CACHE_TTL 환경 변수 또는 30일)
+            max_bytes: 저장할 결과의 최대 총 크기 (바이트, 기본값: OCR_CACHE_MAX_BYTES 환경 변수 또는 100MB)
+        """
+        self.path = path or default_cache_path()
+        self.ttl = ttl if ttl is not None else float(os.getenv('OCR_CACHE_TTL', DEFAULT_TTL_SECONDS))
+        self.max_bytes = max_bytes if max_bytes is not None else int(os.getenv('OCR_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES))
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # 적중 시 갱신할 마지막 사용 시각 (키별, put 또는 close에서 한 번에 기록)
+        self._pending_access: Dict[str, float] = {}
+
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ocr_results ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ocr_results_accessed ON ocr_results (accessed)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ocr_results_created ON ocr_results (created)")
+        self._conn.commit()
+        # 저장된 결과의 총 크기 (저장과 삭제 때 갱신하여 put마다 전체 합계를 다시 계산하지 않음)
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM ocr_results").fetchone()[0]
+
+    def get(self, image_content: bytes, namespace: str = '') -> Optional[List[Dict[str, Any]]]:
+        """
+        캐시된 OCR 결과 조회
+
+        Args:
+            image_content: 이미지 바이트 데이터
+            namespace: 결과를 구분할 이름 (OCR 백엔드 이름 등)
+
+        Returns:
+            OCR 결과 리스트 (캐시에 없거나 만료되었으면 None)
+        """
+        key = image_key(image_content, namespace)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute("SELECT value, created, size FROM ocr_results WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                if row is not None:
+                    self._conn.execute("DELETE FROM ocr_results WHERE key = ?", (key,))
+                    self._conn.commit()
+                    self._total_bytes -= row[2]
+                    self._pending_access.pop(key, None)
+                self.misses += 1
+                return None
+
+            # 적중마다 쓰고 커밋하지 않도록 사용 시각은 모아 두었다가 한 번에 기록
+            self._pending_access[key] = now
+            self.hits += 1
+
+        return [_restore_result(result) for result in json.loads(row[0])]
+
+    def put(self, image_content: bytes, results: List[Dict[str, Any]], namespace: str = ''):
+        """
+        OCR 결과 저장 (크기 제한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제)
+
+        Args:
+            image_content: 이미지 바이트 데이터
+            results: detect_text 형식의 OCR 결과 리스트
+            namespace: 결과를 구분할 이름 (OCR 백엔드 이름 등)
+        """
+        key = image_key(image_content, namespace)
+        value = json.dumps(results, ensure_ascii=False)
+        size = len(value.encode('utf-8'))
+        now = time.time()
+
+        with self._lock:
+            self._flush_access()
+            old = self._conn.execute("SELECT size FROM ocr_results WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ocr_results (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now),
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            self._evict(now)
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 통계
+
+        Returns:
+            적중, 미스, 삭제 횟수와 저장된 항목 수, 총 크기를 담은 딕셔너리
+        """
+        with self._lock:
+            entries, total_bytes = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM ocr_results").fetchone()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': entries,
+            'bytes': total_bytes,
+        }
+
+    def close(self):
+        """모아 둔 사용 시각을 기록하고 캐시 파일 닫기"""
+        with self._lock:
+            self._flush_access()
+            self._conn.commit()
+            self._conn.close()
+
+    def _flush_access(self):
+        """모아 둔 마지막 사용 시각을 기록 (잠금 상태에서 호출, 커밋은 호출한 쪽에서 수행)"""
+        if self._pending_access:
+            self._conn.executemany("UPDATE ocr_results SET accessed = ? WHERE key = ?",
+                                   [(accessed, key) for key, accessed in self._pending_access.items()])
+            self._pending_access.clear()
+
+    def _evict(self, now: float):
+        """만료된 항목과 크기 제한을 넘는 오래된 항목 삭제 (잠금 상태에서 호출)"""
+        cutoff = now - self.ttl
+        expired, expired_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM ocr_results WHERE created < ?", (cutoff,)).fetchone()
+        if expired:
+            self._conn.execute("DELETE FROM ocr_results WHERE created < ?", (cutoff,))
+            self.evictions += expired
+            self._total_bytes -= expired_bytes
+
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        # 다른 프로세스가 같은 캐시 파일을 바꿨을 수 있으므로 삭제 전에 실제 총 크기로 맞춤
+        total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM ocr_results").fetchone()[0]
+        self._total_bytes = total_bytes
+        if total_bytes <= self.max_bytes:
+            return
+
+        # 매번 삭제하지 않도록 제한의 90%까지 줄임
+        target_bytes = int(self.max_bytes * 0.9)
+        for key, size in self._conn.execute("SELECT key, size FROM ocr_results ORDER BY accessed ASC").fetchall():
+            if total_bytes <= target_bytes:
+                break
+            self._conn.execute("DELETE FROM ocr_results WHERE key = ?", (key,))
+            total_bytes -= size
+            self.evictions += 1
+        self._total_bytes = total_bytes
+
+
+def _restore_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON으로 저장하며 리스트가 된 좌표를 튜플로 복원"""
+    restored = dict(result)
+    for key in ('top_left', 'bottom_right', 'center'):
+        if key in restored:
+            restored[key] = tuple(restored[key])
+    if 'vertices' in restored:
+        restored['vertices'] = [tuple(vertex) for vertex in restored['vertices']]
+    return restored
@@ -0,0 +1,213 @@
+"""
+호출 속도와 동시 요청 수를 제한하는 OCR 요청 실행 모듈
+
+원격 OCR 백엔드(Vision API)를 감싸 다음을 처리한다.
+- 토큰 버킷으로 초당 요청 수 제한, 세마포어로 동시 요청 수 제한
+- 재시도 가능한 오류(429, 5xx, 시간 초과)는 지수 백오프(지터 포함)로 다시 요청
+- 실행 전체의 OCR 시간 예산을 넘으면 남은 요청은 보내지 않음
+- 오류 종류별 횟수 기록 (빈 결과로 조용히 사라지지 않도록)
+"""
+import os
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from src.utils.ocr_backends import OCRBackend, OCRRequestError
+
+# 환경 변수 로드
+load_dotenv()
+
+
+class TokenBucket:
+    """초당 rate개의 토큰이 채워지고 최대 capacity개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: 초당 채워지는 토큰 수 (0 이하면 제한 없음)
+            capacity: 최대 토큰 수 (기본값: max(1, rate), 한 번에 몰아 보낼 수 있는 요청 수)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """
+        토큰 하나를 얻을 때까지 대기
+
+        Args:
+            deadline: time.monotonic() 기준 대기 한도 (없으면 무한 대기)
+
+        Returns:
+            토큰을 얻었으면 True, 한도 안에 얻을 수 없으면 False
+        """
+        if self.rate <= 0:
+            return True
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class RateLimitedBackend(OCRBackend):
+    """다른 OCR 백엔드의 요청을 속도 제한, 재시도, 시간 예산 안에서 동시에 실행하는 백엔드"""
+
+    def __init__(self, backend: OCRBackend, concurrency: Optional[int] = None, rate: Optional[float] = None,
+                 max_retries: Optional[int] = None, time_budget: Optional[float] = None,
+                 base_delay: float = 0.5, max_delay: float = 16.0):
+        """
+        Args:
+            backend: 실제 요청을 보내는 OCR 백엔드
+            concurrency: 동시에 보낼 최대 요청 수 (기본값: OCR_CONCURRENCY 환경 변수 또는 4)
+            rate: 초당 최대 요청 수 (기본값: OCR_RATE_LIMIT 환경 변수 또는 10, 0이면 제한 없음)
+            max_retries: 재시도 가능한 오류의 최대 재시도 횟수 (기본값: OCR_MAX_RETRIES 환경 변수 또는 4)
+            time_budget: 실행 전체의 OCR 시간 예산 (초, 기본값: OCR_TIME_BUDGET 환경 변수, 없으면 제한 없음)
+            base_delay: 첫 재시도 대기 시간 (초, 재시도마다 두 배)
+            max_delay: 최대 재시도 대기 시간 (초)
+        """
+        self.backend = backend
+        self.name = backend.name
+        self.available = backend.available
+        self.remote = backend.remote
+        self.max_batch_size = backend.max_batch_size
+        self.unavailable_message = backend.unavailable_message
+
+        self.concurrency = max(1, concurrency if concurrency is not None else int(os.getenv('OCR_CONCURRENCY', '4')))
+        rate = rate if rate is not None else float(os.getenv('OCR_RATE_LIMIT', '10'))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv('OCR_MAX_RETRIES', '4'))
+        if time_budget is None and os.getenv('OCR_TIME_BUDGET'):
+            time_budget = float(os.getenv('OCR_TIME_BUDGET'))
+        self.time_budget = time_budget
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self.bucket = TokenBucket(rate)
+        self._slots = threading.Semaphore(self.concurrency)
+        self._lock = threading.Lock()
+        self._deadline = None
+
+        self.requests = 0
+        self.retries = 0
+        self.failed_images = 0
+        self.errors = Counter()
+
+    def detect_text_batch(self, images: List[bytes]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        max_batch_size개씩 나눈 요청을 동시에 실행
+
+        Args:
+            images: 이미지 바이트 데이터 리스트
+
+        Returns:
+            입력 순서와 같은 순서의 감지 결과 리스트 (최종적으로 실패한 이미지는 None)
+        """
+        chunks = [images[start:start + self.max_batch_size] for start in range(0, len(images), self.max_batch_size)]
+        if len(chunks) <= 1:
+            responses = [self.request_batch(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(chunks))) as executor:
+                responses = list(executor.map(self.request_batch, chunks))
+
+        results = []
+        for chunk, response in zip(chunks, responses):
+            results.extend(response if response is not None else [None] * len(chunk))
+        return results
+
+    def request_batch(self, images: List[bytes]) -> Optional[List[Optional[List[Dict[str, Any]]]]]:
+        """
+        요청 하나를 속도 제한과 재시도를 적용하여 실행
+
+        Args:
+            images: 이미지 바이트 데이터 리스트 (최대 max_batch_size개)
+
+        Returns:
+            감지 결과 리스트 (최종적으로 실패하면 None, 오류는 errors에 기록)
+        """
+        deadline = self._start_budget()
+        attempt = 0
+
+        while True:
+            if not self.bucket.acquire(deadline):
+                return self._fail(images, 'budget_exceeded', "OCR 시간 예산을 초과하여 요청하지 않았습니다.")
+
+            with self._slots:
+                if deadline is not None and time.monotonic() >= deadline:
+                    return self._fail(images, 'budget_exceeded', "OCR 시간 예산을 초과하여 요청하지 않았습니다.")
+                with self._lock:
+                    self.requests += 1
+                try:
+                    return self.backend.request_batch(images)
+                except OCRRequestError as e:
+                    error = e
+                except Exception as e:
+                    error = OCRRequestError(str(e))
+
+            with self._lock:
+                self.errors[error.kind] += 1
+
+            if not error.retryable or attempt >= self.max_retries:
+                return self._fail(images, None, f"텍스트 일괄 감지 중 오류 발생 ({error.kind}): {error}")
+
+            # 지수 백오프 (동시에 실패한 요청이 한꺼번에 재시도하지 않도록 지터 추가)
+            delay = min(self.max_delay, self.base_delay * (2 ** attempt)) * random.uniform(0.5, 1.0)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                return self._fail(images, 'budget_exceeded', f"OCR 시간 예산 안에 재시도할 수 없습니다: {error}")
+
+            attempt += 1
+            with self._lock:
+                self.retries += 1
+            time.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        요청 통계
+
+        Returns:
+            요청 수, 재시도 수, 실패한 이미지 수, 오류 종류별 횟수를 담은 딕셔너리
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'retries': self.retries,
+                'failed_images': self.failed_images,
+                'errors': dict(self.errors),
+            }
+
+    def close(self):
+        """감싼 백엔드 자원 정리"""
+        self.backend.close()
+
+    def _start_budget(self) -> Optional[float]:
+        """첫 요청 시점부터 시간 예산 계산 시작"""
+        if self.time_budget is None:
+            return None
+        with self._lock:
+            if self._deadline is None:
+                self._deadline = time.monotonic() + self.time_budget
+            return self._deadline
+
+    def _fail(self, images: List[bytes], kind: Optional[str], message: str) -> None:
+        """실패한 요청을 기록하고 메시지 출력"""
+        with self._lock:
+            if kind:
+                self.errors[kind] += 1
+            self.failed_images += len(images)
+        print(message)
+        return None
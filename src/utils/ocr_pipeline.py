@@ -0,0 +1,110 @@
+"""
+스크린샷 캡처와 OCR을 겹쳐 실행하는 생산자/소비자 파이프라인 모듈
+
+브라우저 작업(스크린샷 캡처)을 하는 스레드가 OCR 작업을 크기가 제한된 큐에 넣으면
+작업자 스레드들이 꺼내어 OCR을 수행한다. OCR 대기 시간이 브라우저 작업 뒤에 숨겨진다.
+"""
+import queue
+import threading
+import time
+from typing import Any, Dict, List
+
+from src.utils.ocr import OCRProcessor
+
+# 작업자 종료 신호
+_STOP = object()
+
+
+class OCRPipeline:
+    """OCR 작업을 제한된 큐로 받아 작업자 스레드에서 처리하는 파이프라인"""
+
+    def __init__(self, ocr_processor: OCRProcessor, workers: int = 2, batch_size: int = 16, queue_size: int = 4):
+        """
+        작업자 스레드 시작
+
+        Args:
+            ocr_processor: OCR 프로세서 인스턴스
+            workers: OCR 작업자 스레드 수
+            batch_size: 작업 하나로 묶어 보낼 최대 이미지 수
+            queue_size: 대기 중인 작업의 최대 수 (가득 차면 생산자가 기다림)
+        """
+        self.ocr_processor = ocr_processor
+        self.batch_size = max(1, batch_size)
+        self.jobs = 0
+        self.wait_time = 0.0
+
+        self._queue = queue.Queue(maxsize=max(1, queue_size))
+        self._pending = []
+        self._results = {}
+        self._lock = threading.Lock()
+        self._workers = [threading.Thread(target=self._consume, daemon=True) for _ in range(max(1, workers))]
+        for worker in self._workers:
+            worker.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def submit(self, index: int, image_content: bytes):
+        """
+        OCR할 이미지 추가 (batch_size개가 모이면 작업으로 큐에 넣음)
+
+        Args:
+            index: 결과를 찾을 때 사용할 번호
+            image_content: 이미지 바이트 데이터
+        """
+        self._pending.append((index, image_content))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """모인 이미지를 작업으로 큐에 넣음 (큐가 가득 차면 기다림)"""
+        if not self._pending:
+            return
+        job, self._pending = self._pending, []
+        self._queue.put(job)
+        self.jobs += 1
+
+    def results(self) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        남은 작업을 모두 처리한 뒤 결과 반환
+
+        Returns:
+            번호별 감지 결과 딕셔너리 (detect_text_batch와 같은 형식)
+        """
+        self.close()
+        with self._lock:
+            return dict(self._results)
+
+    def close(self):
+        """남은 이미지를 큐에 넣고 작업자가 모두 끝날 때까지 대기"""
+        if not self._workers:
+            return
+
+        start_time = time.time()
+        self.flush()
+        for _ in self._workers:
+            self._queue.put(_STOP)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        self.wait_time = time.time() - start_time
+
+    def _consume(self):
+        """큐에서 작업을 꺼내 OCR 수행 (종료 신호를 받을 때까지)"""
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                return
+
+            try:
+                texts_list = self.ocr_processor.detect_text_batch([image_content for _, image_content in job])
+            except Exception as e:
+                print(f"OCR 작업 처리 중 오류: {e}")
+                texts_list = [[] for _ in job]
+
+            with self._lock:
+                for (index, _), texts in zip(job, texts_list):
+                    self._results[index] = texts
@@ -1,26 +1,64 @@
 """
 페이지 오브젝트 패턴 함수 생성 모듈
 """
-from typing import List, Dict, Any
+import keyword
+import re
+from typing import List, Dict, Any, Optional
+
+from src.utils.incremental import element_fingerprint
+from src.utils.locators import BY_CONSTANTS
+from src.utils.profiler import Profiler
 
 class PageObjectGenerator:
     """페이지 오브젝트 패턴 함수를 생성하는 클래스"""
     
-    def __init__(self):
-        """페이지 오브젝트 생성기 초기화"""
+    # 요소 유형별 로케이터 상수 이름 접미사
+    LOCATOR_SUFFIXES = {
+        'button': 'BUTTON',
+        'input': 'INPUT',
+        'checkbox_radio': 'CHECKBOX',
+        'select': 'SELECT',
+    }
+    
+    # 폼 일괄 입력 메서드에 포함하는 요소 유형과 메서드를 만드는 최소 필드 수
+    FORM_FIELD_CATEGORIES = ('input', 'checkbox_radio', 'select')
+    FORM_MIN_FIELDS = 2
+    
+    # 폼 일괄 입력 메서드의 인수 이름 (같은 이름의 필드와 파이썬 키워드 이름의 필드는 '_field'를 붙임)
+    FORM_RESERVED_ARGUMENTS = ('self', 'dispatch_events', 'type_keys')
+    
+    def __init__(self, profiler: Optional[Profiler] = None):
+        """
+        페이지 오브젝트 생성기 초기화
+        
+        Args:
+            profiler: 코드 생성 시간을 기록할 프로파일러 (기본값: 기록하지 않음)
+        """
         self.indent = "    "  # 들여쓰기 4칸
+        self.profiler = profiler if profiler is not None else Profiler(enabled=False)
     
-    def generate_page_object_class(self, url: str, elements: List[Dict[str, Any]]) -> str:
+    def generate_page_object_class(self, url: str, elements: List[Dict[str, Any]],
+                                   method_cache: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
         """
         페이지 오브젝트 클래스 코드 생성
         
         Args:
             url: 웹페이지 URL
             elements: 요소 정보 리스트
+            method_cache: 요소 지문별 메서드 코드 캐시 (주어지면 지문이 같은 요소의 코드를 재사용하고
+                          새로 생성한 코드를 추가, 증분 재생성용)
             
         Returns:
             생성된 페이지 오브젝트 클래스 코드
         """
+        with self.profiler.phase('generate'):
+            code = self._generate_class(url, elements, method_cache)
+        self.profiler.add('generate.elements', len(elements))
+        return code
+    
+    def _generate_class(self, url: str, elements: List[Dict[str, Any]],
+                        method_cache: Optional[Dict[str, Dict[str, Any]]]) -> str:
+        """generate_page_object_class의 코드 생성 본체"""
         # 페이지 이름 생성 (URL에서 도메인명 추출)
         from urllib.parse import urlparse
         # URL에서 개행 문자 제거
@@ -28,62 +66,202 @@ class PageObjectGenerator:
         domain = urlparse(clean_url).netloc.replace(".", "_").replace("-", "_")
         page_name = f"{domain}_Page"
         
-        # 클래스 코드 생성
+        # 클래스 코드 생성 (대기, 요소 캐시, 동작은 PageTemplate 메서드 사용)
         code = [
-            f"class {page_name}:",
+            f"class {page_name}(PageTemplate):",
             f"{self.indent}\"\"\"",
             f"{self.indent}{url} 페이지의 페이지 오브젝트 클래스",
             f"{self.indent}\"\"\"",
             "",
-            f"{self.indent}def __init__(self, driver):",
-            f"{self.indent}{self.indent}\"\"\"",
-            f"{self.indent}{self.indent}생성자",
-            f"{self.indent}{self.indent}",
-            f"{self.indent}{self.indent}Args:",
-            f"{self.indent}{self.indent}{self.indent}driver: Selenium WebDriver 인스턴스",
-            f"{self.indent}{self.indent}\"\"\"",
-            f"{self.indent}{self.indent}self.driver = driver",
-            f"{self.indent}{self.indent}self.url = \"{url}\"",
-            "",
-            f"{self.indent}def navigate(self):",
-            f"{self.indent}{self.indent}\"\"\"페이지로 이동\"\"\"",
-            f"{self.indent}{self.indent}self.driver.get(self.url)",
-            f"{self.indent}{self.indent}return self",
+            f"{self.indent}url = \"{url}\"",
             ""
         ]
         
         # 생성된 메서드 이름을 저장 (중복 방지)
         used_method_names = set()
         
-        # 요소별 메서드 생성
+        # 요소별 로케이터 상수와 메서드 생성
+        methods = []
         for element in elements:
-            element_category = element.get('element_category', 'button')  # 기본값은 버튼
+            method = self._generate_element_method(element, used_method_names, method_cache)
+            if method:
+                methods.append(method)
+        
+        # 같은 폼의 입력 요소를 한 번에 입력하는 메서드 (요소 메서드 뒤에 추가)
+        forms = self._generate_form_methods(methods, used_method_names)
+        
+        # 로케이터는 클래스 상수로 선언 (메서드 호출마다 튜플을 만들지 않고 요소 캐시의 키로 사용)
+        if methods:
+            code.append(f"{self.indent}# 로케이터")
+            for method in methods:
+                code.append(f"{self.indent}{method['constant']} = {method['locator']}")
+            code.append("")
+        
+        # 폼별 필드 이름과 로케이터 상수
+        for form in forms:
+            code.extend(form['constant_lines'])
+            code.append("")
+        
+        for method in methods + forms:
+            code.extend(method['lines'])
+            code.append("")
+        
+        return "\n".join(code)
+    
+    def _generate_form_methods(self, methods: List[Dict[str, Any]], used_names: set) -> List[Dict[str, Any]]:
+        """
+        같은 폼에 속한 입력 요소(텍스트 필드, 체크박스/라디오, 드롭다운)를 한 번의 스크립트 실행으로
+        입력하는 fill_<폼>(**values) 메서드 코드 생성
+        
+        Args:
+            methods: _generate_element_method()로 생성한 요소 메서드 리스트 (문서 순서)
+            used_names: 이미 사용된 메서드 이름 집합
             
-            if element_category == 'button':
-                # 버튼 요소의 경우 클릭 메서드 생성
-                button_code = self._generate_button_method(element, used_method_names)
-                code.extend(button_code)
-                code.append("")
+        Returns:
+            {'constant_lines': 필드 상수 코드 라인 리스트, 'lines': 메서드 코드 라인 리스트} 딕셔너리 리스트
+            (필드가 FORM_MIN_FIELDS개 미만인 폼은 제외)
+        """
+        groups = {}
+        for method in methods:
+            if method['form'] and method['category'] in self.FORM_FIELD_CATEGORIES:
+                groups.setdefault(method['form'], []).append(method)
+        
+        forms = []
+        for form_name, fields in groups.items():
+            if len(fields) < self.FORM_MIN_FIELDS:
+                continue
+            
+            # 폼 이름의 하이픈은 단어 구분자로 사용 (login-form -> fill_login_form)
+            form_base = self._sanitize_text(form_name.replace('-', ' '))
+            method_name = self._unique_method_name(f"fill_{form_base}"[:50], used_names)
+            constant = f"{method_name.split('_', 1)[1].upper()}_FIELDS"
+            # 키워드 인수 이름은 요소 메서드 이름에서 접두사를 뺀 이름 (enter_username -> username)
+            # (enter_email과 select_email처럼 겹치는 이름은 폼 안에서 번호를 붙여 구분)
+            keywords = []
+            used_keywords = set()
+            for field in fields:
+                argument = field['name'].split('_', 1)[1] if '_' in field['name'] else field['name']
+                if argument in self.FORM_RESERVED_ARGUMENTS or keyword.iskeyword(argument):
+                    argument = f"{argument}_field"
+                keywords.append(self._unique_method_name(argument, used_keywords))
             
-            elif element_category == 'input':
-                # 입력 필드의 경우 입력 메서드 생성
-                input_code = self._generate_input_method(element, used_method_names)
-                code.extend(input_code)
-                code.append("")
-                
-            elif element_category == 'checkbox_radio':
-                # 체크박스나 라디오 버튼의 경우 토글 메서드 생성
-                checkbox_code = self._generate_checkbox_method(element, used_method_names)
-                code.extend(checkbox_code)
-                code.append("")
-                
-            elif element_category == 'select':
-                # 선택 요소의 경우 선택 메서드 생성
-                select_code = self._generate_select_method(element, used_method_names)
-                code.extend(select_code)
-                code.append("")
+            constant_lines = [f"{self.indent}{constant} = {{"]
+            constant_lines.extend(f"{self.indent}{self.indent}'{keyword}': {field['constant']},"
+                                  for keyword, field in zip(keywords, fields))
+            constant_lines.append(f"{self.indent}}}")
+            
+            lines = [
+                f"{self.indent}def {method_name}(self, dispatch_events=False, type_keys=(), **values):",
+                f"{self.indent}{self.indent}\"\"\"",
+                f"{self.indent}{self.indent}'{' '.join(form_name.split())}' 폼의 필드를 한 번의 스크립트 실행으로 입력",
+                f"{self.indent}{self.indent}",
+                f"{self.indent}{self.indent}Args:",
+                f"{self.indent}{self.indent}{self.indent}dispatch_events: True면 값을 설정한 뒤 input, change 이벤트 발생 (기본값: False)",
+                f"{self.indent}{self.indent}{self.indent}type_keys: 실제 키 입력(send_keys)으로 입력할 필드 이름 목록",
+                f"{self.indent}{self.indent}{self.indent}**values: 필드별 값 ({', '.join(keywords)})",
+                f"{self.indent}{self.indent}\"\"\"",
+                f"{self.indent}{self.indent}return self.fill_form(self.{constant}, values, dispatch_events, type_keys)"
+            ]
+            forms.append({'constant_lines': constant_lines, 'lines': lines})
+        
+        return forms
+    
+    def _generate_element_method(self, element: Dict[str, Any], used_names: set,
+                                 method_cache: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[Dict[str, Any]]:
+        """
+        요소 유형에 맞는 로케이터 상수와 메서드 코드 생성
         
-        return "\n".join(code)
+        캐시를 사용하면 메서드 이름이 다른 요소와 겹치지 않은 상태로 코드를 만들어 저장하고,
+        실제 이름은 중복 방지 규칙을 적용하여 바꿔 넣으므로 캐시 없이 생성한 코드와 같다.
+        
+        Args:
+            element: 요소 정보 딕셔너리
+            used_names: 이미 사용된 메서드 이름 집합
+            method_cache: 요소 지문별 메서드 코드 캐시
+            
+        Returns:
+            {'name': 메서드 이름, 'category': 요소 유형, 'form': 요소가 속한 폼,
+             'constant': 로케이터 상수 이름, 'locator': 로케이터 코드, 'lines': 메서드 코드 라인 리스트}
+            딕셔너리 (지원하지 않는 유형이면 None)
+        """
+        element_category = element.get('element_category', 'button')  # 기본값은 버튼
+        
+        if element_category == 'button':
+            # 버튼 요소의 경우 클릭 메서드 생성
+            generate = self._generate_button_method
+        elif element_category == 'input':
+            # 입력 필드의 경우 입력 메서드 생성
+            generate = self._generate_input_method
+        elif element_category == 'checkbox_radio':
+            # 체크박스나 라디오 버튼의 경우 토글 메서드 생성
+            generate = self._generate_checkbox_method
+        elif element_category == 'select':
+            # 선택 요소의 경우 선택 메서드 생성
+            generate = self._generate_select_method
+        else:
+            return None
+        
+        if method_cache is None:
+            locator = self._locator_or_warn(element)
+            if locator is None:
+                return None
+            lines = generate(element, used_names)
+            name = re.search(r'def\s+(\w+)\(', lines[0]).group(1)
+            return {'name': name, 'category': element_category, 'form': element.get('form'),
+                    'constant': self._locator_constant(name, element_category),
+                    'locator': locator, 'lines': lines}
+        
+        fingerprint = element_fingerprint(element)
+        cached = method_cache.get(fingerprint)
+        if cached is None:
+            locator = self._locator_or_warn(element)
+            if locator is None:
+                return None
+            lines = generate(element, set())
+            name = re.search(r'def\s+(\w+)\(', lines[0]).group(1)
+            cached = method_cache[fingerprint] = {'name': name, 'locator': locator, 'lines': lines}
+        
+        # 중복 방지 규칙으로 실제 메서드 이름 결정 (로케이터 상수 이름도 메서드 이름을 따름)
+        method_name = self._unique_method_name(cached['name'], used_names)
+        constant = self._locator_constant(method_name, element_category)
+        lines = list(cached['lines'])
+        if method_name != cached['name']:
+            cached_constant = self._locator_constant(cached['name'], element_category)
+            lines[0] = lines[0].replace(f"def {cached['name']}(", f"def {method_name}(", 1)
+            lines = [line.replace(f"self.{cached_constant})", f"self.{constant})")
+                     .replace(f"self.{cached_constant},", f"self.{constant},") for line in lines]
+        return {'name': method_name, 'category': element_category, 'form': element.get('form'),
+                'constant': constant, 'locator': cached['locator'], 'lines': lines}
+    
+    def _locator_or_warn(self, element: Dict[str, Any]) -> Optional[str]:
+        """
+        요소의 로케이터 코드를 만들고, 만들 수 없으면 경고를 출력
+        
+        Args:
+            element: 요소 정보 딕셔너리
+            
+        Returns:
+            로케이터 튜플 코드 (요소를 식별할 정보가 없으면 None)
+        """
+        locator = self._get_best_locator(element)
+        if locator is None:
+            print(f"경고: {element.get('tag_name', '*')} 요소 {element.get('index', '?')}에는 고유 선택자가 없어 "
+                  f"메서드를 생성하지 않습니다. 요소를 다시 스크래핑하세요.")
+        return locator
+    
+    def _locator_constant(self, method_name: str, element_category: str) -> str:
+        """
+        메서드 이름에 대응하는 로케이터 상수 이름 (예: click_login -> LOGIN_BUTTON)
+        
+        Args:
+            method_name: 메서드 이름 (중복 방지 번호 포함)
+            element_category: 요소 유형
+            
+        Returns:
+            로케이터 상수 이름
+        """
+        base = method_name.split('_', 1)[1] if '_' in method_name else method_name
+        return f"{base.upper()}_{self.LOCATOR_SUFFIXES.get(element_category, 'ELEMENT')}"
     
     def _sanitize_text(self, text: str) -> str:
         """
@@ -198,6 +376,19 @@ class PageObjectGenerator:
         if len(method_name) > 50:
             method_name = method_name[:50]
         
+        return self._unique_method_name(method_name, used_names)
+    
+    def _unique_method_name(self, method_name: str, used_names: set) -> str:
+        """
+        이미 사용된 이름과 겹치지 않도록 번호를 붙인 메서드 이름
+        
+        Args:
+            method_name: 원래 메서드 이름
+            used_names: 이미 사용된 메서드 이름 집합 (결정된 이름이 추가됨)
+            
+        Returns:
+            중복되지 않는 메서드 이름
+        """
         # 중복 방지
         original_name = method_name
         counter = 1
@@ -224,8 +415,8 @@ class PageObjectGenerator:
         # 버튼 텍스트로 함수명 생성
         method_name = self._generate_method_name(element, "click", used_names)
         
-        # 버튼을 찾는 가장 좋은 방법 선택
-        locator_code = self._get_best_locator(element)
+        # 버튼 로케이터 상수 (클래스 상단에 선언)
+        constant = self._locator_constant(method_name, 'button')
         
         # 버튼 설명 텍스트 (개행 문자 제거)
         button_text = element.get('text') or element.get('aria_label') or element.get('title') or element.get('id') or "버튼"
@@ -239,8 +430,7 @@ class PageObjectGenerator:
             f"{self.indent}{self.indent}\"\"\"",
             f"{self.indent}{self.indent}'{button_description}' 버튼 클릭",
             f"{self.indent}{self.indent}\"\"\"",
-            locator_code,
-            f"{self.indent}{self.indent}return self"
+            f"{self.indent}{self.indent}return self.click_element(self.{constant})"
         ]
         
         return method_code
@@ -259,8 +449,8 @@ class PageObjectGenerator:
         # 입력 필드 설명으로 함수명 생성
         method_name = self._generate_method_name(element, "enter", used_names)
         
-        # 입력 필드를 찾는 가장 좋은 방법 선택
-        locator_code = self._get_best_locator(element)
+        # 입력 필드 로케이터 상수 (클래스 상단에 선언)
+        constant = self._locator_constant(method_name, 'input')
         
         # 요소 설명 (placeholder, name, id 등을 사용, 개행 문자 제거)
         field_text = element.get('placeholder') or element.get('name') or element.get('id') or element.get('text') or element.get('aria_label') or "값"
@@ -277,10 +467,7 @@ class PageObjectGenerator:
             f"{self.indent}{self.indent}Args:",
             f"{self.indent}{self.indent}{self.indent}text: 입력할 텍스트",
             f"{self.indent}{self.indent}\"\"\"",
-            f"{self.indent}{self.indent}element = {locator_code.strip()}",
-            f"{self.indent}{self.indent}element.clear()  # 기존 텍스트 지우기",
-            f"{self.indent}{self.indent}element.send_keys(text)",
-            f"{self.indent}{self.indent}return self"
+            f"{self.indent}{self.indent}return self.input_text(self.{constant}, text)"
         ]
         
         return method_code
@@ -299,8 +486,8 @@ class PageObjectGenerator:
         # 체크박스 설명으로 함수명 생성
         method_name = self._generate_method_name(element, "select", used_names)
         
-        # 체크박스를 찾는 가장 좋은 방법 선택
-        locator_code = self._get_best_locator(element)
+        # 체크박스 로케이터 상수 (클래스 상단에 선언)
+        constant = self._locator_constant(method_name, 'checkbox_radio')
         
         # 요소 설명 (개행 문자 제거)
         field_text = element.get('text') or element.get('name') or element.get('id') or element.get('aria_label') or "옵션"
@@ -317,13 +504,7 @@ class PageObjectGenerator:
             f"{self.indent}{self.indent}Args:",
             f"{self.indent}{self.indent}{self.indent}check: True면 체크, False면 체크 해제 (기본값: True)",
             f"{self.indent}{self.indent}\"\"\"",
-            f"{self.indent}{self.indent}element = {locator_code.strip()}",
-            f"{self.indent}{self.indent}# 현재 체크 상태 확인",
-            f"{self.indent}{self.indent}is_checked = element.is_selected()",
-            f"{self.indent}{self.indent}# 원하는 상태와 다르면 클릭",
-            f"{self.indent}{self.indent}if is_checked != check:",
-            f"{self.indent}{self.indent}{self.indent}element.click()",
-            f"{self.indent}{self.indent}return self"
+            f"{self.indent}{self.indent}return self.set_checked(self.{constant}, check)"
         ]
         
         return method_code
@@ -342,8 +523,8 @@ class PageObjectGenerator:
         # 선택 요소 설명으로 함수명 생성
         method_name = self._generate_method_name(element, "select", used_names)
         
-        # 선택 요소를 찾는 가장 좋은 방법 선택
-        locator_code = self._get_best_locator(element)
+        # 선택 요소 로케이터 상수 (클래스 상단에 선언)
+        constant = self._locator_constant(method_name, 'select')
         
         # 요소 설명 (개행 문자 제거)
         field_text = element.get('text') or element.get('name') or element.get('id') or element.get('aria_label') or "드롭다운"
@@ -360,97 +541,89 @@ class PageObjectGenerator:
             f"{self.indent}{self.indent}Args:",
             f"{self.indent}{self.indent}{self.indent}option_text: 선택할 옵션의 텍스트",
             f"{self.indent}{self.indent}\"\"\"",
-            f"{self.indent}{self.indent}from selenium.webdriver.support.ui import Select",
-            f"{self.indent}{self.indent}element = {locator_code.strip()}",
-            f"{self.indent}{self.indent}select = Select(element)",
-            f"{self.indent}{self.indent}select.select_by_visible_text(option_text)",
-            f"{self.indent}{self.indent}return self"
+            f"{self.indent}{self.indent}return self.select_option(self.{constant}, option_text)"
         ]
         
         return method_code
     
-    def _get_best_locator(self, element: Dict[str, Any]) -> str:
+    def _get_best_locator(self, element: Dict[str, Any]) -> Optional[str]:
         """
         요소를 찾기 위한 가장 좋은 로케이터 코드 생성
         
+        대기 조건(클릭 가능 또는 존재)은 PageTemplate의 동작 메서드가 요소 유형에 맞게 적용한다.
+        
         Args:
             element: 요소 정보 딕셔너리
             
         Returns:
-            로케이터 코드
+            '(By.ID, "login")' 형식의 로케이터 튜플 코드 (주의할 로케이터는 같은 줄에 주석 추가),
+            요소를 식별할 정보가 없으면 None
         """
-        # 요소 카테고리에 따라 적절한 대기 조건 결정
-        element_category = element.get('element_category', 'button')
-        if element_category == 'button':
-            wait_code = "WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable"
-        else:
-            wait_code = "WebDriverWait(self.driver, 10).until(EC.presence_of_element_located"
+        # 브라우저에서 검증한 로케이터가 있으면 사용 (대상 요소 하나에만 일치하는 점수가 가장 높은 후보)
+        if element.get('locator'):
+            by, value = element['locator']
+            # 고유하지 않은 로케이터는 같은 줄에 주석으로 표시
+            warning = ""
+            if element.get('locator_matches', 1) != 1:
+                warning = f"  # 주의: 페이지에서 {element['locator_matches']}개 요소와 일치합니다 (첫 번째 요소 사용)"
+            return f"({BY_CONSTANTS.get(by, 'By.XPATH')}, \"{self._escape(value)}\"){warning}"
         
         # ID가 있는 경우 ID 사용 (가장 안정적)
-        if element.get('id'):
-            return (
-                f"{self.indent}{self.indent}{wait_code}((By.ID, \"{element['id']}\")))\n"
-            )
+        elif element.get('id'):
+            return f"(By.ID, \"{self._escape(element['id'])}\")"
         
         # 이름이 있는 경우 이름 사용
         elif element.get('name'):
-            return (
-                f"{self.indent}{self.indent}{wait_code}((By.NAME, \"{element['name']}\")))\n"
-            )
+            return f"(By.NAME, \"{self._escape(element['name'])}\")"
+        
+        # 페이지에서 이 요소에만 일치하는 CSS 선택자 (스크래핑 시 브라우저에서 생성)
+        elif element.get('unique_selector'):
+            return f"(By.CSS_SELECTOR, \"{self._escape(element['unique_selector'])}\")"
         
         # XPath 옵션이 있는 경우 XPath 사용
         elif element.get('xpath_options') and element['xpath_options']:
-            xpath = element['xpath_options'][0]
-            return (
-                f"{self.indent}{self.indent}{wait_code}((By.XPATH, \"{xpath}\")))\n"
-            )
+            return f"(By.XPATH, \"{self._escape(element['xpath_options'][0])}\")"
         
         # CSS 선택자가 있는 경우 CSS 선택자 사용
         elif element.get('css_selector'):
-            return (
-                f"{self.indent}{self.indent}{wait_code}((By.CSS_SELECTOR, \"{element['css_selector']}\")))\n"
-            )
+            return f"(By.CSS_SELECTOR, \"{self._escape(element['css_selector'])}\")"
         
         # 텍스트가 있는 경우 텍스트로 검색
         elif element.get('text'):
-            # 텍스트에 따옴표나 개행이 있는 경우 처리
-            # XPath에서는 개행 문자가 특히 문제가 되므로 완전히 제거
-            text = element['text'].replace("'", "\\'").replace('"', '\\"').replace('\n', ' ').replace('\r', ' ')
-            # 연속된 공백을 하나로 통합
-            text = ' '.join(text.split())
+            # XPath에서는 개행 문자가 특히 문제가 되므로 완전히 제거하고 연속된 공백을 하나로 통합
+            text = ' '.join(element['text'].split())
             tag = element.get('tag_name', '*')
             
-            if element_category == 'button':
-                return (
-                    f"{self.indent}{self.indent}{wait_code}((By.XPATH, \"//{tag}[normalize-space(.)='{text}']"
-                    f" | //{tag}[@value='{text}'] | //{tag}[normalize-space(@placeholder)='{text}']\"))))\n"
-                )
+            if element.get('element_category', 'button') == 'button':
+                xpath = (f"//{tag}[normalize-space(.)='{text}'] | //{tag}[@value='{text}']"
+                         f" | //{tag}[normalize-space(@placeholder)='{text}']")
             else:
-                return (
-                    f"{self.indent}{self.indent}{wait_code}((By.XPATH, \"//{tag}[normalize-space(@placeholder)='{text}']"
-                    f" | //{tag}[normalize-space(@name)='{text}']\"))))\n"
-                )
+                xpath = f"//{tag}[normalize-space(@placeholder)='{text}'] | //{tag}[normalize-space(@name)='{text}']"
+            return f"(By.XPATH, \"{self._escape(xpath)}\")"
         
         # aria-label이 있는 경우 aria-label 사용
         elif element.get('aria_label'):
-            aria_label = element['aria_label'].replace("'", "\\'").replace('"', '\\"').replace('\n', ' ').replace('\r', '')
-            return (
-                f"{self.indent}{self.indent}{wait_code}((By.CSS_SELECTOR, \"[aria-label='{aria_label}']\")))\n"
-            )
+            aria_label = ' '.join(element['aria_label'].split())
+            selector = f"[aria-label='{aria_label}']"
+            return f"(By.CSS_SELECTOR, \"{self._escape(selector)}\")"
         
         # 클래스가 있는 경우 클래스명 사용
         elif element.get('class'):
             class_name = element['class'].split()[0]  # 첫 번째 클래스만 사용
-            return (
-                f"{self.indent}{self.indent}# 주의: 클래스 선택자는 변경될 수 있습니다\n"
-                f"{self.indent}{self.indent}{wait_code}((By.CLASS_NAME, \"{class_name}\"))))\n"
-            )
+            return f"(By.CLASS_NAME, \"{self._escape(class_name)}\")  # 주의: 클래스 선택자는 변경될 수 있습니다"
         
-        # 위치 기반 CSS 선택자 사용 (마지막 수단)
-        else:
-            tag_name = element.get('tag_name', '*')
-            index = element.get('index', 1)
-            return (
-                f"{self.indent}{self.indent}# 주의: 위치 기반 선택자는 페이지가 변경되면 작동하지 않을 수 있습니다\n"
-                f"{self.indent}{self.indent}{wait_code}((By.CSS_SELECTOR, \"{tag_name}:nth-of-type({index})\"))))\n"
-            )
\ No newline at end of file
+        # 위치 정보만 남은 요소는 로케이터를 만들지 않음 (수집 순서 번호는 nth-of-type 위치와 다름)
+        return None
+    
+    def _escape(self, value: str) -> str:
+        """
+        생성 코드의 큰따옴표 문자열에 넣을 수 있도록 이스케이프 (개행 문자는 공백으로)
+        
+        Args:
+            value: 로케이터 값
+            
+        Returns:
+            이스케이프한 문자열
+        """
+        value = value.replace('\n', ' ').replace('\r', ' ')
+        return value.replace('\\', '\\\\').replace('"', '\\"')
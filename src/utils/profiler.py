@@ -0,0 +1,255 @@
+"""
+실행 단계별 시간과 처리량을 기록하는 프로파일러 모듈
+
+스크래퍼, OCR 프로세서, 페이지 오브젝트 생성기와 명령줄 실행이 같은 프로파일러에
+단계별 경과 시간(wall)과 CPU 시간, 요소별 추출 지연 시간 분포, 처리한 바이트 수를 기록하고
+실행이 끝나면 JSON 보고서로 저장한다. (여러 작업자 스레드에서 동시에 기록 가능)
+"""
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+# 보고서 JSON 형식 버전
+REPORT_VERSION = 1
+
+# 지연 시간 분포의 구간 상한 (밀리초, 마지막 구간은 상한 없음)
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+class PhaseTimer:
+    """단계 하나의 경과 시간과 CPU 시간 (단계가 끝난 뒤 값이 채워짐)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall = 0.0
+        self.cpu = 0.0
+
+
+class Histogram:
+    """고정 구간 지연 시간 분포"""
+
+    def __init__(self, bounds_ms=LATENCY_BUCKETS_MS):
+        self.bounds_ms = tuple(bounds_ms)
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, seconds: float):
+        """지연 시간 하나 기록 (초)"""
+        milliseconds = seconds * 1000
+        index = 0
+        while index < len(self.bounds_ms) and milliseconds > self.bounds_ms[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """
+        분위수 추정값 (해당 구간의 상한, 마지막 구간은 최댓값)
+
+        Args:
+            fraction: 0~1 사이의 분위 (0.5는 중앙값)
+
+        Returns:
+            지연 시간 (초, 기록이 없으면 None)
+        """
+        if not self.count:
+            return None
+        rank = max(1, int(round(fraction * self.count)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                if index < len(self.bounds_ms):
+                    return min(self.bounds_ms[index] / 1000, self.max)
+                return self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """보고서용 딕셔너리 (시간 단위: 초, 구간은 [상한(ms), 개수] 리스트)"""
+        upper_bounds = list(self.bounds_ms) + [None]
+        return {
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max,
+            'mean': self.total / self.count if self.count else None,
+            'p50': self.percentile(0.5),
+            'p90': self.percentile(0.9),
+            'p99': self.percentile(0.99),
+            'buckets': [[bound, count] for bound, count in zip(upper_bounds, self.counts) if count],
+        }
+
+
+class Profiler:
+    """
+    단계별 시간, 지연 시간 분포, 처리량 카운터를 모으는 프로파일러
+
+    비활성화된 프로파일러도 phase()로 단계 시간을 측정하여 돌려주지만(진행 메시지 출력용)
+    결과를 모으지는 않으며, 요소별 지연 시간처럼 측정 자체에 비용이 드는 기록은 하지 않는다.
+    (기록하는 쪽은 enabled로 확인)
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        프로파일러 초기화
+
+        Args:
+            enabled: False면 단계 시간만 측정하고 결과는 모으지 않음
+        """
+        self.enabled = enabled
+        self.phases = {}
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+
+    def current_phase(self) -> Optional[str]:
+        """현재 스레드에서 진행 중인 가장 안쪽 단계 이름 (없으면 None)"""
+        stack = getattr(self._local, 'stack', None)
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[PhaseTimer]:
+        """
+        단계 하나의 경과 시간과 CPU 시간(현재 스레드) 측정
+
+        같은 이름의 단계는 호출 횟수와 시간을 합산한다. 단계는 중첩할 수 있으며
+        바깥 단계의 시간에는 안쪽 단계의 시간이 포함된다.
+
+        Args:
+            name: 단계 이름 (예: 'extract', 'ocr.request')
+
+        Yields:
+            단계가 끝나면 wall, cpu(초)가 채워지는 PhaseTimer
+        """
+        timer = PhaseTimer(name)
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(name)
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            yield timer
+        finally:
+            timer.wall = time.perf_counter() - start_wall
+            timer.cpu = time.thread_time() - start_cpu
+            stack.pop()
+            if self.enabled:
+                with self._lock:
+                    entry = self.phases.setdefault(name, {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'max_wall': 0.0})
+                    entry['calls'] += 1
+                    entry['wall'] += timer.wall
+                    entry['cpu'] += timer.cpu
+                    entry['max_wall'] = max(entry['max_wall'], timer.wall)
+
+    def observe(self, name: str, seconds: float):
+        """
+        지연 시간 분포에 값 하나 기록
+
+        Args:
+            name: 분포 이름 (예: 'extract.element')
+            seconds: 지연 시간 (초)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    def add(self, name: str, amount: float = 1):
+        """
+        카운터 값 증가
+
+        Args:
+            name: 카운터 이름 (예: 'screenshot.bytes')
+            amount: 증가량 (기본값: 1)
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def report(self, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        기계가 읽을 수 있는 실행 보고서
+
+        Args:
+            extra: 보고서에 함께 넣을 항목 (명령줄 옵션 등)
+
+        Returns:
+            버전, 실행 환경, 전체 경과/CPU 시간, 단계별 시간, 지연 시간 분포, 카운터를 담은 딕셔너리
+            (시간 단위: 초, CPU 시간은 전체는 프로세스 기준, 단계별은 단계를 실행한 스레드 기준)
+        """
+        with self._lock:
+            phases = {name: dict(entry) for name, entry in self.phases.items()}
+            histograms = {name: histogram.to_dict() for name, histogram in self.histograms.items()}
+            counters = dict(self.counters)
+
+        report = {
+            'version': REPORT_VERSION,
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pid': os.getpid(),
+            'argv': sys.argv[1:],
+            'wall_time': time.perf_counter() - self._start_wall,
+            'cpu_time': time.process_time() - self._start_cpu,
+            'phases': phases,
+            'histograms': histograms,
+            'counters': counters,
+        }
+        if extra:
+            report.update(extra)
+        return report
+
+    def write_report(self, path: str, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        실행 보고서를 JSON 파일로 저장
+
+        Args:
+            path: 저장할 파일 경로
+            extra: 보고서에 함께 넣을 항목
+
+        Returns:
+            저장한 보고서 딕셔너리
+        """
+        report = self.report(extra)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
+
+
+def format_phases(report: Dict[str, Any]) -> List[str]:
+    """
+    보고서의 단계별 시간을 사람이 읽는 표 형식 줄로 변환 (경과 시간이 긴 단계부터)
+
+    Args:
+        report: Profiler.report()가 반환한 딕셔너리
+
+    Returns:
+        출력할 줄 리스트
+    """
+    lines = [f"  {'단계':<22}{'호출':>7}{'경과(s)':>10}{'CPU(s)':>10}{'최대(ms)':>10}"]
+    for name, entry in sorted(report['phases'].items(), key=lambda item: -item[1]['wall']):
+        lines.append(f"  {name:<22}{entry['calls']:>7}{entry['wall']:>10.3f}{entry['cpu']:>10.3f}"
+                     f"{entry['max_wall'] * 1000:>10.1f}")
+    return lines
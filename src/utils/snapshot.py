@@ -0,0 +1,133 @@
+"""
+요소 스냅샷 파일 모듈
+
+페이지별 요소 정보(PageObjectGenerator 입력)를 웹 요소 참조 없이 JSON Lines 파일에 저장하고 다시 읽는다.
+스냅샷이 있으면 브라우저 없이 코드를 다시 생성하거나 생성기만 반복 실행할 수 있다.
+파일 이름이 .gz로 끝나면 gzip으로 압축한다.
+
+파일 형식 (한 줄에 페이지 하나):
+    {"format": "po-snapshot", "version": 1, "url": ..., "output_name": ..., "captured_at": ..., "elements": [...]}
+"""
+import gzip
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+SNAPSHOT_FORMAT = 'po-snapshot'
+SNAPSHOT_VERSION = 1
+
+# 요소 정보 중 저장하지 않는 키 (드라이버에 연결된 웹 요소)
+_LIVE_KEYS = ('element',)
+
+
+class SnapshotError(ValueError):
+    """스냅샷 파일 형식이 올바르지 않을 때 발생하는 예외"""
+
+
+def element_record(element_info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    요소 정보에서 웹 요소 참조를 제외한 저장용 딕셔너리 생성
+
+    Args:
+        element_info: 요소 정보 딕셔너리
+
+    Returns:
+        JSON으로 저장할 수 있는 요소 정보 딕셔너리
+    """
+    return {key: value for key, value in element_info.items() if key not in _LIVE_KEYS}
+
+
+def _open(path: Path, mode: str):
+    """파일 이름에 따라 gzip 또는 일반 텍스트 파일 열기"""
+    if path.suffix == '.gz':
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class SnapshotWriter:
+    """페이지별 요소 정보를 스냅샷 파일에 추가하는 클래스 (여러 작업자 스레드에서 사용 가능)"""
+
+    def __init__(self, path: str):
+        """
+        스냅샷 파일 열기 (기존 파일은 덮어씀)
+
+        Args:
+            path: 스냅샷 파일 경로 (.gz로 끝나면 gzip 압축)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.pages = 0
+        self._lock = threading.Lock()
+        self._file = _open(self.path, 'w')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_page(self, url: str, elements: List[Dict[str, Any]], output_name: Optional[str] = None):
+        """
+        페이지 하나의 요소 정보 저장
+
+        Args:
+            url: 페이지 URL
+            elements: PageObjectGenerator에 전달하는 요소 정보 딕셔너리 리스트
+            output_name: 출력 파일 이름 (없으면 URL로 결정)
+        """
+        record = {
+            'format': SNAPSHOT_FORMAT,
+            'version': SNAPSHOT_VERSION,
+            'url': url,
+            'output_name': output_name,
+            'captured_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'elements': [element_record(element) for element in elements],
+        }
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':'), default=str)
+
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.pages += 1
+
+    def close(self):
+        """스냅샷 파일 닫기"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def read_snapshot(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    스냅샷 파일에서 페이지 레코드 읽기
+
+    Args:
+        path: 스냅샷 파일 경로 (.gz로 끝나면 gzip 압축 해제)
+
+    Yields:
+        {'url', 'output_name', 'captured_at', 'elements'} 형식의 페이지 딕셔너리
+        (요소 정보의 'element'는 None)
+
+    Raises:
+        SnapshotError: 스냅샷 형식이 아니거나 지원하지 않는 버전인 경우
+    """
+    with _open(Path(path), 'r') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise SnapshotError(f"{path}:{line_number}: JSON 형식 오류: {e}")
+
+            if record.get('format') != SNAPSHOT_FORMAT:
+                raise SnapshotError(f"{path}:{line_number}: 스냅샷 레코드가 아닙니다.")
+            if record.get('version') != SNAPSHOT_VERSION:
+                raise SnapshotError(f"{path}:{line_number}: 지원하지 않는 스냅샷 버전입니다: {record.get('version')}")
+
+            for element in record['elements']:
+                element.setdefault('element', None)
+            yield record
@@ -0,0 +1,683 @@
+"""
+브라우저 없이 정적 HTML에서 상호작용 요소를 추출하는 모듈
+
+서버에서 렌더링된 페이지는 Chrome을 실행하지 않고 HTML을 내려받거나 로컬 파일을 읽어
+lxml 파서로 만든 트리에 WebScraper와 같은 유형별 선택자 규칙을 적용한다.
+화면을 렌더링하지 않으므로 요소 스크린샷 메서드는 없다. (정적 엔진에서는 OCR을 사용하지 않음)
+"""
+import os
+import re
+import time
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+from urllib.request import url2pathname
+
+import lxml.etree
+import lxml.html
+import requests
+import soupsieve
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+from dotenv import load_dotenv
+
+from src.utils.element_info import (ELEMENT_ATTRIBUTES, CATEGORY_SELECTORS, PAGE_CONTENT_ATTRIBUTES,
+                                    PAGE_SIGNATURE_ATTRIBUTES, SELECTOR_ATTRIBUTES, attribute_selector,
+                                    build_element_info, category_selector, page_signature_selector)
+from src.utils.profiler import Profiler
+
+# 환경 변수 로드
+load_dotenv()
+
+# 인라인 스타일에서 요소를 숨기는 선언
+_HIDDEN_STYLE_PATTERN = re.compile(r'(display\s*:\s*none|visibility\s*:\s*hidden)', re.IGNORECASE)
+
+# 속성(property) 기본값 (WebElement.get_attribute와 같은 결과를 내기 위함)
+_DEFAULT_TYPES = {
+    'input': 'text',
+    'button': 'submit',
+}
+
+# form 속성으로 다른 위치의 폼에 연결할 수 있는 태그 (브라우저의 el.form 속성이 있는 요소)
+_FORM_ASSOCIATED_TAGS = {'button', 'fieldset', 'input', 'object', 'output', 'select', 'textarea'}
+
+# CSS 선택자의 구조를 찾기 위해 가리는 부분 (따옴표 문자열, 괄호 인자)과 결합자
+_SELECTOR_STRING_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'')
+_SELECTOR_ARGUMENT_PATTERN = re.compile(r'\([^()]*\)')
+_SELECTOR_COMBINATOR_PATTERN = re.compile(r'\s*[>+~]\s*|\s+')
+# 요소 정보의 XPath 후보 형식 ('//*[@속성='값']', '//*[normalize-space(.)='텍스트']', '*' 대신 태그 이름 가능)
+_XPATH_ATTRIBUTE_PATTERN = re.compile(r"^//(\*|[a-zA-Z][\w-]*)\[@([\w-]+)='([^']*)'\]$")
+_XPATH_TEXT_PATTERN = re.compile(r"^//(\*|[a-zA-Z][\w-]*)\[normalize-space\(\.\)='([^']*)'\]$")
+# XPath normalize-space()가 공백으로 보는 문자
+_XPATH_SPACE_PATTERN = re.compile(r'[ \t\r\n]+')
+# 위치 경로 한 단계 ('태그' 또는 '태그:nth-of-type(n)', _TagIndex.segment의 결과)
+_PATH_SEGMENT_PATTERN = re.compile(r'^([a-zA-Z][\w-]*)(?::nth-of-type\((\d+)\))?$')
+# 복합 선택자의 태그와 첫 id, 클래스 또는 속성 이름과 일치 값 (이스케이프가 없는 이름과 값만)
+_COMPOUND_PATTERN = re.compile(r'^(?P<tag>[a-zA-Z][\w-]*)?'
+                               r'(?:#(?P<id>[\w-]+)(?![\w\\-])|\.(?P<class>[\w-]+)(?![\w\\-])'
+                               r'|\[(?P<attribute>[\w-]+)(?:=(?:"(?P<value>[^"\\]*)"|\'(?P<quoted>[^\'\\]*)\')\])?)?')
+
+
+class StaticScraper:
+    """정적 HTML에서 요소를 스크래핑하는 클래스 (브라우저 미사용)"""
+
+    def __init__(self, profiler: Optional[Profiler] = None):
+        """
+        HTTP 세션 초기화
+
+        Args:
+            profiler: 단계별 시간을 기록할 프로파일러 (기본값: 기록하지 않음)
+        """
+        self.profiler = profiler if profiler is not None else Profiler(enabled=False)
+        self.timeout = int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'po-generator (static engine)'
+        self.url = None
+        self.soup = None
+        self._selector_counts = None
+        self._tag_index = None
+
+    def close(self):
+        """HTTP 세션 종료"""
+        self.session.close()
+
+    def is_alive(self) -> bool:
+        """정적 엔진은 항상 재사용 가능"""
+        return True
+
+    def navigate_to(self, url: str) -> bool:
+        """
+        URL의 HTML을 내려받거나 로컬 파일을 읽어 파싱
+
+        Args:
+            url: 웹페이지 URL, file:// URL 또는 로컬 파일 경로
+
+        Returns:
+            성공 여부
+        """
+        try:
+            with self.profiler.phase('navigate'):
+                parsed = urlparse(url)
+                if parsed.scheme in ('http', 'https'):
+                    response = self.session.get(url, timeout=self.timeout)
+                    response.raise_for_status()
+                    html = response.content
+                    self.url = response.url
+                else:
+                    path = url2pathname(parsed.path) if parsed.scheme == 'file' else url
+                    with open(path, 'rb') as f:
+                        html = f.read()
+                    self.url = url if parsed.scheme == 'file' else 'file://' + os.path.abspath(path)
+
+                self.soup = BeautifulSoup(html, 'lxml')
+            self._selector_counts = None
+            self._tag_index = None
+            print("페이지 로드 완료...")
+            return True
+        except Exception as e:
+            print(f"URL 탐색 오류: {e}")
+            return False
+
+    def collect_candidates(self, categories: List[str] = None) -> List[Tuple[Tag, List[str]]]:
+        """
+        유형별 선택자를 적용하여 후보 요소 수집
+
+        Args:
+            categories: 수집할 요소 유형 리스트 (기본값: 모든 유형)
+
+        Returns:
+            (요소 노드, 일치한 유형 리스트) 튜플의 리스트 (문서 순서)
+        """
+        if self.soup is None:
+            return []
+
+        categories = categories or list(CATEGORY_SELECTORS.keys())
+        entries = {}
+
+        with self.profiler.phase('collect'):
+            for category in categories:
+                try:
+                    for node in self.soup.select(category_selector(category)):
+                        entry = entries.setdefault(id(node), (node, []))
+                        if category not in entry[1]:
+                            entry[1].append(category)
+                except Exception as e:
+                    print(f"상호작용 요소 수집 중 오류: {e}")
+
+            # 문서 순서대로 정렬
+            order = {id(node): index for index, node in enumerate(self.soup.find_all(True))}
+            return sorted(entries.values(), key=lambda entry: order.get(id(entry[0]), 0))
+
+    def get_interaction_elements(self) -> Dict[str, List[Tag]]:
+        """
+        페이지에서 모든 상호작용 요소 추출 (버튼, 입력 필드 등)
+
+        Returns:
+            요소 유형별 요소 노드 리스트를 담은 딕셔너리
+        """
+        interaction_elements = {category: [] for category in CATEGORY_SELECTORS}
+        for element, element_categories in self.collect_candidates():
+            for category in element_categories:
+                interaction_elements[category].append(element)
+        return interaction_elements
+
+    def get_links(self) -> List[str]:
+        """
+        현재 페이지의 링크 주소 수집
+        
+        Returns:
+            절대 URL 리스트 (문서 순서)
+        """
+        if self.soup is None:
+            return []
+        return [urljoin(self.url or '', node['href'].strip())
+                for node in self.soup.select('a[href], area[href]') if node['href'].strip()]
+    
+    def get_page_signature(self, include_content: bool = False) -> List[str]:
+        """
+        현재 페이지의 상호작용 요소 구조 서명 (같은 템플릿의 페이지를 구분하기 위함)
+        
+        Args:
+            include_content: True면 코드 생성에 쓰이는 모든 속성, 텍스트, 상위 요소 경로, 표시 여부까지 포함
+                             (내용 변경 감지용, 위치 경로 로케이터나 표시 여부가 바뀌는 변경도 감지)
+        
+        Returns:
+            요소마다 '태그|type|id|name|role' 형식의 문자열 리스트 (문서 순서)
+        """
+        if self.soup is None:
+            return []
+        
+        attributes = PAGE_CONTENT_ATTRIBUTES if include_content else PAGE_SIGNATURE_ATTRIBUTES
+        paths = _NodePaths()
+        signature = []
+        for node in self.soup.select(page_signature_selector()):
+            parts = [node.name]
+            for attribute in attributes:
+                value = node.get(attribute)
+                parts.append(' '.join(value) if isinstance(value, list) else value or '')
+            if include_content:
+                parts.append(' '.join(node.get_text(' ').split()))
+                parts.append('>'.join(f"{name}:{position + 1}" for name, position in paths.path(node)))
+                parts.append('1' if self._is_displayed(node) else '0')
+            signature.append('|'.join(parts))
+        return signature
+    
+    def check_elements(self, elements: List[Tag]) -> List[Dict[str, bool]]:
+        """
+        요소의 표시 여부 확인 (정적 HTML에는 stale 요소가 없음)
+
+        Args:
+            elements: 확인할 요소 노드 리스트
+
+        Returns:
+            입력 순서와 같은 순서의 {'alive': bool, 'displayed': bool} 리스트
+        """
+        with self.profiler.phase('check'):
+            return [{'alive': True, 'displayed': self._is_displayed(element)} for element in elements]
+
+    def get_elements_info(self, elements: List[Tag]) -> List[Dict[str, Any]]:
+        """
+        요소 노드에서 요소 정보 추출
+
+        Args:
+            elements: 정보를 추출할 요소 노드 리스트
+
+        Returns:
+            입력 순서와 같은 순서의 요소 정보 딕셔너리 리스트
+        """
+        element_info_list = []
+        with self.profiler.phase('extract'):
+            for element in elements:
+                start_time = time.perf_counter()
+                element_info_list.append(self.get_element_info(element))
+                self.profiler.observe('extract.element', time.perf_counter() - start_time)
+        return element_info_list
+
+    def get_element_info(self, element: Tag) -> Dict[str, Any]:
+        """
+        요소 노드에 대한 정보 추출
+
+        정적 HTML에는 레이아웃 정보가 없으므로 위치와 크기는 0으로 채운다.
+
+        Args:
+            element: 정보를 추출할 요소 노드
+
+        Returns:
+            요소 정보를 담은 딕셔너리
+        """
+        displayed = self._is_displayed(element)
+        raw = {
+            'tag_name': element.name,
+            'text': ' '.join(element.get_text(' ').split()) if displayed else '',
+            'is_displayed': displayed,
+            'is_enabled': not self._is_disabled(element),
+        }
+
+        for key, attribute in ELEMENT_ATTRIBUTES:
+            value = element.get(attribute)
+            if isinstance(value, list):  # class 등 다중 값 속성
+                value = ' '.join(value)
+            raw[key] = value or ''
+
+        raw['unique_selector'] = self._unique_selector(element)
+        raw['form'] = self._form_key(element)
+
+        if not raw['type'] and element.name in _DEFAULT_TYPES:
+            raw['type'] = _DEFAULT_TYPES[element.name]
+        if raw['href']:
+            raw['href'] = urljoin(self.url or '', raw['href'])
+
+        return build_element_info(raw)
+
+    def check_locators(self, elements: List[Tag],
+                       candidates: List[List[Tuple[str, str]]]) -> List[List[Tuple[int, bool]]]:
+        """
+        요소별 로케이터 후보의 일치 요소 수 검사 (WebScraper.check_locators와 같은 결과 형식)
+
+        id, name, 클래스 로케이터는 문서를 한 번 탐색해 만든 색인에서 찾고, 위치 경로 선택자는 색인의 형제 순번으로
+        경로를 따라 내려가며, 그 외 CSS 선택자는 마지막 복합 선택자의 태그, id, 클래스 또는 속성으로 좁힌 요소에만
+        적용한다. XPath는 같은 HTML을 lxml로 다시 파싱하여 평가하고 (속성 값, 텍스트 조건 XPath는 색인에서 찾음),
+        트리 위치로 대상 요소와 비교한다.
+
+        Args:
+            elements: 대상 요소 노드 리스트
+            candidates: 요소별 (By 값, 로케이터 값) 후보 리스트
+
+        Returns:
+            요소별 후보마다 (일치하는 요소 수, 대상 요소 포함 여부) 리스트 (잘못된 로케이터는 (-1, False))
+        """
+        cache = {}
+        xpath_index = None
+        paths = _NodePaths()
+
+        def find(by, value):
+            """일치하는 요소의 키 집합 (XPath는 트리 위치, 그 외는 노드 id(), 잘못된 로케이터는 None)"""
+            nonlocal xpath_index
+            if (by, value) in cache:
+                return cache[(by, value)]
+
+            try:
+                if by == 'id':
+                    keys = {id(node) for node in index.ids.get(value, [])}
+                elif by == 'name':
+                    keys = {id(node) for node in index.names.get(value, [])}
+                elif by == 'class name':
+                    keys = {id(node) for node in index.classes.get(value, [])}
+                elif by == 'css selector':
+                    keys = {id(node) for node in index.select(value)}
+                elif by == 'xpath':
+                    if xpath_index is None:
+                        xpath_index = _XPathIndex(lxml.html.document_fromstring(str(self.soup)))
+                    keys = {paths.path(node) for node in xpath_index.select(value)
+                            if isinstance(node, lxml.html.HtmlElement)}
+                else:
+                    keys = None
+            except Exception:
+                keys = None
+
+            cache[(by, value)] = keys
+            return keys
+
+        results = []
+        with self.profiler.phase('locators.check'):
+            if self._tag_index is None:
+                self._tag_index = _TagIndex(self.soup)
+            index = self._tag_index
+            for element, locators in zip(elements, candidates):
+                checks = []
+                for by, value in locators:
+                    keys = find(by, value)
+                    if keys is None:
+                        checks.append((-1, False))
+                    else:
+                        key = paths.path(element) if by == 'xpath' else id(element)
+                        checks.append((len(keys), key in keys))
+                results.append(checks)
+        return results
+
+    def _form_key(self, element: Tag) -> str:
+        """
+        요소가 속한 폼의 이름 (WebScraper의 formKey와 같은 규칙)
+
+        Args:
+            element: 요소 노드
+
+        Returns:
+            폼의 id, name 속성 또는 'form순번' (폼 밖의 요소는 빈 문자열)
+        """
+        form = None
+        if element.get('form') and element.name in _FORM_ASSOCIATED_TAGS:
+            form = self.soup.find('form', attrs={'id': element['form']})
+        if form is None:
+            form = element.find_parent('form')
+        if form is None:
+            return ''
+        if form.get('id') or form.get('name'):
+            return form.get('id') or form.get('name')
+        for number, node in enumerate(self.soup.find_all('form'), start=1):
+            if node is form:
+                return f"form{number}"
+        return ''
+
+    def _unique_selector(self, element: Tag) -> Optional[str]:
+        """
+        페이지에서 요소 하나에만 일치하는 CSS 선택자 (WebScraper의 uniqueSelector와 같은 규칙)
+
+        Args:
+            element: 요소 노드
+
+        Returns:
+            CSS 선택자 (만들 수 없으면 None)
+        """
+        if self._selector_counts is None:
+            # 속성 선택자별 요소 수 (문서를 한 번만 탐색)
+            self._selector_counts = {}
+            for node in self.soup.find_all(True):
+                for attribute in SELECTOR_ATTRIBUTES:
+                    value = _attribute_value(node, attribute)
+                    if value:
+                        key = attribute_selector(node.name, attribute, value)
+                        self._selector_counts[key] = self._selector_counts.get(key, 0) + 1
+
+        def stable_selector(node, attributes):
+            for attribute in attributes:
+                value = _attribute_value(node, attribute)
+                if value:
+                    selector = attribute_selector(node.name, attribute, value)
+                    if self._selector_counts.get(selector) == 1:
+                        return selector
+            return None
+
+        if self._tag_index is None:
+            self._tag_index = _TagIndex(self.soup)
+
+        try:
+            selector = stable_selector(element, SELECTOR_ATTRIBUTES)
+            if selector:
+                return selector
+
+            # 고유한 아이디가 있는 가장 가까운 상위 요소(없으면 html)부터의 위치 경로
+            # (각 단계가 부모 안에서 고유하므로 단계마다 문서 전체를 검색하지 않음)
+            path = []
+            node = element
+            while isinstance(node, Tag) and node.name != '[document]':
+                anchor = stable_selector(node, ['id']) if node is not element else None
+                path.insert(0, anchor or self._tag_index.segment(node))
+                if anchor:
+                    break
+                node = node.parent
+            return ' > '.join(path) or None
+        except Exception:
+            return None
+
+    def _is_displayed(self, element: Tag) -> bool:
+        """요소 또는 상위 요소가 HTML 속성이나 인라인 스타일로 숨겨졌는지 확인"""
+        if element.name == 'input' and (element.get('type') or '').lower() == 'hidden':
+            return False
+
+        node = element
+        while isinstance(node, Tag):
+            if node.name in ('head', 'template', 'script', 'noscript'):
+                return False
+            if node.has_attr('hidden'):
+                return False
+            if _HIDDEN_STYLE_PATTERN.search(node.get('style') or ''):
+                return False
+            node = node.parent
+        return True
+
+    def _is_disabled(self, element: Tag) -> bool:
+        """요소 또는 상위 fieldset이 비활성화되었는지 확인"""
+        if element.has_attr('disabled'):
+            return True
+        fieldset = element.find_parent('fieldset')
+        return fieldset is not None and fieldset.has_attr('disabled')
+
+
+def _attribute_value(node: Tag, attribute: str) -> str:
+    """HTML 속성 값 (class 등 다중 값 속성은 공백으로 결합)"""
+    value = node.get(attribute)
+    if isinstance(value, list):
+        value = ' '.join(value)
+    return value or ''
+
+
+def _mask_selector(selector: str, arguments: bool = True) -> str:
+    """
+    따옴표 문자열의 내용과 괄호 인자를 '_'로 가린 같은 길이의 선택자 (결합자와 선택자 목록 구분용)
+
+    Args:
+        selector: CSS 선택자
+        arguments: False면 따옴표 문자열만 가림 (nth-of-type(n) 같은 인자를 남김)
+    """
+    masked = _SELECTOR_STRING_PATTERN.sub(lambda match: match.group(0)[0] + '_' * (len(match.group(0)) - 2)
+                                          + match.group(0)[0], selector)
+    if not arguments:
+        return masked
+    # 중첩된 괄호는 안쪽부터 가림
+    while True:
+        unmasked = masked
+        masked = _SELECTOR_ARGUMENT_PATTERN.sub(lambda match: '_' * len(match.group(0)), masked)
+        if masked == unmasked:
+            return masked
+
+
+class _TagIndex:
+    """
+    문서의 요소를 태그, id, name, 클래스별로 모은 색인과 같은 태그 형제 중 순번 (문서를 한 번만 탐색)
+
+    로케이터마다 문서 전체를 탐색하지 않고 일치할 수 있는 요소만 검사하기 위해 사용한다.
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        self.nodes = soup.find_all(True)
+        self.tags = {}
+        self.ids = {}
+        self.names = {}
+        self.classes = {}
+        self.positions = {}
+        self._attributes = {}
+        self._attribute_values = {}
+        self._type_counts = {}
+        self._children = {}
+        for node in self.nodes:
+            # 문서 순서로 탐색하므로 부모별 태그 수가 곧 nth-of-type 순번
+            key = (id(node.parent), node.name)
+            self._type_counts[key] = self._type_counts.get(key, 0) + 1
+            self.positions[id(node)] = self._type_counts[key]
+            self._children.setdefault(key, []).append(node)
+            self.tags.setdefault(node.name, []).append(node)
+            if node.get('id'):
+                self.ids.setdefault(node['id'], []).append(node)
+            if node.get('name'):
+                self.names.setdefault(node['name'], []).append(node)
+            for class_name in node.get('class') or []:
+                self.classes.setdefault(class_name, []).append(node)
+
+    def segment(self, node: Tag) -> str:
+        """같은 태그의 형제가 있으면 순번을 붙인 경로 한 단계 ('태그' 또는 '태그:nth-of-type(n)')"""
+        if self._type_counts[(id(node.parent), node.name)] <= 1:
+            return node.name
+        return f"{node.name}:nth-of-type({self.positions[id(node)]})"
+
+    def select(self, selector: str) -> List[Tag]:
+        """
+        CSS 선택자와 일치하는 요소
+
+        Args:
+            selector: CSS 선택자
+
+        Returns:
+            요소 노드 리스트 (잘못된 선택자는 soupsieve 예외 발생)
+        """
+        path = self._path_matches(selector)
+        if path is not None:
+            return path
+        compiled = soupsieve.compile(selector)
+        return [node for node in self.pool(selector) if compiled.match(node)]
+
+    def _path_matches(self, selector: str) -> Optional[List[Tag]]:
+        """
+        위치 경로 선택자('기준 > 태그:nth-of-type(n) > 태그')와 일치하는 요소
+
+        soupsieve는 nth-of-type을 평가할 때마다 형제를 다시 세므로, 기준 요소에서 색인의 순번으로
+        자식을 따라 내려간다.
+
+        Returns:
+            요소 노드 리스트 (위치 경로 형식이 아니면 None)
+        """
+        selector = selector.strip()
+        if ',' in _mask_selector(selector):
+            return None
+        segments = _mask_selector(selector, arguments=False).split(' > ')
+        steps = [_PATH_SEGMENT_PATTERN.match(segment) for segment in segments[1:]]
+        if not steps or not all(steps):
+            return None
+
+        first = _PATH_SEGMENT_PATTERN.match(segments[0])
+        if first:
+            nodes = self._path_step(self.tags.get(first.group(1).lower(), []), first)
+        else:
+            # 기준 선택자 (#아이디 또는 속성 선택자)
+            anchor = selector[:len(segments[0])]
+            compiled = soupsieve.compile(anchor)
+            nodes = [node for node in self.pool(anchor) if compiled.match(node)]
+        for step in steps:
+            name = step.group(1).lower()
+            nodes = self._path_step([child for node in nodes for child in self._children.get((id(node), name), [])],
+                                    step)
+        return nodes
+
+    def _path_step(self, nodes: List[Tag], step: re.Match) -> List[Tag]:
+        """경로 한 단계의 nth-of-type 순번과 일치하는 요소 (순번이 없으면 모든 요소)"""
+        if step.group(2) is None:
+            return nodes
+        position = int(step.group(2))
+        return [node for node in nodes if self.positions[id(node)] == position]
+
+    def pool(self, selector: str) -> List[Tag]:
+        """
+        CSS 선택자와 일치할 수 있는 요소 (마지막 복합 선택자의 id, 클래스, 속성 값, 태그 또는 속성을 가진 요소)
+
+        Args:
+            selector: CSS 선택자
+
+        Returns:
+            요소 노드 리스트 (선택자 목록이거나 좁힐 수 없으면 문서의 모든 요소)
+        """
+        selector = selector.strip()
+        masked = _mask_selector(selector)
+        if ',' in masked:
+            return self.nodes
+        start = max((match.end() for match in _SELECTOR_COMBINATOR_PATTERN.finditer(masked)), default=0)
+        match = _COMPOUND_PATTERN.match(selector[start:])
+        attribute = (match.group('attribute') or '').lower()
+        value = match.group('value') if match.group('value') is not None else match.group('quoted')
+        if match.group('id'):
+            return self.ids.get(match.group('id'), [])
+        if match.group('class'):
+            return self.classes.get(match.group('class'), [])
+        # type 속성 값은 대소문자를 구분하지 않고 비교하므로 값 색인을 사용하지 않음
+        if value is not None and attribute != 'type':
+            if attribute not in self._attribute_values:
+                self._attribute_values[attribute] = {}
+                for node in self.nodes:
+                    if node.has_attr(attribute):
+                        self._attribute_values[attribute].setdefault(_attribute_value(node, attribute), []).append(node)
+            return self._attribute_values[attribute].get(value, [])
+        if match.group('tag'):
+            return self.tags.get(match.group('tag').lower(), [])
+        if attribute:
+            if attribute not in self._attributes:
+                self._attributes[attribute] = [node for node in self.nodes if node.has_attr(attribute)]
+            return self._attributes[attribute]
+        return self.nodes
+
+
+class _XPathIndex:
+    """
+    lxml 트리에서 요소 정보의 XPath 후보 형식(속성 값, 텍스트 조건)을 찾는 색인
+
+    XPath마다 문서 전체를 평가하지 않도록 속성 값과 normalize-space 텍스트별 요소를 한 번만 모은다.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self._attributes = {}
+        self._texts = None
+
+    def select(self, expression: str) -> list:
+        """
+        XPath 식과 일치하는 요소 (색인에 없는 형식은 lxml로 평가)
+
+        Args:
+            expression: XPath 식
+
+        Returns:
+            lxml 요소 리스트 (잘못된 식은 lxml 예외 발생)
+        """
+        match = _XPATH_ATTRIBUTE_PATTERN.match(expression)
+        if match:
+            tag, attribute, value = match.groups()
+            if attribute not in self._attributes:
+                self._attributes[attribute] = {}
+                for node in self.tree.iter(lxml.etree.Element):
+                    if node.get(attribute) is not None:
+                        self._attributes[attribute].setdefault(node.get(attribute), []).append(node)
+            nodes = self._attributes[attribute].get(value, [])
+        else:
+            match = _XPATH_TEXT_PATTERN.match(expression)
+            if match is None:
+                return [node for node in self.tree.xpath(expression) if isinstance(node, lxml.html.HtmlElement)]
+            tag, value = match.groups()
+            if self._texts is None:
+                self._texts = {}
+                for node in self.tree.iter(lxml.etree.Element):
+                    text = _XPATH_SPACE_PATTERN.sub(' ', node.xpath('string()')).strip(' ')
+                    self._texts.setdefault(text, []).append(node)
+            nodes = self._texts.get(value, [])
+        return [node for node in nodes if tag == '*' or node.tag == tag]
+
+
+class _NodePaths:
+    """
+    루트부터 요소까지의 (태그 이름, 같은 태그 형제 중 순번) 경로 계산기
+
+    BeautifulSoup 노드와 lxml 요소 모두 지원하여 서로 다른 트리의 같은 요소를 비교할 수 있다.
+    부모마다 자식 순번을 한 번만 세고 상위 경로를 재사용하므로, 형제가 많은 목록에서도
+    요소마다 앞쪽 형제를 다시 세지 않는다.
+    """
+
+    def __init__(self):
+        # id() -> (노드, 값): 노드를 함께 보관하여 lxml 요소 프록시가 해제되고 id가 재사용되지 않게 함
+        self._paths = {}
+        self._positions = {}
+
+    def path(self, node) -> Tuple[Tuple[str, int], ...]:
+        """루트부터 요소까지의 (태그 이름, 같은 태그 형제 중 순번) 경로"""
+        if isinstance(node, Tag):
+            if node.name == '[document]':
+                return ()
+            parent, name = node.parent, node.name
+        elif node is None:
+            return ()
+        else:
+            parent, name = node.getparent(), node.tag
+        cached = self._paths.get(id(node))
+        if cached is None:
+            cached = (node, self.path(parent) + ((name, self._position(node, parent)),))
+            self._paths[id(node)] = cached
+        return cached[1]
+
+    def _position(self, node, parent) -> int:
+        if id(node) not in self._positions:
+            if parent is None:
+                siblings = [(node, node.tag)]
+            elif isinstance(parent, Tag):
+                siblings = [(sibling, sibling.name) for sibling in parent.find_all(recursive=False)]
+            else:
+                siblings = [(sibling, sibling.tag) for sibling in parent if isinstance(sibling.tag, str)]
+            counts = {}
+            for sibling, name in siblings:
+                self._positions[id(sibling)] = (sibling, counts.get(name, 0))
+                counts[name] = counts.get(name, 0) + 1
+        return self._positions[id(node)][1]
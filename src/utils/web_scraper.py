@@ -3,7 +3,7 @@
 """
 import os
 import time
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Iterable, Iterator, Callable, Optional
 from io import BytesIO
 import base64
 
@@ -15,18 +15,339 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
-from webdriver_manager.chrome import ChromeDriverManager
 from PIL import Image
 from dotenv import load_dotenv
 
+from src.utils.batch import run_isolated
+from src.utils.command_tracer import CommandTracer
+from src.utils.driver_resolver import resolve_chromedriver
+from src.utils.element_info import (ELEMENT_ATTRIBUTES, CATEGORY_SELECTORS, PAGE_CONTENT_ATTRIBUTES,
+                                    PAGE_SIGNATURE_ATTRIBUTES, SELECTOR_ATTRIBUTES, build_element_info,
+                                    category_selector, page_signature_selector)
+from src.utils.profiler import Profiler
+
 # 환경 변수 로드
 load_dotenv()
 
+# 요소 표시 여부 판별 함수 (일괄 처리 스크립트 공용)
+_IS_DISPLAYED_JS = """
+function isDisplayed(el) {
+    if (!el.isConnected) return false;
+    if (el.tagName.toLowerCase() === 'input' && (el.type || '').toLowerCase() === 'hidden') return false;
+    var style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden' || style.visibility === 'collapse') return false;
+    if (parseFloat(style.opacity) === 0) return false;
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+"""
+
+# 고유 CSS 선택자 생성 함수 (일괄 처리 스크립트 공용, element_info.attribute_selector와 같은 규칙)
+# 안정적인 속성 선택자 중 페이지에서 요소 하나에만 일치하는 것을 우선 사용하고, 없으면 고유한 아이디가 있는
+# 가장 가까운 상위 요소(없으면 html)부터 '태그:nth-of-type(n)' 경로를 만든다. 경로의 각 단계는 부모 안에서
+# 고유하므로 단계마다 문서 전체를 검색하지 않는다. 속성 값별 요소 수는 문서를 한 번만 탐색하여 세고,
+# 같은 태그 형제 중 순번은 부모마다 한 번만 센다.
+_UNIQUE_SELECTOR_JS = """
+var selectorCounts = null;
+function attributeSelector(tag, name, value) {
+    if (name === 'id' && /^[A-Za-z_][\\w-]*$/.test(value)) return '#' + value;
+    return tag + '[' + name + '="' + value.replace(/\\\\/g, '\\\\\\\\').replace(/"/g, '\\\\"') + '"]';
+}
+function countSelectors(names) {
+    selectorCounts = {};
+    var nodes = document.getElementsByTagName('*');
+    for (var i = 0; i < nodes.length; i++) {
+        for (var j = 0; j < names.length; j++) {
+            var value = nodes[i].getAttribute(names[j]);
+            if (!value) continue;
+            var key = attributeSelector(nodes[i].tagName.toLowerCase(), names[j], value);
+            selectorCounts[key] = (selectorCounts[key] || 0) + 1;
+        }
+    }
+}
+function stableSelector(el, names) {
+    if (selectorCounts === null) countSelectors(names);
+    for (var i = 0; i < names.length; i++) {
+        var value = el.getAttribute(names[i]);
+        if (!value) continue;
+        var selector = attributeSelector(el.tagName.toLowerCase(), names[i], value);
+        if (selectorCounts[selector] === 1) return selector;
+    }
+    return null;
+}
+var pathSegments = new Map();
+function pathSegment(el) {
+    if (!pathSegments.has(el)) {
+        var siblings = el.parentElement ? el.parentElement.children : [el], counts = {}, indices = [];
+        for (var i = 0; i < siblings.length; i++) {
+            counts[siblings[i].tagName] = (counts[siblings[i].tagName] || 0) + 1;
+            indices.push(counts[siblings[i].tagName]);
+        }
+        for (var i = 0; i < siblings.length; i++) {
+            var tag = siblings[i].tagName.toLowerCase();
+            if (counts[siblings[i].tagName] > 1) tag += ':nth-of-type(' + indices[i] + ')';
+            pathSegments.set(siblings[i], tag);
+        }
+    }
+    return pathSegments.get(el);
+}
+function uniqueSelector(el, names) {
+    try {
+        var selector = stableSelector(el, names);
+        if (selector) return selector;
+        var path = [];
+        for (var node = el; node && node.nodeType === 1; node = node.parentElement) {
+            var anchor = node !== el ? stableSelector(node, ['id']) : null;
+            path.unshift(anchor || pathSegment(node));
+            if (anchor) break;
+        }
+        return path.join(' > ') || null;
+    } catch (e) {
+        return null;
+    }
+}
+"""
+
+# 요소가 속한 폼의 이름 (폼의 id, name 속성, 없으면 문서 안의 순번으로 'form1', 'form2', ...)
+# 폼 밖의 요소는 빈 문자열, form 속성으로 연결된 요소는 연결된 폼을 사용한다.
+_FORM_KEY_JS = """
+function formKey(el) {
+    var form = el.form || (el.closest ? el.closest('form') : null);
+    if (!form || !form.getAttribute) return '';
+    var name = form.getAttribute('id') || form.getAttribute('name');
+    if (name) return name;
+    var forms = document.getElementsByTagName('form');
+    for (var i = 0; i < forms.length; i++) {
+        if (forms[i] === form) return 'form' + (i + 1);
+    }
+    return '';
+}
+"""
+
+# 요소 정보 일괄 추출 스크립트
+# arguments[0]: 웹 요소 리스트, arguments[1]: [키, 속성 이름] 리스트, arguments[2]: 고유 선택자용 속성 리스트,
+# arguments[3]: true면 요소별 추출 시간(밀리초)을 extract_ms로 함께 반환 (프로파일링용)
+# get_attribute와 같이 속성(property) 값을 우선 사용하고 없으면 HTML 속성 값을 사용한다.
+BULK_EXTRACT_SCRIPT = _IS_DISPLAYED_JS + _UNIQUE_SELECTOR_JS + _FORM_KEY_JS + """
+var elements = arguments[0], attributes = arguments[1], selectorAttributes = arguments[2], timing = arguments[3];
+function readAttribute(el, name) {
+    var prop = name === 'class' ? 'className' : name;
+    var value = el[prop];
+    if (typeof value === 'string' && value) return value;
+    return el.getAttribute(name) || '';
+}
+var results = [];
+for (var i = 0; i < elements.length; i++) {
+    var el = elements[i];
+    var started = timing ? performance.now() : 0;
+    var rect = el.getBoundingClientRect();
+    var displayed = isDisplayed(el);
+    var info = {
+        tag_name: el.tagName.toLowerCase(),
+        text: displayed ? (el.innerText || '') : '',
+        location: {x: Math.round(rect.left + window.scrollX), y: Math.round(rect.top + window.scrollY)},
+        size: {width: Math.round(rect.width), height: Math.round(rect.height)},
+        is_displayed: displayed,
+        is_enabled: !(el.matches && el.matches(':disabled')),
+        unique_selector: uniqueSelector(el, selectorAttributes),
+        form: formKey(el)
+    };
+    for (var j = 0; j < attributes.length; j++) {
+        info[attributes[j][0]] = readAttribute(el, attributes[j][1]);
+    }
+    if (timing) info.extract_ms = performance.now() - started;
+    results.push(info);
+}
+return results;
+"""
+
+# 페이지 로드 시작 스크립트 ('none' 로드 전략에서 로드 완료를 기다리지 않고 이동)
+# 이동 전 문서에 표시를 남겨 두고, 새 문서에 표시가 없으면 이동이 완료된 것으로 판단한다.
+# 프래그먼트만 다른 URL은 문서를 새로 불러오지 않으므로 표시를 남기지 않는다.
+TAB_NAVIGATE_SCRIPT = """
+var target = new URL(arguments[0], window.location.href).href;
+var sameDocument = target.indexOf('#') >= 0 && target.split('#')[0] === window.location.href.split('#')[0];
+window.__poGeneratorPending = !sameDocument;
+window.location.href = target;
+"""
+
+# 페이지 로드 상태 확인 스크립트
+TAB_READY_SCRIPT = """
+return window.__poGeneratorPending !== true && document.readyState === 'complete';
+"""
+
+# 요소 위치 일괄 조회 스크립트 (스크린샷 잘라내기용)
+# 문서 좌표 기준 사각형과 고정 위치 여부, 화면 크기, 스크롤 위치, 화면 배율을 반환한다.
+# 고정 위치(position: fixed) 요소는 스크롤과 무관하게 화면 좌표를 사용한다.
+ELEMENT_RECTS_SCRIPT = """
+var elements = arguments[0], rects = [];
+function isFixed(el) {
+    for (var node = el; node && node.nodeType === 1; node = node.parentElement) {
+        if (window.getComputedStyle(node).position === 'fixed') return true;
+    }
+    return false;
+}
+for (var i = 0; i < elements.length; i++) {
+    var el = elements[i];
+    if (!el || !el.isConnected) { rects.push(null); continue; }
+    var rect = el.getBoundingClientRect(), fixed = isFixed(el);
+    rects.push({
+        x: rect.left + (fixed ? 0 : window.scrollX),
+        y: rect.top + (fixed ? 0 : window.scrollY),
+        width: rect.width,
+        height: rect.height,
+        fixed: fixed
+    });
+}
+return {
+    rects: rects,
+    viewport: [window.innerWidth, window.innerHeight],
+    scroll: [window.scrollX, window.scrollY],
+    scale: window.devicePixelRatio || 1
+};
+"""
+
+# 스크롤 후 실제 스크롤 위치 반환 스크립트 (문서 끝에서는 요청한 위치보다 덜 스크롤됨)
+SCROLL_TO_SCRIPT = """
+window.scrollTo(arguments[0], arguments[1]);
+return [window.scrollX, window.scrollY];
+"""
+
+# 후보 요소 일괄 수집 스크립트
+# arguments[0]: [유형 이름, CSS 선택자] 리스트
+# 모든 선택자를 한 번의 탐색에서 적용하고 브라우저 안에서 중복을 제거하여
+# [웹 요소, 일치한 유형 리스트] 리스트를 문서 순서대로 반환한다.
+COLLECT_CANDIDATES_SCRIPT = """
+var categories = arguments[0], seen = new Map(), results = [];
+for (var i = 0; i < categories.length; i++) {
+    var name = categories[i][0];
+    var nodes = document.querySelectorAll(categories[i][1]);
+    for (var j = 0; j < nodes.length; j++) {
+        var entry = seen.get(nodes[j]);
+        if (!entry) {
+            entry = [nodes[j], []];
+            seen.set(nodes[j], entry);
+            results.push(entry);
+        }
+        if (entry[1].indexOf(name) < 0) entry[1].push(name);
+    }
+}
+results.sort(function (a, b) {
+    if (a[0] === b[0]) return 0;
+    return a[0].compareDocumentPosition(b[0]) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1;
+});
+return results;
+"""
+
+# 페이지의 링크 주소 수집 스크립트 (절대 URL)
+LINKS_SCRIPT = """
+return Array.from(document.querySelectorAll('a[href], area[href]'), function (a) { return a.href; });
+"""
+
+# 페이지 구조 서명 스크립트
+# arguments[0]: 상호작용 요소 선택자, arguments[1]: 서명에 포함할 속성 이름 리스트,
+# arguments[2]: 요소 텍스트, 상위 요소 경로, 표시 여부 포함 여부 (내용 변경 감지용)
+# 반환값: 요소마다 '태그|속성 값|...[|텍스트|경로|표시 여부]' 문자열 (문서 순서)
+# 경로는 루트부터 '태그:같은 태그 형제 중 순번'을 '>'로 이은 문자열 (형제 순번은 부모마다 한 번만 계산)
+PAGE_SIGNATURE_SCRIPT = _IS_DISPLAYED_JS + """
+var nodes = document.querySelectorAll(arguments[0]), attributes = arguments[1], signature = [];
+var paths = new Map(), typeIndices = new Map();
+function typeIndex(el) {
+    if (!typeIndices.has(el)) {
+        var counts = {}, siblings = el.parentElement ? el.parentElement.children : [el];
+        for (var i = 0; i < siblings.length; i++) {
+            counts[siblings[i].tagName] = (counts[siblings[i].tagName] || 0) + 1;
+            typeIndices.set(siblings[i], counts[siblings[i].tagName]);
+        }
+    }
+    return typeIndices.get(el);
+}
+function nodePath(el) {
+    if (!paths.has(el)) {
+        var prefix = el.parentElement ? nodePath(el.parentElement) + '>' : '';
+        paths.set(el, prefix + el.tagName.toLowerCase() + ':' + typeIndex(el));
+    }
+    return paths.get(el);
+}
+for (var i = 0; i < nodes.length; i++) {
+    var parts = [nodes[i].tagName.toLowerCase()];
+    for (var j = 0; j < attributes.length; j++) parts.push(nodes[i].getAttribute(attributes[j]) || '');
+    if (arguments[2]) {
+        parts.push((nodes[i].textContent || '').replace(/\\s+/g, ' ').trim());
+        parts.push(nodePath(nodes[i]));
+        parts.push(isDisplayed(nodes[i]) ? '1' : '0');
+    }
+    signature.push(parts.join('|'));
+}
+return signature;
+"""
+
+# 로케이터 일괄 검사 스크립트
+# arguments[0]: 대상 웹 요소 리스트, arguments[1]: 요소별 [By 값, 로케이터 값] 후보 리스트
+# 반환값: 요소별 후보마다 [일치하는 요소 수, 대상 요소 포함 여부] (잘못된 로케이터는 [-1, false])
+LOCATOR_CHECK_SCRIPT = """
+var targets = arguments[0], candidates = arguments[1], cache = {}, results = [];
+function cssString(value) { return '"' + value.replace(/\\\\/g, '\\\\\\\\').replace(/"/g, '\\\\"') + '"'; }
+function find(by, value) {
+    var key = by + '\\n' + value;
+    if (key in cache) return cache[key];
+    var nodes = null;
+    try {
+        if (by === 'id') nodes = document.querySelectorAll('[id=' + cssString(value) + ']');
+        else if (by === 'name') nodes = document.querySelectorAll('[name=' + cssString(value) + ']');
+        else if (by === 'class name') nodes = document.getElementsByClassName(value);
+        else if (by === 'css selector') nodes = document.querySelectorAll(value);
+        else if (by === 'xpath') {
+            var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+        }
+    } catch (e) {
+        nodes = null;
+    }
+    cache[key] = nodes ? Array.prototype.slice.call(nodes) : null;
+    return cache[key];
+}
+for (var i = 0; i < targets.length; i++) {
+    var checks = [];
+    for (var j = 0; j < candidates[i].length; j++) {
+        var nodes = find(candidates[i][j][0], candidates[i][j][1]);
+        checks.push(nodes ? [nodes.length, nodes.indexOf(targets[i]) >= 0] : [-1, false]);
+    }
+    results.push(checks);
+}
+return results;
+"""
+
+# 요소 생존/표시 여부 일괄 확인 스크립트
+# arguments[0]: 웹 요소 리스트, 반환값: [DOM 연결 여부, 표시 여부] 리스트
+LIVENESS_SCRIPT = _IS_DISPLAYED_JS + """
+var elements = arguments[0], states = [];
+for (var i = 0; i < elements.length; i++) {
+    states.push([elements[i].isConnected, isDisplayed(elements[i])]);
+}
+return states;
+"""
+
 class WebScraper:
     """웹페이지에서 요소를 스크래핑하는 클래스"""
     
-    def __init__(self):
-        """Selenium WebDriver 초기화"""
+    def __init__(self, driver_path: str = None, profiler: Optional[Profiler] = None,
+                 tracer: Optional[CommandTracer] = None, page_load_strategy: Optional[str] = None,
+                 allow_driver_download: bool = True):
+        """
+        Selenium WebDriver 초기화
+        
+        Args:
+            driver_path: ChromeDriver 실행 파일 경로 (기본값: CHROMEDRIVER_PATH, PATH, 로컬 캐시 순으로 탐색)
+            profiler: 단계별 시간과 스크린샷 크기를 기록할 프로파일러 (기본값: 기록하지 않음)
+            tracer: 드라이버의 모든 WebDriver 명령을 기록할 추적기 (기본값: 추적하지 않음)
+            page_load_strategy: 페이지 로드 전략 (기본값: 'normal', 여러 탭을 번갈아 쓰려면 'none')
+            allow_driver_download: 맞는 드라이버가 없을 때 내려받을지 여부 (False면 DriverNotFoundError 발생)
+        """
+        self.profiler = profiler if profiler is not None else Profiler(enabled=False)
+        self.tracer = tracer
+        self.page_load_strategy = page_load_strategy or 'normal'
         headless = os.getenv('HEADLESS_MODE', 'True').lower() == 'true'
         timeout = int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
         
@@ -56,16 +377,53 @@ class WebScraper:
             }
         }
         chrome_options.add_experimental_option('prefs', prefs)
+        chrome_options.page_load_strategy = self.page_load_strategy
+        if os.getenv('CHROME_BINARY'):
+            chrome_options.binary_location = os.getenv('CHROME_BINARY')
+        
+        # 드라이버 경로 결정 (일치하는 드라이버가 있으면 네트워크 미사용)
+        with self.profiler.phase('startup.resolve_driver') as resolve_timer:
+            resolved_path, driver_source = resolve_chromedriver(driver_path, allow_download=allow_driver_download)
         
         # WebDriver 초기화
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.set_page_load_timeout(timeout)
+        with self.profiler.phase('startup.launch') as launch_timer:
+            service = Service(resolved_path)
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.driver.set_page_load_timeout(timeout)
+        self.page_load_timeout = timeout
+        if tracer is not None:
+            tracer.attach(self.driver)
+        
+        # 시작 소요 시간 (실행 요약에 표시)
+        self.startup_info = {
+            'driver_path': resolved_path,
+            'driver_source': driver_source,
+            'resolve_time': resolve_timer.wall,
+            'launch_time': launch_timer.wall,
+        }
     
     def __del__(self):
         """소멸자: 드라이버 종료"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
+        self.close()
+    
+    def close(self):
+        """드라이버 종료 (여러 번 호출해도 안전)"""
+        driver = self.__dict__.pop('driver', None)
+        if driver is not None:
+            driver.quit()
+    
+    def is_alive(self) -> bool:
+        """
+        드라이버 세션이 응답하는지 확인
+        
+        Returns:
+            세션이 살아 있으면 True
+        """
+        try:
+            self.driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
     
     def navigate_to(self, url: str) -> bool:
         """
@@ -78,65 +436,148 @@ class WebScraper:
             성공 여부
         """
         try:
-            self.driver.get(url)
-            # 페이지가 완전히 로드될 때까지 대기
-            self.driver.implicitly_wait(10)
+            with self.profiler.phase('navigate'):
+                if self.page_load_strategy == 'none':
+                    # 드라이버 호출이 로드 완료를 기다리지 않으므로 새 문서의 로드 완료를 직접 확인
+                    self.driver.execute_script(TAB_NAVIGATE_SCRIPT, url)
+                    WebDriverWait(self.driver, self.page_load_timeout, poll_frequency=0.05).until(
+                        lambda driver: driver.execute_script(TAB_READY_SCRIPT))
+                else:
+                    self.driver.get(url)
+                # 페이지가 완전히 로드될 때까지 대기
+                self.driver.implicitly_wait(10)
             print("페이지 로드 완료...")
             return True
         except Exception as e:
             print(f"URL 탐색 오류: {e}")
             return False
     
-    def get_buttons(self) -> List[WebElement]:
+    def process_urls_in_tabs(self, urls: Iterable[str], handler: Callable[[str], Any], tabs: int = 4,
+                             page_timeout: float = None, poll_interval: float = 0.05) -> Iterator[Dict[str, Any]]:
         """
-        페이지에서 버튼 요소 추출 (헤더와 푸터 포함)
+        브라우저 하나에서 여러 탭을 번갈아 사용하며 URL 처리
         
-        Returns:
-            버튼 웹 요소 리스트
+        각 탭에서 로드를 시작해 두고 로드가 끝난 탭부터 handler를 실행한다.
+        한 탭에서 요소를 추출하는 동안 다른 탭들은 계속 페이지를 로드하므로
+        브라우저 프로세스를 늘리지 않고 페이지 로드 시간을 겹칠 수 있다.
+        드라이버 호출이 로드 중인 탭을 기다리지 않아야 하므로 page_load_strategy='none'으로
+        생성한 스크래퍼에서만 탭을 번갈아 사용하고, 그 밖에는 URL을 하나씩 로드하여 처리한다.
+        
+        Args:
+            urls: 처리할 URL 이터러블 (여러 스크래퍼가 공유하는 이터레이터도 가능)
+            handler: 현재 탭에 로드된 페이지를 처리하는 함수 (출력 파일 경로 반환)
+            tabs: 사용할 탭 수
+            page_timeout: 탭별 페이지 로드 타임아웃 (초, 기본값: PAGE_LOAD_TIMEOUT)
+            poll_interval: 로드가 끝난 탭이 없을 때 대기 간격 (초)
+            
+        Yields:
+            URL별 처리 결과 딕셔너리 (처리가 끝난 순서)
         """
-        # 다양한 버튼 선택자 시도
-        button_elements = []
+        page_timeout = page_timeout or self.page_load_timeout
+        urls = iter(urls)
+        
+        if self.page_load_strategy != 'none':
+            def load_and_handle(url):
+                if not self.navigate_to(url):
+                    raise RuntimeError(f"URL '{url}'로 이동할 수 없습니다.")
+                return handler(url)
+            
+            for url in urls:
+                yield run_isolated(lambda: load_and_handle(url), url)
+            return
+        
+        handles = [self.driver.current_window_handle]
+        for _ in range(max(1, tabs) - 1):
+            self.driver.switch_to.new_window('tab')
+            handles.append(self.driver.current_window_handle)
+        
+        # 탭 핸들 -> (URL, 로드 시작 시각)
+        loading = {}
+        
+        def start_next(handle):
+            url = next(urls, None)
+            if url is None:
+                return
+            self.driver.switch_to.window(handle)
+            self.driver.execute_script(TAB_NAVIGATE_SCRIPT, url)
+            loading[handle] = (url, time.time())
         
         try:
-            # 타임아웃 설정
-            self.driver.implicitly_wait(5)
-            print("버튼 요소 검색 중...")
-            
-            # 1. 표준 button 태그 (가장 빠르게 처리)
-            button_elements.extend(self.driver.find_elements(By.TAG_NAME, "button"))
-            
-            # 2. input 태그 중 button, submit 타입
-            button_elements.extend(self.driver.find_elements(By.CSS_SELECTOR, "input[type='button'], input[type='submit']"))
-            
-            # 3. role이 button인 요소들
-            button_elements.extend(self.driver.find_elements(By.CSS_SELECTOR, "[role='button']"))
-            
-            # 검색 효율 향상을 위해 일괄 CSS 선택자 사용
-            button_elements.extend(self.driver.find_elements(By.CSS_SELECTOR, 
-                "a[class*='btn'], div[class*='btn'], span[class*='btn'], " + 
-                "a[href*='login'], a[href*='signin'], a[href*='signup'], a[href*='register'], " +
-                "a[href*='mypage'], a[href*='cart'], a[href*='search'], a[href*='customer'], " +
-                "header a, .header a, #header a, footer a, .footer a, #footer a"
-            ))
-            
-            # 중복 요소 제거 (element ID 기준)
-            unique_elements = {}
-            for element in button_elements:
+            for handle in handles:
+                start_next(handle)
+            
+            while loading:
+                progressed = False
+                for handle in list(loading):
+                    url, started = loading[handle]
+                    self.driver.switch_to.window(handle)
+                    
+                    if self.driver.execute_script(TAB_READY_SCRIPT):
+                        del loading[handle]
+                        result = run_isolated(lambda: handler(url), url)
+                        result['elapsed'] = time.time() - started  # 로드 시간 포함
+                        yield result
+                    elif time.time() - started > page_timeout:
+                        del loading[handle]
+                        self.driver.execute_script("window.stop();")
+                        yield {'url': url, 'status': 'error', 'output': None,
+                               'error': f"페이지 로드 타임아웃 ({page_timeout}초)", 'elapsed': time.time() - started}
+                    else:
+                        continue
+                    
+                    progressed = True
+                    start_next(handle)
+                
+                if not progressed:
+                    time.sleep(poll_interval)
+        finally:
+            # 추가로 연 탭을 닫고 첫 번째 탭으로 복귀
+            for handle in handles[1:]:
                 try:
-                    # WebElement 객체의 ID로 중복 체크
-                    element_id = element.id
-                    if element_id not in unique_elements:
-                        unique_elements[element_id] = element
-                except:
-                    continue
-            
-            buttons = list(unique_elements.values())
-            print(f"{len(buttons)}개의 버튼 요소 찾음.")
-            return buttons
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except Exception:
+                    pass
+            try:
+                self.driver.switch_to.window(handles[0])
+            except Exception:
+                pass
+    
+    def collect_candidates(self, categories: List[str] = None) -> List[Tuple[WebElement, List[str]]]:
+        """
+        모든 유형의 선택자를 한 번의 브라우저 내 탐색으로 적용하여 후보 요소 수집
+        
+        중복 제거도 브라우저 안에서 처리하므로 선택자나 폼 수와 관계없이
+        WebDriver 호출은 한 번이다.
+        
+        Args:
+            categories: 수집할 요소 유형 리스트 (기본값: 모든 유형)
             
+        Returns:
+            (웹 요소, 일치한 유형 리스트) 튜플의 리스트 (문서 순서)
+        """
+        categories = categories or list(CATEGORY_SELECTORS.keys())
+        selectors = [[category, category_selector(category)] for category in categories]
+        
+        try:
+            print("상호작용 요소 검색 중...")
+            with self.profiler.phase('collect'):
+                results = self.driver.execute_script(COLLECT_CANDIDATES_SCRIPT, selectors)
+            return [(element, list(element_categories)) for element, element_categories in results]
         except Exception as e:
-            print(f"버튼 요소 추출 중 오류: {e}")
-            return button_elements
+            print(f"상호작용 요소 수집 중 오류: {e}")
+            return []
+    
+    def get_buttons(self) -> List[WebElement]:
+        """
+        페이지에서 버튼 요소 추출 (헤더와 푸터 포함)
+        
+        Returns:
+            버튼 웹 요소 리스트
+        """
+        buttons = [element for element, _ in self.collect_candidates(['button'])]
+        print(f"{len(buttons)}개의 버튼 요소 찾음.")
+        return buttons
     
     def get_inputs(self) -> List[WebElement]:
         """
@@ -145,61 +586,9 @@ class WebScraper:
         Returns:
             입력 웹 요소 리스트
         """
-        input_elements = []
-        
-        try:
-            # 타임아웃 설정
-            self.driver.implicitly_wait(5)
-            print("입력 요소 검색 중...")
-            
-            # 1. 기본 입력 필드 (text, password, email, number 등)
-            input_elements.extend(self.driver.find_elements(By.CSS_SELECTOR, 
-                "input[type='text'], input[type='password'], input[type='email'], input[type='number'], " +
-                "input[type='tel'], input[type='search'], input[type='url'], input:not([type])"
-            ))
-            
-            # 2. textarea 요소
-            input_elements.extend(self.driver.find_elements(By.TAG_NAME, "textarea"))
-            
-            # 3. contenteditable 요소
-            input_elements.extend(self.driver.find_elements(By.CSS_SELECTOR, "[contenteditable='true']"))
-            
-            # 4. 특정 클래스나 역할을 가진 입력 요소
-            input_elements.extend(self.driver.find_elements(By.CSS_SELECTOR, 
-                "[role='textbox'], [class*='input'], [class*='field'], [class*='text-box']"
-            ))
-            
-            # 5. 로그인/회원가입 폼 내의 입력 요소 찾기
-            form_selectors = ["form", "form[action*='login']", "form[action*='signin']", 
-                             "form[action*='register']", "form[action*='signup']", 
-                             "div[class*='login'], div[class*='signin'], div[id*='login']"]
-            
-            for selector in form_selectors:
-                try:
-                    forms = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for form in forms:
-                        form_inputs = form.find_elements(By.TAG_NAME, "input")
-                        input_elements.extend(form_inputs)
-                except:
-                    continue
-            
-            # 중복 요소 제거
-            unique_elements = {}
-            for element in input_elements:
-                try:
-                    element_id = element.id
-                    if element_id not in unique_elements:
-                        unique_elements[element_id] = element
-                except:
-                    continue
-            
-            inputs = list(unique_elements.values())
-            print(f"{len(inputs)}개의 입력 요소 찾음.")
-            return inputs
-            
-        except Exception as e:
-            print(f"입력 요소 추출 중 오류: {e}")
-            return input_elements
+        inputs = [element for element, _ in self.collect_candidates(['input'])]
+        print(f"{len(inputs)}개의 입력 요소 찾음.")
+        return inputs
     
     def get_interaction_elements(self) -> Dict[str, List[WebElement]]:
         """
@@ -208,26 +597,44 @@ class WebScraper:
         Returns:
             요소 유형별 웹 요소 리스트를 담은 딕셔너리
         """
-        # 버튼 요소 추출
-        buttons = self.get_buttons()
-        
-        # 입력 요소 추출
-        inputs = self.get_inputs()
+        interaction_elements = {category: [] for category in CATEGORY_SELECTORS}
+        for element, element_categories in self.collect_candidates():
+            for category in element_categories:
+                interaction_elements[category].append(element)
+        return interaction_elements
+    
+    def get_links(self) -> List[str]:
+        """
+        현재 페이지의 링크 주소 수집
         
-        # 체크박스와 라디오 버튼 추출
-        checkboxes_radios = self.driver.find_elements(By.CSS_SELECTOR, 
-            "input[type='checkbox'], input[type='radio']"
-        )
+        Returns:
+            절대 URL 리스트 (문서 순서)
+        """
+        try:
+            return [href for href in self.driver.execute_script(LINKS_SCRIPT) if href]
+        except Exception as e:
+            print(f"링크 수집 중 오류: {e}")
+            return []
+    
+    def get_page_signature(self, include_content: bool = False) -> List[str]:
+        """
+        현재 페이지의 상호작용 요소 구조 서명 (같은 템플릿의 페이지를 구분하기 위함)
         
-        # 선택 요소 추출 (드롭다운 등)
-        selects = self.driver.find_elements(By.TAG_NAME, "select")
+        Args:
+            include_content: True면 코드 생성에 쓰이는 모든 속성, 텍스트, 상위 요소 경로, 표시 여부까지 포함
+                             (내용 변경 감지용, 위치 경로 로케이터나 표시 여부가 바뀌는 변경도 감지)
         
-        return {
-            'button': buttons,
-            'input': inputs,
-            'checkbox_radio': checkboxes_radios,
-            'select': selects
-        }
+        Returns:
+            요소마다 '태그|type|id|name|role' 형식의 문자열 리스트 (문서 순서)
+        """
+        attributes = PAGE_CONTENT_ATTRIBUTES if include_content else PAGE_SIGNATURE_ATTRIBUTES
+        try:
+            with self.profiler.phase('signature'):
+                return list(self.driver.execute_script(PAGE_SIGNATURE_SCRIPT, page_signature_selector(),
+                                                       attributes, include_content))
+        except Exception as e:
+            print(f"페이지 구조 확인 중 오류: {e}")
+            return []
     
     def get_element_info(self, element: WebElement) -> Dict[str, Any]:
         """
@@ -239,124 +646,30 @@ class WebScraper:
         Returns:
             요소 정보를 담은 딕셔너리
         """
+        start_time = time.perf_counter()
         try:
-            # 요소가 존재하는지 확인
-            WebDriverWait(self.driver, 1).until(EC.staleness_of(element))
-            print("요소가 더 이상 존재하지 않습니다.")
-            return {'is_displayed': False}
-        except:
-            pass
-            
-        try:
-            location = element.location
-            size = element.size
-            
-            # 텍스트 및 속성 추출
-            text = element.text.strip() if element.text else ""
-            element_id = element.get_attribute('id') or ""
-            element_class = element.get_attribute('class') or ""
-            element_name = element.get_attribute('name') or ""
-            element_type = element.get_attribute('type') or ""
-            element_value = element.get_attribute('value') or ""
-            element_href = element.get_attribute('href') or ""
-            element_aria_label = element.get_attribute('aria-label') or ""
-            element_title = element.get_attribute('title') or ""
-            element_placeholder = element.get_attribute('placeholder') or ""
-            
-            # 요소 유형 판별
-            tag_name = element.tag_name
-            if tag_name == 'input':
-                if element_type in ['text', 'password', 'email', 'tel', 'number', 'url', 'search']:
-                    element_category = 'input'
-                elif element_type in ['checkbox', 'radio']:
-                    element_category = 'checkbox_radio'
-                elif element_type in ['button', 'submit', 'reset']:
-                    element_category = 'button'
-                else:
-                    element_category = 'other'
-            elif tag_name == 'button':
-                element_category = 'button'
-            elif tag_name == 'textarea':
-                element_category = 'input'
-            elif tag_name == 'select':
-                element_category = 'select'
-            elif tag_name == 'a':
-                element_category = 'button'  # a 태그를 버튼으로 간주
-            else:
-                element_category = 'other'
-            
-            # 텍스트가 없으면 다른 속성에서 텍스트 추출 시도
-            if not text:
-                if element_value and element_category != 'input':  # 입력 필드의 값은 텍스트로 사용하지 않음
-                    text = element_value
-                elif element_placeholder:
-                    text = element_placeholder
-                elif element_aria_label:
-                    text = element_aria_label
-                elif element_title:
-                    text = element_title
-                elif element_href:
-                    # URL에서 마지막 부분만 추출 (개행 문자 제거)
-                    element_href = element_href.replace('\n', '').replace('\r', '')
-                    text = element_href.split('/')[-1].split('?')[0].replace('-', ' ').replace('_', ' ')
-            
-            # XPath 생성 (더 효율적인 방법으로)
-            xpath_options = []
-            
-            # ID 기반 XPath (가장 안정적)
-            if element_id:
-                # ID도 개행 문자가 있을 수 있으므로 제거
-                clean_id = element_id.replace('\n', ' ').replace('\r', ' ')
-                clean_id = ' '.join(clean_id.split())  # 연속된 공백을 하나로
-                id_xpath = f"//*[@id='{clean_id}']"
-                xpath_options.append(id_xpath)
-            
-            # 이름 기반 XPath
-            if element_name:
-                # 이름에도 개행 문자가 있을 수 있으므로 제거
-                clean_name = element_name.replace('\n', ' ').replace('\r', ' ')
-                clean_name = ' '.join(clean_name.split())  # 연속된 공백을 하나로
-                name_xpath = f"//*[@name='{clean_name}']"
-                xpath_options.append(name_xpath)
-            
-            # 텍스트 기반 XPath (안정적이지만 텍스트가 변경될 수 있음)
-            if text and len(text) < 50:  # 텍스트가 너무 길면 XPath로 쓰기 어려움
-                # 개행문자를 공백으로 변환하고 정규화
-                clean_text = text.replace('\n', ' ').replace('\r', ' ')
-                clean_text = ' '.join(clean_text.split())  # 연속된 공백을 하나로
-                text_xpath = f"//*[normalize-space(.)='{clean_text}']"
-                xpath_options.append(text_xpath)
+            raw = {
+                'tag_name': element.tag_name,
+                'text': element.text,
+                'location': element.location,
+                'size': element.size,
+                'is_displayed': element.is_displayed(),
+                'is_enabled': element.is_enabled(),
+            }
             
-            # 다른 속성 기반 XPath는 생략 (성능 향상)
+            # 속성 추출
+            for key, attribute in ELEMENT_ATTRIBUTES:
+                raw[key] = element.get_attribute(attribute)
             
-            # CSS 선택자 생성
-            css_selector = None
-            if element_id:
-                css_selector = f"#{element_id}"
-            elif element_class:
-                css_selector = f".{element_class.split()[0]}"  # 첫 번째 클래스만 사용
+            # 페이지에서 이 요소에만 일치하는 CSS 선택자와 요소가 속한 폼
+            raw['unique_selector'], raw['form'] = self.driver.execute_script(
+                _UNIQUE_SELECTOR_JS + _FORM_KEY_JS
+                + "return [uniqueSelector(arguments[0], arguments[1]), formKey(arguments[0])];",
+                element, SELECTOR_ATTRIBUTES)
             
-            return {
-                'element': element,
-                'tag_name': tag_name,
-                'element_category': element_category,
-                'text': text,
-                'id': element_id,
-                'class': element_class,
-                'name': element_name,
-                'type': element_type,
-                'value': element_value,
-                'placeholder': element_placeholder,
-                'href': element_href,
-                'aria_label': element_aria_label,
-                'title': element_title,
-                'location': location,
-                'size': size,
-                'xpath_options': xpath_options,
-                'css_selector': css_selector,
-                'is_displayed': element.is_displayed(),
-                'is_enabled': element.is_enabled()
-            }
+            info = build_element_info(raw, element)
+            self.profiler.observe('extract.element', time.perf_counter() - start_time)
+            return info
         except StaleElementReferenceException:
             print("요소가 더 이상 존재하지 않습니다.")
             return {'is_displayed': False}
@@ -364,6 +677,119 @@ class WebScraper:
             print(f"요소 정보 추출 중 오류: {e}")
             return {'is_displayed': False}
     
+    def check_elements(self, elements: List[WebElement]) -> List[Dict[str, bool]]:
+        """
+        여러 웹 요소의 생존 및 표시 여부를 한 번에 확인
+        
+        전체 요소를 한 번의 스크립트 실행으로 검사한다. 스크립트에 전달된
+        요소 중 더 이상 존재하지 않는(stale) 요소가 있으면 실행 전체가 실패하므로,
+        이 경우 리스트를 반으로 나누어 다시 검사하여 stale 요소만 골라낸다.
+        
+        Args:
+            elements: 확인할 웹 요소 리스트
+            
+        Returns:
+            입력 순서와 같은 순서의 {'alive': bool, 'displayed': bool} 리스트
+        """
+        states = [{'alive': False, 'displayed': False} for _ in elements]
+        pending = [(0, len(elements))]
+        
+        with self.profiler.phase('check'):
+            while pending:
+                start, end = pending.pop()
+                if start >= end:
+                    continue
+                try:
+                    results = self.driver.execute_script(LIVENESS_SCRIPT, elements[start:end])
+                    for offset, (alive, displayed) in enumerate(results):
+                        states[start + offset] = {'alive': bool(alive), 'displayed': bool(alive and displayed)}
+                except StaleElementReferenceException:
+                    # 구간에 stale 요소가 포함됨: 하나만 남을 때까지 나누어 검사
+                    if end - start > 1:
+                        middle = (start + end) // 2
+                        pending.append((start, middle))
+                        pending.append((middle, end))
+        
+        return states
+    
+    def check_locators(self, elements: List[WebElement],
+                       candidates: List[List[Tuple[str, str]]]) -> List[List[Tuple[int, bool]]]:
+        """
+        요소별 로케이터 후보의 일치 요소 수를 한 번의 스크립트 실행으로 검사
+        
+        같은 로케이터는 한 번만 평가한다. 스크립트 실행에 실패하면 (stale 요소 등)
+        check_elements와 같이 리스트를 반으로 나누어 다시 검사하여, 실패한 요소의 후보만
+        검사하지 못한 것으로 반환한다.
+        
+        Args:
+            elements: 대상 웹 요소 리스트
+            candidates: 요소별 (By 값, 로케이터 값) 후보 리스트
+            
+        Returns:
+            요소별 후보마다 (일치하는 요소 수, 대상 요소 포함 여부) 리스트 (잘못된 로케이터는 (-1, False))
+        """
+        results = [[(-1, False)] * len(locators) for locators in candidates]
+        pending = [(0, len(elements))]
+        
+        with self.profiler.phase('locators.check'):
+            while pending:
+                start, end = pending.pop()
+                if start >= end:
+                    continue
+                try:
+                    checked = self.driver.execute_script(LOCATOR_CHECK_SCRIPT, elements[start:end],
+                                                         [[list(locator) for locator in locators]
+                                                          for locators in candidates[start:end]])
+                    for offset, checks in enumerate(checked):
+                        results[start + offset] = [(int(count), bool(found)) for count, found in checks]
+                except Exception as e:
+                    # 구간에 stale 요소 등 검사할 수 없는 요소가 포함됨: 하나만 남을 때까지 나누어 검사
+                    if end - start > 1:
+                        middle = (start + end) // 2
+                        pending.append((start, middle))
+                        pending.append((middle, end))
+                    else:
+                        print(f"로케이터 검사 중 오류: {e}")
+        
+        return results
+    
+    def get_elements_info(self, elements: List[WebElement], chunk_size: int = 500) -> List[Dict[str, Any]]:
+        """
+        여러 웹 요소의 정보를 한 번의 스크립트 실행으로 일괄 추출
+        
+        요소당 약 15회의 WebDriver 호출 대신 청크당 한 번의 execute_script로
+        속성, 위치, 크기, 표시/활성 상태를 가져온다. 스크립트 실행에 실패한
+        청크는 요소별 get_element_info로 대체한다.
+        프로파일러가 활성화되어 있으면 브라우저 안에서 잰 요소별 추출 시간을 함께 기록한다.
+        
+        Args:
+            elements: 정보를 추출할 웹 요소 리스트
+            chunk_size: 한 번의 스크립트 실행으로 처리할 최대 요소 수
+            
+        Returns:
+            입력 순서와 같은 순서의 요소 정보 딕셔너리 리스트
+        """
+        attributes = [[key, attribute] for key, attribute in ELEMENT_ATTRIBUTES]
+        timing = self.profiler.enabled
+        element_info_list = []
+        
+        with self.profiler.phase('extract'):
+            for start in range(0, len(elements), chunk_size):
+                chunk = elements[start:start + chunk_size]
+                try:
+                    raw_list = self.driver.execute_script(BULK_EXTRACT_SCRIPT, chunk, attributes,
+                                                          SELECTOR_ATTRIBUTES, timing)
+                except Exception as e:
+                    print(f"요소 정보 일괄 추출 중 오류 (개별 추출로 대체): {e}")
+                    element_info_list.extend(self.get_element_info(element) for element in chunk)
+                    continue
+                for raw, element in zip(raw_list, chunk):
+                    if timing:
+                        self.profiler.observe('extract.element', (raw.pop('extract_ms', None) or 0) / 1000)
+                    element_info_list.append(build_element_info(raw, element))
+        
+        return element_info_list
+    
     def capture_element_screenshot(self, element: WebElement) -> bytes:
         """
         웹 요소의 스크린샷 캡처
@@ -374,37 +800,132 @@ class WebScraper:
         Returns:
             요소 이미지 바이트 데이터
         """
-        try:
-            # 스크롤해서 요소가 보이게 함
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.2)  # 스크롤 후 짧게 대기 (시간 단축)
-            
-            # 전체 페이지 스크린샷
-            screenshot = self.driver.get_screenshot_as_png()
-            
-            # 스크린샷 이미지로 변환
-            img = Image.open(BytesIO(screenshot))
-            
-            # 요소 위치와 크기
-            location = element.location
-            size = element.size
-            
-            # 요소 영역 크롭
-            left = location['x']
-            top = location['y']
-            right = location['x'] + size['width']
-            bottom = location['y'] + size['height']
+        return self.capture_elements_screenshots([element])[0]
+    
+    def capture_elements_screenshots(self, elements: List[WebElement]) -> List[bytes]:
+        """
+        여러 웹 요소의 스크린샷을 한꺼번에 캡처
+        
+        Args:
+            elements: 스크린샷을 찍을 웹 요소 리스트
             
-            # 이미지 크롭 및 바이트로 변환
-            element_img = img.crop((left, top, right, bottom))
-            img_byte_arr = BytesIO()
-            element_img.save(img_byte_arr, format='PNG')
+        Returns:
+            입력 순서와 같은 순서의 요소 이미지 바이트 데이터 리스트
+        """
+        screenshots = [None] * len(elements)
+        for index, image_bytes in self.iter_element_screenshots(elements):
+            screenshots[index] = image_bytes
+        return [image_bytes or _blank_image() for image_bytes in screenshots]
+    
+    def iter_element_screenshots(self, elements: List[WebElement]) -> Iterator[Tuple[int, bytes]]:
+        """
+        요소들을 덮는 최소한의 화면 캡처로 모든 요소 이미지를 잘라내어 순서대로 반환
+        
+        요소 위치를 한 번에 조회한 뒤 화면 크기 단위의 구간으로 묶고, 구간마다
+        스크롤 한 번과 스크린샷 한 번만 수행한다. 각 스크린샷은 한 번만 디코딩하여
+        구간에 속한 모든 요소를 잘라낸다. 요소별 스크롤 대기는 하지 않는다.
+        가로로 화면 밖에 있는 요소는 가로 스크롤 위치가 다른 구간으로 나눈다.
+        캡처에 실패한 구간의 요소는 빈 이미지로 반환하고 다음 구간을 계속 처리한다.
+        
+        Args:
+            elements: 스크린샷을 찍을 웹 요소 리스트
             
-            return img_byte_arr.getvalue()
+        Yields:
+            (입력 리스트에서의 인덱스, 요소 이미지 바이트 데이터) 튜플 (캡처가 끝난 구간 순서, 모든 인덱스를 한 번씩)
+        """
+        if not elements:
+            return
+        
+        try:
+            layout = self.driver.execute_script(ELEMENT_RECTS_SCRIPT, elements)
         except Exception as e:
-            print(f"요소 스크린샷 캡처 중 오류: {e}")
-            # 오류 발생 시 빈 이미지 반환
-            empty_img = Image.new('RGB', (100, 100), color = 'white')
-            img_byte_arr = BytesIO()
-            empty_img.save(img_byte_arr, format='PNG')
-            return img_byte_arr.getvalue()
\ No newline at end of file
+            print(f"요소 위치 조회 중 오류: {e}")
+            for index in range(len(elements)):
+                yield index, _blank_image()
+            return
+        
+        viewport_width = max(1, layout['viewport'][0])
+        viewport_height = max(1, layout['viewport'][1])
+        scale = layout['scale'] or 1
+        
+        # 크기가 없는 요소는 빈 이미지로 처리
+        rects = []
+        for index, rect in enumerate(layout['rects']):
+            if rect is None or rect['width'] <= 0 or rect['height'] <= 0:
+                yield index, _blank_image()
+            else:
+                rects.append((index, rect))
+        
+        # 위치가 고정된 요소는 스크롤과 무관하므로 첫 구간에서 함께 잘라냄
+        fixed = [(index, rect) for index, rect in rects if rect['fixed']]
+        flowing = sorted(((index, rect) for index, rect in rects if not rect['fixed']), key=lambda item: item[1]['y'])
+        
+        # 화면 크기 단위 구간 나누기 (구간 시작점은 아직 포함되지 않은 가장 위쪽 요소,
+        # 가로로 화면을 벗어나는 요소는 그 요소의 왼쪽에서 시작하는 구간)
+        bands = []  # [왼쪽, 위쪽, [(인덱스, 사각형)]]
+        for index, rect in flowing:
+            width = min(rect['width'], viewport_width)
+            height = min(rect['height'], viewport_height)
+            band = next((band for band in reversed(bands)
+                         if rect['y'] + height <= band[1] + viewport_height
+                         and band[0] <= rect['x'] and rect['x'] + width <= band[0] + viewport_width), None)
+            if band is not None:
+                band[2].append((index, rect))
+            else:
+                left = 0 if rect['x'] + width <= viewport_width else rect['x']
+                bands.append([left, rect['y'], [(index, rect)]])
+        if not bands and fixed:
+            bands.append([layout['scroll'][0], layout['scroll'][1], []])
+        if fixed:
+            bands[0][2].extend(fixed)
+        
+        try:
+            for band_left, band_top, members in bands:
+                done = 0
+                try:
+                    with self.profiler.phase('screenshot'):
+                        scroll_x, scroll_y = self.driver.execute_script(SCROLL_TO_SCRIPT, band_left, band_top)
+                        png = self.driver.get_screenshot_as_png()
+                        screenshot = Image.open(BytesIO(png))
+                        screenshot.load()  # 구간당 한 번만 디코딩
+                    self.profiler.add('screenshot.captures')
+                    self.profiler.add('screenshot.bytes', len(png))
+                    
+                    for index, rect in members:
+                        # 고정 요소는 화면 좌표, 나머지는 문서 좌표에서 스크롤 위치를 뺀 좌표
+                        left = rect['x'] - (0 if rect['fixed'] else scroll_x)
+                        top = rect['y'] - (0 if rect['fixed'] else scroll_y)
+                        box = (
+                            max(0, int(left * scale)),
+                            max(0, int(top * scale)),
+                            min(screenshot.width, int((left + rect['width']) * scale)),
+                            min(screenshot.height, int((top + rect['height']) * scale)),
+                        )
+                        if box[2] <= box[0] or box[3] <= box[1]:
+                            image_bytes = _blank_image()
+                        else:
+                            img_byte_arr = BytesIO()
+                            screenshot.crop(box).save(img_byte_arr, format='PNG')
+                            self.profiler.add('screenshot.element_bytes', img_byte_arr.tell())
+                            image_bytes = img_byte_arr.getvalue()
+                        yield index, image_bytes
+                        done += 1
+                except Exception as e:
+                    # 이 구간에서 아직 반환하지 못한 요소는 빈 이미지로 대체하고 다음 구간 계속
+                    print(f"요소 스크린샷 캡처 중 오류: {e}")
+                    for index, _ in members[done:]:
+                        yield index, _blank_image()
+        finally:
+            # 원래 스크롤 위치로 복원
+            try:
+                self.driver.execute_script(SCROLL_TO_SCRIPT, *layout['scroll'])
+            except Exception:
+                pass
+
+
+def _blank_image() -> bytes:
+    """캡처에 실패한 요소를 대신할 빈 이미지"""
+    empty_img = Image.new('RGB', (100, 100), color = 'white')
+    img_byte_arr = BytesIO()
+    empty_img.save(img_byte_arr, format='PNG')
+    return img_byte_arr.getvalue()
@@ -0,0 +1,114 @@
+"""
+스크래퍼 풀 일괄 처리 테스트
+"""
+import os
+import sys
+import unittest
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.batch import ScraperPool
+
+
+class FakeScraper:
+    """테스트용 스크래퍼"""
+    
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+    
+    def is_alive(self):
+        return self.alive
+    
+    def close(self):
+        self.closed = True
+    
+    def navigate_to(self, url):
+        self.url = url
+        return url != 'unreachable'
+
+
+class FakeTabScraper(FakeScraper):
+    """탭 처리를 지원하는 테스트용 스크래퍼"""
+    
+    def process_urls_in_tabs(self, urls, handler, tabs):
+        for url in urls:
+            self.url = url
+            yield {'url': url, 'status': 'success', 'output': handler(url), 'error': None, 'elapsed': 0.0}
+
+
+class TestScraperPool(unittest.TestCase):
+    """스크래퍼 풀 테스트 클래스"""
+    
+    def test_map_isolates_failures(self):
+        """URL별 실패 격리 및 입력 순서 유지 테스트"""
+        def process(scraper, url):
+            if url == 'bad':
+                raise RuntimeError('navigation failed')
+            return None if url == 'empty' else f"{url}_page.py"
+        
+        with ScraperPool(FakeScraper, size=2) as pool:
+            results = pool.map(process, ['a', 'bad', 'empty', 'b'])
+        
+        self.assertEqual([result['url'] for result in results], ['a', 'bad', 'empty', 'b'])
+        self.assertEqual([result['status'] for result in results], ['success', 'error', 'empty', 'success'])
+        self.assertEqual(results[0]['output'], 'a_page.py')
+        self.assertEqual(results[1]['error'], 'navigation failed')
+    
+    def test_scrapers_are_reused_and_closed(self):
+        """스크래퍼 재사용 및 종료 테스트"""
+        created = []
+        
+        def factory():
+            created.append(FakeScraper())
+            return created[-1]
+        
+        with ScraperPool(factory, size=1) as pool:
+            pool.map(lambda scraper, url: url, ['a', 'b', 'c'])
+        
+        self.assertEqual(len(created), 1)
+        self.assertTrue(created[0].closed)
+    
+    def test_dead_scraper_is_replaced(self):
+        """세션이 끊긴 스크래퍼 폐기 테스트"""
+        created = []
+        
+        def factory():
+            created.append(FakeScraper())
+            return created[-1]
+        
+        def process(scraper, url):
+            if url == 'crash':
+                scraper.alive = False
+                raise RuntimeError('session lost')
+            return url
+        
+        with ScraperPool(factory, size=1) as pool:
+            results = pool.map(process, ['crash', 'next'])
+        
+        self.assertEqual(results[1]['status'], 'success')
+        self.assertEqual(len(created), 2)
+        self.assertTrue(created[0].closed)
+
+    
+    def test_map_tabs_shares_url_queue(self):
+        """작업자들이 공유 URL 목록을 탭으로 나누어 처리하는지 테스트"""
+        urls = [f"u{i}" for i in range(10)]
+        with ScraperPool(FakeTabScraper, size=3) as pool:
+            results = pool.map_tabs(lambda scraper, url: scraper.url, urls, tabs=2)
+        
+        self.assertEqual([result['url'] for result in results], urls)
+        self.assertEqual([result['output'] for result in results], urls)
+    
+    def test_map_tabs_without_tab_support(self):
+        """탭을 지원하지 않는 스크래퍼는 페이지를 직접 로드하는지 테스트"""
+        with ScraperPool(FakeScraper, size=2) as pool:
+            results = pool.map_tabs(lambda scraper, url: scraper.url, ['a', 'unreachable', 'b'], tabs=4)
+        
+        self.assertEqual([result['status'] for result in results], ['success', 'error', 'success'])
+        self.assertEqual(results[2]['output'], 'b')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+WebDriver 명령 추적 모듈 테스트
+"""
+import os
+import sys
+import threading
+import unittest
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.command_tracer import UNPHASED, CommandTracer, format_commands, payload_size
+from src.utils.profiler import Profiler
+
+
+class FakeExecutor:
+    """RemoteConnection.execute처럼 URL 경로 인수를 params에서 지우고 응답을 돌려주는 명령 실행기"""
+
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, command, params):
+        self.commands.append(command)
+        params.pop('sessionId', None)
+        if command == 'screenshot':
+            return {'value': 'A' * 1000}
+        if command == 'findElement':
+            return {'status': 404, 'value': {'error': 'no such element', 'message': 'missing'}}
+        if command == 'quit':
+            raise ConnectionError("connection refused")
+        return {'value': [{'element-6066-11e4-a52e-4f735466cecf': 'abc'}]}
+
+
+class FakeDriver:
+    """command_executor만 있는 드라이버"""
+
+    def __init__(self):
+        self.command_executor = FakeExecutor()
+
+
+class TestCommandTracer(unittest.TestCase):
+    """WebDriver 명령 추적 테스트 클래스"""
+
+    def test_commands_grouped_by_phase(self):
+        """명령을 실행한 시점의 프로파일러 단계와 명령 이름별로 횟수와 크기를 모으는지 테스트"""
+        profiler = Profiler(enabled=False)  # 보고서 없이 추적만 해도 단계 이름은 사용
+        tracer = CommandTracer(profiler)
+        driver = FakeDriver()
+        tracer.attach(driver)
+        execute = driver.command_executor.execute
+
+        with profiler.phase('collect'):
+            params = {'sessionId': 's1', 'script': 'return 1;', 'args': []}
+            request_bytes = payload_size(dict(params))
+            execute('w3cExecuteScript', params)
+            execute('w3cExecuteScript', {'sessionId': 's1', 'script': 'return 2;', 'args': []})
+        with profiler.phase('screenshot'):
+            execute('screenshot', {'sessionId': 's1'})
+        execute('findElement', {'sessionId': 's1', 'using': 'css selector', 'value': '#missing'})
+
+        phases = tracer.by_phase()
+        self.assertEqual(set(phases), {'collect', 'screenshot', UNPHASED})
+        collect = phases['collect']['commands']['w3cExecuteScript']
+        self.assertEqual(collect['calls'], 2)
+        self.assertEqual(collect['request_bytes'], 2 * request_bytes)
+        self.assertEqual(collect['response_bytes'], 2 * payload_size([{'element-6066-11e4-a52e-4f735466cecf': 'abc'}]))
+        self.assertEqual(phases['screenshot']['response_bytes'], 1000)
+        self.assertEqual(phases[UNPHASED]['errors'], 1)
+        self.assertEqual(driver.command_executor.commands,
+                         ['w3cExecuteScript', 'w3cExecuteScript', 'screenshot', 'findElement'])
+
+        totals = tracer.totals()
+        self.assertEqual((totals['calls'], totals['errors']), (4, 1))
+        self.assertEqual(tracer.report()['totals'], totals)
+        self.assertIn('w3cExecuteScript 2', '\n'.join(format_commands(tracer.report())))
+
+    def test_failed_command_is_recorded(self):
+        """연결 오류로 실패한 명령도 기록하고 예외는 그대로 전달하는지 테스트"""
+        tracer = CommandTracer()
+        driver = FakeDriver()
+        tracer.attach(driver)
+
+        with self.assertRaises(ConnectionError):
+            driver.command_executor.execute('quit', {'sessionId': 's1'})
+        self.assertEqual(tracer.by_phase()[UNPHASED]['commands']['quit']['errors'], 1)
+
+    def test_thread_totals(self):
+        """스레드별 누적 합계에는 다른 작업자 스레드의 명령이 포함되지 않는지 테스트"""
+        tracer = CommandTracer()
+        driver = FakeDriver()
+        tracer.attach(driver)
+        before = tracer.thread_totals()
+
+        worker = threading.Thread(target=lambda: [driver.command_executor.execute('getTitle', {})
+                                                  for _ in range(5)])
+        worker.start()
+        worker.join()
+        driver.command_executor.execute('getTitle', {})
+
+        self.assertEqual(tracer.thread_totals()['calls'] - before['calls'], 1)
+        self.assertEqual(tracer.totals()['calls'], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+사이트 크롤러 테스트
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.main import assign_output_names
+from src.utils.batch import ScraperPool
+from src.utils.crawler import SiteCrawler, is_page_url, normalize_url, read_sitemap
+from src.utils.static_scraper import StaticScraper
+
+SITE = {
+    'index.html': """
+        <header>
+            <a href="about.html">About</a>
+            <a href="products/1.html#reviews">Product 1</a>
+            <a href="products/2.html?utm_source=home">Product 2</a>
+            <a href="logout.html">Logout</a>
+            <a href="manual.pdf">Manual</a>
+            <a href="https://other.example.com/">Other site</a>
+        </header>
+        <form><input name="q" type="search"><button>Search</button></form>
+    """,
+    'about.html': '<form><input name="email"><button>Send</button></form><a href="index.html">Home</a>',
+    'products/1.html': '<h1>Product 1</h1><button id="buy">Buy</button><a href="3.html">Next</a>',
+    'products/2.html': '<h1>Product 2</h1><button id="buy">Buy now</button><a href="3.html">Next</a>',
+    'products/3.html': '<h1>Product 3</h1><button id="buy">Buy</button><a href="4.html">Next</a>',
+    'products/4.html': '<h1>Product 4</h1><button id="buy">Buy</button>',
+    'logout.html': '<button>Sign in again</button>',
+}
+
+
+class TestCrawler(unittest.TestCase):
+    """사이트 크롤러 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트용 로컬 사이트 생성"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        for name, body in SITE.items():
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"<html><body>{body}</body></html>", encoding='utf-8')
+    
+    def tearDown(self):
+        """임시 파일 정리"""
+        self.tmp_dir.cleanup()
+    
+    def crawl(self, before_level=None, **kwargs):
+        """정적 엔진으로 크롤링하고 (결과, 처리된 URL 리스트) 반환"""
+        processed = []
+        
+        def process(scraper, url):
+            processed.append(url)
+            return f"{Path(url).stem}_page.py"
+        
+        with ScraperPool(StaticScraper, size=2) as pool:
+            crawler = SiteCrawler(pool, [str(self.root / 'index.html')], **kwargs)
+            results = crawler.crawl(process, before_level=before_level)
+        return results, processed
+    
+    def page(self, name):
+        """로컬 페이지의 정규화된 URL"""
+        return (self.root / name).as_uri()
+    
+    def test_normalize_url(self):
+        """같은 페이지를 가리키는 URL이 같은 문자열로 정규화되는지 테스트"""
+        self.assertEqual(normalize_url('HTTP://Example.COM:80/a//b?b=2&a=1&utm_source=x#top'),
+                         'http://example.com/a/b?a=1&b=2')
+        self.assertEqual(normalize_url('https://example.com'), 'https://example.com/')
+        self.assertEqual(normalize_url('https://example.com:8443/x'), 'https://example.com:8443/x')
+        self.assertEqual(normalize_url('../c?x=1', base='https://example.com/a/b/'), 'https://example.com/a/c?x=1')
+        self.assertIsNone(normalize_url('mailto:help@example.com'))
+        self.assertIsNone(normalize_url('javascript:void(0)'))
+    
+    def test_is_page_url(self):
+        """리소스 파일과 로그아웃 링크를 제외하는지 테스트"""
+        self.assertTrue(is_page_url('https://example.com/products/1'))
+        self.assertFalse(is_page_url('https://example.com/files/manual.PDF'))
+        self.assertFalse(is_page_url('https://example.com/account/log-out'))
+    
+    def test_read_sitemap(self):
+        """sitemap index를 따라가며 페이지 URL을 읽는지 테스트"""
+        namespace = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+        (self.root / 'sitemap.xml').write_text(
+            f'<sitemapindex {namespace}><sitemap><loc>pages.xml</loc></sitemap></sitemapindex>')
+        (self.root / 'pages.xml').write_text(
+            f'<urlset {namespace}><url><loc>https://example.com/</loc></url>'
+            f'<url><loc>https://example.com/about</loc></url><url><loc>https://example.com/</loc></url></urlset>')
+        
+        self.assertEqual(read_sitemap((self.root / 'sitemap.xml').as_uri()),
+                         ['https://example.com/', 'https://example.com/about'])
+    
+    def test_crawl_dedupes_by_fingerprint(self):
+        """같은 출처의 링크를 따라가고 구조가 같은 페이지는 한 번만 처리하는지 테스트"""
+        results, processed = self.crawl(max_depth=3)
+        statuses = {result['url']: result['status'] for result in results}
+        
+        self.assertEqual(set(statuses), {self.page(name) for name in
+                                         ['index.html', 'about.html', 'products/1.html', 'products/2.html',
+                                          'products/3.html', 'products/4.html']})
+        # 상품 페이지는 구조가 같으므로 먼저 방문한 하나만 처리
+        products = [url for url in processed if '/products/' in url]
+        self.assertEqual(len(processed), 3)
+        self.assertEqual(len(products), 1)
+        self.assertEqual(sum(1 for status in statuses.values() if status == 'duplicate'), 3)
+        self.assertEqual([result['depth'] for result in results if result['url'] == self.page('products/4.html')], [3])
+    
+    def test_crawl_limits(self):
+        """깊이와 페이지 수 제한 테스트"""
+        results, _ = self.crawl(max_depth=1)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(max(result['depth'] for result in results), 1)
+        
+        results, _ = self.crawl(max_depth=3, max_pages=2)
+        self.assertEqual([result['url'] for result in results], [self.page('index.html'), self.page('about.html')])
+    
+    def test_output_names_in_discovery_order(self):
+        """출력 파일 이름을 작업자 완료 순서가 아닌 깊이별 발견 순서로 지정하는지 테스트"""
+        levels = []
+        self.crawl(before_level=lambda urls: levels.append(list(urls)), max_depth=3)
+        
+        self.assertEqual(levels, [[self.page('index.html')],
+                                  [self.page('about.html'), self.page('products/1.html'), self.page('products/2.html')],
+                                  [self.page('products/3.html')], [self.page('products/4.html')]])
+        
+        used_names = set()
+        first = assign_output_names(['https://example.com/a?x=1', 'https://example.com/a-x-1'], used_names)
+        second = assign_output_names(['https://example.com/a?x=1'], used_names)
+        self.assertEqual(list(first.values()), ['example_com_a_x_1_page.py', 'example_com_a_x_1_1_page.py'])
+        self.assertEqual(second, {'https://example.com/a?x=1': 'example_com_a_x_1_2_page.py'})
+
+
+if __name__ == '__main__':
+    unittest.main()
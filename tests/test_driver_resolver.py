@@ -0,0 +1,96 @@
+"""
+ChromeDriver 경로 결정 테스트
+"""
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import driver_resolver
+from src.utils.driver_resolver import DRIVER_NAME, DriverNotFoundError, resolve_chromedriver
+
+
+def make_executable(path: Path) -> str:
+    """실행 가능한 빈 파일 생성"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text('')
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path)
+
+
+@patch.dict(os.environ, {'CHROMEDRIVER_PATH': ''})
+@patch.object(driver_resolver.shutil, 'which', return_value=None)
+class TestDriverResolver(unittest.TestCase):
+    """ChromeDriver 경로 결정 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmp_dir.name) / 'cache'
+    
+    def tearDown(self):
+        """임시 파일 정리"""
+        self.tmp_dir.cleanup()
+    
+    def test_explicit_path(self, _which):
+        """명시적 경로 우선 사용 테스트"""
+        driver = make_executable(Path(self.tmp_dir.name) / 'custom' / DRIVER_NAME)
+        self.assertEqual(resolve_chromedriver(driver, self.cache_dir), (driver, 'explicit'))
+        
+        with self.assertRaises(DriverNotFoundError):
+            resolve_chromedriver(driver + '.missing', self.cache_dir)
+    
+    @patch.object(driver_resolver, 'detect_chrome_version', return_value=None)
+    def test_system_path(self, _version, which):
+        """시스템 PATH의 드라이버 사용 테스트 (Chrome 버전을 알 수 없으면 그대로 사용)"""
+        which.return_value = '/usr/bin/chromedriver'
+        self.assertEqual(resolve_chromedriver(cache_dir=self.cache_dir), ('/usr/bin/chromedriver', 'path'))
+    
+    @patch.object(driver_resolver, 'detect_chrome_version', return_value='120.0.6099.109')
+    def test_system_path_version_check(self, _version, which):
+        """PATH의 드라이버는 Chrome과 주 버전이 같을 때만 사용하는지 테스트"""
+        which.return_value = '/usr/bin/chromedriver'
+        with patch.object(driver_resolver, 'detect_driver_version', return_value='120.0.6099.71'):
+            self.assertEqual(resolve_chromedriver(cache_dir=self.cache_dir), ('/usr/bin/chromedriver', 'path'))
+        
+        # 주 버전이 다르면 캐시를 사용하고, 캐시에도 없으면 내려받지 않고 실패
+        cached = make_executable(self.cache_dir / '120' / DRIVER_NAME)
+        with patch.object(driver_resolver, 'detect_driver_version', return_value='114.0.5735.90'):
+            self.assertEqual(resolve_chromedriver(cache_dir=self.cache_dir), (cached, 'cache'))
+            with patch('webdriver_manager.chrome.ChromeDriverManager') as manager:
+                with self.assertRaises(DriverNotFoundError):
+                    resolve_chromedriver(cache_dir=Path(self.tmp_dir.name) / 'empty', allow_download=False)
+                manager.assert_not_called()
+    
+    @patch.object(driver_resolver, 'detect_chrome_version', return_value='120.0.6099.109')
+    def test_cache_hit_without_network(self, _version, _which):
+        """캐시에 있으면 네트워크를 사용하지 않는지 테스트"""
+        cached = make_executable(self.cache_dir / '120' / DRIVER_NAME)
+        with patch('webdriver_manager.chrome.ChromeDriverManager') as manager:
+            self.assertEqual(resolve_chromedriver(cache_dir=self.cache_dir), (cached, 'cache'))
+            manager.assert_not_called()
+    
+    @patch.object(driver_resolver, 'detect_chrome_version', return_value='121.0.6167.85')
+    def test_cache_miss_downloads_once(self, _version, _which):
+        """캐시에 없으면 내려받아 버전별 캐시에 저장하는지 테스트"""
+        downloaded = make_executable(Path(self.tmp_dir.name) / 'wdm' / DRIVER_NAME)
+        with patch('webdriver_manager.chrome.ChromeDriverManager') as manager:
+            manager.return_value.install.return_value = downloaded
+            path, source = resolve_chromedriver(cache_dir=self.cache_dir)
+        
+        self.assertEqual(source, 'download')
+        self.assertEqual(path, str(self.cache_dir / '121' / DRIVER_NAME))
+        self.assertEqual(resolve_chromedriver(cache_dir=self.cache_dir), (path, 'cache'))
+        
+        with self.assertRaises(DriverNotFoundError):
+            resolve_chromedriver(cache_dir=Path(self.tmp_dir.name) / 'empty', allow_download=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+요소 정보 딕셔너리 생성 테스트
+"""
+import os
+import sys
+import unittest
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.element_info import build_element_info, classify_element
+
+
+class TestElementInfo(unittest.TestCase):
+    """요소 정보 생성 테스트 클래스"""
+    
+    def test_classify_element(self):
+        """요소 유형 판별 테스트"""
+        self.assertEqual(classify_element('input', 'password'), 'input')
+        self.assertEqual(classify_element('input', 'radio'), 'checkbox_radio')
+        self.assertEqual(classify_element('input', 'submit'), 'button')
+        self.assertEqual(classify_element('a', ''), 'button')
+        self.assertEqual(classify_element('select', ''), 'select')
+        self.assertEqual(classify_element('div', ''), 'other')
+    
+    def test_build_element_info(self):
+        """일괄 추출 결과로 요소 정보 생성 테스트"""
+        raw = {
+            'tag_name': 'button',
+            'text': '  Login \n',
+            'id': 'login-button',
+            'class': 'btn btn-primary',
+            'location': {'x': 10, 'y': 20},
+            'size': {'width': 80, 'height': 30},
+            'is_displayed': True,
+            'is_enabled': True,
+        }
+        info = build_element_info(raw)
+        
+        self.assertEqual(info['text'], 'Login')
+        self.assertEqual(info['element_category'], 'button')
+        self.assertEqual(info['name'], '')
+        self.assertEqual(info['css_selector'], '#login-button')
+        self.assertEqual(info['xpath_options'], [
+            "//*[@id='login-button']",
+            "//*[normalize-space(.)='Login']",
+        ])
+        self.assertIsNone(info['element'])
+    
+    def test_text_fallback_from_href(self):
+        """텍스트가 없을 때 href에서 텍스트 추출 테스트"""
+        raw = {'tag_name': 'a', 'href': 'https://example.com/my-page?x=1\n'}
+        info = build_element_info(raw)
+        
+        self.assertEqual(info['text'], 'my page')
+        self.assertEqual(info['href'], 'https://example.com/my-page?x=1')
+        self.assertEqual(info['css_selector'], None)
+        self.assertFalse(info['is_displayed'])
+
+
+if __name__ == "__main__":
+    unittest.main()
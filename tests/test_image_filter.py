@@ -0,0 +1,69 @@
+"""
+OCR 이미지 사전 필터 테스트
+"""
+import os
+import sys
+import unittest
+from io import BytesIO
+
+from PIL import Image, ImageDraw
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.image_filter import ImageFilter
+
+
+def make_png(width, height, color='white', label=None):
+    """테스트용 PNG 이미지 생성"""
+    image = Image.new('RGB', (width, height), color)
+    if label:
+        ImageDraw.Draw(image).text((4, 4), label, fill='black')
+    buffer = BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+class TestImageFilter(unittest.TestCase):
+    """OCR 이미지 사전 필터 테스트 클래스"""
+    
+    def test_skip_reasons(self):
+        """보낼 필요가 없는 이미지를 이유별로 건너뛰는지 테스트"""
+        image_filter = ImageFilter()
+        
+        self.assertIsNone(image_filter.prepare(0, make_png(100, 100)))       # 캡처 실패 대체 이미지
+        self.assertIsNone(image_filter.prepare(1, make_png(5, 30, label='x')))
+        self.assertIsNone(image_filter.prepare(2, b'not an image'))
+        
+        noisy = Image.new('L', (40, 20), 200)
+        noisy.putpixel((0, 0), 201)
+        buffer = BytesIO()
+        noisy.save(buffer, format='PNG')
+        self.assertIsNone(image_filter.prepare(3, buffer.getvalue()))
+        
+        stats = image_filter.stats()
+        self.assertEqual((stats['empty'], stats['too_small'], stats['uniform']), (2, 1, 1))
+        self.assertEqual((stats['sent'], stats['skipped']), (0, 4))
+    
+    def test_prepare_and_duplicates(self):
+        """보낼 이미지를 흑백으로 압축하고 중복 이미지는 원본 번호를 기록하는지 테스트"""
+        image_filter = ImageFilter(max_side=64)
+        original = make_png(200, 40, color='lightsteelblue', label='Login')
+        
+        prepared = image_filter.prepare(0, original)
+        self.assertIsNotNone(prepared)
+        image = Image.open(BytesIO(prepared))
+        self.assertEqual(image.mode, 'L')
+        self.assertEqual(max(image.size), 64)
+        
+        self.assertIsNone(image_filter.prepare(1, original))
+        self.assertIsNotNone(image_filter.prepare(2, make_png(200, 40, color='lightsteelblue', label='Search')))
+        
+        self.assertEqual(image_filter.duplicates, {1: 0})
+        stats = image_filter.stats()
+        self.assertEqual((stats['sent'], stats['duplicate']), (2, 1))
+        self.assertLess(stats['bytes_out'], stats['bytes_in'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+증분 재생성 모듈 테스트
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.crawler import dom_fingerprint
+from src.utils.element_info import build_element_info
+from src.utils.incremental import Manifest, content_hash, element_fingerprint, write_if_changed
+from src.utils.po_generator import PageObjectGenerator
+from src.utils.static_scraper import StaticScraper
+
+
+def make_element(category, index, **raw):
+    """카테고리와 인덱스를 설정한 요소 정보"""
+    raw.setdefault('is_displayed', True)
+    element = build_element_info(raw)
+    element['element_category'] = category
+    element['index'] = index
+    return element
+
+
+class TestIncremental(unittest.TestCase):
+    """증분 재생성 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+        self.generator = PageObjectGenerator()
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.tmp_dir.cleanup()
+
+    def test_element_fingerprint_ignores_layout(self):
+        """요소 지문이 위치와 크기 변화는 무시하고 속성과 구조적 위치 변화는 반영하는지 테스트"""
+        element = make_element('button', 1, tag_name='button', text='Save', id='save')
+        moved = dict(element, location={'x': 50, 'y': 80}, size={'width': 10, 'height': 10})
+        self.assertEqual(element_fingerprint(element), element_fingerprint(moved))
+        self.assertNotEqual(element_fingerprint(element), element_fingerprint(dict(element, text='Store')))
+        self.assertNotEqual(element_fingerprint(element), element_fingerprint(dict(element, index=2)))
+
+    def test_method_cache_matches_full_generation(self):
+        """메서드 코드 캐시를 사용해도 전체 생성과 같은 코드를 만드는지 테스트 (이름 중복 포함)"""
+        first = make_element('button', 1, tag_name='button', text='Save')
+        second = make_element('button', 2, tag_name='button', text='Save', id='save-2')
+        field = make_element('input', 3, tag_name='input', type='text', name='query')
+
+        cache = {}
+        cached_code = self.generator.generate_page_object_class('https://example.com', [first, second, field], cache)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cached_code,
+                         self.generator.generate_page_object_class('https://example.com', [first, second, field]))
+        self.assertIn("def click_save_1(self):", cached_code)
+
+        # 첫 요소가 사라지면 두 번째 요소가 원래 이름을 받음 (캐시된 코드의 이름도 바뀜)
+        reused_code = self.generator.generate_page_object_class('https://example.com', [second, field], cache)
+        self.assertEqual(reused_code, self.generator.generate_page_object_class('https://example.com', [second, field]))
+        self.assertIn("def click_save(self):", reused_code)
+        self.assertNotIn("click_save_1", reused_code)
+
+    def test_write_if_changed(self):
+        """내용 해시가 같으면 파일을 다시 쓰지 않는지 테스트"""
+        path = self.root / 'page.py'
+        self.assertTrue(write_if_changed(path, "A = 1\n"))
+        modified = path.stat().st_mtime_ns
+        os.utime(path, ns=(modified - 10 ** 9, modified - 10 ** 9))
+
+        self.assertFalse(write_if_changed(path, "A = 1\n"))
+        self.assertEqual(path.stat().st_mtime_ns, modified - 10 ** 9)
+        self.assertTrue(write_if_changed(path, "A = 2\n"))
+        self.assertEqual(path.read_text(encoding='utf-8'), "A = 2\n")
+
+    def test_manifest_round_trip(self):
+        """매니페스트에 기록한 페이지를 다음 실행에서 건너뛰는지 테스트"""
+        element = make_element('button', 1, tag_name='button', text='Save')
+        content = "class Page:\n    pass\n"
+        (self.root / 'page.py').write_text(content, encoding='utf-8')
+
+        manifest = Manifest(self.root, options={'text_only': False})
+        cache = manifest.method_cache('page.py')
+        self.generator.generate_page_object_class('https://example.com', [element], cache)
+        manifest.update('page.py', 'https://example.com', 'fp-1', [element], cache, content)
+        manifest.save()
+        self.assertEqual((manifest.reused_methods, manifest.generated_methods), (0, 1))
+
+        reloaded = Manifest(self.root, options={'text_only': False})
+        self.assertTrue(reloaded.is_unchanged('page.py', 'fp-1', self.root))
+        self.assertFalse(reloaded.is_unchanged('page.py', 'fp-2', self.root))
+        self.assertIn(element_fingerprint(element), reloaded.method_cache('page.py'))
+        self.assertEqual(reloaded.pages['page.py']['content_hash'], content_hash(content))
+
+        # 출력 파일이 수정되었으면 다시 처리
+        (self.root / 'page.py').write_text(content + "# edited\n", encoding='utf-8')
+        self.assertFalse(reloaded.is_unchanged('page.py', 'fp-1', self.root))
+
+        # 출력에 영향을 주는 옵션이 바뀌면 매니페스트 전체 무효화
+        self.assertEqual(Manifest(self.root, options={'text_only': True}).pages, {})
+
+    def test_content_signature_detects_text_change(self):
+        """내용 서명이 구조 서명과 달리 텍스트, 코드 생성 속성, 위치, 표시 여부 변화를 감지하는지 테스트"""
+        def signatures(html):
+            path = self.root / 'page.html'
+            path.write_text(html, encoding='utf-8')
+            scraper = StaticScraper()
+            try:
+                self.assertTrue(scraper.navigate_to(str(path)))
+                return (dom_fingerprint(scraper.get_page_signature()),
+                        dom_fingerprint(scraper.get_page_signature(include_content=True)))
+            finally:
+                scraper.close()
+
+        original = signatures('<button id="go" class="btn primary">Go</button>')
+        renamed = signatures('<button id="go" class="btn primary">Start</button>')
+        restyled = signatures('<button id="go" class="btn secondary">Go</button>')
+
+        self.assertEqual(original[0], renamed[0])
+        self.assertNotEqual(original[1], renamed[1])
+        self.assertNotEqual(original[1], restyled[1])
+        self.assertEqual(original, signatures('<button id="go" class="btn primary">Go</button>'))
+
+        # 위치 경로 로케이터나 표시 여부만 바뀌는 변경도 감지
+        page = '<div><button>Go</button></div><div>{}</div>'
+        moved = signatures(page.format('<button>Go</button>'))
+        self.assertNotEqual(moved[1], signatures('<div><button>Go</button><button>Go</button></div><div></div>')[1])
+        self.assertNotEqual(moved[1], signatures(page.format('<button style="display: none">Go</button>'))[1])
+        self.assertEqual(moved, signatures(page.format('<button>Go</button>')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+로케이터 견고성 점수 모듈 테스트
+"""
+import os
+import sys
+import unittest
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.element_info import build_element_info
+from src.utils.locator_scoring import AttributeIndex, looks_generated, score_locator
+from src.utils.locators import BY_CSS_SELECTOR, BY_ID, BY_NAME, BY_XPATH, candidate_locators, choose_locators
+
+
+class TestLocatorScoring(unittest.TestCase):
+    """로케이터 견고성 점수 테스트 클래스"""
+
+    def test_looks_generated(self):
+        """자동 생성 아이디와 해시 클래스 이름을 패턴과 엔트로피로 판별하는지 테스트"""
+        generated = ['ember412', ':r3:', 'react-select-2-input', 'mui-12', 'css-1x2y3z4', 'sc-bdVaJa',
+                     'Button_primary__3kF9a', 'item-9f8e7d6c', 'a8Kx2pQzW7', 'row-20231018',
+                     '3f2504e0-4f89-11d3-9a0c-0305e82c3301']
+        stable = ['save', 'login-button', 'search_query', 'btn-primary', 'nav-item-2', 'header', 'col-md-6',
+                  'firstName1', 'submitOrder1', 'shippingAddress2', 'copyright-2024']
+        for value in generated:
+            self.assertTrue(looks_generated(value), value)
+        for value in stable:
+            self.assertFalse(looks_generated(value), value)
+
+    def test_index_counts_unique_elements(self):
+        """색인이 여러 유형으로 중복된 요소를 한 번만 세고 숫자만 다른 변형을 모으는지 테스트"""
+        button = build_element_info({'tag_name': 'a', 'text': 'Next', 'class': 'btn link'}, element=object())
+        duplicate = dict(button, element_category='input')
+        other = build_element_info({'tag_name': 'button', 'text': 'Go', 'class': 'btn'}, element=object())
+
+        index = AttributeIndex()
+        index.add_page([button, duplicate, other])
+        self.assertEqual(index.count('class', 'btn'), 2)
+        self.assertEqual(index.count('class', 'link'), 1)
+        self.assertEqual(index.count('text', 'Missing'), 0)
+
+        index.add_page([build_element_info({'tag_name': 'div', 'id': 'item-2'})], current=False)
+        index.add_page([build_element_info({'tag_name': 'div', 'id': 'item-3'})], current=False)
+        self.assertEqual(index.variant_count('id', 'item-7'), 3)
+        self.assertEqual(index.count('class', 'btn'), 2)  # current=False는 조회 대상 페이지를 바꾸지 않음
+
+    def test_variants_only_from_other_pages(self):
+        """같은 페이지 안의 숫자만 다른 값은 변형으로 세지 않고 다른 페이지의 값만 세는지 테스트"""
+        page = [build_element_info({'tag_name': 'input', 'name': f'address{number}'}, element=object())
+                for number in (1, 2)]
+        index = AttributeIndex()
+        index.add_page(page)
+        self.assertEqual(index.variant_count('name', 'address1'), 1)
+        self.assertEqual(score_locator(BY_NAME, 'name', 'address1', index)['stability'], 0.9)
+
+        # 다른 페이지에 같은 값만 있으면 변형이 아니고, 숫자만 다른 값이 있으면 변형
+        index.add_page([build_element_info({'tag_name': 'input', 'name': 'address1'})], current=False)
+        self.assertEqual(index.variant_count('name', 'address1'), 1)
+        self.assertEqual(index.variant_count('name', 'address2'), 2)
+        other = AttributeIndex()
+        other.add_page(page)
+        other.add_page(page, current=False)
+        self.assertEqual(other.variant_count('name', 'address1'), 2)
+
+    def test_score_components(self):
+        """중복 값, 자동 생성 값, 느린 로케이터 방식의 점수가 낮은지 테스트"""
+        index = AttributeIndex()
+        index.add_page([build_element_info({'tag_name': 'button', 'class': 'btn'}, element=object())
+                        for _ in range(4)])
+
+        stable = score_locator(BY_ID, 'id', 'save', index)
+        self.assertEqual((stable['stability'], stable['speed']), (0.95, 1.0))
+        self.assertLess(score_locator(BY_ID, 'id', 'ember412', index)['stability'], 0.1)
+        self.assertAlmostEqual(score_locator(BY_CSS_SELECTOR, 'class', 'btn', index)['stability'], 0.125)
+        self.assertLess(score_locator(BY_XPATH, 'id', 'save')['score'], stable['score'])
+        # 사람이 읽는 문구는 자동 생성 값으로 판별하지 않음
+        self.assertEqual(score_locator(BY_XPATH, 'text', 'Copyright 2024')['stability'], 0.6)
+        self.assertEqual(score_locator(BY_CSS_SELECTOR, 'aria-label', 'Report 20240101')['stability'], 0.8)
+
+    def test_generated_id_ranks_below_text(self):
+        """자동 생성 아이디보다 텍스트 XPath를 먼저 후보로 사용하는지 테스트"""
+        info = build_element_info({'tag_name': 'button', 'text': 'Save', 'id': 'ember412'})
+        candidates = candidate_locators(info)
+        self.assertEqual(candidates[0], (BY_XPATH, "//*[normalize-space(.)='Save']"))
+        self.assertLess(candidates.index((BY_XPATH, "//button[normalize-space(.)='Save']")),
+                        candidates.index((BY_ID, 'ember412')))
+
+    def test_choose_locators_across_pages(self):
+        """여러 페이지 색인에서 페이지마다 숫자만 바뀌는 아이디보다 이름을 선택하고 검증한 로케이터는 유지하는지 테스트"""
+        pages = [[build_element_info({'tag_name': 'input', 'id': f'field-{number}', 'name': 'email'})]
+                 for number in (1, 2)]
+        validated = build_element_info({'tag_name': 'button', 'id': 'save'})
+        validated.update({'locator': [BY_XPATH, "//button"], 'locator_matches': 1})
+        pages[0].append(validated)
+
+        index = AttributeIndex()
+        for elements in pages:
+            index.add_page(elements, current=False)
+        index.use_page(pages[0])
+        self.assertEqual(choose_locators(pages[0], index), 1)
+
+        self.assertEqual(pages[0][0]['locator'], ['name', 'email'])
+        self.assertEqual(validated['locator'], [BY_XPATH, "//button"])
+
+        # 한 페이지만 보면 아이디가 가장 좋은 후보
+        single = build_element_info({'tag_name': 'input', 'id': 'field-1', 'name': 'email'})
+        choose_locators([single])
+        self.assertEqual(single['locator'], [BY_ID, 'field-1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
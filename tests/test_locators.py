@@ -0,0 +1,195 @@
+"""
+로케이터 후보 생성 및 고유성 검증 테스트
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import lxml.etree
+import lxml.html
+import soupsieve
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.element_info import build_element_info
+from src.utils.locators import BY_CSS_SELECTOR, BY_ID, BY_NAME, BY_XPATH, candidate_locators, validate_locators
+from src.utils.po_generator import PageObjectGenerator
+from src.utils.static_scraper import StaticScraper
+
+TEST_HTML = """
+<html><body>
+<form>
+  <input name="q" class="field" placeholder="검색어">
+  <input name="q" class="field" placeholder="다시 입력">
+</form>
+<button class="btn">Go</button>
+<button class="btn">Stop</button>
+<a class="btn" href="/next">Next</a>
+<button id="save" name="action">Save</button>
+</body></html>
+"""
+
+
+class TestLocators(unittest.TestCase):
+    """로케이터 검증 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정 (정적 스크래퍼로 테스트 페이지 로드)"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        path = Path(self.tmp_dir.name) / 'page.html'
+        path.write_text(TEST_HTML, encoding='utf-8')
+
+        self.scraper = StaticScraper()
+        self.assertTrue(self.scraper.navigate_to(str(path)))
+        candidates = self.scraper.collect_candidates()
+        self.references = [element for element, _ in candidates]
+        self.elements = self.scraper.get_elements_info(self.references)
+        for info, (_, categories) in zip(self.elements, candidates):
+            info['element_category'] = categories[0]
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.scraper.close()
+        self.tmp_dir.cleanup()
+
+    def find(self, text):
+        """텍스트 또는 placeholder로 요소 정보 찾기"""
+        return next(info for info in self.elements if text in (info.get('text'), info.get('placeholder')))
+
+    def test_candidate_order(self):
+        """로케이터 후보가 견고성 점수 순서(ID, 이름, XPath 속성 조건, CSS 클래스)로 생성되는지 테스트"""
+        info = build_element_info({'tag_name': 'button', 'text': 'Save', 'id': 'save', 'name': 'action',
+                                   'class': 'btn primary'})
+        candidates = candidate_locators(info)
+
+        self.assertEqual(candidates[:3], [(BY_ID, 'save'), (BY_NAME, 'action'), (BY_XPATH, "//*[@id='save']")])
+        # '#save'는 By.ID와 같은 요소를 찾으므로 후보에서 제외
+        self.assertNotIn((BY_CSS_SELECTOR, '#save'), candidates)
+        self.assertIn((BY_CSS_SELECTOR, 'button.btn'), candidates)
+        self.assertIn((BY_XPATH, "//button[normalize-space(.)='Save']"), candidates)
+        self.assertEqual(len(candidates), len(set(candidates)))
+
+    def test_validate_picks_cheapest_unique_locator(self):
+        """대상 요소 하나에만 일치하는 가장 저렴한 로케이터를 선택하는지 테스트"""
+        ambiguous = validate_locators(self.scraper, self.elements, self.references)
+
+        # ID가 고유하면 ID 사용
+        self.assertEqual(self.find('Save')['locator'], [BY_ID, 'save'])
+        # 이름이 같은 입력 필드는 속성 기반 고유 선택자 사용
+        self.assertEqual(self.find('검색어')['locator'], [BY_CSS_SELECTOR, 'input[placeholder="검색어"]'])
+        # 클래스 선택자(.btn)는 3개 요소와 일치하므로 위치 경로보다 텍스트 XPath 우선
+        self.assertEqual(self.find('Go')['locator'], [BY_XPATH, "//*[normalize-space(.)='Go']"])
+        self.assertEqual(self.find('Next')['locator'], [BY_CSS_SELECTOR, 'a[href="/next"]'])
+        self.assertEqual(ambiguous, [])
+
+    def test_validate_reports_ambiguous_locators(self):
+        """고유한 로케이터 후보가 없는 요소를 가장 적게 일치하는 로케이터와 함께 보고하는지 테스트"""
+        for info in self.elements:
+            info['unique_selector'] = None
+            info['placeholder'] = ''
+        ambiguous = validate_locators(self.scraper, self.elements, self.references)
+
+        # 이름이 같은 두 입력 필드는 고유한 로케이터가 없음
+        self.assertEqual(len(ambiguous), 2)
+        for info in ambiguous:
+            self.assertEqual(info['locator'], [BY_NAME, 'q'])
+            self.assertEqual(info['locator_matches'], 2)
+
+        code = PageObjectGenerator().generate_page_object_class('https://example.com', self.elements)
+        self.assertIn('Q_INPUT = (By.NAME, "q")  # 주의: 페이지에서 2개 요소와 일치합니다', code)
+        compile(code, 'page.py', 'exec')
+
+    def test_generator_uses_validated_locator(self):
+        """생성기가 검증한 로케이터를 사용하는지 테스트"""
+        validate_locators(self.scraper, self.elements, self.references)
+        code = PageObjectGenerator().generate_page_object_class('https://example.com', self.elements)
+
+        self.assertIn('(By.XPATH, "//*[normalize-space(.)=\'Go\']")', code)
+        self.assertIn('(By.CSS_SELECTOR, "input[placeholder=\\"검색어\\"]")', code)
+        self.assertNotIn('nth-of-type', code)
+        compile(code, 'page.py', 'exec')
+
+    def test_generator_prefers_unique_selector_without_check(self):
+        """검증하지 않은 경우 클래스 선택자보다 고유 선택자를 쓰고, 위치 정보만 있는 요소는 건너뛰는지 테스트"""
+        generator = PageObjectGenerator()
+        element = {'tag_name': 'button', 'text': 'Go', 'css_selector': '.btn', 'class': 'btn',
+                   'xpath_options': ['//button[@class="btn"]'], 'unique_selector': 'body > button:nth-of-type(1)'}
+        self.assertEqual(generator._get_best_locator(element), '(By.CSS_SELECTOR, "body > button:nth-of-type(1)")')
+
+        # 고유 선택자가 없는 이전 스냅샷의 요소는 수집 순서로 위치를 추측하지 않음
+        legacy = {'tag_name': 'button', 'index': 3, 'text': '', 'element_category': 'button'}
+        self.assertIsNone(generator._get_best_locator(legacy))
+        with patch('builtins.print') as mock_print:
+            code = generator.generate_page_object_class('https://example.com', [legacy, element])
+        self.assertIn('고유 선택자가 없어', mock_print.call_args[0][0])
+        self.assertNotIn('nth-of-type(3)', code)
+        self.assertEqual(code.count('_BUTTON = ('), 1)
+        compile(code, 'page.py', 'exec')
+
+    def test_static_check_matches_document_select(self):
+        """정적 엔진의 색인 기반 검사가 문서 전체 select와 같은 결과를 내는지 테스트"""
+        locators = [(BY_CSS_SELECTOR, '.btn'), (BY_CSS_SELECTOR, 'button.btn'), (BY_CSS_SELECTOR, '#save'),
+                    (BY_CSS_SELECTOR, 'body > button:nth-of-type(2)'), (BY_CSS_SELECTOR, 'form > [name="q"]'),
+                    (BY_CSS_SELECTOR, "[placeholder='다시 입력']"), (BY_CSS_SELECTOR, 'a.btn, button'),
+                    (BY_CSS_SELECTOR, 'button:not(.btn)'), (BY_CSS_SELECTOR, ':is(a, input)'),
+                    (BY_CSS_SELECTOR, 'form input.field:nth-of-type(1)'), (BY_CSS_SELECTOR, '[[')]
+        # 위치 경로 선택자 (형제 순번으로 직접 따라 내려가는 경우)
+        locators += [(BY_CSS_SELECTOR, 'html > body > button:nth-of-type(2)'), (BY_CSS_SELECTOR, 'body > form > input'),
+                     (BY_CSS_SELECTOR, 'form > input:nth-of-type(2)'), (BY_CSS_SELECTOR, 'body > button'),
+                     (BY_CSS_SELECTOR, 'button[id="save"] > span'), (BY_CSS_SELECTOR, "[class='a > b'] > input"),
+                     (BY_CSS_SELECTOR, 'a, form > input:nth-of-type(1)'), (BY_CSS_SELECTOR, 'body form > input')]
+        results = self.scraper.check_locators(self.references, [locators] * len(self.references))
+
+        for element, checks in zip(self.references, results):
+            for (_, selector), check in zip(locators, checks):
+                try:
+                    matches = self.scraper.soup.select(selector)
+                except Exception:
+                    self.assertEqual(check, (-1, False))
+                    continue
+                self.assertEqual(check, (len(matches), any(node is element for node in matches)), selector)
+
+        # 색인으로 찾는 XPath 후보 형식과 lxml로 평가하는 그 밖의 XPath
+        xpaths = ["//*[@name='q']", "//input[@name='q']", "//*[@id='save']", "//*[normalize-space(.)='Go']",
+                  "//button[normalize-space(.)='Next']", "//a[normalize-space(.)='Next']", "//*[@class='btn']",
+                  "//form/input[2]", "//*[normalize-space(.)='']", "//*[@@"]
+        tree = lxml.html.document_fromstring(str(self.scraper.soup))
+        # 두 트리의 같은 요소는 문서 순서가 같음
+        lxml_nodes = dict(zip(map(id, self.scraper.soup.find_all(True)), tree.iter(lxml.etree.Element)))
+        results = self.scraper.check_locators(self.references, [[(BY_XPATH, xpath) for xpath in xpaths]]
+                                              * len(self.references))
+        for element, checks in zip(self.references, results):
+            for xpath, check in zip(xpaths, checks):
+                try:
+                    matches = [node for node in tree.xpath(xpath) if isinstance(node, lxml.html.HtmlElement)]
+                except lxml.etree.XPathError:
+                    self.assertEqual(check, (-1, False))
+                    continue
+                self.assertEqual(check, (len(matches), lxml_nodes[id(element)] in matches), xpath)
+
+        # ID, 이름, 클래스 이름 로케이터
+        save = self.references[[info.get('text') for info in self.elements].index('Save')]
+        checks = self.scraper.check_locators([save], [[(BY_ID, 'save'), (BY_NAME, 'q'), ('class name', 'btn')]])
+        self.assertEqual(checks, [[(1, True), (2, False), (3, False)]])
+
+    def test_static_path_selectors_use_index(self):
+        """정적 엔진이 위치 경로 선택자를 soupsieve 대신 색인의 형제 순번으로 찾는지 테스트"""
+        selectors = ['html > body > button:nth-of-type(3)', 'form > input:nth-of-type(2)']
+        with patch.object(soupsieve, 'compile', side_effect=AssertionError('soupsieve used')):
+            results = self.scraper.check_locators(self.references[:1], [[(BY_CSS_SELECTOR, selector)
+                                                                         for selector in selectors]])
+        self.assertEqual([count for count, _ in results[0]], [1, 1])
+
+    def test_elements_without_reference_are_skipped(self):
+        """요소 참조가 없는 요소(스냅샷)는 검사하지 않는지 테스트"""
+        info = build_element_info({'tag_name': 'button', 'text': 'Go', 'class': 'btn'})
+        self.assertEqual(validate_locators(self.scraper, [info]), [])
+        self.assertNotIn('locator', info)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+OCR 백엔드 테스트
+"""
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from google.cloud import vision
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.ocr import OCRProcessor
+from src.utils.ocr_backends import (MAX_IMAGES_PER_REQUEST, FakeBackend, OCRBackend, TesseractBackend,
+                                    VisionBackend, create_backend, parse_tesseract_tsv)
+from src.utils.ocr_cache import OCRCache
+
+TSV_HEADER = "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext\n"
+TSV_OUTPUT = (
+    TSV_HEADER
+    + "1\t1\t0\t0\t0\t0\t0\t0\t120\t40\t-1\t\n"
+    + "5\t1\t1\t1\t1\t1\t10\t8\t50\t20\t91.5\tSign\n"
+    + "5\t1\t1\t1\t1\t2\t64\t8\t30\t20\t88.0\tup\n"
+    + "5\t1\t1\t1\t1\t3\t100\t8\t4\t20\t-1\t \n"
+)
+
+
+class FakeVisionClient:
+    """batch_annotate_images 요청마다 이미지 내용을 텍스트로 돌려주는 Vision 클라이언트
+    (b'error'는 이미지 오류, b'drop'은 응답 누락)"""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def batch_annotate_images(self, requests):
+        self.batch_sizes.append(len(requests))
+        responses = []
+        for request in requests:
+            content = request.image.content
+            if content == b'drop':
+                continue
+            if content == b'error':
+                responses.append(vision.AnnotateImageResponse(error={'message': 'bad image'}))
+                continue
+            word = vision.EntityAnnotation(description=content.decode(), bounding_poly={
+                'vertices': [{'x': 0, 'y': 0}, {'x': 40, 'y': 0}, {'x': 40, 'y': 20}, {'x': 0, 'y': 20}]})
+            # 첫 번째 항목은 전체 텍스트
+            responses.append(vision.AnnotateImageResponse(text_annotations=[word, word]))
+        return vision.BatchAnnotateImagesResponse(responses=responses)
+
+
+class TestOCRBackends(unittest.TestCase):
+    """OCR 백엔드 테스트 클래스"""
+    
+    def test_parse_tesseract_tsv(self):
+        """Tesseract TSV 출력에서 단어와 경계 상자를 추출하는지 테스트"""
+        texts = parse_tesseract_tsv(TSV_OUTPUT)
+        
+        self.assertEqual([text['text'] for text in texts], ['Sign', 'up'])
+        self.assertEqual(texts[0]['top_left'], (10, 8))
+        self.assertEqual(texts[0]['bottom_right'], (60, 28))
+        self.assertEqual(texts[1]['center'], (79.0, 18.0))
+    
+    def test_tesseract_backend(self):
+        """Tesseract 실행 파일의 출력을 이미지별 결과로 변환하는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, 'output.tsv')
+            with open(output_path, 'w') as f:
+                f.write(TSV_OUTPUT)
+            command = os.path.join(tmp_dir, 'tesseract')
+            with open(command, 'w') as f:
+                f.write(f"#!/bin/sh\ncat > /dev/null\ncat '{output_path}'\n")
+            os.chmod(command, os.stat(command).st_mode | stat.S_IXUSR)
+            
+            backend = TesseractBackend(command=command, workers=2)
+            results = backend.detect_text_batch([b'first', b'second', b'third'])
+        
+        self.assertTrue(backend.available)
+        self.assertEqual([[text['text'] for text in texts] for texts in results], [['Sign', 'up']] * 3)
+    
+    def test_tesseract_backend_unavailable(self):
+        """실행 파일이 없으면 사용 불가로 표시되는지 테스트"""
+        with self.assertWarns(UserWarning):
+            backend = TesseractBackend(command='/nonexistent/tesseract')
+        self.assertFalse(backend.available)
+    
+    def test_backend_must_implement_request_batch(self):
+        """request_batch를 구현하지 않은 백엔드는 만들 수 없는지 테스트"""
+        class IncompleteBackend(OCRBackend):
+            name = 'incomplete'
+        
+        with self.assertRaises(TypeError):
+            IncompleteBackend()
+    
+    def test_create_backend(self):
+        """이름 또는 환경 변수로 백엔드를 선택하는지 테스트"""
+        self.assertIsInstance(create_backend('fake'), FakeBackend)
+        with patch.dict(os.environ, {'OCR_BACKEND': 'fake'}):
+            self.assertIsInstance(create_backend(), FakeBackend)
+        with self.assertRaises(ValueError):
+            create_backend('unknown')
+    
+    def test_processor_with_fake_backend(self):
+        """OCRProcessor가 중복 이미지를 한 번만 보내고 캐시된 결과를 재사용하는지 테스트"""
+        backend = FakeBackend({b'login': 'Login', b'blank': ''})
+        processor = OCRProcessor(cache=OCRCache(':memory:'), backend=backend)
+        
+        results = processor.detect_text_batch([b'login', b'blank', b'login'])
+        self.assertEqual([[text['text'] for text in texts] for texts in results], [['Login'], [], ['Login']])
+        self.assertEqual((backend.calls, backend.images), (1, 2))
+        
+        # 두 번째 실행은 모두 캐시에서 처리
+        self.assertEqual(processor.detect_text(b'login')[0]['text'], 'Login')
+        self.assertEqual((backend.calls, backend.images), (1, 2))
+    
+    def test_vision_batches_of_sixteen(self):
+        """Vision 백엔드가 요청 하나에 최대 16개씩 묶어 보내고 입력 순서대로 결과를 돌려주는지 테스트"""
+        with patch.dict(os.environ, {'GOOGLE_APPLICATION_CREDENTIALS': ''}), self.assertWarns(UserWarning):
+            backend = VisionBackend()
+        backend.client = FakeVisionClient()
+        backend.available = True
+        images = [f"image{index}".encode() for index in range(35)]
+        images[20] = b'error'
+
+        results = backend.detect_text_batch(images)
+
+        self.assertEqual(backend.client.batch_sizes, [MAX_IMAGES_PER_REQUEST, MAX_IMAGES_PER_REQUEST, 3])
+        self.assertIsNone(results[20])
+        self.assertEqual([texts[0]['text'] for index, texts in enumerate(results) if index != 20],
+                         [f"image{index}" for index in range(35) if index != 20])
+        self.assertEqual(results[0][0]['bottom_right'], (40, 20))
+
+        # 프로세서는 중복 이미지를 한 번만 보내고 입력 순서대로 결과를 채움 (오류 이미지는 빈 리스트)
+        backend.client = FakeVisionClient()
+        processor = OCRProcessor(backend=backend)
+        results = processor.detect_text_batch([b'next', b'error', b'login', b'next'])
+        self.assertEqual(backend.client.batch_sizes, [3])
+        self.assertEqual([[text['text'] for text in texts] for texts in results], [['next'], [], ['login'], ['next']])
+
+    def test_vision_short_response(self):
+        """Vision 응답 수가 요청 수보다 적으면 결과를 어긋나게 채우지 않고 묶음 전체를 실패로 처리하는지 테스트"""
+        with patch.dict(os.environ, {'GOOGLE_APPLICATION_CREDENTIALS': ''}), self.assertWarns(UserWarning):
+            backend = VisionBackend()
+        backend.client = FakeVisionClient()
+        backend.available = True
+        images = [f"image{index}".encode() for index in range(20)]
+        images[3] = b'drop'
+
+        with patch('builtins.print'):
+            results = backend.detect_text_batch(images)
+
+        self.assertEqual(backend.client.batch_sizes, [MAX_IMAGES_PER_REQUEST, 4])
+        self.assertEqual(results[:MAX_IMAGES_PER_REQUEST], [None] * MAX_IMAGES_PER_REQUEST)
+        self.assertEqual([texts[0]['text'] for texts in results[MAX_IMAGES_PER_REQUEST:]],
+                         [f"image{index}" for index in range(MAX_IMAGES_PER_REQUEST, 20)])
+
+    def test_cache_separated_by_backend(self):
+        """백엔드가 다르면 캐시된 결과를 공유하지 않는지 테스트"""
+        cache = OCRCache(':memory:')
+        OCRProcessor(cache=cache, backend=FakeBackend({b'icon': 'Search'})).detect_text(b'icon')
+        
+        cache.put(b'icon', [], 'other')
+        self.assertEqual(cache.get(b'icon', 'other'), [])
+        self.assertEqual(cache.get(b'icon', 'fake')[0]['text'], 'Search')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+OCR 결과 캐시 테스트
+"""
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import ocr_cache
+from src.utils.ocr_cache import OCRCache
+
+
+SAMPLE_RESULT = [{
+    'text': '검색',
+    'top_left': (1, 2),
+    'bottom_right': (30, 12),
+    'center': (15.5, 7.0),
+    'width': 29,
+    'height': 10,
+    'vertices': [(1, 2), (30, 2), (30, 12), (1, 12)],
+}]
+
+
+class TestOCRCache(unittest.TestCase):
+    """OCR 결과 캐시 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'ocr_cache.sqlite3')
+    
+    def tearDown(self):
+        """임시 파일 정리"""
+        self.tmp_dir.cleanup()
+    
+    def test_get_put(self):
+        """저장한 결과를 같은 형식으로 다시 읽는지 테스트"""
+        cache = OCRCache(self.path, ttl=60, max_bytes=1024 * 1024)
+        
+        self.assertIsNone(cache.get(b'image'))
+        cache.put(b'image', SAMPLE_RESULT)
+        
+        self.assertEqual(cache.get(b'image'), SAMPLE_RESULT)
+        self.assertIsNone(cache.get(b'other image'))
+        
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (1, 2, 1))
+        cache.close()
+    
+    def test_persistence(self):
+        """캐시 파일을 다시 열어도 결과가 유지되는지 테스트"""
+        cache = OCRCache(self.path, ttl=60, max_bytes=1024 * 1024)
+        cache.put(b'image', SAMPLE_RESULT)
+        cache.close()
+        
+        reopened = OCRCache(self.path, ttl=60, max_bytes=1024 * 1024)
+        self.assertEqual(reopened.get(b'image'), SAMPLE_RESULT)
+        reopened.close()
+    
+    def test_ttl_expiry(self):
+        """만료 시간이 지난 결과는 미스로 처리되는지 테스트"""
+        cache = OCRCache(self.path, ttl=60, max_bytes=1024 * 1024)
+        with patch.object(ocr_cache.time, 'time', return_value=1000.0):
+            cache.put(b'image', SAMPLE_RESULT)
+        
+        with patch.object(ocr_cache.time, 'time', return_value=1030.0):
+            self.assertIsNotNone(cache.get(b'image'))
+        with patch.object(ocr_cache.time, 'time', return_value=1061.0):
+            self.assertIsNone(cache.get(b'image'))
+        
+        self.assertEqual(cache.stats()['entries'], 0)
+        cache.close()
+    
+    def test_size_eviction(self):
+        """크기 제한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제되는지 테스트"""
+        cache = OCRCache(self.path, ttl=60, max_bytes=250)
+        
+        with patch.object(ocr_cache.time, 'time', return_value=1000.0):
+            cache.put(b'first', [{'text': 'a' * 80}])
+        with patch.object(ocr_cache.time, 'time', return_value=1001.0):
+            cache.put(b'second', [{'text': 'b' * 80}])
+        with patch.object(ocr_cache.time, 'time', return_value=1002.0):
+            cache.get(b'first')  # first를 최근 사용 항목으로 갱신
+        with patch.object(ocr_cache.time, 'time', return_value=1003.0):
+            cache.put(b'third', [{'text': 'c' * 80}])
+        
+        with patch.object(ocr_cache.time, 'time', return_value=1004.0):
+            self.assertIsNotNone(cache.get(b'first'))
+            self.assertIsNone(cache.get(b'second'))
+            self.assertIsNotNone(cache.get(b'third'))
+        self.assertEqual(cache.stats()['evictions'], 1)
+        cache.close()
+
+    
+    def test_hits_are_not_committed_one_by_one(self):
+        """적중 시 사용 시각을 바로 쓰지 않고 다음 저장이나 닫기에서 한 번에 기록하는지 테스트"""
+        cache = OCRCache(self.path, ttl=60, max_bytes=1024 * 1024)
+        with patch.object(ocr_cache.time, 'time', return_value=1000.0):
+            cache.put(b'image', SAMPLE_RESULT)
+        
+        statements = []
+        cache._conn.set_trace_callback(statements.append)
+        with patch.object(ocr_cache.time, 'time', return_value=1010.0):
+            for _ in range(5):
+                self.assertEqual(cache.get(b'image'), SAMPLE_RESULT)
+        self.assertFalse([sql for sql in statements if not sql.startswith('SELECT')])
+        
+        # 저장할 때는 총 크기를 다시 합산하지 않음
+        with patch.object(ocr_cache.time, 'time', return_value=1020.0):
+            cache.put(b'other image', SAMPLE_RESULT)
+        self.assertFalse([sql for sql in statements if 'SUM(size)' in sql and 'created' not in sql])
+        cache.close()
+        
+        reopened = OCRCache(self.path, ttl=60, max_bytes=1024 * 1024)
+        accessed = reopened._conn.execute("SELECT MIN(accessed) FROM ocr_results").fetchone()[0]
+        self.assertEqual(accessed, 1010.0)
+        self.assertEqual(reopened.stats()['bytes'], reopened._total_bytes)
+        reopened.close()
+    
+    def test_access_flushed_on_close(self):
+        """저장 없이 닫아도 적중한 항목의 사용 시각이 기록되는지 테스트"""
+        cache = OCRCache(self.path, ttl=60, max_bytes=1024 * 1024)
+        with patch.object(ocr_cache.time, 'time', return_value=1000.0):
+            cache.put(b'image', SAMPLE_RESULT)
+        with patch.object(ocr_cache.time, 'time', return_value=1005.0):
+            cache.get(b'image')
+        cache.close()
+        
+        reopened = OCRCache(self.path, ttl=60, max_bytes=1024 * 1024)
+        self.assertEqual(reopened._conn.execute("SELECT accessed FROM ocr_results").fetchone()[0], 1005.0)
+        reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+속도 제한 OCR 요청 실행 테스트 (429 응답과 지연을 넣는 로컬 대역 서버 사용)
+"""
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.ocr_backends import VisionRestBackend
+from src.utils.ocr_executor import RateLimitedBackend, TokenBucket
+
+
+class FakeVisionServer:
+    """images:annotate 요청에 응답하는 로컬 대역 서버"""
+    
+    def __init__(self, delay=0.0, rate_limited=0, status=429):
+        self.delay = delay
+        self.rate_limited = rate_limited  # 처음 몇 번의 요청에 오류 응답
+        self.status = status
+        self.requests = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with server.lock:
+                    server.requests += 1
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                    failing = server.requests <= server.rate_limited
+                time.sleep(server.delay)
+                with server.lock:
+                    server.active -= 1
+                
+                if failing:
+                    payload, status = {'error': {'code': server.status, 'message': 'quota exceeded'}}, server.status
+                else:
+                    payload, status = {'responses': [{'textAnnotations': [
+                        {'description': 'Login'},
+                        {'description': 'Login', 'boundingPoly': {'vertices': [{'x': 2}, {'x': 40}, {'x': 40, 'y': 12}, {'x': 2, 'y': 12}]}},
+                    ]} for _ in body['requests']]}, 200
+                
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def log_message(self, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.endpoint = f"http://127.0.0.1:{self.httpd.server_address[1]}/v1/images:annotate"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+    
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestOCRExecutor(unittest.TestCase):
+    """속도 제한 OCR 요청 실행 테스트 클래스"""
+    
+    def make_backend(self, server, **kwargs):
+        """대역 서버로 요청하는 속도 제한 백엔드 생성"""
+        kwargs.setdefault('base_delay', 0.01)
+        return RateLimitedBackend(VisionRestBackend(endpoint=server.endpoint), **kwargs)
+    
+    def test_retry_after_rate_limit(self):
+        """429 응답을 재시도하여 결과를 받는지 테스트"""
+        server = FakeVisionServer(rate_limited=2)
+        self.addCleanup(server.close)
+        backend = self.make_backend(server, rate=0)
+        
+        results = backend.detect_text_batch([b'a', b'b'])
+        
+        self.assertEqual([texts[0]['text'] for texts in results], ['Login', 'Login'])
+        self.assertEqual(results[0][0]['top_left'], (2, 0))
+        stats = backend.stats()
+        self.assertEqual((stats['requests'], stats['retries'], stats['failed_images']), (3, 2, 0))
+        self.assertEqual(stats['errors'], {'rate_limited': 2})
+    
+    def test_non_retryable_error(self):
+        """재시도할 수 없는 오류는 한 번만 요청하고 실패로 기록하는지 테스트"""
+        server = FakeVisionServer(rate_limited=5, status=403)
+        self.addCleanup(server.close)
+        backend = self.make_backend(server, rate=0)
+        
+        self.assertEqual(backend.detect_text_batch([b'a']), [None])
+        self.assertEqual(server.requests, 1)
+        self.assertEqual(backend.stats()['errors'], {'client_error': 1})
+        self.assertEqual(backend.stats()['failed_images'], 1)
+    
+    def test_concurrency_limit(self):
+        """동시 요청 수가 제한을 넘지 않고 결과 순서가 유지되는지 테스트"""
+        server = FakeVisionServer(delay=0.05)
+        self.addCleanup(server.close)
+        backend = self.make_backend(server, concurrency=2, rate=0)
+        backend.max_batch_size = 1
+        
+        results = backend.detect_text_batch([b'a', b'b', b'c', b'd', b'e', b'f'])
+        
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(texts and texts[0]['text'] == 'Login' for texts in results))
+        self.assertEqual(server.max_active, 2)
+    
+    def test_time_budget(self):
+        """시간 예산을 넘으면 남은 요청을 보내지 않는지 테스트"""
+        server = FakeVisionServer(rate_limited=100)
+        self.addCleanup(server.close)
+        backend = self.make_backend(server, rate=0, max_retries=100, time_budget=0.3, base_delay=0.05, max_delay=0.05)
+        
+        start_time = time.time()
+        self.assertEqual(backend.detect_text_batch([b'a']), [None])
+        
+        self.assertLess(time.time() - start_time, 1.0)
+        self.assertEqual(backend.stats()['errors'].get('budget_exceeded'), 1)
+        
+        # 예산 시간이 지난 뒤에는 요청하지 않음
+        time.sleep(0.1)
+        requests = server.requests
+        self.assertEqual(backend.detect_text_batch([b'b']), [None])
+        self.assertEqual(server.requests, requests)
+    
+    def test_token_bucket(self):
+        """토큰 버킷이 초당 요청 수를 제한하는지 테스트"""
+        bucket = TokenBucket(rate=20, capacity=1)
+        start_time = time.monotonic()
+        for _ in range(5):
+            self.assertTrue(bucket.acquire())
+        
+        # 첫 토큰은 바로, 나머지 4개는 0.05초 간격
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.18)
+        self.assertFalse(bucket.acquire(deadline=time.monotonic() + 0.001))
+
+
+if __name__ == '__main__':
+    unittest.main()
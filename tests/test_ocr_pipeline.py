@@ -0,0 +1,74 @@
+"""
+OCR 파이프라인 테스트
+"""
+import os
+import sys
+import time
+import unittest
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.ocr import OCRProcessor
+from src.utils.ocr_backends import FakeBackend
+from src.utils.ocr_pipeline import OCRPipeline
+
+
+class SlowBackend(FakeBackend):
+    """요청마다 일정 시간이 걸리는 테스트용 백엔드"""
+    
+    def __init__(self, delay, texts=None):
+        super().__init__(texts)
+        self.delay = delay
+    
+    def detect_text_batch(self, images):
+        time.sleep(self.delay)
+        return super().detect_text_batch(images)
+
+
+class TestOCRPipeline(unittest.TestCase):
+    """OCR 파이프라인 테스트 클래스"""
+    
+    def test_results_by_index(self):
+        """이미지가 batch_size개씩 작업으로 묶이고 번호별 결과가 모이는지 테스트"""
+        images = {index: f"image {index}".encode() for index in range(7)}
+        backend = FakeBackend({image: f"label {index}" for index, image in images.items()})
+        
+        with OCRPipeline(OCRProcessor(backend=backend), workers=2, batch_size=3) as pipeline:
+            for index in (3, 0, 6, 1, 5, 2, 4):
+                pipeline.submit(index, images[index])
+            results = pipeline.results()
+        
+        self.assertEqual(pipeline.jobs, 3)
+        self.assertEqual(backend.images, 7)
+        self.assertEqual({index: texts[0]['text'] for index, texts in results.items()},
+                         {index: f"label {index}" for index in images})
+    
+    def test_overlaps_with_producer(self):
+        """생산자 작업과 OCR이 겹쳐 실행되는지 테스트"""
+        backend = SlowBackend(0.1)
+        start_time = time.time()
+        
+        with OCRPipeline(OCRProcessor(backend=backend), workers=2, batch_size=1, queue_size=2) as pipeline:
+            for index in range(4):
+                time.sleep(0.1)  # 스크린샷 캡처에 해당하는 작업
+                pipeline.submit(index, f"image {index}".encode())
+            results = pipeline.results()
+        
+        # 순차 실행이면 0.8초, 겹쳐 실행되면 캡처 0.4초 + 마지막 OCR 0.1초 정도
+        self.assertLess(time.time() - start_time, 0.7)
+        self.assertEqual(sorted(results), [0, 1, 2, 3])
+    
+    def test_worker_error(self):
+        """OCR 작업 오류가 빈 결과로 기록되는지 테스트"""
+        class BrokenProcessor:
+            def detect_text_batch(self, images):
+                raise RuntimeError("broken")
+        
+        with OCRPipeline(BrokenProcessor(), workers=1) as pipeline:
+            pipeline.submit(0, b'image')
+            self.assertEqual(pipeline.results(), {0: []})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+"""
+페이지 오브젝트 템플릿 테스트
+"""
+import os
+import sys
+import unittest
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from src.templates.page_object_template import PageTemplate
+from src.utils.element_info import build_element_info
+from src.utils.po_generator import PageObjectGenerator
+
+
+class FakeElement:
+    """클릭과 입력을 기록하는 웹 요소 (stale 설정 가능)"""
+
+    def __init__(self):
+        self.stale = False
+        self.clicks = 0
+        self.keys = []
+
+    def _check(self):
+        if self.stale:
+            raise StaleElementReferenceException("stale")
+
+    def is_displayed(self):
+        self._check()
+        return True
+
+    def is_enabled(self):
+        self._check()
+        return True
+
+    def click(self):
+        self._check()
+        self.clicks += 1
+
+    def clear(self):
+        self._check()
+        self.keys = []
+
+    def send_keys(self, text):
+        self._check()
+        self.keys.append(text)
+
+
+class FakeDriver:
+    """find_element 호출 수와 실행한 스크립트 인수를 기록하는 드라이버"""
+
+    def __init__(self):
+        self.lookups = 0
+        self.elements = []
+        self.scripts = []
+        self.missing = []
+
+    def find_element(self, by, value):
+        self.lookups += 1
+        self.elements.append(FakeElement())
+        return self.elements[-1]
+
+    def execute_script(self, script, *args):
+        self.scripts.append(args)
+        missing, self.missing = self.missing, []
+        return missing
+
+
+class LoginPage(PageTemplate):
+    """테스트용 페이지 오브젝트"""
+
+    LOGIN_BUTTON = (By.ID, "login")
+    USER_INPUT = (By.NAME, "user")
+
+    def click_login(self):
+        return self.click_element(self.LOGIN_BUTTON)
+
+    def enter_user(self, text):
+        return self.input_text(self.USER_INPUT, text)
+
+
+class TestPageTemplate(unittest.TestCase):
+    """페이지 오브젝트 템플릿 테스트 클래스"""
+
+    def test_elements_are_cached(self):
+        """같은 로케이터의 요소를 한 번만 찾고 대기 객체를 재사용하는지 테스트"""
+        driver = FakeDriver()
+        page = LoginPage(driver, poll_frequency=0.01)
+        wait = page.wait
+
+        for _ in range(5):
+            page.click_login().enter_user("kim")
+        self.assertEqual(driver.lookups, 2)
+        self.assertEqual(driver.elements[0].clicks, 5)
+        self.assertEqual(driver.elements[1].keys, ["kim"])
+        self.assertIs(page.wait, wait)
+        self.assertEqual((page.timeout, page.wait._poll), (10, 0.01))
+
+    def test_stale_element_is_looked_up_again(self):
+        """캐시한 요소가 stale이면 다시 찾아 동작하는지 테스트"""
+        driver = FakeDriver()
+        page = LoginPage(driver)
+        page.click_login()
+        driver.elements[0].stale = True
+
+        page.click_login()
+        self.assertEqual(driver.lookups, 2)
+        self.assertEqual(driver.elements[1].clicks, 1)
+
+        page.clear_cache().click_login()
+        self.assertEqual(driver.lookups, 3)
+
+    def test_generated_class_uses_template(self):
+        """생성된 클래스가 로케이터 상수와 템플릿 메서드를 사용하는지 테스트"""
+        button = build_element_info({'tag_name': 'button', 'text': 'Login', 'id': 'login'})
+        field = build_element_info({'tag_name': 'input', 'type': 'text', 'name': 'user'})
+        code = PageObjectGenerator().generate_page_object_class('https://example.com', [button, field])
+
+        self.assertIn("class example_com_Page(PageTemplate):", code)
+        self.assertIn('    LOGIN_BUTTON = (By.ID, "login")', code)
+        self.assertIn('    USER_INPUT = (By.NAME, "user")', code)
+        self.assertIn("return self.click_element(self.LOGIN_BUTTON)", code)
+        self.assertNotIn("WebDriverWait", code)
+
+        namespace = {'By': By, 'PageTemplate': PageTemplate}
+        exec(compile(code, 'page.py', 'exec'), namespace)
+        driver = FakeDriver()
+        page = namespace['example_com_Page'](driver)
+        page.click_login().enter_user("kim").click_login()
+        self.assertEqual(driver.lookups, 2)
+
+    def test_fill_form_uses_one_script(self):
+        """폼 필드를 한 번의 스크립트 실행으로 입력하고 키 입력 필드와 없는 필드를 따로 처리하는지 테스트"""
+        driver = FakeDriver()
+        page = LoginPage(driver)
+        fields = {'user': LoginPage.USER_INPUT, 'login': LoginPage.LOGIN_BUTTON}
+
+        page.fill_form(fields, {'user': 'kim', 'login': True}, dispatch_events=True)
+        self.assertEqual(driver.scripts, [([['user', ['name', 'user'], 'kim'],
+                                            ['login', ['id', 'login'], True]], True)])
+        self.assertEqual(driver.lookups, 0)
+
+        # 아직 나타나지 않은 필드는 대기하여 찾은 요소로 다시 실행
+        driver.scripts, driver.missing = [], ['user']
+        page.fill_form(fields, {'user': 'lee'})
+        self.assertEqual(driver.lookups, 1)
+        self.assertEqual(driver.scripts[1], ([['user', driver.elements[0], 'lee']], False))
+
+        # 실제 키 입력이 필요한 필드는 send_keys 사용
+        driver.scripts = []
+        page.fill_form(fields, {'user': 'park'}, type_keys=('user',))
+        self.assertEqual(driver.scripts, [])
+        self.assertEqual(driver.elements[0].keys, ['park'])
+
+        with self.assertRaises(TypeError):
+            page.fill_form(fields, {'password': 'x'})
+
+    def test_generated_fill_method(self):
+        """같은 폼의 입력 요소로 fill_<폼> 메서드를 생성하는지 테스트"""
+        def field(**raw):
+            return build_element_info(dict(raw, form='login-form'))
+
+        elements = [
+            field(tag_name='input', type='text', name='username'),
+            field(tag_name='input', type='password', name='password'),
+            field(tag_name='input', type='checkbox', id='remember', text='Remember'),
+            field(tag_name='button', text='Login', id='login'),
+            build_element_info({'tag_name': 'input', 'type': 'text', 'name': 'q', 'form': 'search'}),
+        ]
+        code = PageObjectGenerator().generate_page_object_class('https://example.com', elements)
+
+        self.assertIn("    LOGIN_FORM_FIELDS = {\n        'username': USERNAME_INPUT,\n"
+                      "        'password': PASSWORD_INPUT,\n        'remember': REMEMBER_CHECKBOX,\n    }", code)
+        self.assertIn("def fill_login_form(self, dispatch_events=False, type_keys=(), **values):", code)
+        self.assertIn("return self.fill_form(self.LOGIN_FORM_FIELDS, values, dispatch_events, type_keys)", code)
+        self.assertNotIn("fill_search", code)  # 필드가 하나인 폼은 개별 메서드만 사용
+
+        namespace = {'By': By, 'PageTemplate': PageTemplate}
+        exec(compile(code, 'page.py', 'exec'), namespace)
+        driver = FakeDriver()
+        namespace['example_com_Page'](driver).fill_login_form(username='kim', remember=True)
+        self.assertEqual(driver.scripts, [([['username', ['name', 'username'], 'kim'],
+                                            ['remember', ['id', 'remember'], True]], False)])
+
+    def test_fill_method_keywords(self):
+        """파이썬 키워드 이름의 필드에 '_field'를 붙이고 폼 안에서 겹치는 인수 이름을 구분하는지 테스트"""
+        elements = [build_element_info(dict(raw, form='flight')) for raw in (
+            {'tag_name': 'input', 'type': 'text', 'name': 'from'},
+            {'tag_name': 'input', 'type': 'text', 'name': 'email'},
+            {'tag_name': 'select', 'name': 'email'},
+        )]
+        code = PageObjectGenerator().generate_page_object_class('https://example.com', elements)
+
+        self.assertIn("    FLIGHT_FIELDS = {\n        'from_field': FROM_INPUT,\n        'email': EMAIL_INPUT,\n"
+                      "        'email_1': EMAIL_SELECT,\n    }", code)
+
+        namespace = {'By': By, 'PageTemplate': PageTemplate}
+        exec(compile(code, 'page.py', 'exec'), namespace)
+        driver = FakeDriver()
+        namespace['example_com_Page'](driver).fill_flight(from_field='ICN', email_1='a@b.c')
+        self.assertEqual(driver.scripts, [([['from_field', ['name', 'from'], 'ICN'],
+                                            ['email_1', ['name', 'email'], 'a@b.c']], False)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,19 +22,27 @@ class TestPageObjectGenerator(unittest.TestCase):
     
     def test_generate_method_name(self):
         """메서드 이름 생성 테스트"""
+        def method_name(text):
+            return self.generator._generate_method_name({'text': text}, 'click', set())
+        
         # 영어 텍스트
-        self.assertEqual(self.generator._generate_method_name("Login"), "click_login")
-        self.assertEqual(self.generator._generate_method_name("Sign Up"), "click_sign_up")
-        self.assertEqual(self.generator._generate_method_name("Submit Form"), "click_submit_form")
+        self.assertEqual(method_name("Login"), "click_login")
+        self.assertEqual(method_name("Sign Up"), "click_sign_up")
+        self.assertEqual(method_name("Submit Form"), "click_submit_form")
         
         # 특수문자 포함
-        self.assertEqual(self.generator._generate_method_name("Login!"), "click_login")
-        self.assertEqual(self.generator._generate_method_name("Sign-Up Now"), "click_signup_now")
+        self.assertEqual(method_name("Login!"), "click_login")
+        self.assertEqual(method_name("Sign-Up Now"), "click_signup_now")
+        
+        # 한글 텍스트 (로마자 변환 또는 영어 대체어로 변환)
+        korean_method = method_name("로그인")
+        self.assertTrue(korean_method.startswith("click_"))
+        self.assertTrue(korean_method.isidentifier())
         
-        # 한글 텍스트 (해시값으로 변환)
-        korean_method = self.generator._generate_method_name("로그인")
-        self.assertTrue(korean_method.startswith("click_button_"))
-        self.assertEqual(len(korean_method), len("click_button_") + 6)  # 6자리 해시값
+        # 이미 사용된 이름은 번호를 붙여 구분
+        used_names = set()
+        self.assertEqual(self.generator._generate_method_name({'text': 'Login'}, 'click', used_names), "click_login")
+        self.assertNotEqual(self.generator._generate_method_name({'text': 'Login'}, 'click', used_names), "click_login")
     
     def test_get_best_locator(self):
         """최적의 로케이터 선택 테스트"""
@@ -45,7 +53,7 @@ class TestPageObjectGenerator(unittest.TestCase):
             'xpath_options': ['//*[@id="login-button"]']
         }
         locator_code = self.generator._get_best_locator(button_with_id)
-        self.assertIn('find_element(By.ID, "login-button")', locator_code)
+        self.assertEqual(locator_code, '(By.ID, "login-button")')
         
         # ID가 없고 XPath만 있는 경우
         button_with_xpath = {
@@ -54,7 +62,7 @@ class TestPageObjectGenerator(unittest.TestCase):
             'xpath_options': ['/html/body/div/button[1]']
         }
         locator_code = self.generator._get_best_locator(button_with_xpath)
-        self.assertIn('find_element(By.XPATH, "/html/body/div/button[1]")', locator_code)
+        self.assertEqual(locator_code, '(By.XPATH, "/html/body/div/button[1]")')
         
         # ID와 XPath가 없고 텍스트만 있는 경우
         button_with_text = {
@@ -63,7 +71,7 @@ class TestPageObjectGenerator(unittest.TestCase):
             'xpath_options': []
         }
         locator_code = self.generator._get_best_locator(button_with_text)
-        self.assertIn('find_element(By.XPATH, "//button[contains(text(), \'Login\')]', locator_code)
+        self.assertIn('(By.XPATH, "//*[normalize-space(.)=\'Login\']', locator_code)
         
         # 모두 없고 클래스만 있는 경우
         button_with_class = {
@@ -73,7 +81,7 @@ class TestPageObjectGenerator(unittest.TestCase):
             'class': 'btn btn-primary'
         }
         locator_code = self.generator._get_best_locator(button_with_class)
-        self.assertIn('find_element(By.CLASS_NAME, "btn")', locator_code)
+        self.assertIn('(By.CLASS_NAME, "btn")', locator_code)
     
     def test_generate_page_object_class(self):
         """페이지 오브젝트 클래스 생성 테스트"""
@@ -96,18 +104,19 @@ class TestPageObjectGenerator(unittest.TestCase):
         code = self.generator.generate_page_object_class(url, buttons)
         
         # 클래스 이름 확인
-        self.assertIn("class example_com_Page:", code)
+        self.assertIn("class example_com_Page(PageTemplate):", code)
         
         # URL 확인
-        self.assertIn(f'self.url = "{url}"', code)
+        self.assertIn(f'url = "{url}"', code)
         
         # 버튼 메서드 확인
         self.assertIn("def click_login(self):", code)
         self.assertIn("def click_sign_up(self):", code)
         
         # 로케이터 확인
-        self.assertIn('find_element(By.ID, "login-button")', code)
-        self.assertIn('find_element(By.XPATH, "/html/body/div/a[1]")', code)
+        self.assertIn('LOGIN_BUTTON = (By.ID, "login-button")', code)
+        self.assertIn('SIGN_UP_BUTTON = (By.XPATH, "/html/body/div/a[1]")', code)
+        self.assertIn('return self.click_element(self.LOGIN_BUTTON)', code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+"""
+실행 프로파일러 테스트
+"""
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.element_info import build_element_info
+from src.utils.ocr import OCRProcessor
+from src.utils.ocr_backends import FakeBackend
+from src.utils.po_generator import PageObjectGenerator
+from src.utils.profiler import Histogram, Profiler, format_phases
+from src.utils.static_scraper import StaticScraper
+
+
+class TestProfiler(unittest.TestCase):
+    """실행 프로파일러 테스트 클래스"""
+
+    def test_phases_are_aggregated(self):
+        """같은 이름의 단계를 합산하고 중첩 단계와 현재 단계 이름을 기록하는지 테스트"""
+        profiler = Profiler()
+        for _ in range(3):
+            with profiler.phase('page') as timer:
+                with profiler.phase('extract'):
+                    self.assertEqual(profiler.current_phase(), 'extract')
+                self.assertEqual(profiler.current_phase(), 'page')
+        self.assertIsNone(profiler.current_phase())
+
+        self.assertEqual(profiler.phases['page']['calls'], 3)
+        self.assertEqual(profiler.phases['extract']['calls'], 3)
+        self.assertGreaterEqual(profiler.phases['page']['wall'], profiler.phases['extract']['wall'])
+        self.assertGreaterEqual(profiler.phases['page']['max_wall'], timer.wall)
+
+    def test_disabled_profiler_only_times(self):
+        """비활성화된 프로파일러는 단계 시간만 측정하고 결과를 모으지 않는지 테스트"""
+        profiler = Profiler(enabled=False)
+        with profiler.phase('search') as timer:
+            sum(range(1000))
+        profiler.observe('extract.element', 0.001)
+        profiler.add('ocr.bytes', 10)
+
+        self.assertGreater(timer.wall, 0)
+        self.assertEqual((profiler.phases, profiler.histograms, profiler.counters), ({}, {}, {}))
+
+    def test_histogram(self):
+        """지연 시간을 구간별로 세고 분위수를 구간 상한으로 추정하는지 테스트"""
+        histogram = Histogram()
+        for milliseconds in [0.05] * 8 + [3, 700]:
+            histogram.observe(milliseconds / 1000)
+
+        data = histogram.to_dict()
+        self.assertEqual(data['count'], 10)
+        self.assertEqual(data['buckets'], [[0.1, 8], [5, 1], [1000, 1]])
+        self.assertAlmostEqual(data['p50'], 0.0001)
+        self.assertAlmostEqual(data['p90'], 0.005)
+        self.assertAlmostEqual(data['p99'], 0.7)
+        self.assertAlmostEqual(data['max'], 0.7)
+
+    def test_report_from_threads(self):
+        """여러 스레드의 기록을 모아 JSON 보고서로 저장하는지 테스트"""
+        profiler = Profiler()
+
+        def work():
+            for _ in range(100):
+                with profiler.phase('ocr.request'):
+                    profiler.add('ocr.bytes', 2)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'reports', 'run.json')
+            profiler.write_report(path, {'options': {'engine': 'static'}})
+            with open(path, encoding='utf-8') as f:
+                report = json.load(f)
+
+        self.assertEqual(report['phases']['ocr.request']['calls'], 400)
+        self.assertEqual(report['counters'], {'ocr.bytes': 800})
+        self.assertEqual(report['options'], {'engine': 'static'})
+        self.assertIn('ocr.request', format_phases(report)[1])
+
+    def test_components_record_to_profiler(self):
+        """스크래퍼, OCR 프로세서, 생성기가 같은 프로파일러에 단계와 바이트 수를 기록하는지 테스트"""
+        profiler = Profiler()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            page_path = os.path.join(tmp_dir, 'page.html')
+            with open(page_path, 'w', encoding='utf-8') as f:
+                f.write('<html><body><button id="save">Save</button><input name="q"></body></html>')
+
+            scraper = StaticScraper(profiler=profiler)
+            self.assertTrue(scraper.navigate_to(page_path))
+            nodes = [node for node, _ in scraper.collect_candidates()]
+            elements = scraper.get_elements_info(nodes)
+            scraper.close()
+
+        OCRProcessor(backend=FakeBackend(), profiler=profiler).detect_text_batch([b'login', b'login', b'next'])
+        PageObjectGenerator(profiler=profiler).generate_page_object_class('https://example.com', elements)
+
+        self.assertEqual({'navigate', 'collect', 'extract', 'ocr.request', 'generate'}, set(profiler.phases))
+        self.assertEqual(profiler.histograms['extract.element'].count, 2)
+        self.assertEqual(profiler.counters['ocr.images'], 2)  # 같은 이미지는 한 번만 전송
+        self.assertEqual(profiler.counters['ocr.bytes'], len(b'login') + len(b'next'))
+        self.assertEqual(profiler.counters['generate.elements'], len(elements))
+
+        # 프로파일러를 주지 않으면 기록하지 않음
+        generator = PageObjectGenerator()
+        generator.generate_page_object_class('https://example.com', [build_element_info({'tag_name': 'button'})])
+        self.assertEqual(generator.profiler.phases, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
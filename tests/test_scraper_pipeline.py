@@ -0,0 +1,70 @@
+"""
+스크래핑 파이프라인 벤치마크 테스트
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.scraper_pipeline import MIN_REGRESSION_SECONDS, compare, make_page
+from src.utils.static_scraper import StaticScraper
+
+
+def result(size, total, elements=None, **phases):
+    """벤치마크 결과 한 크기 항목"""
+    return {'size': size, 'elements': size if elements is None else elements, 'total': total, 'phases': phases}
+
+
+class TestScraperPipeline(unittest.TestCase):
+    """파이프라인 벤치마크 테스트 클래스"""
+
+    def test_page_size_is_collected_elements(self):
+        """합성 페이지의 크기가 스크래퍼가 실제로 수집하는 요소 수와 같은지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for size in (10, 51, 500, 2000):
+                path = os.path.join(tmp_dir, f'page_{size}.html')
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(make_page(size))
+                scraper = StaticScraper()
+                self.assertTrue(scraper.navigate_to(path))
+                self.assertEqual(len(scraper.collect_candidates()), size)
+        self.assertEqual(make_page(500), make_page(500))
+
+    def test_compare_flags_regressions(self):
+        """허용 증가율과 최소 증가 시간을 모두 넘은 단계만 회귀로 판단하는지 테스트"""
+        baseline = {'results': [result(50, 1.0, extract=0.5, collect=0.001, ocr=0.2)]}
+        current = {'results': [result(50, 1.05, extract=0.6, collect=0.002, ocr=0.2)]}
+
+        rows = {row['phase']: row for row in compare(current, baseline, 0.1)}
+
+        self.assertEqual(sorted(rows), ['collect', 'extract', 'ocr', 'total'])
+        self.assertTrue(rows['extract']['regression'])
+        self.assertAlmostEqual(rows['extract']['ratio'], 1.2)
+        # 2배 느려졌지만 증가 시간이 측정 잡음 수준이면 회귀가 아님
+        self.assertLess(0.001, MIN_REGRESSION_SECONDS)
+        self.assertFalse(rows['collect']['regression'])
+        self.assertFalse(rows['ocr']['regression'])
+        self.assertFalse(rows['total']['regression'])  # 5% 증가는 허용 범위
+        self.assertTrue(compare(current, baseline, 0.01)[-1]['regression'])
+
+    def test_compare_skips_unmatched_entries(self):
+        """기준 결과에 없는 크기와 단계, 요소 수가 다른 크기는 비교하지 않는지 테스트"""
+        baseline = {'results': [result(50, 1.0, extract=0.5), result(500, 2.0, elements=480, extract=1.0),
+                                result(2000, 3.0, navigate=0.0)]}
+        current = {'results': [result(50, 1.0, extract=0.5, ocr=0.3), result(500, 2.0, extract=1.0),
+                               result(2000, 3.0, navigate=0.1), result(10000, 9.0, extract=5.0)]}
+
+        rows = compare(current, baseline, 0.1)
+
+        self.assertEqual([(row['size'], row['phase']) for row in rows],
+                         [(50, 'extract'), (50, 'total'), (2000, 'navigate'), (2000, 'total')])
+        # 기준 시간이 0이면 비율 1로 취급
+        self.assertEqual(rows[2]['ratio'], 1.0)
+        self.assertEqual(compare(current, {}, 0.1), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
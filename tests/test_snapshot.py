@@ -0,0 +1,78 @@
+"""
+요소 스냅샷 파일 테스트
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.element_info import build_element_info
+from src.utils.po_generator import PageObjectGenerator
+from src.utils.snapshot import SnapshotError, SnapshotWriter, read_snapshot
+
+
+def make_elements():
+    """웹 요소 참조가 들어 있는 요소 정보 리스트"""
+    live_element = object()
+    button = build_element_info({'tag_name': 'button', 'text': '로그인', 'id': 'login-btn', 'is_displayed': True},
+                                live_element)
+    button['element_category'] = 'button'
+    button['ocr_data'] = [{'text': '로그인', 'top_left': (1, 2), 'bottom_right': (3, 4)}]
+    field = build_element_info({'tag_name': 'input', 'type': 'email', 'name': 'email', 'placeholder': '이메일',
+                                'is_displayed': True}, live_element)
+    field['element_category'] = 'input'
+    return [button, field]
+
+
+class TestSnapshot(unittest.TestCase):
+    """요소 스냅샷 파일 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp_dir.name)
+    
+    def tearDown(self):
+        """임시 파일 정리"""
+        self.tmp_dir.cleanup()
+    
+    def test_round_trip(self):
+        """웹 요소 참조 없이 저장하고 같은 코드를 다시 생성하는지 테스트 (일반, gzip)"""
+        elements = make_elements()
+        expected_code = PageObjectGenerator().generate_page_object_class('https://example.com/login', elements)
+        
+        for name in ('snapshot.jsonl', 'snapshot.jsonl.gz'):
+            path = self.root / name
+            with SnapshotWriter(str(path)) as writer:
+                writer.write_page('https://example.com/login', elements, 'example_com_login_page.py')
+                writer.write_page('https://example.com/empty', [])
+            
+            pages = list(read_snapshot(str(path)))
+            self.assertEqual([page['url'] for page in pages], ['https://example.com/login', 'https://example.com/empty'])
+            self.assertEqual(pages[0]['output_name'], 'example_com_login_page.py')
+            self.assertIsNone(pages[0]['elements'][0]['element'])
+            self.assertEqual(pages[0]['elements'][1]['placeholder'], '이메일')
+            
+            code = PageObjectGenerator().generate_page_object_class(pages[0]['url'], pages[0]['elements'])
+            self.assertEqual(code, expected_code)
+    
+    def test_invalid_snapshot(self):
+        """스냅샷 형식이 아니거나 버전이 다르면 오류가 발생하는지 테스트"""
+        path = self.root / 'invalid.jsonl'
+        
+        path.write_text(json.dumps({'url': 'https://example.com'}) + '\n')
+        with self.assertRaises(SnapshotError):
+            list(read_snapshot(str(path)))
+        
+        path.write_text(json.dumps({'format': 'po-snapshot', 'version': 99, 'elements': []}) + '\n')
+        with self.assertRaises(SnapshotError):
+            list(read_snapshot(str(path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+정적 HTML 스크래퍼 테스트
+"""
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import main
+from src.utils.profiler import Profiler
+from src.utils.static_scraper import StaticScraper
+
+
+SAMPLE_HTML = """
+<html><body>
+<header><a href="/cart">Cart</a></header>
+<form action="/login">
+  <input type="text" name="username" placeholder="User name">
+  <input type="password" name="password" id="pw">
+  <input type="hidden" name="csrf" value="token">
+  <input type="checkbox" name="remember">
+  <select name="lang"><option>ko</option></select>
+  <button class="btn primary">Login</button>
+</form>
+<div style="display: none"><button>Hidden</button></div>
+</body></html>
+"""
+
+
+class TestStaticScraper(unittest.TestCase):
+    """정적 HTML 스크래퍼 테스트 클래스"""
+    
+    def setUp(self):
+        """테스트 설정"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.page_path = os.path.join(self.tmp_dir.name, 'login.html')
+        with open(self.page_path, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_HTML)
+        
+        self.scraper = StaticScraper()
+        self.assertTrue(self.scraper.navigate_to(self.page_path))
+    
+    def tearDown(self):
+        """임시 파일 정리"""
+        self.tmp_dir.cleanup()
+    
+    def test_collect_candidates(self):
+        """유형별 후보 요소 수집 테스트 (문서 순서, 중복 제거)"""
+        candidates = self.scraper.collect_candidates()
+        summary = [(element.name, element.get('name'), categories) for element, categories in candidates]
+        
+        self.assertEqual(summary[0], ('a', None, ['button']))
+        self.assertIn(('input', 'remember', ['input', 'checkbox_radio']), summary)
+        self.assertIn(('select', 'lang', ['select']), summary)
+        self.assertEqual(len(candidates), len({id(element) for element, _ in candidates}))
+    
+    def test_check_elements(self):
+        """숨겨진 요소 판별 테스트"""
+        candidates = self.scraper.collect_candidates(['button', 'input'])
+        states = self.scraper.check_elements([element for element, _ in candidates])
+        hidden = [element for (element, _), state in zip(candidates, states) if not state['displayed']]
+        
+        self.assertEqual(sorted(element.get('name') or element.get_text() for element in hidden),
+                         ['Hidden', 'csrf'])
+    
+    def test_get_elements_info(self):
+        """WebScraper와 같은 형식의 요소 정보 생성 테스트"""
+        elements = [element for element, _ in self.scraper.collect_candidates(['button'])]
+        cart, login = self.scraper.get_elements_info(elements)[:2]
+        
+        self.assertEqual(cart['text'], 'Cart')
+        self.assertEqual(cart['href'], 'file:///cart')
+        self.assertEqual(login['type'], 'submit')
+        self.assertEqual(login['element_category'], 'button')
+        self.assertEqual(login['css_selector'], '.btn')
+        self.assertIsNone(login['element'])
+    
+    def test_unique_selector(self):
+        """고유 선택자가 안정적인 속성을 우선 사용하고 없으면 아이디가 있는 상위 요소나 루트부터의 위치 경로를 사용하는지 테스트"""
+        with open(self.page_path, 'w', encoding='utf-8') as f:
+            f.write("""
+<html><body>
+<div><button class="btn">Go</button><span>x</span></div>
+<div><button class="btn">Go</button></div>
+<p><a class="btn">Out</a></p>
+<section id="panel"><p><a class="btn">More</a></p><p><a class="btn">More</a></p></section>
+<input name="q"><input name="q" placeholder="Again">
+<button data-testid="send">Send</button><button id="1st">First</button>
+</body></html>
+""")
+        self.assertTrue(self.scraper.navigate_to(self.page_path))
+        elements = [element for element, _ in self.scraper.collect_candidates()]
+        selectors = [info['unique_selector'] for info in self.scraper.get_elements_info(elements)]
+        
+        self.assertIn('button[data-testid="send"]', selectors)
+        self.assertIn('input[placeholder="Again"]', selectors)
+        self.assertIn('button[id="1st"]', selectors)
+        self.assertIn('html > body > div:nth-of-type(2) > button', selectors)
+        self.assertIn('html > body > p > a', selectors)
+        self.assertIn('#panel > p:nth-of-type(1) > a', selectors)
+        
+        # 모든 선택자가 자기 요소 하나에만 일치
+        for element, selector in zip(elements, selectors):
+            self.assertEqual(self.scraper.soup.select(selector), [element])
+    
+    def test_form_key(self):
+        """요소가 속한 폼을 id, name, 순번 또는 form 속성으로 찾는지 테스트"""
+        with open(self.page_path, 'w', encoding='utf-8') as f:
+            f.write("""
+<html><body>
+<form id="login"><input name="user"><input name="pass" type="password"></form>
+<form><input name="q"></form>
+<form name="signup"><select name="country"><option>KR</option></select></form>
+<input name="remote" form="login"><input name="loose">
+</body></html>
+""")
+        self.assertTrue(self.scraper.navigate_to(self.page_path))
+        elements = [element for element, _ in self.scraper.collect_candidates()]
+        forms = {info['name']: info['form'] for info in self.scraper.get_elements_info(elements)}
+        
+        self.assertEqual(forms, {'user': 'login', 'pass': 'login', 'q': 'form2', 'country': 'signup',
+                                 'remote': 'login', 'loose': None})
+    
+    def test_run_without_ocr_backend(self):
+        """정적 엔진 실행은 OCR을 쓰지 않으므로 OCR 백엔드를 만들지 않는지 테스트"""
+        output_dir = os.path.join(self.tmp_dir.name, 'output')
+        argv = ['main.py', '--url', self.page_path, '--engine', 'static', '--output', output_dir, '--ocr-backend', 'vision']
+        with patch('sys.argv', argv), patch.object(main, 'create_backend', side_effect=AssertionError) as create_backend:
+            main.run(main.parse_args(), Profiler(enabled=False))
+        
+        create_backend.assert_not_called()
+        self.assertTrue(os.path.exists(os.path.join(output_dir, 'login_page.py')))
+
+    
+    def test_incremental_rerun_when_locator_check_toggled(self):
+        """--no-locator-check나 --debug를 바꾸면 생성 결과가 달라지므로 증분 모드에서도 페이지를 다시 처리하는지 테스트"""
+        output_dir = os.path.join(self.tmp_dir.name, 'output')
+        
+        def run(*options):
+            argv = ['main.py', '--url', self.page_path, '--engine', 'static', '--output', output_dir,
+                    '--incremental', *options]
+            output = io.StringIO()
+            with patch('sys.argv', argv), redirect_stdout(output):
+                main.run(main.parse_args(), Profiler(enabled=False))
+            return '건너뜁니다' in output.getvalue()
+        
+        self.assertFalse(run())
+        self.assertTrue(run())
+        self.assertFalse(run('--no-locator-check'))
+        self.assertTrue(run('--no-locator-check'))
+        # 디버그 모드는 텍스트가 있는 버튼도 OCR하므로 역시 다시 처리
+        self.assertFalse(run('--no-locator-check', '--debug'))
+        self.assertTrue(run('--no-locator-check', '--debug'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,351 @@
+"""
+웹 스크래퍼 테스트 (브라우저 없이 execute_script 호출을 흉내 내는 드라이버 사용)
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+
+# 프로젝트 루트 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.main import process_page
+from src.utils.element_info import CATEGORY_SELECTORS, category_selector
+from src.utils.ocr import OCRProcessor
+from src.utils.ocr_backends import FakeBackend
+from src.utils.po_generator import PageObjectGenerator
+from src.utils.profiler import Profiler
+from src.utils.web_scraper import (BULK_EXTRACT_SCRIPT, COLLECT_CANDIDATES_SCRIPT, ELEMENT_RECTS_SCRIPT,
+                                   LIVENESS_SCRIPT, LOCATOR_CHECK_SCRIPT, SCROLL_TO_SCRIPT, WebScraper, _blank_image)
+
+
+class FakeElement:
+    """테스트용 웹 요소"""
+
+    def __init__(self, name, displayed=True, stale=False, tag_name='button'):
+        self.name = name
+        self.displayed = displayed
+        self.stale = stale
+        self.tag_name = tag_name
+
+    def __repr__(self):
+        return f"FakeElement({self.name!r})"
+
+
+class FakeDriver:
+    """스크립트별 응답을 흉내 내고 execute_script 호출을 기록하는 드라이버"""
+
+    def __init__(self, candidates=None):
+        """
+        Args:
+            candidates: 후보 수집 스크립트가 돌려줄 [요소, 일치한 유형 리스트] 리스트
+        """
+        self.candidates = candidates or []
+        self.calls = []
+        self.page = None  # 문서 전체를 그린 이미지 (스크린샷은 현재 스크롤 위치의 화면 크기만큼 잘라냄)
+        self.viewport = (100, 100)
+        self.scroll = (0, 0)
+        self.rects = []
+        self.failing_screenshots = set()  # 실패시킬 스크린샷 순번 (0부터)
+        self.screenshots = 0
+
+    def execute_script(self, script, *args):
+        self.calls.append((script, args))
+        if script == COLLECT_CANDIDATES_SCRIPT:
+            return [[element, list(categories)] for element, categories in self.candidates]
+        if script == BULK_EXTRACT_SCRIPT:
+            return [{'tag_name': element.tag_name, 'text': element.name, 'name': element.name,
+                     'is_displayed': element.displayed, 'is_enabled': True} for element in args[0]]
+        if script == ELEMENT_RECTS_SCRIPT:
+            return {'rects': self.rects, 'viewport': list(self.viewport), 'scroll': list(self.scroll), 'scale': 1}
+        if script == SCROLL_TO_SCRIPT:
+            # 실제 브라우저처럼 문서 끝을 넘어 스크롤하지 않음
+            self.scroll = (max(0, min(args[0], self.page.width - self.viewport[0])),
+                           max(0, min(args[1], self.page.height - self.viewport[1])))
+            return list(self.scroll)
+        if script == LOCATOR_CHECK_SCRIPT:
+            if any(element.stale for element in args[0]):
+                raise StaleElementReferenceException('stale element reference')
+            return [[[1, True] for _ in locators] for locators in args[1]]
+        if script == LIVENESS_SCRIPT:
+            # 실제 드라이버처럼 stale 요소가 하나라도 있으면 실행 전체가 실패
+            elements = args[0]
+            if any(element.stale for element in elements):
+                raise StaleElementReferenceException("stale element reference")
+            return [[True, element.displayed] for element in elements]
+        raise AssertionError("예상하지 못한 스크립트 실행")
+
+    def get_screenshot_as_png(self):
+        number, self.screenshots = self.screenshots, self.screenshots + 1
+        if number in self.failing_screenshots:
+            raise RuntimeError("screenshot failed")
+        x, y = self.scroll
+        output = BytesIO()
+        self.page.crop((x, y, x + self.viewport[0], y + self.viewport[1])).save(output, format='PNG')
+        return output.getvalue()
+
+    def get(self, url):
+        if url == 'unreachable':
+            raise TimeoutException("page load timeout")
+        self.url = url
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def quit(self):
+        pass
+
+    def script_calls(self, script):
+        """특정 스크립트의 실행 인수 리스트"""
+        return [args for called, args in self.calls if called == script]
+
+
+def draw_page(driver, rects, size):
+    """요소마다 다른 색으로 칠한 문서 이미지와 요소 위치 설정 (요소 i의 색은 (i * 20, 100, 200))"""
+    driver.page = Image.new('RGB', size, 'white')
+    driver.rects = []
+    for index, (x, y, width, height) in enumerate(rects):
+        driver.page.paste((index * 20, 100, 200), (x, y, x + width, y + height))
+        driver.rects.append({'x': x, 'y': y, 'width': width, 'height': height, 'fixed': False})
+
+
+def image_color(image_bytes):
+    """잘라낸 요소 이미지가 한 가지 색이면 그 색 (아니면 None)"""
+    colors = Image.open(BytesIO(image_bytes)).convert('RGB').getcolors()
+    return colors[0][1] if len(colors) == 1 else None
+
+
+def make_scraper(driver):
+    """브라우저를 시작하지 않고 테스트용 드라이버를 사용하는 스크래퍼"""
+    scraper = WebScraper.__new__(WebScraper)
+    scraper.driver = driver
+    scraper.profiler = Profiler(enabled=False)
+    scraper.tracer = None
+    scraper.page_load_timeout = 30
+    scraper.page_load_strategy = 'normal'
+    return scraper
+
+
+class TestWebScraper(unittest.TestCase):
+    """웹 스크래퍼 테스트 클래스"""
+
+    def test_check_elements_single_call(self):
+        """stale 요소가 없으면 한 번의 스크립트 실행으로 모든 요소를 확인하는지 테스트"""
+        driver = FakeDriver()
+        elements = [FakeElement('a'), FakeElement('b', displayed=False), FakeElement('c')]
+
+        states = make_scraper(driver).check_elements(elements)
+
+        self.assertEqual(states, [{'alive': True, 'displayed': True}, {'alive': True, 'displayed': False},
+                                  {'alive': True, 'displayed': True}])
+        self.assertEqual(len(driver.script_calls(LIVENESS_SCRIPT)), 1)
+
+    def test_check_elements_bisects_stale(self):
+        """stale 요소가 있으면 구간을 나누어 해당 요소만 제외하는지 테스트"""
+        driver = FakeDriver()
+        elements = [FakeElement(str(index), stale=index in (2, 5)) for index in range(8)]
+
+        states = make_scraper(driver).check_elements(elements)
+
+        self.assertEqual([state['alive'] for state in states], [index not in (2, 5) for index in range(8)])
+        self.assertEqual([state['displayed'] for state in states], [index not in (2, 5) for index in range(8)])
+        # 전체 1회 + stale 요소가 포함된 구간만 나누어 검사
+        calls = driver.script_calls(LIVENESS_SCRIPT)
+        self.assertLess(len(calls), 2 * len(elements))
+
+    def test_check_elements_empty(self):
+        """빈 리스트는 스크립트를 실행하지 않는지 테스트"""
+        driver = FakeDriver()
+        self.assertEqual(make_scraper(driver).check_elements([]), [])
+        self.assertEqual(driver.calls, [])
+
+    def test_check_locators_bisects_stale(self):
+        """stale 요소가 있으면 해당 요소의 후보만 검사하지 못한 것으로 반환하는지 테스트"""
+        driver = FakeDriver()
+        elements = [FakeElement(str(index), stale=index == 3) for index in range(6)]
+        candidates = [[('id', str(index)), ('name', str(index))] for index in range(6)]
+
+        results = make_scraper(driver).check_locators(elements, candidates)
+
+        self.assertEqual(results, [[(-1, False)] * 2 if index == 3 else [(1, True)] * 2 for index in range(6)])
+        self.assertLess(len(driver.script_calls(LOCATOR_CHECK_SCRIPT)), 2 * len(elements))
+
+    def test_check_locators_single_call(self):
+        """stale 요소가 없으면 한 번의 스크립트 실행으로 모든 후보를 검사하는지 테스트"""
+        driver = FakeDriver()
+        results = make_scraper(driver).check_locators([FakeElement('a'), FakeElement('b')],
+                                                      [[('id', 'a')], [('id', 'b'), ('name', 'b')]])
+
+        self.assertEqual(results, [[(1, True)], [(1, True), (1, True)]])
+        self.assertEqual(len(driver.script_calls(LOCATOR_CHECK_SCRIPT)), 1)
+
+    def test_tabs_need_none_load_strategy(self):
+        """기본 로드 전략의 스크래퍼는 탭을 열지 않고 URL을 하나씩 로드하여 처리하는지 테스트"""
+        driver = FakeDriver()
+        scraper = make_scraper(driver)
+
+        results = list(scraper.process_urls_in_tabs(['a', 'unreachable', 'b'], lambda url: driver.url, tabs=4))
+
+        self.assertEqual([result['status'] for result in results], ['success', 'error', 'success'])
+        self.assertEqual([result['output'] for result in results], ['a', None, 'b'])
+
+    def test_screenshots_grouped_into_bands(self):
+        """화면 높이 안의 요소들을 스크린샷 한 번으로 잘라내는지 테스트"""
+        driver = FakeDriver()
+        draw_page(driver, [(10, 10, 30, 20), (50, 60, 20, 20), (10, 150, 40, 30), (20, 260, 30, 10)], (100, 400))
+        driver.rects.insert(2, None)  # 문서에서 제거된 요소
+
+        results = dict(make_scraper(driver).iter_element_screenshots([FakeElement(str(i)) for i in range(5)]))
+
+        self.assertEqual(sorted(results), [0, 1, 2, 3, 4])
+        self.assertEqual(results[2], _blank_image())
+        self.assertEqual([image_color(results[index]) for index in (0, 1, 3, 4)],
+                         [(0, 100, 200), (20, 100, 200), (40, 100, 200), (60, 100, 200)])
+        self.assertEqual(driver.screenshots, 3)  # y=10, y=150, y=260 구간
+        self.assertEqual(driver.scroll, (0, 0))  # 원래 스크롤 위치로 복원
+
+    def test_screenshots_horizontal_offscreen(self):
+        """가로로 화면 밖에 있는 요소는 가로로 스크롤하여 잘라내는지 테스트"""
+        driver = FakeDriver()
+        draw_page(driver, [(10, 10, 30, 20), (250, 20, 30, 20), (320, 40, 30, 20)], (400, 100))
+
+        results = dict(make_scraper(driver).iter_element_screenshots([FakeElement(str(i)) for i in range(3)]))
+
+        self.assertEqual([image_color(results[index]) for index in range(3)],
+                         [(0, 100, 200), (20, 100, 200), (40, 100, 200)])
+        self.assertEqual(driver.screenshots, 2)
+
+    def test_screenshot_failure_keeps_other_bands(self):
+        """구간 하나의 캡처가 실패해도 그 구간 요소는 빈 이미지로 반환하고 다음 구간을 계속 처리하는지 테스트"""
+        driver = FakeDriver()
+        draw_page(driver, [(10, 10, 30, 20), (10, 40, 30, 20), (10, 150, 30, 20), (10, 300, 30, 20)], (100, 400))
+        driver.failing_screenshots = {1}
+        scraper = make_scraper(driver)
+
+        results = list(scraper.iter_element_screenshots([FakeElement(str(i)) for i in range(4)]))
+
+        self.assertEqual(sorted(index for index, _ in results), [0, 1, 2, 3])
+        images = dict(results)
+        self.assertEqual(image_color(images[0]), (0, 100, 200))
+        self.assertEqual(images[2], _blank_image())
+        self.assertEqual(image_color(images[3]), (60, 100, 200))
+        self.assertEqual(len(scraper.capture_elements_screenshots([FakeElement(str(i)) for i in range(4)])), 4)
+
+    def test_collect_candidates_single_call(self):
+        """모든 유형의 선택자를 한 번의 스크립트 실행으로 보내고 요소별 유형 목록을 돌려주는지 테스트"""
+        search, query = FakeElement('search'), FakeElement('query', tag_name='input')
+        driver = FakeDriver([(search, ['button', 'input']), (query, ['input'])])
+
+        candidates = make_scraper(driver).collect_candidates()
+
+        self.assertEqual(candidates, [(search, ['button', 'input']), (query, ['input'])])
+        calls = driver.script_calls(COLLECT_CANDIDATES_SCRIPT)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][0], [[category, category_selector(category)] for category in CATEGORY_SELECTORS])
+
+    def test_collect_candidates_categories(self):
+        """유형별 조회는 해당 유형의 선택자만 보내고 같은 요소를 한 번만 돌려주는지 테스트"""
+        save = FakeElement('save')
+        driver = FakeDriver([(save, ['button'])])
+        scraper = make_scraper(driver)
+
+        self.assertEqual(scraper.get_buttons(), [save])
+        self.assertEqual(driver.script_calls(COLLECT_CANDIDATES_SCRIPT)[0][0], [['button', category_selector('button')]])
+        self.assertEqual(scraper.get_interaction_elements()['button'], [save])
+
+    def test_max_elements_counts_unique_elements(self):
+        """--max-elements가 유형별 일치 수가 아닌 고유 요소 수로 제한하는지 테스트"""
+        elements = [FakeElement(f"field{index}", tag_name='input') for index in range(4)]
+        driver = FakeDriver([(element, ['button', 'input']) for element in elements])
+        args = argparse.Namespace(timeout=10, buttons_only=False, inputs_only=False, max_elements=3, debug=False,
+                                  no_ocr=True, text_only=False, no_locator_check=False)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = process_page(make_scraper(driver), 'https://example.com/form', args,
+                                       OCRProcessor(backend=FakeBackend()), PageObjectGenerator(), Path(tmp_dir),
+                                       navigate=False)
+            self.assertIsNotNone(output_file)
+
+        # 유형 일치 8건 중 앞의 요소 3개만 확인하고 추출
+        self.assertEqual(driver.script_calls(LIVENESS_SCRIPT)[0][0], elements[:3])
+        self.assertEqual(driver.script_calls(BULK_EXTRACT_SCRIPT)[0][0], elements[:3])
+
+
+class SlowPageHandler(BaseHTTPRequestHandler):
+    """'/slow'는 늦게 응답하고 나머지 경로는 바로 응답하는 요청 처리기"""
+
+    def do_GET(self):
+        if self.path.startswith('/slow'):
+            time.sleep(4)
+        body = f"<html><body><button id='b'>{self.path}</button></body></html>".encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def chrome_available() -> bool:
+    """실제 브라우저 테스트에 필요한 Chrome과 ChromeDriver가 있는지 확인"""
+    chrome = os.getenv('CHROME_BINARY') or shutil.which('google-chrome') or shutil.which('chromium')
+    driver = os.getenv('CHROMEDRIVER_PATH') or shutil.which('chromedriver')
+    return bool(chrome and driver)
+
+
+@unittest.skipUnless(chrome_available(), "Chrome과 ChromeDriver가 필요합니다")
+class TestTabsInBrowser(unittest.TestCase):
+    """실제 브라우저에서 여러 탭을 번갈아 사용하는 페이지 로드 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), SlowPageHandler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.scraper = WebScraper(page_load_strategy='none')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.scraper.close()
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def current_text(self, url):
+        return self.scraper.driver.find_element('id', 'b').text
+
+    def test_slow_tab_does_not_block_others(self):
+        """느린 페이지가 로드되는 동안 다른 탭의 페이지를 처리하고 느린 페이지만 타임아웃 처리하는지 테스트"""
+        urls = [f"{self.base_url}/slow", f"{self.base_url}/a", f"{self.base_url}/b", f"{self.base_url}/c"]
+        start_time = time.time()
+        results = list(self.scraper.process_urls_in_tabs(urls, self.current_text, tabs=2, page_timeout=2))
+
+        self.assertLess(time.time() - start_time, 4)
+        self.assertEqual([result['url'] for result in results], urls[1:] + urls[:1])
+        self.assertEqual([result['output'] for result in results[:3]], ['/a', '/b', '/c'])
+        self.assertEqual(results[3]['status'], 'error')
+        self.assertIn('타임아웃', results[3]['error'])
+
+    def test_fragment_only_navigation(self):
+        """프래그먼트만 다른 URL도 타임아웃 없이 처리하는지 테스트"""
+        urls = [f"{self.base_url}/page", f"{self.base_url}/page#details"]
+        results = list(self.scraper.process_urls_in_tabs(urls, self.current_text, tabs=1, page_timeout=3))
+
+        self.assertEqual([result['status'] for result in results], ['success', 'success'])
+        self.assertTrue(self.scraper.navigate_to(f"{self.base_url}/page#summary"))
+
+
+if __name__ == '__main__':
+    unittest.main()